@@ -0,0 +1,246 @@
+"""
+Performance Benchmark Suite for the controllers of the Finance Toolkit
+
+This suite times the most demanding method of each controller for a universe of 10, 100
+and 1,000 tickers. The universe is generated synthetically with a fixed seed so that no
+API key or internet connection is required.
+
+The durations can be compared against the thresholds in benchmarks/thresholds.json which
+makes it possible to guard against performance regressions in CI. The thresholds contain a
+margin given that the durations depend on the machine the suite runs on. After a deliberate
+change in performance (or when moving to a different machine), the thresholds can be
+updated with the --update flag.
+
+Run the benchmark suite with:
+
+    python benchmarks/benchmark_suite.py --tickers 10 100 1000
+
+Check for regressions (exits with a non-zero exit code if a threshold is exceeded) with:
+
+    python benchmarks/benchmark_suite.py --tickers 10 100 --check
+"""
+
+import argparse
+import json
+import sys
+import time
+import warnings
+from collections.abc import Callable
+from pathlib import Path
+
+import pandas as pd
+
+from financetoolkit import Portfolio, Toolkit
+from financetoolkit.utilities import synthetic_model
+
+THRESHOLDS_LOCATION = Path(__file__).parent / "thresholds.json"
+
+# The margin that is applied to the measured durations when updating the thresholds and
+# the minimum threshold which prevents very short durations from failing due to noise
+THRESHOLD_MARGIN = 3.0
+MINIMUM_THRESHOLD = 0.5
+
+# The universe consists of four years of financial statements and historical data
+YEARS = 4
+SEED = 0
+
+# The Greeks are calculated per ticker, strike price and expiration date which takes several
+# seconds per ticker, larger universes are therefore skipped unless explicitly requested
+MAXIMUM_TICKERS = {"Options.collect_all_greeks": 100}
+
+
+def create_datasets(tickers: int) -> dict:
+    """Creates the synthetic universe for the given amount of tickers."""
+    return synthetic_model.generate_universe(tickers=tickers, years=YEARS, seed=SEED)
+
+
+def create_toolkit(datasets: dict) -> Toolkit:
+    """Creates a Toolkit that does not require an API key or internet connection."""
+    toolkit = Toolkit(
+        tickers=datasets["tickers"],
+        balance=datasets["balance"],
+        income=datasets["income"],
+        cash=datasets["cash"],
+        historical=datasets["historical"],
+        convert_currency=False,
+        start_date=datasets["start_date"],
+        end_date=datasets["end_date"],
+        sleep_timer=False,
+        progress_bar=False,
+    )
+
+    # The treasury data is set beforehand to prevent it from being retrieved
+    toolkit._daily_risk_free_rate = datasets["risk_free_rate"]
+    toolkit._daily_treasury_data = datasets["treasury"]
+
+    return toolkit
+
+
+def create_portfolio(datasets: dict) -> Portfolio:
+    """Creates a Portfolio based on the transaction ledger of the universe."""
+    historical = datasets["historical"]
+
+    portfolio = Portfolio(portfolio_dataset=datasets["portfolio"])
+    portfolio._currency_column = None
+
+    benchmark_historical = historical.xs("Benchmark", level=1, axis=1)
+    benchmark_historical.columns = pd.MultiIndex.from_product(
+        [benchmark_historical.columns, [portfolio._cfg["general"]["benchmark_ticker"]]]
+    )
+
+    portfolio._daily_historical_data = historical.drop(columns="Benchmark", level=1)
+    portfolio._daily_benchmark_data = benchmark_historical
+    portfolio._benchmark_tickers = dict.fromkeys(
+        portfolio._original_tickers, portfolio._cfg["general"]["benchmark_ticker"]
+    )
+    portfolio._benchmark_toolkit = Toolkit(
+        tickers=list(set(portfolio._benchmark_tickers.values())),
+        historical=benchmark_historical,
+        benchmark_ticker=None,
+        start_date=portfolio._start_date,
+        sleep_timer=False,
+        progress_bar=False,
+    )
+    portfolio._toolkit = Toolkit(
+        tickers=portfolio._tickers,
+        historical=portfolio._daily_historical_data,
+        benchmark_ticker=None,
+        start_date=portfolio._start_date,
+        sleep_timer=False,
+        progress_bar=False,
+    )
+
+    for toolkit in [portfolio._toolkit, portfolio._benchmark_toolkit]:
+        toolkit._daily_risk_free_rate = datasets["risk_free_rate"]
+        toolkit._daily_treasury_data = datasets["treasury"]
+
+    return portfolio
+
+
+# Each benchmark consists of the setup, which is not timed, and the method that is timed
+BENCHMARKS: dict[str, tuple[Callable, Callable]] = {
+    "Ratios.collect_all_ratios": (
+        lambda datasets: create_toolkit(datasets).ratios,
+        lambda ratios: ratios.collect_all_ratios(),
+    ),
+    "Technicals.collect_all_indicators": (
+        lambda datasets: create_toolkit(datasets).technicals,
+        lambda technicals: technicals.collect_all_indicators(),
+    ),
+    "Risk.collect_all_metrics": (
+        lambda datasets: create_toolkit(datasets).risk,
+        lambda risk: risk.collect_all_metrics(),
+    ),
+    "Performance.collect_all_metrics": (
+        lambda datasets: create_toolkit(datasets).performance,
+        lambda performance: performance.collect_all_metrics(),
+    ),
+    "Options.collect_all_greeks": (
+        lambda datasets: create_toolkit(datasets).options,
+        lambda options: options.collect_all_greeks(),
+    ),
+    "Models.get_intrinsic_valuation": (
+        lambda datasets: create_toolkit(datasets).models,
+        lambda models: models.get_intrinsic_valuation(
+            growth_rate=0.05,
+            perpetual_growth_rate=0.025,
+            weighted_average_cost_of_capital=0.094,
+        ),
+    ),
+    "Portfolio.get_portfolio_overview": (
+        create_portfolio,
+        lambda portfolio: portfolio.get_portfolio_overview(),
+    ),
+}
+
+
+def measure(benchmark: str, datasets: dict, repeats: int) -> float:
+    """Measures the fastest duration of a benchmark in seconds."""
+    setup, method = BENCHMARKS[benchmark]
+    durations = []
+
+    for _ in range(repeats):
+        controller = setup(datasets)
+
+        start = time.perf_counter()
+        method(controller)
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def main():
+    """Runs the benchmark suite and compares the durations against the thresholds."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tickers", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument(
+        "--benchmarks", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS)
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--thresholds", type=Path, default=THRESHOLDS_LOCATION)
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--update", action="store_true")
+    parser.add_argument("--margin", type=float, default=THRESHOLD_MARGIN)
+    parser.add_argument("--no-limit", action="store_true")
+    parser.add_argument("--output", type=Path, default=None)
+    arguments = parser.parse_args()
+
+    thresholds = (
+        json.loads(arguments.thresholds.read_text())
+        if arguments.thresholds.exists()
+        else {}
+    )
+    results: dict[str, dict[str, float]] = {}
+    regressions = []
+
+    for tickers in arguments.tickers:
+        datasets = create_datasets(tickers)
+
+        for benchmark in arguments.benchmarks:
+            if not arguments.no_limit and tickers > MAXIMUM_TICKERS.get(
+                benchmark, tickers
+            ):
+                print(f"{benchmark:<36} | tickers: {tickers:>5} | skipped")
+                continue
+
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                duration = measure(benchmark, datasets, repeats=arguments.repeats)
+
+            threshold = thresholds.get(benchmark, {}).get(str(tickers))
+            results.setdefault(benchmark, {})[str(tickers)] = round(duration, 4)
+
+            status = ""
+
+            if threshold is not None:
+                status = "ok" if duration <= threshold else "REGRESSION"
+
+                if duration > threshold:
+                    regressions.append(f"{benchmark} ({tickers} tickers)")
+
+            print(
+                f"{benchmark:<36} | tickers: {tickers:>5} | duration: {duration:8.3f}s"
+                + (f" | threshold: {threshold:8.3f}s | {status}" if status else "")
+            )
+
+    if arguments.output:
+        arguments.output.write_text(json.dumps(results, indent=4) + "\n")
+
+    if arguments.update:
+        for benchmark, durations in results.items():
+            for tickers, duration in durations.items():
+                thresholds.setdefault(benchmark, {})[tickers] = max(
+                    round(duration * arguments.margin, 2), MINIMUM_THRESHOLD
+                )
+
+        arguments.thresholds.write_text(json.dumps(thresholds, indent=4) + "\n")
+
+    if arguments.check and regressions:
+        print(
+            f"The following benchmarks exceed their threshold: {', '.join(regressions)}"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
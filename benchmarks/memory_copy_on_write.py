@@ -0,0 +1,118 @@
+"""
+Memory Benchmark for the Copy-on-Write mode of the Toolkit
+
+This benchmark measures the peak memory usage (RSS) of a workflow that retrieves the daily
+historical data of a large set of tickers multiple times, as is done when initializing the
+different modules of the Toolkit. Each mode is run in a fresh interpreter given that the
+peak memory usage of a process can only increase.
+
+Run the benchmark with:
+
+    python benchmarks/memory_copy_on_write.py --tickers 1000
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+WORKFLOW = """
+import json
+import resource
+
+import numpy as np
+import pandas as pd
+
+from financetoolkit import Toolkit
+
+tickers = [f"TICKER{{number}}" for number in range({tickers})]
+dates = pd.period_range("2015-01-01", "2024-12-31", freq="B").asfreq("D")
+random_generator = np.random.default_rng(0)
+
+historical_columns = pd.MultiIndex.from_product(
+    [
+        ["Open", "High", "Low", "Close", "Adj Close", "Volume", "Dividends", "Return",
+         "Volatility", "Excess Return", "Excess Volatility", "Cumulative Return"],
+        [*tickers, "Benchmark"],
+    ]
+)
+historical = pd.DataFrame(
+    random_generator.random((len(dates), len(historical_columns))),
+    index=dates,
+    columns=historical_columns,
+)
+treasury_data = pd.DataFrame(
+    random_generator.random((len(dates), 40)) / 100,
+    index=dates,
+    columns=pd.MultiIndex.from_product(
+        [
+            ["Open", "High", "Low", "Close", "Adj Close", "Volume", "Dividends",
+             "Return", "Volatility", "Cumulative Return"],
+            ["13 Week", "5 Year", "10 Year", "30 Year"],
+        ]
+    ),
+)
+
+# Copy-on-Write is enabled by the caller, the Toolkit only returns views when it is enabled
+pd.set_option("mode.copy_on_write", {copy_on_write})
+
+toolkit = Toolkit(
+    tickers=tickers,
+    historical=historical,
+    start_date="2016-01-01",
+    end_date="2024-12-31",
+    sleep_timer=False,
+    progress_bar=False,
+    copy_on_write={copy_on_write},
+)
+toolkit._daily_treasury_data = treasury_data
+toolkit._daily_risk_free_rate = treasury_data.xs("10 Year", level=1, axis=1)
+
+baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+# Each module of the Toolkit retrieves and stores the historical data separately
+results = [toolkit.get_historical_data() for _ in range(5)]
+
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+print(json.dumps({{"baseline": baseline / 1024, "peak": peak / 1024}}))
+"""
+
+
+def run_workflow(tickers: int, copy_on_write: bool) -> dict:
+    """Runs the workflow in a fresh interpreter and returns the memory usage in MB."""
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            WORKFLOW.format(tickers=tickers, copy_on_write=copy_on_write),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    """Compares the peak memory usage with and without Copy-on-Write."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tickers", type=int, default=1000)
+    arguments = parser.parse_args()
+
+    for copy_on_write in [False, True]:
+        memory_usage = run_workflow(
+            tickers=arguments.tickers, copy_on_write=copy_on_write
+        )
+
+        print(
+            f"copy_on_write={copy_on_write!s:<5} | "
+            f"data loaded: {memory_usage['baseline']:,.0f} MB | "
+            f"peak: {memory_usage['peak']:,.0f} MB | "
+            f"increase: {memory_usage['peak'] - memory_usage['baseline']:,.0f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Rounding Benchmark for the collection of all ratios
+
+This benchmark measures how much time the intermediate rounding costs when collecting
+all ratios. With the default rounding, each ratio, each category of ratios and the
+combined ratios are rounded. With rounding set to None, all intermediate rounding is
+skipped and the ratios are only rounded once when returned.
+
+The universe is generated synthetically with a fixed seed.
+
+Run the benchmark with:
+
+    python benchmarks/rounding_collect_all_ratios.py --tickers 200
+"""
+
+import argparse
+import time
+
+from financetoolkit import Toolkit
+from financetoolkit.utilities import synthetic_model
+
+
+def measure(datasets: dict, rounding: int | None) -> float:
+    """Measures the time it takes to collect all ratios in seconds."""
+    toolkit = Toolkit(
+        tickers=datasets["tickers"],
+        balance=datasets["balance"],
+        income=datasets["income"],
+        cash=datasets["cash"],
+        historical=datasets["historical"],
+        start_date=datasets["start_date"],
+        end_date=datasets["end_date"],
+        convert_currency=False,
+        sleep_timer=False,
+        progress_bar=False,
+        rounding=rounding,
+    )
+
+    # The treasury data is set beforehand to prevent it from being retrieved
+    toolkit._daily_risk_free_rate = datasets["risk_free_rate"]
+    toolkit._daily_treasury_data = datasets["treasury"]
+
+    # The ratios module is initialized beforehand to only measure the calculations
+    ratios = toolkit.ratios
+
+    start = time.perf_counter()
+    ratios.collect_all_ratios(rounding=4)
+
+    return time.perf_counter() - start
+
+
+def main():
+    """Compares the time it takes to collect all ratios with and without intermediate rounding."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    datasets = synthetic_model.generate_universe(tickers=arguments.tickers)
+    durations = {}
+
+    for rounding in [4, None]:
+        durations[rounding] = min(
+            measure(datasets, rounding=rounding) for _ in range(arguments.repeats)
+        )
+
+        print(f"rounding={rounding!s:<4} | duration: {durations[rounding]:.2f}s")
+
+    print(
+        f"Intermediate rounding costs {durations[4] - durations[None]:.2f}s "
+        f"({(durations[4] - durations[None]) / durations[4]:.1%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
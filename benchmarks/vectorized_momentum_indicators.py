@@ -0,0 +1,152 @@
+"""
+Vectorization Benchmark for the momentum indicators that used apply
+
+This benchmark compares the Aroon Indicator and the Average Directional Index, which
+previously called back into Python for every window (rolling apply) or every price
+(Series apply), with their current vectorized implementations. The previous
+implementations are reproduced below and, as before, calculated per ticker while the
+current implementations calculate all tickers at once. Both results are compared to
+confirm that these are identical.
+
+The universe is generated synthetically with a fixed seed.
+
+Run the benchmark with:
+
+    python benchmarks/vectorized_momentum_indicators.py --tickers 100 --years 10
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+import pandas as pd
+
+from financetoolkit.technicals import momentum_model
+from financetoolkit.utilities import synthetic_model
+
+WINDOW = 14
+
+
+def get_aroon_indicator_apply(
+    prices_high: pd.Series, prices_low: pd.Series, window: int
+) -> pd.DataFrame:
+    """The previous implementation of the Aroon Indicator which uses rolling apply."""
+    aroon_up = (
+        (
+            window
+            - prices_high.rolling(window=window).apply(lambda x: x.argmax(), raw=True)
+        )
+        / window
+        * 100
+    )
+    aroon_down = (
+        (
+            window
+            - prices_low.rolling(window=window).apply(lambda x: x.argmin(), raw=True)
+        )
+        / window
+        * 100
+    )
+
+    return pd.concat([aroon_up, aroon_down], keys=["Aroon Up", "Aroon Down"], axis=1)
+
+
+def get_average_directional_index_apply(
+    prices_high: pd.Series, prices_low: pd.Series, prices_close: pd.Series, window: int
+) -> pd.Series:
+    """The previous implementation of the Average Directional Index which uses apply."""
+    true_range = pd.concat(
+        [
+            prices_high - prices_low,
+            abs(prices_high - prices_close.shift(1)),
+            abs(prices_low - prices_close.shift(1)),
+        ],
+        axis=1,
+    ).max(axis=1)
+
+    plus_dm = prices_high.diff().apply(lambda x: x if x > 0 else 0)
+    minus_dm = -prices_low.diff().apply(lambda x: x if x < 0 else 0)
+
+    atr = true_range.rolling(window=window).mean()
+    plus_di = 100 * (plus_dm.rolling(window=window).mean() / atr)
+    minus_di = 100 * (minus_dm.rolling(window=window).mean() / atr)
+
+    dx = 100 * (abs(plus_di - minus_di) / (plus_di + minus_di))
+
+    return dx.rolling(window=window).mean()
+
+
+def per_ticker(function: Callable, *prices: pd.DataFrame) -> pd.DataFrame:
+    """Calculates the indicator for each ticker separately, as the controller did."""
+    return pd.concat(
+        {
+            ticker: function(*[price[ticker] for price in prices], WINDOW)
+            for ticker in prices[0].columns
+        },
+        axis=1,
+    )
+
+
+def measure(function: Callable, repeats: int) -> tuple[float, pd.DataFrame]:
+    """Measures the fastest duration of the function in seconds and returns its result."""
+    durations = []
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        durations.append(time.perf_counter() - start)
+
+    return min(durations), result
+
+
+def main():
+    """Compares the apply based momentum indicators with the vectorized implementations."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tickers", type=int, default=100)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    historical = synthetic_model.generate_universe(
+        tickers=arguments.tickers, years=arguments.years
+    )["historical"]
+    high, low, close = historical["High"], historical["Low"], historical["Adj Close"]
+
+    benchmarks = {
+        "Aroon Indicator": (
+            lambda: per_ticker(get_aroon_indicator_apply, high, low)
+            .swaplevel(1, 0, axis=1)
+            .sort_index(axis=1),
+            lambda: momentum_model.get_aroon_indicator(high, low, WINDOW).sort_index(
+                axis=1
+            ),
+        ),
+        "Average Directional Index": (
+            lambda: per_ticker(get_average_directional_index_apply, high, low, close),
+            lambda: momentum_model.get_average_directional_index(
+                high, low, close, WINDOW
+            ),
+        ),
+    }
+
+    print(f"{arguments.tickers} tickers, {len(historical)} periods, window of {WINDOW}")
+
+    for name, (apply_function, vectorized_function) in benchmarks.items():
+        apply_duration, apply_result = measure(apply_function, arguments.repeats)
+        vectorized_duration, vectorized_result = measure(
+            vectorized_function, arguments.repeats
+        )
+
+        pd.testing.assert_frame_equal(
+            vectorized_result, apply_result, check_names=False
+        )
+
+        print(
+            f"{name:<26} | apply: {apply_duration:.3f}s | vectorized: "
+            f"{vectorized_duration:.3f}s | speedup: "
+            f"{apply_duration / vectorized_duration:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
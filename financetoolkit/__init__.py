@@ -1,8 +1,47 @@
 """FinanceToolkit Initialization"""
 
 # flake8: noqa
-from .toolkit_controller import Toolkit
-from .economics.economics_controller import Economics
-from .fixedincome.fixedincome_controller import FixedIncome
-from .discovery.discovery_controller import Discovery
-from .portfolio.portfolio_controller import Portfolio
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .toolkit_controller import Toolkit
+    from .economics.economics_controller import Economics
+    from .fixedincome.fixedincome_controller import FixedIncome
+    from .discovery.discovery_controller import Discovery
+    from .portfolio.portfolio_controller import Portfolio
+    from .utilities.metrics_model import metrics
+
+# The classes are only imported once they are accessed. This prevents every controller
+# and its dependencies (e.g. scipy, scikit-learn and yfinance) from being imported
+# when only a single class is used.
+_LAZY_IMPORTS: dict[str, str] = {
+    "Toolkit": "financetoolkit.toolkit_controller",
+    "Economics": "financetoolkit.economics.economics_controller",
+    "FixedIncome": "financetoolkit.fixedincome.fixedincome_controller",
+    "Discovery": "financetoolkit.discovery.discovery_controller",
+    "Portfolio": "financetoolkit.portfolio.portfolio_controller",
+}
+
+# Objects other than classes that are available at the package level, e.g. the
+# metrics registry through financetoolkit.metrics
+_LAZY_OBJECTS: dict[str, str] = {
+    "metrics": "financetoolkit.utilities.metrics_model",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS or name in _LAZY_OBJECTS:
+        module = _LAZY_IMPORTS.get(name) or _LAZY_OBJECTS[name]
+        value = getattr(importlib.import_module(module), name)
+        globals()[name] = value
+
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__ + list(_LAZY_OBJECTS))
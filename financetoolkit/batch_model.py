@@ -0,0 +1,294 @@
+"""Batch Module"""
+
+__docformat__ = "google"
+
+import gc
+import json
+import os
+from collections.abc import Callable
+
+import pandas as pd
+
+from financetoolkit.toolkit_controller import Toolkit
+from financetoolkit.utilities import logger_model, long_format_model
+
+logger = logger_model.get_logger()
+
+try:
+    from tqdm import tqdm
+
+    ENABLE_TQDM = True
+except ImportError:
+    ENABLE_TQDM = False
+
+MANIFEST_FILE_NAME = "manifest.json"
+
+# The datasets that can be passed to the Toolkit directly and are therefore split up
+# in batches as well. The value defines the axis and level the tickers are stored in.
+TICKER_DATASETS = {
+    "balance": ("index", 0),
+    "income": ("index", 0),
+    "cash": ("index", 0),
+    "historical": ("columns", 1),
+}
+
+# pylint: disable=too-many-locals
+
+
+def collect_all_ratios(toolkit: Toolkit) -> dict[str, pd.DataFrame]:
+    """
+    The default collection for each batch which calculates all ratios.
+
+    Args:
+        toolkit (Toolkit): the Toolkit initialized with the tickers of the batch.
+
+    Returns:
+        dict[str, pd.DataFrame]: the ratios of the batch.
+    """
+    return {"ratios": toolkit.ratios.collect_all_ratios()}
+
+
+def split_in_batches(tickers: list[str], batch_size: int) -> list[list[str]]:
+    """
+    Splits the tickers into batches of at most the batch size while keeping the order.
+
+    Args:
+        tickers (list[str]): the tickers to split.
+        batch_size (int): the maximum number of tickers within each batch.
+
+    Returns:
+        list[list[str]]: the tickers of each batch.
+    """
+    if batch_size < 1:
+        raise ValueError("The batch size should be at least 1.")
+
+    return [
+        tickers[position : position + batch_size]
+        for position in range(0, len(tickers), batch_size)
+    ]
+
+
+def select_tickers(
+    dataset: pd.DataFrame, name: str, tickers: list[str]
+) -> pd.DataFrame:
+    """
+    Selects the tickers of a batch from a dataset that is passed to the Toolkit. For the
+    historical data, the benchmark is kept as well.
+
+    Args:
+        dataset (pd.DataFrame): the dataset containing all tickers.
+        name (str): the name of the dataset, e.g. "balance" or "historical".
+        tickers (list[str]): the tickers of the batch.
+
+    Returns:
+        pd.DataFrame: the dataset with only the tickers of the batch.
+    """
+    if dataset.empty:
+        return dataset
+
+    axis, level = TICKER_DATASETS[name]
+    labels = getattr(dataset, axis).get_level_values(level)
+    selected_tickers = [*tickers, "Benchmark"] if name == "historical" else tickers
+
+    if axis == "index":
+        return dataset.loc[labels.isin(selected_tickers)]
+
+    return dataset.loc[:, labels.isin(selected_tickers)]
+
+
+def load_manifest(output_location: str) -> dict:
+    """
+    Loads the manifest which keeps track of the batches that are finished.
+
+    Args:
+        output_location (str): the location of the Parquet datasets.
+
+    Returns:
+        dict: the manifest or an empty dictionary if there is no manifest.
+    """
+    try:
+        with open(f"{output_location}/{MANIFEST_FILE_NAME}") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def save_manifest(output_location: str, manifest: dict):
+    """
+    Saves the manifest by first writing to a temporary file and then replacing the
+    existing manifest. This prevents a corrupted manifest if the process is interrupted.
+
+    Args:
+        output_location (str): the location of the Parquet datasets.
+        manifest (dict): the manifest to save.
+    """
+    temporary_location = f"{output_location}/{MANIFEST_FILE_NAME}.tmp"
+
+    with open(temporary_location, "w") as file:
+        json.dump(manifest, file, indent=4)
+
+    os.replace(temporary_location, f"{output_location}/{MANIFEST_FILE_NAME}")
+
+
+def collect_in_batches(
+    tickers: list[str] | str,
+    output_location: str,
+    batch_size: int = 100,
+    collect_function: Callable[[Toolkit], dict[str, pd.DataFrame]] = collect_all_ratios,
+    resume: bool = True,
+    progress_bar: bool = True,
+    **toolkit_settings,
+) -> dict[str, str]:
+    """
+    Collects the results of a large set of tickers in batches and appends the results of each
+    batch to a Parquet dataset. For each batch, a Toolkit is initialized that collects the data,
+    normalizes the statements and calculates the results after which the Toolkit is discarded.
+    This means the memory usage is bounded by the batch size instead of the amount of tickers.
+
+    The finished batches are recorded in a manifest. When the collection is interrupted, e.g. due
+    to a crash or reaching the API limit, calling this function again with the same tickers and
+    batch size continues from the first batch that did not finish.
+
+    Args:
+        tickers (list[str] | str): the tickers to collect the results for.
+        output_location (str): the directory to store the Parquet datasets in.
+        batch_size (int): the amount of tickers within each batch. Defaults to 100.
+        collect_function (Callable): a function that receives the Toolkit of a batch and returns
+            a dictionary with the name and the result of each dataset to store. Each result has
+            the tickers and metrics as index and the periods as columns, as the ratios have.
+            Defaults to collecting all ratios.
+        resume (bool): whether to skip the batches that already finished. If False, the existing
+            results are overwritten. Defaults to True.
+        progress_bar (bool): whether to show a progress bar over the batches. Defaults to True.
+        **toolkit_settings: the settings passed to each Toolkit, e.g. api_key or quarterly. When
+            datasets such as balance or historical are given, these are split up per batch.
+
+    Returns:
+        dict[str, str]: the location of each Parquet dataset which can be read with pd.read_parquet.
+            The datasets are stored in the long format of the collectors, e.g. as returned by
+            collect_all_ratios(long_format=True), with the periods as strings.
+
+    As an example:
+
+    ```python
+    import pandas as pd
+
+    from financetoolkit.batch_model import collect_in_batches
+    from financetoolkit.utilities import long_format_model
+
+    datasets = collect_in_batches(
+        tickers=["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META"],
+        output_location="universe",
+        batch_size=2,
+        api_key="FINANCIAL_MODELING_PREP_KEY",
+    )
+
+    ratios = pd.read_parquet(datasets["ratios"])
+
+    # The long format can be converted back to the wide format of the ratios
+    ratios = long_format_model.to_wide_format(ratios)
+    ```
+    """
+    try:
+        import pyarrow  # noqa: F401, PLC0415 # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError as error:
+        raise ImportError(
+            "Writing the results to Parquet requires pyarrow, install it with: "
+            'pip install "financetoolkit[parquet]"'
+        ) from error
+
+    tickers = [tickers] if isinstance(tickers, str) else list(tickers)
+    batches = split_in_batches(tickers=tickers, batch_size=batch_size)
+
+    os.makedirs(output_location, exist_ok=True)
+
+    manifest = load_manifest(output_location)
+
+    if manifest and not resume:
+        # The results of the previous collection are removed to prevent these from
+        # being combined with the new results
+        for name in manifest["datasets"]:
+            for file_name in os.listdir(f"{output_location}/{name}"):
+                if file_name.startswith("batch-") and file_name.endswith(".parquet"):
+                    os.remove(f"{output_location}/{name}/{file_name}")
+
+        manifest = {}
+
+    if manifest and manifest["batches"] != batches:
+        raise ValueError(
+            f"The results in {output_location} were collected with different tickers or a "
+            "different batch size. Use the same tickers and batch size to resume or set "
+            "resume to False to start over."
+        )
+
+    if not manifest:
+        manifest = {"batches": batches, "finished": [], "datasets": []}
+        save_manifest(output_location, manifest)
+
+    batch_iterator = (
+        tqdm(range(len(batches)), desc="Collecting batches")
+        if ENABLE_TQDM & progress_bar
+        else range(len(batches))
+    )
+
+    for batch_number in batch_iterator:
+        if batch_number in manifest["finished"]:
+            continue
+
+        batch_settings = {
+            name: (
+                select_tickers(dataset, name, batches[batch_number])
+                if name in TICKER_DATASETS
+                else dataset
+            )
+            for name, dataset in toolkit_settings.items()
+        }
+
+        toolkit = Toolkit(
+            tickers=batches[batch_number],
+            progress_bar=False,
+            **batch_settings,
+        )
+
+        results = collect_function(toolkit)
+
+        for name, result in results.items():
+            dataset_location = f"{output_location}/{name}"
+            os.makedirs(dataset_location, exist_ok=True)
+
+            file_name = f"batch-{batch_number:06d}.parquet"
+
+            # A Toolkit with a single ticker omits the ticker from the index
+            dataset = (
+                pd.concat({batches[batch_number][0]: result})
+                if result.index.nlevels == 1
+                else result
+            )
+
+            # The long format gives each batch the same schema regardless of the periods that
+            # are available. The periods are stored as strings given that Parquet can not
+            # store the periods of pandas.
+            long_format = long_format_model.collect_long_format(
+                [dataset.set_axis(dataset.columns.astype(str), axis=1)]
+            )
+
+            # The file is written as a hidden file (which is ignored when reading the dataset) and
+            # renamed once finished so that an interrupted write never results in a partial file
+            long_format.to_parquet(
+                f"{dataset_location}/.{file_name}", engine="pyarrow", index=False
+            )
+            os.replace(
+                f"{dataset_location}/.{file_name}", f"{dataset_location}/{file_name}"
+            )
+
+            if name not in manifest["datasets"]:
+                manifest["datasets"].append(name)
+
+        manifest["finished"].append(batch_number)
+        save_manifest(output_location, manifest)
+
+        # The Toolkit and its results are removed to keep the memory bounded by the batch size
+        del toolkit, results
+        gc.collect()
+
+    return {name: f"{output_location}/{name}" for name in manifest["datasets"]}
@@ -8,6 +8,7 @@ from financetoolkit import fmp_model
 from financetoolkit.discovery import discovery_model
 from financetoolkit.utilities import logger_model
 from financetoolkit.utilities.error_model import handle_errors
+from financetoolkit.utilities.metrics_model import measure_methods
 
 # pylint: disable=too-many-instance-attributes,too-few-public-methods,too-many-lines,
 # pylint: disable=too-many-locals,line-too-long,too-many-public-methods
@@ -20,6 +21,7 @@ logger_model.setup_logger()
 logger = logger_model.get_logger()
 
 
+@measure_methods
 class Discovery:
     """
     The Discovery module contains a collection of functions that are meant to get
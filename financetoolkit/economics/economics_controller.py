@@ -9,9 +9,10 @@ from datetime import datetime, timedelta
 import pandas as pd
 
 from financetoolkit.economics import gmdb_model, oecd_model
-from financetoolkit.helpers import calculate_growth
+from financetoolkit.helpers import calculate_growth, round_dataset
 from financetoolkit.utilities.error_model import handle_errors
 from financetoolkit.utilities.logger_model import get_logger
+from financetoolkit.utilities.metrics_model import measure_methods
 
 logger = get_logger()
 
@@ -20,6 +21,7 @@ logger = get_logger()
 # ruff: noqa: E501
 
 
+@measure_methods
 class Economics:
     """
     The Economics module contains methods to retrieve economic data from the OECD.
@@ -205,7 +207,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return gross_domestic_product.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            gross_domestic_product, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_gross_domestic_product_deflator(
@@ -281,8 +285,8 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return gross_domestic_product_deflator.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            gross_domestic_product_deflator, rounding if rounding else self._rounding
         )
 
     @handle_errors
@@ -357,7 +361,9 @@ class Economics:
 
         total_consumption = total_consumption.loc[self._start_date : self._end_date]
 
-        return total_consumption.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            total_consumption, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_total_consumption_to_gdp_ratio(
@@ -427,8 +433,8 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return total_consumption_to_gdp_ratio.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            total_consumption_to_gdp_ratio, rounding if rounding else self._rounding
         )
 
     @handle_errors
@@ -498,7 +504,7 @@ class Economics:
 
         investment = investment.loc[self._start_date : self._end_date]
 
-        return investment.round(rounding if rounding else self._rounding)
+        return round_dataset(investment, rounding if rounding else self._rounding)
 
     @handle_errors
     def get_investment_to_gdp_ratio(
@@ -567,7 +573,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return investment_to_gdp_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            investment_to_gdp_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_fixed_investment(
@@ -632,7 +640,7 @@ class Economics:
 
         fixed_investment = fixed_investment.loc[self._start_date : self._end_date]
 
-        return fixed_investment.round(rounding if rounding else self._rounding)
+        return round_dataset(fixed_investment, rounding if rounding else self._rounding)
 
     @handle_errors
     def get_fixed_investment_to_gdp_ratio(
@@ -720,8 +728,8 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return fixed_investment_to_gdp_ratio.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            fixed_investment_to_gdp_ratio, rounding if rounding else self._rounding
         )
 
     @handle_errors
@@ -790,7 +798,7 @@ class Economics:
 
         exports = exports.loc[self._start_date : self._end_date]
 
-        return exports.round(rounding if rounding else self._rounding)
+        return round_dataset(exports, rounding if rounding else self._rounding)
 
     @handle_errors
     def get_exports_to_gdp_ratio(
@@ -862,7 +870,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return exports_to_gdp_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            exports_to_gdp_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_imports(
@@ -936,7 +946,7 @@ class Economics:
 
         imports = imports.loc[self._start_date : self._end_date]
 
-        return imports.round(rounding if rounding else self._rounding)
+        return round_dataset(imports, rounding if rounding else self._rounding)
 
     @handle_errors
     def get_imports_to_gdp_ratio(
@@ -1008,7 +1018,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return imports_to_gdp_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            imports_to_gdp_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_current_account_balance(
@@ -1080,7 +1092,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return current_account_balance.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            current_account_balance, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_current_account_balance_to_gdp_ratio(
@@ -1155,8 +1169,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return current_account_balance_to_gdp_ratio.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            current_account_balance_to_gdp_ratio,
+            rounding if rounding else self._rounding,
         )
 
     @handle_errors
@@ -1224,7 +1239,7 @@ class Economics:
 
         government_debt = government_debt.loc[self._start_date : self._end_date]
 
-        return government_debt.round(rounding if rounding else self._rounding)
+        return round_dataset(government_debt, rounding if rounding else self._rounding)
 
     @handle_errors
     def get_government_debt_to_gdp_ratio(
@@ -1296,8 +1311,8 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return government_debt_to_gdp_ratio.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            government_debt_to_gdp_ratio, rounding if rounding else self._rounding
         )
 
     @handle_errors
@@ -1362,7 +1377,9 @@ class Economics:
 
         government_revenue = government_revenue.loc[self._start_date : self._end_date]
 
-        return government_revenue.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            government_revenue, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_government_revenue_to_gdp_ratio(
@@ -1436,8 +1453,8 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return government_revenue_to_gdp_ratio.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            government_revenue_to_gdp_ratio, rounding if rounding else self._rounding
         )
 
     @handle_errors
@@ -1508,7 +1525,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return government_tax_revenue.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            government_tax_revenue, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_government_tax_revenue_to_gdp_ratio(
@@ -1580,8 +1599,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return government_tax_revenue_to_gdp_ratio.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            government_tax_revenue_to_gdp_ratio,
+            rounding if rounding else self._rounding,
         )
 
     @handle_errors
@@ -1653,7 +1673,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return government_expenditure.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            government_expenditure, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_government_expenditure_to_gdp_ratio(
@@ -1727,8 +1749,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return government_expenditure_to_gdp_ratio.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            government_expenditure_to_gdp_ratio,
+            rounding if rounding else self._rounding,
         )
 
     @handle_errors
@@ -1799,7 +1822,9 @@ class Economics:
 
         government_deficit = government_deficit.loc[self._start_date : self._end_date]
 
-        return government_deficit.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            government_deficit, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_government_deficit_to_gdp_ratio(
@@ -1874,8 +1899,8 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return government_deficit_to_gdp_ratio.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            government_deficit_to_gdp_ratio, rounding if rounding else self._rounding
         )
 
     @handle_errors
@@ -1955,7 +1980,9 @@ class Economics:
 
         trust_in_government = trust_in_government.loc[self._start_date : self._end_date]
 
-        return trust_in_government.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            trust_in_government, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_consumer_price_index(
@@ -2029,7 +2056,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return consumer_price_index.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            consumer_price_index, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_inflation_rate(
@@ -2092,7 +2121,7 @@ class Economics:
 
         inflation_rate = inflation_rate.loc[self._start_date : self._end_date]
 
-        return inflation_rate.round(rounding if rounding else self._rounding)
+        return round_dataset(inflation_rate, rounding if rounding else self._rounding)
 
     @handle_errors
     def get_consumer_confidence_index(
@@ -2159,7 +2188,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return consumer_confidence_index.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            consumer_confidence_index, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_business_confidence_index(
@@ -2222,7 +2253,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return business_confidence_index.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            business_confidence_index, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_composite_leading_indicator(
@@ -2281,8 +2314,8 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return composite_leading_indicator.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            composite_leading_indicator, rounding if rounding else self._rounding
         )
 
     @handle_errors
@@ -2373,7 +2406,7 @@ class Economics:
 
         house_prices = house_prices.loc[self._start_date : self._end_date]
 
-        return house_prices.round(rounding if rounding else self._rounding)
+        return round_dataset(house_prices, rounding if rounding else self._rounding)
 
     @handle_errors
     def get_rent_prices(
@@ -2442,7 +2475,7 @@ class Economics:
 
         rent_prices = rent_prices.loc[self._start_date : self._end_date]
 
-        return rent_prices.round(rounding if rounding else self._rounding)
+        return round_dataset(rent_prices, rounding if rounding else self._rounding)
 
     @handle_errors
     def get_share_prices(
@@ -2527,7 +2560,7 @@ class Economics:
 
         share_prices = share_prices.loc[self._start_date : self._end_date]
 
-        return share_prices.round(rounding if rounding else self._rounding)
+        return round_dataset(share_prices, rounding if rounding else self._rounding)
 
     @handle_errors
     def get_exchange_rates(
@@ -2613,7 +2646,7 @@ class Economics:
 
         exchange_rates = exchange_rates.loc[self._start_date : self._end_date]
 
-        return exchange_rates.round(rounding if rounding else self._rounding)
+        return round_dataset(exchange_rates, rounding if rounding else self._rounding)
 
     @handle_errors
     def get_money_supply(
@@ -2689,7 +2722,7 @@ class Economics:
 
         money_supply = money_supply.loc[self._start_date : self._end_date]
 
-        return money_supply.round(rounding if rounding else self._rounding)
+        return round_dataset(money_supply, rounding if rounding else self._rounding)
 
     @handle_errors
     def get_central_bank_policy_rate(
@@ -2755,7 +2788,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return central_bank_policy_rate.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            central_bank_policy_rate, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_short_term_interest_rate(
@@ -2844,7 +2879,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return short_term_interest_rate.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            short_term_interest_rate, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_long_term_interest_rate(
@@ -2939,7 +2976,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return long_term_interest_rate.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            long_term_interest_rate, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_renewable_energy(
@@ -3014,7 +3053,7 @@ class Economics:
 
         renewable_energy = renewable_energy.loc[self._start_date : self._end_date]
 
-        return renewable_energy.round(rounding if rounding else self._rounding)
+        return round_dataset(renewable_energy, rounding if rounding else self._rounding)
 
     @handle_errors
     def get_carbon_footprint(
@@ -3081,7 +3120,9 @@ class Economics:
 
         carbon_footprint_df = carbon_footprint_df.loc[self._start_date : self._end_date]
 
-        return carbon_footprint_df.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            carbon_footprint_df, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_unemployment_rate(
@@ -3175,7 +3216,9 @@ class Economics:
 
         unemployment_rate = unemployment_rate.loc[self._start_date : self._end_date]
 
-        return unemployment_rate.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            unemployment_rate, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_labour_productivity(
@@ -3247,7 +3290,9 @@ class Economics:
 
         labour_productivity = labour_productivity.loc[self._start_date : self._end_date]
 
-        return labour_productivity.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            labour_productivity, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_income_inequality(
@@ -3315,7 +3360,9 @@ class Economics:
 
         income_inequality = income_inequality.loc[self._start_date : self._end_date]
 
-        return income_inequality.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            income_inequality, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_population_statistics(
@@ -3430,7 +3477,9 @@ class Economics:
             self._start_date : self._end_date
         ]
 
-        return population_statistics_df.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            population_statistics_df, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_poverty_rate(
@@ -3493,4 +3542,4 @@ class Economics:
 
         poverty_rate = poverty_rate.loc[self._start_date : self._end_date]
 
-        return poverty_rate.round(rounding if rounding else self._rounding)
+        return round_dataset(poverty_rate, rounding if rounding else self._rounding)
@@ -7,6 +7,8 @@ from io import StringIO
 import pandas as pd
 import requests
 
+from financetoolkit.utilities.metrics_model import metrics
+
 # pylint: disable=too-many-lines
 
 
@@ -207,9 +209,9 @@ def collect_oecd_data(oecd_data_string: str, period_code: str) -> pd.DataFrame:
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/58.0.3029.110 Safari/537.3"
     }
-    response = requests.get(
-        f"{BASE_URL}{oecd_data_string}{EXTENSIONS}", headers=headers, timeout=300
-    )
+    url = f"{BASE_URL}{oecd_data_string}{EXTENSIONS}"
+    response = requests.get(url, headers=headers, timeout=300)
+    metrics.record_response("OECD", url, response)
 
     response.raise_for_status()
 
@@ -18,9 +18,10 @@ from financetoolkit.fixedincome import (
     fed_model,
     fred_model,
 )
-from financetoolkit.helpers import calculate_growth
+from financetoolkit.helpers import calculate_growth, round_dataset
 from financetoolkit.utilities import logger_model
 from financetoolkit.utilities.error_model import handle_errors
+from financetoolkit.utilities.metrics_model import measure_methods
 
 logger = logger_model.get_logger()
 
@@ -29,6 +30,7 @@ logger = logger_model.get_logger()
 # ruff: noqa: E501
 
 
+@measure_methods
 class FixedIncome:
     """
     The Fixed income module contains methods to obtain data related to Central Banks, Option Adjusted Spreads,
@@ -263,7 +265,7 @@ class FixedIncome:
                 frequency,
             )
 
-        return pd.Series(bond_statistics).round(self._rounding)
+        return round_dataset(pd.Series(bond_statistics), self._rounding)
 
     def get_present_value(
         self,
@@ -330,7 +332,7 @@ class FixedIncome:
         for coupon in coupon_rate:
             bond_prices[coupon] = {}
             for maturity in years_to_maturity:
-                (bond_prices[coupon][maturity]) = bond_model.get_bond_price(
+                bond_prices[coupon][maturity] = bond_model.get_bond_price(
                     par_value=par_value,
                     coupon_rate=float(coupon),
                     years_to_maturity=maturity,
@@ -559,17 +561,15 @@ class FixedIncome:
         for price in bond_price:
             yield_to_maturities[price] = {}
             for maturity in years_to_maturity:
-                (yield_to_maturities[price][maturity]) = (
-                    bond_model.get_yield_to_maturity(
-                        par_value=par_value,
-                        coupon_rate=coupon_rate,
-                        years_to_maturity=maturity,
-                        bond_price=price,
-                        frequency=frequency,
-                        guess=guess,
-                        tolerance=tolerance,
-                        max_iterations=max_iterations,
-                    )
+                yield_to_maturities[price][maturity] = bond_model.get_yield_to_maturity(
+                    par_value=par_value,
+                    coupon_rate=coupon_rate,
+                    years_to_maturity=maturity,
+                    bond_price=price,
+                    frequency=frequency,
+                    guess=guess,
+                    tolerance=tolerance,
+                    max_iterations=max_iterations,
                 )
 
         yield_to_maturities_df = pd.DataFrame.from_dict(
@@ -587,7 +587,7 @@ class FixedIncome:
                 frequency,
             )
 
-        return yield_to_maturities_df.round(self._rounding)
+        return round_dataset(yield_to_maturities_df, self._rounding)
 
     def get_derivative_price(
         self,
@@ -781,8 +781,8 @@ class FixedIncome:
 
             derivative_payoffs_df.index.name = "Strike Rate"
 
-            return derivative_prices_df.round(2), derivative_payoffs_df.round(
-                self._rounding
+            return derivative_prices_df.round(2), round_dataset(
+                derivative_payoffs_df, self._rounding
             )
 
         return derivative_prices_df.round(2)
@@ -885,7 +885,9 @@ class FixedIncome:
             self._start_date : self._end_date
         ]
 
-        return government_bond_yield.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            government_bond_yield, rounding if rounding else self._rounding
+        )
 
     @handle_errors
     def get_ice_bofa_option_adjusted_spread(
@@ -954,8 +956,8 @@ class FixedIncome:
             self._start_date : self._end_date
         ]
 
-        option_adjusted_spread = option_adjusted_spread.round(
-            rounding if rounding else self._rounding
+        option_adjusted_spread = round_dataset(
+            option_adjusted_spread, rounding if rounding else self._rounding
         )
 
         return option_adjusted_spread
@@ -1024,8 +1026,8 @@ class FixedIncome:
 
         effective_yield = effective_yield.loc[self._start_date : self._end_date]
 
-        effective_yield = effective_yield.round(
-            rounding if rounding else self._rounding
+        effective_yield = round_dataset(
+            effective_yield, rounding if rounding else self._rounding
         )
 
         return effective_yield
@@ -1092,7 +1094,9 @@ class FixedIncome:
 
         total_return = total_return.loc[self._start_date : self._end_date]
 
-        total_return = total_return.round(rounding if rounding else self._rounding)
+        total_return = round_dataset(
+            total_return, rounding if rounding else self._rounding
+        )
 
         return total_return
 
@@ -1159,7 +1163,9 @@ class FixedIncome:
 
         yield_to_worst = yield_to_worst.loc[self._start_date : self._end_date]
 
-        yield_to_worst = yield_to_worst.round(rounding if rounding else self._rounding)
+        yield_to_worst = round_dataset(
+            yield_to_worst, rounding if rounding else self._rounding
+        )
 
         return yield_to_worst
 
@@ -1246,7 +1252,9 @@ class FixedIncome:
 
         euribor_rates = euribor_rates.loc[self._start_date : self._end_date]
 
-        euribor_rates = euribor_rates.round(rounding if rounding else self._rounding)
+        euribor_rates = round_dataset(
+            euribor_rates, rounding if rounding else self._rounding
+        )
 
         return euribor_rates
 
@@ -1331,7 +1339,7 @@ class FixedIncome:
 
         ecb_rates = ecb_rates.loc[self._start_date : self._end_date]
 
-        ecb_rates = ecb_rates.round(rounding if rounding else self._rounding)
+        ecb_rates = round_dataset(ecb_rates, rounding if rounding else self._rounding)
 
         return ecb_rates
 
@@ -1432,6 +1440,6 @@ class FixedIncome:
 
         fed_data = fed_data.loc[self._start_date : self._end_date]
 
-        fed_data = fed_data.round(rounding if rounding else self._rounding)
+        fed_data = round_dataset(fed_data, rounding if rounding else self._rounding)
 
         return fed_data
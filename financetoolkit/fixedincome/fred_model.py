@@ -6,6 +6,8 @@ import numpy as np
 import pandas as pd
 import requests
 
+from financetoolkit.utilities.metrics_model import metrics
+
 
 def get_fred_data(fred_series_id: str | list):
     """
@@ -30,6 +32,7 @@ def get_fred_data(fred_series_id: str | list):
 
     try:
         response = requests.get(url, headers=headers, timeout=60)
+        metrics.record_response("FRED", url, response)
         response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
         fred_data = pd.read_csv(io.StringIO(response.text))
     except requests.exceptions.RequestException as e:
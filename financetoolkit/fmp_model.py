@@ -19,6 +19,7 @@ from urllib3.exceptions import MaxRetryError
 
 from financetoolkit import helpers
 from financetoolkit.utilities import error_model, logger_model
+from financetoolkit.utilities.metrics_model import get_endpoint, metrics
 
 logger = logger_model.get_logger()
 
@@ -59,10 +60,12 @@ def get_financial_data(
     """
     error_retry_counter = 0
     limit_retry_counter = 0
+    endpoint = get_endpoint(url)
 
     while True:
         try:
             response = requests.get(url, timeout=60)
+            metrics.record_response("FinancialModelingPrep", url, response)
             response.raise_for_status()
 
             if raw:
@@ -86,8 +89,11 @@ def get_financial_data(
             if "Premium Endpoint" in error_message:
                 return pd.DataFrame(columns=["SPECIAL ENDPOINT"])
             if "Bandwidth Limit Reach" in error_message:
+                metrics.record_quota_limited("FinancialModelingPrep", endpoint)
                 return pd.DataFrame(columns=["BANDWIDTH LIMIT REACH"])
             if "Limit Reach" in error_message:
+                metrics.record_quota_limited("FinancialModelingPrep", endpoint)
+
                 if (
                     sleep_timer
                     and limit_retry_counter < RETRY_LIMIT
@@ -95,6 +101,7 @@ def get_financial_data(
                 ):
                     time.sleep(5.01)
                     limit_retry_counter += 1
+                    metrics.record_retry("FinancialModelingPrep", endpoint, "limit")
                 else:
                     return pd.DataFrame(columns=["LIMIT REACH"])
             if "US stocks only" in error_message:
@@ -110,41 +117,40 @@ def get_financial_data(
         ):
             # When the connection is refused, retry the request 12 times
             # and if it doesn't work, then return an empty dataframe
+            metrics.record_request("FinancialModelingPrep", endpoint, status="error")
+
             if error_retry_counter == RETRY_LIMIT:
                 return pd.DataFrame(columns=["NO ERRORS"])
 
             error_retry_counter += 1
+            metrics.record_retry("FinancialModelingPrep", endpoint, "connection")
             time.sleep(5)
 
 
-def get_financial_statement(
+def get_financial_statement_url(
     ticker: str,
-    statement: str = "",
-    api_key: str = "",
+    statement: str,
+    api_key: str,
     quarter: bool = False,
     start_date: str | None = None,
     end_date: str | None = None,
-    sleep_timer: bool = True,
     user_subscription: str = "Free",
-) -> pd.DataFrame:
+) -> str:
     """
-    Retrieves financial statements (balance, income, or cash flow statements) for a single company ticker.
+    Constructs the URL to retrieve a financial statement for a single company ticker. The amount
+    of periods that is requested depends on the start and end date as well as the subscription.
 
     Args:
         ticker (str): The company ticker.
-        statement (str): The type of financial statement to retrieve. Can be "balance", "income", or "cash-flow".
+        statement (str): The type of financial statement to retrieve. Can be "balance", "income", or "cashflow".
         api_key (str): API key for the financial data provider.
         quarter (bool): Whether to retrieve quarterly data. Defaults to False (annual data).
         start_date (str | None): The start date to filter data with. Defaults to None.
         end_date (str | None): The end date to filter data with. Defaults to None.
-        sleep_timer (bool): Whether to set a sleep timer when the rate limit is reached. Note that this only works
-            if you have a Premium subscription (Starter or higher) from FinancialModelingPrep. Defaults to True.
         user_subscription (str): The subscription type of the user. Defaults to "Free".
 
     Returns:
-        pd.DataFrame: A DataFrame containing the financial statement data for the specified ticker.
-                      The index represents the financial statement items, and the columns represent the dates/periods.
-                      Returns an empty DataFrame if data retrieval fails or no data is found for the given parameters.
+        str: The URL of the financial statement.
     """
     if statement == "balance":
         location = "balance-sheet-statement"
@@ -158,12 +164,6 @@ def get_financial_statement(
             "cashflow' for the statement parameter."
         )
 
-    if not api_key:
-        raise ValueError(
-            "Please enter an API key from FinancialModelingPrep. "
-            "For more information, look here: https://www.jeroenbouma.com/fmp"
-        )
-
     period = "quarter" if quarter else "annual"
 
     periods_to_fetch = 5  # Default limit
@@ -189,11 +189,58 @@ def get_financial_statement(
     # Ensure we don't exceed the API's limit
     periods_to_fetch = min(periods_to_fetch, 9999) if user_subscription != "Free" else 5
 
-    url = (
+    return (
         f"https://financialmodelingprep.com/stable/{location}"
         f"?symbol={ticker}&period={period}&apikey={api_key}&"
         f"limit={periods_to_fetch}"
     )
+
+
+def get_financial_statement(
+    ticker: str,
+    statement: str = "",
+    api_key: str = "",
+    quarter: bool = False,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    sleep_timer: bool = True,
+    user_subscription: str = "Free",
+) -> pd.DataFrame:
+    """
+    Retrieves financial statements (balance, income, or cash flow statements) for a single company ticker.
+
+    Args:
+        ticker (str): The company ticker.
+        statement (str): The type of financial statement to retrieve. Can be "balance", "income", or "cash-flow".
+        api_key (str): API key for the financial data provider.
+        quarter (bool): Whether to retrieve quarterly data. Defaults to False (annual data).
+        start_date (str | None): The start date to filter data with. Defaults to None.
+        end_date (str | None): The end date to filter data with. Defaults to None.
+        sleep_timer (bool): Whether to set a sleep timer when the rate limit is reached. Note that this only works
+            if you have a Premium subscription (Starter or higher) from FinancialModelingPrep. Defaults to True.
+        user_subscription (str): The subscription type of the user. Defaults to "Free".
+
+    Returns:
+        pd.DataFrame: A DataFrame containing the financial statement data for the specified ticker.
+                      The index represents the financial statement items, and the columns represent the dates/periods.
+                      Returns an empty DataFrame if data retrieval fails or no data is found for the given parameters.
+    """
+    url = get_financial_statement_url(
+        ticker=ticker,
+        statement=statement,
+        api_key=api_key,
+        quarter=quarter,
+        start_date=start_date,
+        end_date=end_date,
+        user_subscription=user_subscription,
+    )
+
+    if not api_key:
+        raise ValueError(
+            "Please enter an API key from FinancialModelingPrep. "
+            "For more information, look here: https://www.jeroenbouma.com/fmp"
+        )
+
     financial_statement = get_financial_data(
         url=url, sleep_timer=sleep_timer, user_subscription=user_subscription
     )
@@ -231,6 +278,87 @@ def get_financial_statement(
     return financial_statement
 
 
+def get_historical_period(
+    start: str | None = None, end: str | None = None
+) -> tuple[str, str]:
+    """
+    Determines the period to request historical data for. Additional data is collected before the
+    start date and after the end date to ensure the return calculations are correct. If the start
+    date is not provided, it defaults to 10 years from the current date.
+
+    Args:
+        start (str, optional): The start date in 'YYYY-MM-DD' format. Defaults to None.
+        end (str, optional): The end date in 'YYYY-MM-DD' format. Defaults to None.
+
+    Raises:
+        ValueError: If the start date is after the end date.
+
+    Returns:
+        tuple[str, str]: The start and end date of the request in 'YYYY-MM-DD' format.
+    """
+    end_date_value = (
+        datetime.strptime(end, "%Y-%m-%d") + timedelta(days=1 * 365)
+        if end is not None
+        else datetime.today()
+    )
+
+    if start is not None:
+        start_date_value = datetime.strptime(start, "%Y-%m-%d") - timedelta(
+            days=1 * 365
+        )
+
+        if start_date_value > end_date_value:
+            raise ValueError(
+                f"Start date ({start_date_value}) must be before end date ({end_date_value}))"
+            )
+    else:
+        start_date_value = datetime.now() - timedelta(days=10 * 365)
+
+        if start_date_value > end_date_value:
+            start_date_value = end_date_value - timedelta(days=10 * 365)
+
+    return start_date_value.strftime("%Y-%m-%d"), end_date_value.strftime("%Y-%m-%d")
+
+
+def get_historical_data_url(
+    ticker: str, api_key: str, start_date: str, end_date: str
+) -> str:
+    """
+    Constructs the URL to retrieve the daily historical data for a single ticker.
+
+    Args:
+        ticker (str): The ticker symbol to retrieve data for.
+        api_key (str): API key for the financial data provider.
+        start_date (str): The start date of the request in 'YYYY-MM-DD' format.
+        end_date (str): The end date of the request in 'YYYY-MM-DD' format.
+
+    Returns:
+        str: The URL of the historical data.
+    """
+    return (
+        f"https://financialmodelingprep.com/stable/historical-price-eod/full"
+        f"?symbol={ticker}&apikey={api_key}&from={start_date}&to={end_date}"
+    )
+
+
+def get_dividend_url(ticker: str, api_key: str, user_subscription: str = "Free") -> str:
+    """
+    Constructs the URL to retrieve the dividends for a single ticker.
+
+    Args:
+        ticker (str): The ticker symbol to retrieve data for.
+        api_key (str): API key for the financial data provider.
+        user_subscription (str): The subscription type of the user. Defaults to "Free".
+
+    Returns:
+        str: The URL of the dividends.
+    """
+    return (
+        f"https://financialmodelingprep.com/stable/dividends"
+        f"?symbol={ticker}&apikey={api_key}&limit={'99999' if user_subscription != 'Free' else '5'}"
+    )
+
+
 def get_historical_data(
     ticker: str,
     api_key: str,
@@ -283,43 +411,19 @@ def get_historical_data(
                       Dividends (if requested), Log Return, Cumulative Return, Volatility, and Excess Return.
                       Returns an empty DataFrame if data retrieval fails or no data is found for the given parameters.
     """
-    # Additional data is collected to ensure return calculations are correct
-    end_date_value = (
-        datetime.strptime(end, "%Y-%m-%d") + timedelta(days=1 * 365)
-        if end is not None
-        else datetime.today()
-    )
-
-    if start is not None:
-        # Additional data is collected to ensure return calculations are correct
-        start_date_value = datetime.strptime(start, "%Y-%m-%d") - timedelta(
-            days=1 * 365
-        )
-
-        if start_date_value > end_date_value:
-            raise ValueError(
-                f"Start date ({start_date_value}) must be before end date ({end_date_value}))"
-            )
-    else:
-        start_date_value = datetime.now() - timedelta(days=10 * 365)
-
-        if start_date_value > end_date_value:
-            start_date_value = end_date_value - timedelta(days=10 * 365)
-
-    end_date_string = end_date_value.strftime("%Y-%m-%d")
-    start_date_string = start_date_value.strftime("%Y-%m-%d")
+    start_date_string, end_date_string = get_historical_period(start=start, end=end)
 
     if interval in ["yearly", "quarterly"]:
         interval = "1d"
 
-    historical_data_url = (
-        f"https://financialmodelingprep.com/stable/historical-price-eod/full"
-        f"?symbol={ticker}&apikey={api_key}&from={start_date_string}&to={end_date_string}"
+    historical_data_url = get_historical_data_url(
+        ticker=ticker,
+        api_key=api_key,
+        start_date=start_date_string,
+        end_date=end_date_string,
     )
-
-    dividend_url = (
-        f"https://financialmodelingprep.com/stable/dividends"
-        f"?symbol={ticker}&apikey={api_key}&limit={'99999' if user_subscription != 'Free' else '5'}"
+    dividend_url = get_dividend_url(
+        ticker=ticker, api_key=api_key, user_subscription=user_subscription
     )
 
     try:
@@ -994,7 +1098,9 @@ def get_analyst_estimates(
             before=start_date, axis=1
         )
 
-        analyst_estimates_total = analyst_estimates_total.round(rounding)
+        analyst_estimates_total = helpers.round_dataset(
+            analyst_estimates_total, rounding
+        )
 
         if quarter:
             analyst_estimates_total.columns = pd.PeriodIndex(
@@ -1013,6 +1119,20 @@ def get_analyst_estimates(
     return pd.DataFrame(), no_data
 
 
+def get_profile_url(ticker: str, api_key: str) -> str:
+    """
+    Constructs the URL to retrieve the profile of a single company.
+
+    Args:
+        ticker (str): the company ticker (for example: "AAPL")
+        api_key (str): the API Key obtained from https://www.jeroenbouma.com/fmp
+
+    Returns:
+        str: the URL of the profile.
+    """
+    return f"https://financialmodelingprep.com/stable/profile?symbol={ticker}&apikey={api_key}"
+
+
 def get_profile(
     tickers: list[str] | str,
     api_key: str,
@@ -1034,7 +1154,7 @@ def get_profile(
     """
 
     def worker(ticker, profile_dict):
-        url = f"https://financialmodelingprep.com/stable/profile?symbol={ticker}&apikey={api_key}"
+        url = get_profile_url(ticker=ticker, api_key=api_key)
         profile_data = get_financial_data(url=url, user_subscription=user_subscription)
 
         if profile_data.empty:
@@ -1137,6 +1257,20 @@ def get_profile(
     return pd.DataFrame(), no_data
 
 
+def get_quote_url(ticker: str, api_key: str) -> str:
+    """
+    Constructs the URL to retrieve the quote of a single company.
+
+    Args:
+        ticker (str): the company ticker (for example: "TSLA")
+        api_key (str): the API Key obtained from https://www.jeroenbouma.com/fmp
+
+    Returns:
+        str: the URL of the quote.
+    """
+    return f"https://financialmodelingprep.com/stable/quote?symbol={ticker}&apikey={api_key}"
+
+
 def get_quote(
     tickers: list[str] | str,
     api_key: str,
@@ -1159,7 +1293,7 @@ def get_quote(
     """
 
     def worker(ticker, quote_dict):
-        url = f"https://financialmodelingprep.com/stable/quote?symbol={ticker}&apikey={api_key}"
+        url = get_quote_url(ticker=ticker, api_key=api_key)
         quote_data = get_financial_data(url=url, user_subscription=user_subscription)
 
         if quote_data.empty:
@@ -1236,6 +1370,24 @@ def get_quote(
     return quote_dataframe, no_data
 
 
+def get_rating_url(ticker: str, api_key: str, user_subscription: str = "Free") -> str:
+    """
+    Constructs the URL to retrieve the historical ratings of a single company.
+
+    Args:
+        ticker (str): the company ticker (for example: "MSFT")
+        api_key (str): the API Key obtained from https://www.jeroenbouma.com/fmp
+        user_subscription (str): The subscription type of the user. Defaults to "Free".
+
+    Returns:
+        str: the URL of the ratings.
+    """
+    return (
+        f"https://financialmodelingprep.com/stable/ratings-historical?symbol={ticker}&"
+        f"apikey={api_key}&limit={'99999' if user_subscription != 'Free' else '1'}"
+    )
+
+
 def get_rating(
     tickers: list[str] | str,
     api_key: str,
@@ -1258,9 +1410,8 @@ def get_rating(
     """
 
     def worker(ticker, ratings_dict):
-        url = (
-            f"https://financialmodelingprep.com/stable/ratings-historical?symbol={ticker}&"
-            f"apikey={api_key}&limit={'99999' if user_subscription != 'Free' else '1'}"
+        url = get_rating_url(
+            ticker=ticker, api_key=api_key, user_subscription=user_subscription
         )
         ratings = get_financial_data(url=url, user_subscription=user_subscription)
 
@@ -8,7 +8,7 @@ import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
-from financetoolkit import fmp_model, normalization_model, yfinance_model
+from financetoolkit import fmp_model, helpers, normalization_model, yfinance_model
 from financetoolkit.utilities import error_model, logger_model
 
 # Check if yfinance is installed
@@ -295,7 +295,9 @@ def collect_financial_statements(
     financial_statement_total = financial_statement_total.dropna(axis=1, how="all")
 
     # Round the financial statement total if rounding is specified
-    financial_statement_total = financial_statement_total.round(rounding)
+    financial_statement_total = helpers.round_dataset(
+        financial_statement_total, rounding
+    )
 
     return (
         financial_statement_total,
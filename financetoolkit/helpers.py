@@ -5,7 +5,6 @@ __docformat__ = "google"
 import contextlib
 import inspect
 import re
-import warnings
 from functools import wraps
 
 import numpy as np
@@ -13,12 +12,38 @@ import pandas as pd
 import requests
 
 from financetoolkit.utilities import logger_model
+from financetoolkit.utilities.metrics_model import metrics
 
 logger = logger_model.get_logger()
 
 
 # pylint: disable=comparison-with-itself,too-many-locals,protected-access
 
+# The dtypes that can be used to store the historical data and financial statements
+# in which "compact" is an alias for float32
+DTYPE_OPTIONS = {"float64": "float64", "float32": "float32", "compact": "float32"}
+
+
+def round_dataset(
+    dataset: pd.Series | pd.DataFrame, rounding: int | None
+) -> pd.Series | pd.DataFrame:
+    """
+    Rounds the dataset to the given number of decimals. When rounding is None, the
+    dataset is returned as is which keeps the full precision of the calculations and
+    leaves the rounding to the moment the results are presented.
+
+    Args:
+        dataset (pd.Series | pd.DataFrame): the dataset to round.
+        rounding (int | None): the number of decimals to round to or None to skip rounding.
+
+    Returns:
+        pd.Series | pd.DataFrame: the rounded dataset.
+    """
+    if rounding is None:
+        return dataset
+
+    return dataset.round(rounding)
+
 
 def calculate_growth(
     dataset: pd.Series | pd.DataFrame,
@@ -31,74 +56,70 @@ def calculate_growth(
 
     Args:
         dataset (pd.Series | pd.DataFrame): the dataset to calculate the growth values for.
-        lag (int | str): the lag to use for the calculation. Defaults to 1.
+        lag (int | list[int]): the lag to use for the calculation. When a list is
+            provided, the growth is calculated for each lag and the lags are added as
+            the last level of the index (or columns). Defaults to 1.
+        rounding (int | None): the number of decimals to round to. When None, the growth
+            is not rounded. Defaults to 4.
+        axis (str): the axis that contains the periods. Defaults to "columns".
 
     Returns:
-        pd.Series | pd.DataFrame: _description_
+        pd.Series | pd.DataFrame: the growth values.
     """
-    # With Pandas 2.1, pct_change will no longer automatically forward fill
-    # given that this has been solved within the code already but the warning
-    # still appears, this is a temporary fix to ignore the warning
-    warnings.simplefilter(action="ignore", category=FutureWarning)
+    # Missing values are forward filled before the growth is calculated which is what
+    # pct_change used to do by default, this avoids the deprecated fill_method of Pandas
+    if isinstance(lag, list) and axis == "columns":
+        filled_dataset = dataset.ffill(axis="columns")
+    elif isinstance(dataset, pd.DataFrame) and axis == "columns":
+        filled_dataset = dataset.ffill().ffill(axis="columns")
+    else:
+        filled_dataset = dataset.ffill()
 
     if isinstance(lag, list):
-        new_index = []
+        # All lags are calculated at once and stacked so that the lags of each row (or
+        # column) are placed directly below (or next to) each other
         lag_dict = {f"Lag {lag_value}": lag_value for lag_value in lag}
+        labels = dataset.index if axis == "columns" else dataset.columns
+        values = filled_dataset.to_numpy()
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            growth = np.stack(
+                [
+                    values / filled_dataset.shift(lag_value, axis=axis).to_numpy() - 1
+                    for lag_value in lag_dict.values()
+                ],
+                axis=1 if axis == "columns" else 2,
+            ).astype(np.float64)
+
+        lag_labels = pd.MultiIndex.from_arrays(
+            [
+                *[
+                    labels.get_level_values(level).repeat(len(lag_dict))
+                    for level in range(labels.nlevels)
+                ],
+                np.tile(list(lag_dict), len(labels)),
+            ],
+            names=[None] * (labels.nlevels + 1),
+        )
 
         if axis == "columns":
-            for old_index in dataset.index:
-                for lag_value in lag_dict:
-                    new_index.append(
-                        (*old_index, lag_value)
-                        if isinstance(old_index, tuple)
-                        else (old_index, lag_value)
-                    )
-
             dataset_lag = pd.DataFrame(
-                index=pd.MultiIndex.from_tuples(new_index),
+                growth.reshape(len(labels) * len(lag_dict), -1),
+                index=lag_labels,
                 columns=dataset.columns,
-                dtype=np.float64,
             )
-
-            for new_index in dataset_lag.index:
-                lag_key = new_index[-1]
-                other_indices = new_index[:-1]
-
-                dataset_lag.loc[new_index] = (
-                    dataset.loc[other_indices]
-                    .ffill()
-                    .pct_change(periods=lag_dict[lag_key])  # type: ignore
-                    .to_numpy()
-                )
         else:
-            for old_index in dataset.columns:
-                for lag_value in lag_dict:
-                    new_index.append(
-                        (*old_index, lag_value)
-                        if isinstance(old_index, tuple)
-                        else (old_index, lag_value)
-                    )
-
             dataset_lag = pd.DataFrame(
-                columns=pd.MultiIndex.from_tuples(new_index),
+                growth.reshape(len(dataset.index), -1),
                 index=dataset.index,
-                dtype=np.float64,
+                columns=lag_labels,
             )
 
-            for new_index in dataset_lag.columns:
-                lag_key = new_index[-1]
-                other_indices = new_index[:-1]
-
-                dataset_lag.loc[:, new_index] = (
-                    dataset.loc[:, other_indices]
-                    .ffill()
-                    .pct_change(periods=lag_dict[lag_key])  # type: ignore
-                    .to_numpy()
-                )
-
-        return dataset_lag.round(rounding)
+        return round_dataset(dataset_lag, rounding)
 
-    return dataset.ffill().pct_change(periods=lag, axis=axis).round(rounding)
+    return round_dataset(
+        filled_dataset / filled_dataset.shift(lag, axis=axis) - 1, rounding
+    )
 
 
 def combine_dataframes(dataset_dictionary: dict[str, pd.DataFrame]) -> pd.DataFrame:
@@ -146,6 +167,30 @@ def equal_length(dataset1: pd.Series, dataset2: pd.Series) -> pd.Series:
     return dataset1, dataset2
 
 
+def convert_dtype(dataset: pd.DataFrame, dtype: str = "float64") -> pd.DataFrame:
+    """
+    Converts the floating point columns of a dataset to the given dtype. This makes it possible
+    to store historical data and financial statements compactly as float32 which halves the memory
+    usage at the cost of precision, as float32 holds approximately 7 significant digits.
+
+    Args:
+        dataset (pd.DataFrame): the dataset to convert.
+        dtype (str): the dtype to convert the floating point columns to. Defaults to "float64".
+
+    Returns:
+        pd.DataFrame: the dataset with the floating point columns converted.
+    """
+    if dataset.empty or dtype == "float64":
+        return dataset
+
+    float_columns = dataset.select_dtypes(include="float64").columns
+
+    if len(float_columns) == len(dataset.columns):
+        return dataset.astype(dtype)
+
+    return dataset.astype(dict.fromkeys(float_columns, dtype))
+
+
 def convert_isin_to_ticker(isin_code: str) -> str:
     """
     Converts an ISIN code to a ticker symbol using Yahoo Finance search.
@@ -158,14 +203,16 @@ def convert_isin_to_ticker(isin_code: str) -> str:
     """
     if bool(re.match("^([A-Z]{2})([A-Z0-9]{9})([0-9])$", isin_code)):
         try:
+            url = f"https://query2.finance.yahoo.com/v1/finance/search?q={isin_code}"
             response = requests.get(
-                f"https://query2.finance.yahoo.com/v1/finance/search?q={isin_code}",
+                url,
                 timeout=60,
                 headers={
                     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit"
                     "/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36"
                 },
             )
+            metrics.record_response("YahooFinance", url, response)
             response.raise_for_status()  # Raise an exception for bad status codes
 
             data = response.json()
@@ -268,13 +315,112 @@ def enrich_historical_data(
 
     historical_data["Cumulative Return"] = pd.Series(np.nan).astype(float)
 
+    # The cumulative product is calculated with double precision to prevent the
+    # accumulation of rounding errors when the data is stored compactly
     historical_data.loc[start:end, "Cumulative Return"] = (
-        1.0 + adjusted_return
+        1.0 + adjusted_return.astype("float64")
     ).cumprod()
 
     return historical_data
 
 
+def get_portfolio_weights(
+    instance, period: str, periods: pd.Index
+) -> tuple[np.ndarray, pd.Index, np.ndarray]:
+    """
+    Obtains the portfolio weights of the given period aligned to the given periods. The
+    aligned weights are cached on the instance so that consecutive results with the same
+    periods, e.g. all ratios within collect_all_ratios, reuse the same weights.
+
+    Args:
+        instance (object): the class instance that contains `_portfolio_weights`.
+        period (str): the period of the weights, e.g. "yearly" or "daily".
+        periods (pd.Index): the periods the weights should be aligned to.
+
+    Raises:
+        KeyError: If any of the periods has no portfolio weights.
+
+    Returns:
+        tuple[np.ndarray, pd.Index, np.ndarray]: the weights with the periods as rows and
+            the tickers as columns, the tickers and the sum of the weights per period.
+    """
+    weights = instance._portfolio_weights.get(period, pd.DataFrame())
+    cache = getattr(instance, "_portfolio_weights_cache", None)
+
+    if cache is None:
+        cache = {}
+        instance._portfolio_weights_cache = cache
+
+    cached_weights = cache.get(period)
+
+    if (
+        cached_weights is not None
+        and cached_weights[0] is weights
+        and (cached_weights[1] is periods or cached_weights[1].equals(periods))
+    ):
+        return cached_weights[2:]
+
+    period_indexer = weights.index.get_indexer(periods)
+
+    if (period_indexer == -1).any():
+        raise KeyError(
+            f"The periods {list(periods[period_indexer == -1])} have no portfolio weights."
+        )
+
+    aligned_weights = weights.to_numpy(dtype=np.float64)[period_indexer]
+    cache[period] = (
+        weights,
+        periods,
+        aligned_weights,
+        weights.columns,
+        np.nansum(aligned_weights, axis=1),
+    )
+
+    return cache[period][2:]
+
+
+def calculate_portfolio_weighted_average(
+    instance, dataset: pd.DataFrame, period: str, axis: str = "columns"
+) -> np.ndarray:
+    """
+    Calculates the weighted average of the tickers in the dataset for each period with a
+    single product of the values and the aligned portfolio weights. Missing values do
+    not contribute to the weighted average but their weights are part of the total.
+
+    Args:
+        instance (object): the class instance that contains `_portfolio_weights`.
+        dataset (pd.DataFrame): the dataset with the tickers as rows and the periods as
+            columns when axis is "columns" or the other way around when axis is "index".
+        period (str): the period of the weights, e.g. "yearly" or "daily".
+        axis (str): the axis that contains the periods. Defaults to "columns".
+
+    Returns:
+        np.ndarray: the weighted average for each period.
+    """
+    if axis == "columns":
+        periods, tickers, values = dataset.columns, dataset.index, dataset.to_numpy().T
+    else:
+        periods, tickers, values = dataset.index, dataset.columns, dataset.to_numpy()
+
+    weights, weight_tickers, total_weights = get_portfolio_weights(
+        instance, period, periods
+    )
+    ticker_indexer = weight_tickers.get_indexer(tickers)
+    values = values.astype(np.float64, copy=False)
+
+    if not np.array_equal(ticker_indexer, np.arange(len(weight_tickers))):
+        # Tickers without weights do not contribute to the weighted average
+        available = ticker_indexer != -1
+        values = values[:, available]
+        weights = weights[:, ticker_indexer[available]]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weighted_values = values * weights
+        weighted_values[np.isnan(weighted_values)] = 0
+
+        return weighted_values.sum(axis=1) / total_weights
+
+
 def handle_portfolio(func):
     """
     A decorator that processes the result of a function to handle portfolio data.
@@ -282,6 +428,10 @@ def handle_portfolio(func):
     calculates the weighted average of the result DataFrame using `self._portfolio_weights`
     and appends it as a new row or column named "Portfolio".
 
+    The signature of the function is inspected once when it is decorated and the
+    portfolio weights are aligned once per period (see get_portfolio_weights) so that
+    calling many decorated functions in a row, as the collect functions do, remains fast.
+
     Args:
         func (function): The function to be decorated.
 
@@ -292,6 +442,13 @@ def handle_portfolio(func):
         - The decorated function should have a `self` parameter as the first argument.
         - The decorated function should return a DataFrame.
     """
+    parameters = list(inspect.signature(func).parameters.values())[1:]
+    parameter_names = [parameter.name for parameter in parameters]
+    defaults = {
+        parameter.name: parameter.default
+        for parameter in parameters
+        if parameter.default is not inspect.Parameter.empty
+    }
 
     @wraps(func)
     def wrapper(self, *args, **kwargs):
@@ -304,63 +461,51 @@ def handle_portfolio(func):
             and "Portfolio" in self._tickers
             and isinstance(result, pd.DataFrame)
         ):
-            sig = inspect.signature(func)
-            bound_args = sig.bind(self, *args, **kwargs)
-            bound_args.apply_defaults()
-
-            # Merge defaults with kwargs, without overriding explicitly passed values
-            for key, value in bound_args.arguments.items():
-                if key not in kwargs:
-                    kwargs[key] = value
+            # Merge defaults with the passed arguments, without overriding explicitly
+            # passed values
+            arguments = {**defaults, **dict(zip(parameter_names, args)), **kwargs}
 
             # Get the rounding parameter from kwargs or use a default value
-            rounding = kwargs.get("rounding", self._rounding)
-            lag = kwargs.get("lag", 1)
-            growth = kwargs.get("growth", False)
-            period = kwargs.get("period")
+            rounding = arguments.get("rounding", self._rounding)
+            lag = arguments.get("lag", 1)
+            growth = arguments.get("growth", False)
+            period = arguments.get("period")
 
             if rounding is None:
                 rounding = self._rounding
             if period is None:
                 period = "quarterly" if getattr(self, "_quarterly", False) else "yearly"
 
-            # Select the appropriate portfolio weights
-            weights = self._portfolio_weights.get(period, pd.DataFrame())
-
-            # Exclude "Benchmark" from the weighted average calculation
-            result_without_benchmark = (
-                result.drop(columns=["Benchmark"])
-                if "Benchmark" in result.columns
-                else result
-            )
-
             # Calculate the weighted average for each column
             if isinstance(result.columns, pd.PeriodIndex) and not isinstance(
-                result.columns, pd.MultiIndex
+                result.index, pd.MultiIndex
             ):
-                weights = weights.loc[result_without_benchmark.columns, :].T
-
-                weighted_averages = round(
-                    (result_without_benchmark * weights).sum(axis=0)
-                    / weights.sum(axis=0),
-                    rounding,
+                weighted_averages = calculate_portfolio_weighted_average(
+                    self, result, period, axis="columns"
                 )
 
                 # Append the weighted averages as a new row
-                result.loc["Portfolio"] = weighted_averages
+                result.loc["Portfolio"] = round_dataset(
+                    pd.Series(weighted_averages, index=result.columns), rounding
+                )
             elif isinstance(result.index, pd.PeriodIndex) and not isinstance(
                 result.columns, pd.MultiIndex
             ):
-                weights = weights.loc[result.index, :]
+                # Exclude "Benchmark" from the weighted average calculation
+                result_without_benchmark = (
+                    result.drop(columns=["Benchmark"])
+                    if "Benchmark" in result.columns
+                    else result
+                )
 
-                weighted_averages = round(
-                    (result_without_benchmark * weights).sum(axis=1)
-                    / weights.sum(axis=1),
-                    rounding,
+                weighted_averages = calculate_portfolio_weighted_average(
+                    self, result_without_benchmark, period, axis="index"
                 )
 
-                # Append the weighted averages as a new row
-                result["Portfolio"] = weighted_averages
+                # Append the weighted averages as a new column
+                result["Portfolio"] = round_dataset(
+                    pd.Series(weighted_averages, index=result.index), rounding
+                )
 
             if growth and isinstance(lag, list):
                 logger.warning(
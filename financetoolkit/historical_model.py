@@ -10,7 +10,7 @@ import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
-from financetoolkit import fmp_model, yfinance_model
+from financetoolkit import fmp_model, helpers, yfinance_model
 from financetoolkit.utilities import error_model, logger_model
 
 logger = logger_model.get_logger()
@@ -290,7 +290,7 @@ def get_historical_data(
             historical_data = historical_data.interpolate(limit_area="inside")
 
         if rounding:
-            historical_data = historical_data.round(rounding)
+            historical_data = helpers.round_dataset(historical_data, rounding)
 
         return historical_data, no_data
 
@@ -400,7 +400,11 @@ def convert_daily_to_other_period(
         adjusted_return = period_historical_data.loc[start:end, "Return"].copy()
         adjusted_return.iloc[0] = 0
 
-        period_historical_data["Cumulative Return"] = (1 + adjusted_return).cumprod()
+        # The cumulative product is calculated with double precision to prevent the
+        # accumulation of rounding errors when the data is stored compactly
+        period_historical_data["Cumulative Return"] = (
+            1 + adjusted_return.astype("float64")
+        ).cumprod()
         period_historical_data["Cumulative Return"] = period_historical_data[
             "Cumulative Return"
         ].fillna(1)
@@ -408,11 +412,55 @@ def convert_daily_to_other_period(
     period_historical_data = period_historical_data.sort_index()
 
     if rounding:
-        period_historical_data = period_historical_data.round(rounding)
+        period_historical_data = helpers.round_dataset(period_historical_data, rounding)
 
     return period_historical_data.fillna(0)
 
 
+def select_historical_data(
+    historical_data: pd.DataFrame,
+    start: str | None = None,
+    end: str | None = None,
+    copy_on_write: bool = False,
+) -> pd.DataFrame:
+    """
+    Selects the historical data between the start and end date and sets the return of the first
+    period to zero given that this return falls outside of the selected range.
+
+    By default, the selection is copied so that the returned DataFrame can never alter the stored
+    historical data. With Copy-on-Write enabled in pandas, this defensive copy is not required since
+    any modification of the returned DataFrame results in a copy of only the modified data. In that
+    case only the Return columns are replaced and the other columns remain views on the stored data.
+    Given that Copy-on-Write can be disabled at any moment, the pandas option is checked on each
+    selection and the selection is copied whenever Copy-on-Write is not enabled.
+
+    Args:
+        historical_data (pd.DataFrame): A DataFrame containing historical data.
+        start (str | None): The start date of the selection. Defaults to None.
+        end (str | None): The end date of the selection. Defaults to None.
+        copy_on_write (bool): Whether to return views on the historical data when pandas
+            Copy-on-Write is enabled. Defaults to False.
+
+    Returns:
+        pd.DataFrame: The historical data between the start and end date.
+    """
+    if not copy_on_write or pd.get_option("mode.copy_on_write") is not True:
+        selected_historical_data = historical_data.loc[start:end, :].copy()
+        selected_historical_data.loc[selected_historical_data.index[0], "Return"] = 0
+
+        return selected_historical_data
+
+    selected_historical_data = historical_data.loc[start:end, :]
+
+    returns = selected_historical_data["Return"].copy()
+    returns.iloc[0] = 0
+
+    selected_historical_data = selected_historical_data.copy(deep=False)
+    selected_historical_data["Return"] = returns
+
+    return selected_historical_data
+
+
 def get_historical_statistics(
     tickers: list[str] | str,
     api_key: str | None = None,
@@ -4,7 +4,7 @@ __docformat__ = "google"
 
 import pandas as pd
 
-from financetoolkit.helpers import calculate_growth
+from financetoolkit.helpers import calculate_growth, round_dataset
 from financetoolkit.models import (
     altman_model,
     dupont_model,
@@ -18,10 +18,12 @@ from financetoolkit.models import (
 from financetoolkit.performance.performance_model import get_beta
 from financetoolkit.ratios import liquidity_model, valuation_model
 from financetoolkit.utilities.error_model import handle_errors
+from financetoolkit.utilities.metrics_model import measure_methods
 
 # pylint: disable=too-many-instance-attributes,too-many-locals,too-many-lines
 
 
+@measure_methods
 class Models:
     """
     The Models module is meant to execute well-known models such
@@ -92,10 +94,11 @@ class Models:
         self._risk_free_rate_data = risk_free_rate_data
 
         # Within Period Calculations
-        daily_historical_data = self._historical_data["daily"].copy()
+        # A shallow copy is sufficient given that only the index is replaced
+        daily_historical_data = self._historical_data["daily"].copy(deep=False)
 
         daily_historical_data.index = pd.DatetimeIndex(
-            daily_historical_data.to_timestamp().index
+            daily_historical_data.index.to_timestamp()
         )
 
         self._within_historical_data = helpers.determine_within_historical_data(
@@ -201,8 +204,8 @@ class Models:
                 axis="index",
             )
 
-        self._dupont_analysis = self._dupont_analysis.round(
-            rounding if rounding else self._rounding
+        self._dupont_analysis = round_dataset(
+            self._dupont_analysis, rounding if rounding else self._rounding
         )
 
         if len(self._tickers) == 1:
@@ -319,8 +322,8 @@ class Models:
                 axis="columns",
             )
 
-        self._extended_dupont_analysis = self._extended_dupont_analysis.round(
-            rounding if rounding else self._rounding
+        self._extended_dupont_analysis = round_dataset(
+            self._extended_dupont_analysis, rounding if rounding else self._rounding
         )
 
         if len(self._tickers) == 1:
@@ -427,8 +430,8 @@ class Models:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        self._enterprise_value_breakdown = self._enterprise_value_breakdown.round(
-            rounding if rounding else self._rounding
+        self._enterprise_value_breakdown = round_dataset(
+            self._enterprise_value_breakdown, rounding if rounding else self._rounding
         )
 
         if len(self._tickers) == 1:
@@ -575,10 +578,9 @@ class Models:
                 axis="columns",
             )
 
-        self._weighted_average_cost_of_capital = (
-            self._weighted_average_cost_of_capital.round(
-                rounding if rounding else self._rounding
-            )
+        self._weighted_average_cost_of_capital = round_dataset(
+            self._weighted_average_cost_of_capital,
+            rounding if rounding else self._rounding,
         )
 
         if len(self._tickers) == 1:
@@ -764,8 +766,8 @@ class Models:
                 .iloc[-1],
                 periods=periods,
             )
-            intrinsic_values_dict[ticker] = intrinsic_values_dict[ticker].round(
-                rounding if rounding else self._rounding
+            intrinsic_values_dict[ticker] = round_dataset(
+                intrinsic_values_dict[ticker], rounding if rounding else self._rounding
             )
 
         self._intrinsic_values = pd.concat(intrinsic_values_dict)
@@ -870,8 +872,8 @@ class Models:
 
         gorden_growth_model_df = pd.DataFrame(gorden_growth_model)
 
-        gorden_growth_model_df = gorden_growth_model_df.round(
-            rounding if rounding else self._rounding
+        gorden_growth_model_df = round_dataset(
+            gorden_growth_model_df, rounding if rounding else self._rounding
         )
 
         return gorden_growth_model_df
@@ -1027,7 +1029,9 @@ class Models:
                 axis="columns",
             )
 
-        altman_results = altman_results.round(rounding if rounding else self._rounding)
+        altman_results = round_dataset(
+            altman_results, rounding if rounding else self._rounding
+        )
 
         return altman_results
 
@@ -1292,7 +1296,7 @@ class Models:
                 axis="index",
             )
 
-        pvgo = pvgo.round(rounding if rounding else self._rounding)
+        pvgo = round_dataset(pvgo, rounding if rounding else self._rounding)
 
         # When there is no data found for any ticker, drop the row
         pvgo = pvgo.dropna(how="all", axis=0)
@@ -50,12 +50,17 @@ def define_strike_prices(
                 * round(int(stock_price.loc[ticker]) / strike_step_size)
             ]
         else:
+            # A strike price of zero is excluded given that it is not a valid strike
+            # price, this occurs for stock prices below the strike step size
             strike_prices_per_ticker[ticker] = list(
                 range(
                     strike_step_size
-                    * round(
-                        int(stock_price.loc[ticker] * (1 - strike_price_range))
-                        / strike_step_size
+                    * max(
+                        round(
+                            int(stock_price.loc[ticker] * (1 - strike_price_range))
+                            / strike_step_size
+                        ),
+                        1,
                     ),
                     strike_step_size
                     * round(
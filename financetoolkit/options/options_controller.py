@@ -8,6 +8,7 @@ import numpy as np
 import pandas as pd
 from scipy.optimize import minimize
 
+from financetoolkit.helpers import round_dataset
 from financetoolkit.options import (
     binomial_trees_model,
     black_scholes_model,
@@ -16,6 +17,7 @@ from financetoolkit.options import (
     options_model,
 )
 from financetoolkit.ratios import valuation_model
+from financetoolkit.utilities.metrics_model import measure_methods
 
 # pylint: disable=too-many-instance-attributes,too-few-public-methods,too-many-lines,too-many-locals,cell-var-from-loop
 # pylint: disable=line-too-long,too-many-public-methods
@@ -29,6 +31,7 @@ except ImportError:
     ENABLE_TQDM = False
 
 
+@measure_methods
 class Options:
     """
     The Options module is meant to calculate important options metrics such as the
@@ -197,14 +200,15 @@ class Options:
             put_option=put_option,
         )
 
-        option_chains["Change"] = option_chains["Change"].round(
-            rounding if rounding else self._rounding
+        option_chains["Change"] = round_dataset(
+            option_chains["Change"], rounding if rounding else self._rounding
         )
-        option_chains["Percent Change"] = option_chains["Percent Change"].round(
-            rounding if rounding else self._rounding
+        option_chains["Percent Change"] = round_dataset(
+            option_chains["Percent Change"], rounding if rounding else self._rounding
         )
-        option_chains["Implied Volatility"] = option_chains["Implied Volatility"].round(
-            rounding if rounding else self._rounding
+        option_chains["Implied Volatility"] = round_dataset(
+            option_chains["Implied Volatility"],
+            rounding if rounding else self._rounding,
         )
 
         option_chains.name = expiration_date
@@ -365,8 +369,8 @@ class Options:
             start_date=start_date,
         )
 
-        black_scholes_df = black_scholes_df.round(
-            rounding if rounding else self._rounding
+        black_scholes_df = round_dataset(
+            black_scholes_df, rounding if rounding else self._rounding
         )
 
         if show_input_info:
@@ -544,8 +548,8 @@ class Options:
 
         implied_volatility_df = pd.DataFrame(implied_volatility).unstack().dropna()
 
-        implied_volatility_df = implied_volatility_df.round(
-            rounding if rounding else self._rounding
+        implied_volatility_df = round_dataset(
+            implied_volatility_df, rounding if rounding else self._rounding
         )
 
         # The Expiration date is used as the name of the DataFrame
@@ -754,8 +758,8 @@ class Options:
             time_to_expiration=time_to_expiration,
         )
 
-        binomial_trees_df = binomial_trees_df.round(
-            rounding if rounding else self._rounding
+        binomial_trees_df = round_dataset(
+            binomial_trees_df, rounding if rounding else self._rounding
         )
 
         if show_input_info:
@@ -921,8 +925,8 @@ class Options:
             time_to_expiration=time_to_expiration,
         )
 
-        stock_price_simulation_df = stock_price_simulation_df.round(
-            rounding if rounding else self._rounding
+        stock_price_simulation_df = round_dataset(
+            stock_price_simulation_df, rounding if rounding else self._rounding
         )
 
         if show_input_info:
@@ -1384,7 +1388,7 @@ class Options:
             start_date=start_date,
         )
 
-        delta_df = delta_df.round(rounding if rounding else self._rounding)
+        delta_df = round_dataset(delta_df, rounding if rounding else self._rounding)
 
         if show_input_info:
             helpers.show_input_info(
@@ -1522,7 +1526,9 @@ class Options:
             start_date=start_date,
         )
 
-        dual_delta_df = dual_delta_df.round(rounding if rounding else self._rounding)
+        dual_delta_df = round_dataset(
+            dual_delta_df, rounding if rounding else self._rounding
+        )
 
         if show_input_info:
             helpers.show_input_info(
@@ -1660,7 +1666,7 @@ class Options:
             start_date=start_date,
         )
 
-        vega_df = vega_df.round(rounding if rounding else self._rounding)
+        vega_df = round_dataset(vega_df, rounding if rounding else self._rounding)
 
         if show_input_info:
             helpers.show_input_info(
@@ -1804,7 +1810,7 @@ class Options:
             start_date=start_date,
         )
 
-        theta_df = theta_df.round(rounding if rounding else self._rounding)
+        theta_df = round_dataset(theta_df, rounding if rounding else self._rounding)
 
         if show_input_info:
             helpers.show_input_info(
@@ -1949,7 +1955,7 @@ class Options:
             start_date=start_date,
         )
 
-        rho_df = rho_df.round(rounding if rounding else self._rounding)
+        rho_df = round_dataset(rho_df, rounding if rounding else self._rounding)
 
         if show_input_info:
             helpers.show_input_info(
@@ -2090,7 +2096,7 @@ class Options:
             start_date=start_date,
         )
 
-        epsilon_df = epsilon_df.round(rounding if rounding else self._rounding)
+        epsilon_df = round_dataset(epsilon_df, rounding if rounding else self._rounding)
 
         if show_input_info:
             helpers.show_input_info(
@@ -2233,7 +2239,7 @@ class Options:
             start_date=start_date,
         )
 
-        lambda_df = lambda_df.round(rounding if rounding else self._rounding)
+        lambda_df = round_dataset(lambda_df, rounding if rounding else self._rounding)
 
         if show_input_info:
             helpers.show_input_info(
@@ -2536,7 +2542,7 @@ class Options:
             start_date=start_date,
         )
 
-        gamma_df = gamma_df.round(rounding if rounding else self._rounding)
+        gamma_df = round_dataset(gamma_df, rounding if rounding else self._rounding)
 
         if show_input_info:
             helpers.show_input_info(
@@ -2668,7 +2674,9 @@ class Options:
             start_date=start_date,
         )
 
-        dual_gamma_df = dual_gamma_df.round(rounding if rounding else self._rounding)
+        dual_gamma_df = round_dataset(
+            dual_gamma_df, rounding if rounding else self._rounding
+        )
 
         if show_input_info:
             helpers.show_input_info(
@@ -2807,7 +2815,7 @@ class Options:
             start_date=start_date,
         )
 
-        vanna_df = vanna_df.round(rounding if rounding else self._rounding)
+        vanna_df = round_dataset(vanna_df, rounding if rounding else self._rounding)
 
         if show_input_info:
             helpers.show_input_info(
@@ -2949,7 +2957,7 @@ class Options:
             start_date=start_date,
         )
 
-        charm_df = charm_df.round(rounding if rounding else self._rounding)
+        charm_df = round_dataset(charm_df, rounding if rounding else self._rounding)
 
         if show_input_info:
             helpers.show_input_info(
@@ -3087,7 +3095,7 @@ class Options:
             start_date=start_date,
         )
 
-        vomma_df = vomma_df.round(rounding if rounding else self._rounding)
+        vomma_df = round_dataset(vomma_df, rounding if rounding else self._rounding)
 
         if show_input_info:
             helpers.show_input_info(
@@ -3226,7 +3234,7 @@ class Options:
             start_date=start_date,
         )
 
-        vera_df = vera_df.round(rounding if rounding else self._rounding)
+        vera_df = round_dataset(vera_df, rounding if rounding else self._rounding)
 
         if show_input_info:
             helpers.show_input_info(
@@ -3366,7 +3374,7 @@ class Options:
             start_date=start_date,
         )
 
-        veta_df = veta_df.round(rounding if rounding else self._rounding)
+        veta_df = round_dataset(veta_df, rounding if rounding else self._rounding)
 
         if show_input_info:
             helpers.show_input_info(
@@ -3497,8 +3505,8 @@ class Options:
             start_date=start_date,
         )
 
-        partial_derivative_df = partial_derivative_df.round(
-            rounding if rounding else self._rounding
+        partial_derivative_df = round_dataset(
+            partial_derivative_df, rounding if rounding else self._rounding
         )
 
         if show_input_info:
@@ -3748,7 +3756,7 @@ class Options:
             start_date=start_date,
         )
 
-        speed_df = speed_df.round(rounding if rounding else self._rounding)
+        speed_df = round_dataset(speed_df, rounding if rounding else self._rounding)
 
         if show_input_info:
             helpers.show_input_info(
@@ -3887,7 +3895,7 @@ class Options:
             start_date=start_date,
         )
 
-        zomma_df = zomma_df.round(rounding if rounding else self._rounding)
+        zomma_df = round_dataset(zomma_df, rounding if rounding else self._rounding)
 
         if show_input_info:
             helpers.show_input_info(
@@ -4026,7 +4034,7 @@ class Options:
             start_date=start_date,
         )
 
-        color_df = color_df.round(rounding if rounding else self._rounding)
+        color_df = round_dataset(color_df, rounding if rounding else self._rounding)
 
         if show_input_info:
             helpers.show_input_info(
@@ -4165,7 +4173,7 @@ class Options:
             start_date=start_date,
         )
 
-        ultima_df = ultima_df.round(rounding if rounding else self._rounding)
+        ultima_df = round_dataset(ultima_df, rounding if rounding else self._rounding)
 
         if show_input_info:
             helpers.show_input_info(
@@ -6,15 +6,14 @@ import warnings
 
 import pandas as pd
 
-from financetoolkit.helpers import calculate_growth, handle_portfolio
+from financetoolkit.helpers import calculate_growth, handle_portfolio, round_dataset
 from financetoolkit.performance import performance_model
-from financetoolkit.performance.helpers import (
-    determine_within_dataset,
-    determine_within_historical_data,
-    handle_errors,
-)
+from financetoolkit.performance.helpers import determine_within_dataset, handle_errors
+from financetoolkit.risk.helpers import WithinHistoricalData
 from financetoolkit.risk.risk_model import get_ui
+from financetoolkit.utilities import long_format_model, parallel_model
 from financetoolkit.utilities.logger_model import get_logger
+from financetoolkit.utilities.metrics_model import measure_methods
 
 try:
     from tqdm import tqdm
@@ -33,6 +32,7 @@ warnings.filterwarnings("ignore", category=RuntimeWarning)
 logger = get_logger()
 
 
+@measure_methods
 class Performance:
     """
     The Performance module is meant to calculate important performance metrics such
@@ -93,6 +93,7 @@ class Performance:
         self._rounding: int | None = rounding
         self._start_date: str | None = start_date
         self._end_date: str | None = end_date
+        self._intraday_period: str | None = intraday_period
         self._progress_bar: bool = progress_bar
         self._portfolio_weights: dict | None = None
 
@@ -107,22 +108,10 @@ class Performance:
         self._factor_asset_correlations: pd.DataFrame = pd.DataFrame()
         self._factor_correlations: pd.DataFrame = pd.DataFrame()
 
-        # Within Period Calculations
-        daily_historical_data = self._historical_data["daily"].copy()
-        intraday_historical_data = self._historical_data["intraday"].copy()
-
-        daily_historical_data.index = pd.DatetimeIndex(
-            daily_historical_data.to_timestamp().index
-        )
-
-        if not self._historical_data["intraday"].empty:
-            intraday_historical_data.index = pd.DatetimeIndex(
-                intraday_historical_data.to_timestamp().index
-            )
-
-        self._within_historical_data = determine_within_historical_data(
-            daily_historical_data=daily_historical_data,
-            intraday_historical_data=intraday_historical_data,
+        # Within Period Calculations, these are determined once a period is requested
+        self._within_historical_data = WithinHistoricalData(
+            daily_historical_data=self._historical_data["daily"],
+            intraday_historical_data=self._historical_data["intraday"],
             intraday_period=intraday_period,
         )
 
@@ -139,6 +128,8 @@ class Performance:
         rounding: int | None = None,
         growth: bool = False,
         lag: int | list[int] = 1,
+        n_jobs: int | None = None,
+        long_format: bool = False,
     ):
         """
         Calculates and collects all performance metrics.
@@ -149,6 +140,12 @@ class Performance:
             lag (int | str, optional): The lag to use for the growth calculation. Defaults to 1.
             trailing (int): Defines whether to select a trailing period.
             E.g. when selecting 4 with quarterly data, the TTM is calculated.
+            n_jobs (int | None, optional): The number of processes to divide the tickers over. A negative
+            number is subtracted from the number of CPU cores, e.g. -1 uses all cores. Defaults to None
+            which means the metrics are calculated within the current process.
+            long_format (bool, optional): Whether to return the metrics in the long format with a row for
+            each ticker, metric and period, which can be converted back with long_format_model.to_wide_format.
+            Defaults to False.
 
         Returns:
             pd.Series or pd.DataFrame: Performance metrics calculated based on the specified parameters.
@@ -171,43 +168,82 @@ class Performance:
         period = period if period else "quarterly" if self._quarterly else "yearly"
         rounding = rounding if rounding else self._rounding
 
-        performance_metrics = {
-            "Alpha": self.get_alpha(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "Beta": self.get_beta(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "CAPM": self.get_capital_asset_pricing_model(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "Jensen's Alpha": self.get_jensens_alpha(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "Treynor Ratio": self.get_treynor_ratio(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "Sharpe Ratio": self.get_sharpe_ratio(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "Sortino Ratio": self.get_sortino_ratio(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "Ulcer Index": self.get_ulcer_performance_index(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "M2 Ratio": self.get_m2_ratio(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "Tracking Error": self.get_tracking_error(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "Information Ratio": self.get_information_ratio(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-        }
-
-        performance_metrics = pd.concat(performance_metrics, axis=1)
+        shards = parallel_model.split_in_shards(self._tickers, n_jobs)
+
+        if shards:
+            performance_metrics = parallel_model.collect_in_parallel(
+                controller_class=Performance,
+                arguments={
+                    "historical_data": self._historical_data,
+                    "risk_free_rate_data": self._risk_free_rate_data,
+                    "quarterly": self._quarterly,
+                    "rounding": self._rounding,
+                    "start_date": self._start_date,
+                    "end_date": self._end_date,
+                    "intraday_period": self._intraday_period,
+                    "progress_bar": False,
+                },
+                method="collect_all_metrics",
+                method_arguments={
+                    "period": period,
+                    "rounding": rounding,
+                    "growth": growth,
+                    "lag": lag,
+                },
+                shards=shards,
+                axis=1,
+            )
+
+            if long_format:
+                return long_format_model.collect_long_format_from_metrics(
+                    {
+                        metric: performance_metrics[metric]
+                        for metric in performance_metrics.columns.unique(level=0)
+                    }
+                )
+        else:
+            performance_metrics = {
+                "Alpha": self.get_alpha(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "Beta": self.get_beta(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "CAPM": self.get_capital_asset_pricing_model(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "Jensen's Alpha": self.get_jensens_alpha(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "Treynor Ratio": self.get_treynor_ratio(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "Sharpe Ratio": self.get_sharpe_ratio(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "Sortino Ratio": self.get_sortino_ratio(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "Ulcer Index": self.get_ulcer_performance_index(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "M2 Ratio": self.get_m2_ratio(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "Tracking Error": self.get_tracking_error(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "Information Ratio": self.get_information_ratio(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+            }
+
+            if long_format:
+                return long_format_model.collect_long_format_from_metrics(
+                    performance_metrics
+                )
+
+            performance_metrics = pd.concat(performance_metrics, axis=1)
 
         if len(self._tickers) == 1:
             performance_metrics = performance_metrics.xs(
@@ -293,7 +329,7 @@ class Performance:
         else:
             beta = performance_model.get_beta(returns, benchmark_returns)
 
-        beta = beta.round(rounding if rounding else self._rounding).loc[
+        beta = round_dataset(beta, rounding if rounding else self._rounding).loc[
             self._start_date : self._end_date
         ]
 
@@ -391,7 +427,7 @@ class Performance:
             risk_free_rate, beta, benchmark_returns
         )
 
-        capm = capm.round(rounding if rounding else self._rounding).loc[
+        capm = round_dataset(capm, rounding if rounding else self._rounding).loc[
             self._start_date : self._end_date
         ]
 
@@ -527,8 +563,8 @@ class Performance:
             .reindex(self._tickers_without_portfolio, level=0, axis=1)
         )
 
-        self._factor_asset_correlations = factor_asset_correlations.round(
-            rounding if rounding else self._rounding
+        self._factor_asset_correlations = round_dataset(
+            factor_asset_correlations, rounding if rounding else self._rounding
         ).loc[self._start_date : self._end_date]
 
         return self._factor_asset_correlations
@@ -608,8 +644,8 @@ class Performance:
             correlation=True,
         )
 
-        self._factor_correlations = fama_and_french_period.round(
-            rounding if rounding else self._rounding
+        self._factor_correlations = round_dataset(
+            fama_and_french_period, rounding if rounding else self._rounding
         )
 
         return self._factor_correlations
@@ -621,6 +657,7 @@ class Performance:
         method: str = "multi",
         factors_to_calculate: list[str] | None = None,
         include_daily_residuals: bool = False,
+        include_t_statistics: bool = False,
         rounding: int | None = None,
         growth: bool = False,
         lag: int | list[int] = 1,
@@ -674,6 +711,8 @@ class Performance:
             factors_to_calculate (list of str, optional): List of factors to calculate scores and residuals for.
                 Defaults to ["Mkt-RF", "SMB", "HML", "RMW", "CMA"].
             include_residuals (bool, optional): Whether to include residuals in the results. Defaults to False.
+            include_t_statistics (bool, optional): Whether to include the T-Statistic of each regression
+                parameter in the results. Defaults to False.
             rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
             growth (bool, optional): Whether to calculate the growth of the ratio values. Defaults to False.
             lag (int or list of int, optional): The lag to use for the growth calculation. Defaults to 1.
@@ -686,6 +725,8 @@ class Performance:
         - Daily Fama and French results is not an option as it would attempt to do a linear regression on a
         single data point which will not give any meaningful results.
         - The method retrieves historical data and calculates regression parameters and residuals for each asset.
+        The regressions of all assets and periods are solved at once which means that also large sets of tickers
+        can be calculated quickly.
         - The risk-free rate is typically represented by the return of a risk-free investment, such as a Treasury bond.
         In this case, the Risk Free Rate from the Fama and French dataset is used.
         - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
@@ -742,172 +783,109 @@ class Performance:
         merged_df = fama_and_french_period.merge(
             returns, left_index=True, right_index=True
         )
-        factor_scores: dict = {}
-        daily_residuals: dict = {}
-
-        ticker_list_iterator = (
-            tqdm(
-                self._tickers_without_portfolio,
-                desc=f"Calculating {'Multi' if method == 'multi' else 'Individual'} Factor Exposures",
-            )
-            if ENABLE_TQDM & self._progress_bar
-            else self._tickers_without_portfolio
+        excess_returns = merged_df[self._tickers_without_portfolio].sub(
+            merged_df["RF"], axis=0
         )
 
-        for ticker in ticker_list_iterator:
-            factor_scores[ticker] = {}
-            daily_residuals[ticker] = {}
-
-            if method == "multi":
-                for dataset_period in merged_df.index.get_level_values(0):
-                    factor_data = merged_df.loc[dataset_period][factors_to_calculate]
-                    excess_returns = (
-                        merged_df.loc[dataset_period][ticker]
-                        - merged_df.loc[dataset_period]["RF"]
-                    )
-
-                    (
-                        factor_scores[ticker][dataset_period],
-                        daily_residuals[ticker][dataset_period],
-                        error_message,
-                    ) = performance_model.get_fama_and_french_model_multi(
-                        excess_returns=excess_returns, factor_dataset=factor_data
-                    )
-
-                    if error_message:
-                        logger.warning(
-                            "%s for %s in %s.", error_message, ticker, dataset_period
-                        )
+        observations = merged_df.index.get_level_values(0).value_counts(sort=False)
 
-                    fama_and_french_model = pd.DataFrame.from_dict(
-                        {
-                            (ticker, factor): value
-                            for ticker, factor_scores_ticker in factor_scores.items()
-                            for factor, value in factor_scores_ticker.items()
-                        },
-                        orient="index",
-                    )
-
-                fama_and_french_model = fama_and_french_model.unstack(
-                    level=0, sort=False
-                ).swaplevel(0, 1, axis=1)
-
-                # Sort the DataFrame with respect to the original column order
-                tickers_column_order = fama_and_french_model.columns.get_level_values(
-                    0
-                ).unique()
-                parameters_column_order = (
-                    fama_and_french_model.columns.get_level_values(1).unique()
-                )
+        for dataset_period in observations[observations < 2].index:  # noqa
+            logger.warning(
+                "R2 score is not well-defined with less than two samples. "
+                "Setting value to NaN for %s.",
+                dataset_period,
+            )
 
-                fama_and_french_model = (
-                    fama_and_french_model.sort_index(axis=1)
-                    .reindex(tickers_column_order, level=0, axis=1)
-                    .reindex(parameters_column_order, level=1, axis=1)
+        if method == "multi":
+            fama_and_french_model, daily_residuals = (
+                performance_model.get_fama_and_french_model_multi_batch(
+                    excess_returns=excess_returns,
+                    factor_dataset=merged_df[factors_to_calculate],
                 )
+            )
 
-            elif method == "simple":
-                for factor in factors_to_calculate:
-                    factor_scores[ticker][factor] = {}
-                    daily_residuals[ticker][factor] = {}
-                    for dataset_period in merged_df.index.get_level_values(0):
-                        factor_data = merged_df.loc[dataset_period][factor]
-                        excess_returns = (
-                            merged_df.loc[dataset_period][ticker]
-                            - merged_df.loc[dataset_period]["RF"]
-                        )
-
-                        (
-                            factor_scores[ticker][factor][dataset_period],
-                            daily_residuals[ticker][factor][dataset_period],
-                        ) = performance_model.get_fama_and_french_model_single(
-                            excess_returns=excess_returns, factor=factor_data
-                        )
+            if not include_t_statistics:
+                fama_and_french_model = fama_and_french_model.loc[
+                    :,
+                    ~fama_and_french_model.columns.get_level_values(1).str.endswith(
+                        "T-Statistic"
+                    ),
+                ]
 
-                        factor_scores[ticker][factor][dataset_period][
-                            "Factor Value"
-                        ] = factor_data.iloc[-1]
+            daily_residuals = daily_residuals.droplevel(0).rename_axis(None)
 
-                        factor_scores[ticker][factor][dataset_period][
-                            "Residuals"
-                        ] = returns_total.loc[dataset_period][ticker] - (
-                            factor_scores[ticker][factor][dataset_period]["Slope"]
-                            * factor_data.iloc[-1]
-                            + factor_scores[ticker][factor][dataset_period]["Intercept"]
-                        )
+        elif method == "simple":
+            factor_scores: dict = {}
+            factor_residuals: dict = {}
 
-                fama_and_french_model = pd.DataFrame.from_dict(
-                    {
-                        (period, factor, ticker): value
-                        for ticker, factor_scores_ticker in factor_scores.items()
-                        for factor, factor_scores_factor in factor_scores_ticker.items()
-                        for period, value in factor_scores_factor.items()
-                    },
-                    orient="index",
+            for factor in factors_to_calculate:
+                factor_scores[factor], factor_residuals[factor] = (
+                    performance_model.get_fama_and_french_model_single_batch(
+                        excess_returns=excess_returns, factor=merged_df[factor]
+                    )
                 )
 
-                # Sort the DataFrame with respect to the original column order
-                parameters_column_order = fama_and_french_model.columns.unique()
-                factor_column_order = fama_and_french_model.index.get_level_values(
-                    1
-                ).unique()
-                ticker_column_order = fama_and_french_model.index.get_level_values(
-                    2
-                ).unique()
-
-                fama_and_french_model = fama_and_french_model.stack(
-                    future_stack=True
-                ).unstack(level=[2, 1, 3])
-
-                fama_and_french_model = (
-                    fama_and_french_model.sort_index(axis=1)
-                    .reindex(parameters_column_order, level=2, axis=1)
-                    .reindex(factor_column_order, level=1, axis=1)
-                    .reindex(ticker_column_order, level=0, axis=1)
+                factor_value = (
+                    merged_df[factor]
+                    .groupby(level=0)
+                    .tail(1)
+                    .droplevel(1)
+                    .reindex(factor_scores[factor].index)
                 )
+                total_returns = returns_total.reindex(factor_scores[factor].index)
+
+                for ticker in self._tickers_without_portfolio:
+                    factor_scores[factor][ticker, "Factor Value"] = factor_value
+                    factor_scores[factor][ticker, "Residuals"] = total_returns[
+                        ticker
+                    ] - (
+                        factor_scores[factor][ticker, "Slope"] * factor_value
+                        + factor_scores[factor][ticker, "Intercept"]
+                    )
 
-        self._fama_and_french_model = fama_and_french_model.round(
-            rounding if rounding else self._rounding
-        ).loc[self._start_date : self._end_date]
-
-        if include_daily_residuals:
-            if method == "multi":
-                daily_residuals_df = pd.DataFrame.from_dict(
-                    {
-                        (ticker, factor): value
-                        for ticker, residuals_ticker in daily_residuals.items()
-                        for factor, value in residuals_ticker.items()
-                    },
-                    orient="index",
-                )
+            parameters = [
+                "Intercept",
+                "Slope",
+                "R Squared",
+                "P Value",
+                "Standard Error",
+                "Factor Value",
+                "Residuals",
+            ]
 
-                daily_residuals_df = (
-                    daily_residuals_df.stack()
-                    .unstack(level=0)
-                    .sort_index(axis=1, sort_remaining=False)
-                )
-                daily_residuals_df = daily_residuals_df.reset_index(level=0, drop=True)
-            else:
-                daily_residuals_df = pd.DataFrame.from_dict(
-                    {
-                        (period, factor, ticker): value
-                        for ticker, residuals_ticker in daily_residuals.items()
-                        for factor, residuals_factor in residuals_ticker.items()
-                        for period, value in residuals_factor.items()
-                    },
-                    orient="index",
+            if include_t_statistics:
+                parameters.append("T Statistic")
+
+            fama_and_french_model = (
+                pd.concat(factor_scores, axis=1)
+                .swaplevel(0, 1, axis=1)
+                .reindex(
+                    pd.MultiIndex.from_product(
+                        [
+                            self._tickers_without_portfolio,
+                            factors_to_calculate,
+                            parameters,
+                        ]
+                    ),
+                    axis=1,
                 )
+            )
 
-                daily_residuals_df = (
-                    daily_residuals_df.unstack(level=[1, 2])
-                    .stack(level=0)
-                    .sort_index(axis=1, sort_remaining=False)
-                )
+            daily_residuals = (
+                pd.concat(factor_residuals, axis=1)
+                .droplevel(0)
+                .rename_axis(None)
+                .dropna(how="all")
+                .sort_index(axis=1, level=0, sort_remaining=False)
+            )
 
-                daily_residuals_df = daily_residuals_df.reset_index(level=0, drop=True)
+        self._fama_and_french_model = round_dataset(
+            fama_and_french_model, rounding if rounding else self._rounding
+        ).loc[self._start_date : self._end_date]
 
-            self._fama_and_french_residuals = daily_residuals_df.round(
-                rounding if rounding else self._rounding
+        if include_daily_residuals:
+            self._fama_and_french_residuals = round_dataset(
+                daily_residuals, rounding if rounding else self._rounding
             ).loc[self._start_date : self._end_date]
 
             return self._fama_and_french_model, self._fama_and_french_residuals
@@ -975,7 +953,7 @@ class Performance:
 
         alpha = performance_model.get_alpha(returns, benchmark_returns)
 
-        alpha = alpha.round(rounding if rounding else self._rounding).loc[
+        alpha = round_dataset(alpha, rounding if rounding else self._rounding).loc[
             self._start_date : self._end_date
         ]
 
@@ -1080,8 +1058,8 @@ class Performance:
             period_returns, risk_free_rate, beta, benchmark_returns
         )
 
-        jensens_alpha = jensens_alpha.round(
-            rounding if rounding else self._rounding
+        jensens_alpha = round_dataset(
+            jensens_alpha, rounding if rounding else self._rounding
         ).loc[self._start_date : self._end_date]
 
         jensens_alpha = jensens_alpha.dropna(how="all", axis=0)
@@ -1168,8 +1146,8 @@ class Performance:
             period_returns, risk_free_rate, beta
         )
 
-        treynor_ratio = treynor_ratio.round(
-            rounding if rounding else self._rounding
+        treynor_ratio = round_dataset(
+            treynor_ratio, rounding if rounding else self._rounding
         ).loc[self._start_date : self._end_date]
 
         treynor_ratio = treynor_ratio.dropna(how="all", axis=0)
@@ -1266,9 +1244,9 @@ class Performance:
         else:
             sharpe_ratio = performance_model.get_sharpe_ratio(excess_return)
 
-        sharpe_ratio = sharpe_ratio.round(rounding if rounding else self._rounding).loc[
-            self._start_date : self._end_date
-        ]
+        sharpe_ratio = round_dataset(
+            sharpe_ratio, rounding if rounding else self._rounding
+        ).loc[self._start_date : self._end_date]
 
         sharpe_ratio = sharpe_ratio.dropna(how="all", axis=0)
 
@@ -1351,8 +1329,8 @@ class Performance:
 
         sortino_ratio = performance_model.get_sortino_ratio(excess_return)
 
-        sortino_ratio = sortino_ratio.round(
-            rounding if rounding else self._rounding
+        sortino_ratio = round_dataset(
+            sortino_ratio, rounding if rounding else self._rounding
         ).loc[self._start_date : self._end_date]
 
         sortino_ratio = sortino_ratio.dropna(how="all", axis=0)
@@ -1427,8 +1405,8 @@ class Performance:
         ulcer_performance_index = performance_model.get_ulcer_performance_index(
             excess_return, ulcer_index
         )
-        ulcer_performance_index = ulcer_performance_index.round(
-            rounding if rounding else self._rounding
+        ulcer_performance_index = round_dataset(
+            ulcer_performance_index, rounding if rounding else self._rounding
         ).loc[self._start_date : self._end_date]
 
         ulcer_performance_index = ulcer_performance_index.dropna(how="all", axis=0)
@@ -1508,9 +1486,9 @@ class Performance:
             period_returns, risk_free_rate, period_standard_deviation
         )
 
-        m2_ratio = m2_ratio.round(rounding if rounding else self._rounding).loc[
-            self._start_date : self._end_date
-        ]
+        m2_ratio = round_dataset(
+            m2_ratio, rounding if rounding else self._rounding
+        ).loc[self._start_date : self._end_date]
 
         m2_ratio = m2_ratio.dropna(how="all", axis=0)
 
@@ -1584,8 +1562,8 @@ class Performance:
             returns, benchmark_returns
         )
 
-        tracking_error = tracking_error.round(
-            rounding if rounding else self._rounding
+        tracking_error = round_dataset(
+            tracking_error, rounding if rounding else self._rounding
         ).loc[self._start_date : self._end_date]
 
         tracking_error = tracking_error.dropna(how="all", axis=0)
@@ -1669,8 +1647,8 @@ class Performance:
             returns, benchmark_returns
         )
 
-        information_ratio = information_ratio.round(
-            rounding if rounding else self._rounding
+        information_ratio = round_dataset(
+            information_ratio, rounding if rounding else self._rounding
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -1776,8 +1754,8 @@ class Performance:
             ],
         )
 
-        compound_growth_rate = compound_growth_rate.round(
-            rounding if rounding else self._rounding
+        compound_growth_rate = round_dataset(
+            compound_growth_rate, rounding if rounding else self._rounding
         )
 
         return compound_growth_rate
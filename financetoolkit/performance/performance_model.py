@@ -8,10 +8,13 @@ import zipfile
 import numpy as np
 import pandas as pd
 import requests
+from scipy import stats
 from scipy.stats import linregress
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_squared_error
 
+from financetoolkit.utilities.metrics_model import metrics
+
 # This is meant for calculations in which a Multi Index exists. This is the case
 # when calculating a "within period" in which the first index represents the period
 # (e.g. 2020Q1) and the second index the days within that period (January to March)
@@ -218,6 +221,7 @@ def obtain_fama_and_french_dataset(fama_and_french_url: str | None = None):
     try:
         # Use requests library for better error handling and timeout capabilities
         response = requests.get(fama_and_french_url, timeout=10, headers=headers)
+        metrics.record_response("FamaFrench", fama_and_french_url, response)
         response.raise_for_status()  # Raise exception for HTTP errors
         zip_data = response.content
     except requests.exceptions.RequestException:
@@ -391,6 +395,252 @@ def get_fama_and_french_model_single(
     return regression_results, residuals
 
 
+def _group_periods(
+    index: pd.MultiIndex,
+) -> tuple[pd.Index, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Determines the order, the period codes and the boundaries of each period within a
+    Multi Index so that the observations of each period form a contiguous block.
+
+    Args:
+        index (pd.MultiIndex): the index with the period as the first level.
+
+    Returns:
+        pd.Index: the unique periods.
+        np.ndarray: the order that sorts the observations by period.
+        np.ndarray: the period code of each (sorted) observation.
+        np.ndarray: the position at which each period starts.
+        np.ndarray: the number of observations within each period.
+    """
+    codes, periods = pd.factorize(index.get_level_values(0))
+    order = np.argsort(codes, kind="stable")
+    codes = codes[order]
+    observations = np.bincount(codes, minlength=len(periods))
+    starts = np.concatenate([[0], np.cumsum(observations)[:-1]])
+
+    return periods, order, codes, starts, observations
+
+
+def get_fama_and_french_model_multi_batch(
+    excess_returns: pd.DataFrame,
+    factor_dataset: pd.DataFrame,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Performs the Multi Linear Regression of the Fama and French model for every asset and every
+    period at once. This is equivalent to calling get_fama_and_french_model_multi for each asset and
+    period but instead of fitting a separate model for each combination, the normal equations of all
+    periods are stacked and solved in a single pass. Given that the factors are the same for each
+    asset, the factor covariance matrix only needs to be inverted once per period.
+
+    The formula is as follows:
+
+        - Excess Return = Intercept + Beta1 * Mkt-RF + Beta2 * SMB + Beta3 * HML +
+            Beta4 * RMW + Beta5 * CMA + Residuals
+
+    Next to the regression parameters, the T-Statistic of each parameter is returned which is defined
+    as the parameter divided by its standard error.
+
+    Args:
+        excess_returns (pd.DataFrame): the excess returns with each asset in a column and a
+            Multi Index of the period and the dates within that period.
+        factor_dataset (pd.DataFrame): the factor dataset with each factor in a column and the
+            same index as the excess returns.
+
+    Returns:
+        pd.DataFrame: the regression results with the periods as index and the assets and
+            parameters as columns.
+        pd.DataFrame: the residuals with the same shape as the excess returns.
+    """
+    periods, order, codes, starts, observations = _group_periods(excess_returns.index)
+    factors = factor_dataset.columns
+
+    period_grouper = excess_returns.index.get_level_values(0)
+    excess_returns = excess_returns.groupby(period_grouper).bfill()
+    excess_returns = excess_returns.groupby(period_grouper).ffill()
+    factor_dataset = factor_dataset.groupby(period_grouper).bfill()
+    factor_dataset = factor_dataset.groupby(period_grouper).ffill()
+
+    x = factor_dataset.to_numpy(dtype=float)[order]
+    y = excess_returns.to_numpy(dtype=float)[order]
+
+    # The regression is performed on the demeaned data so that the intercept can be
+    # derived from the means afterwards which is how a Linear Regression is fitted as well
+    x_mean = np.add.reduceat(x, starts, axis=0) / observations[:, None]
+    y_mean = np.add.reduceat(y, starts, axis=0) / observations[:, None]
+    x_centered = x - x_mean[codes]
+    y_centered = y - y_mean[codes]
+
+    gram = np.add.reduceat(
+        x_centered[:, :, None] * x_centered[:, None, :], starts, axis=0
+    )
+    cross = np.stack(
+        [
+            np.add.reduceat(x_centered[:, [factor]] * y_centered, starts, axis=0)
+            for factor in range(len(factors))
+        ],
+        axis=1,
+    )
+
+    # The pseudo-inverse makes sure that periods with too few observations still
+    # result in the minimum norm solution instead of raising an error
+    gram_inverse = np.linalg.pinv(gram, hermitian=True)
+    slopes = gram_inverse @ cross
+    intercept = y_mean - np.einsum("pk,pkt->pt", x_mean, slopes)
+
+    residuals = y_centered.copy()
+    for factor in range(len(factors)):
+        residuals -= x_centered[:, [factor]] * slopes[codes, factor]
+
+    sum_squared_residuals = np.add.reduceat(residuals**2, starts, axis=0)
+    sum_squared_total = np.add.reduceat(y_centered**2, starts, axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_squared = np.where(
+            sum_squared_total > 0,
+            1 - sum_squared_residuals / sum_squared_total,
+            np.where(sum_squared_residuals == 0, 1.0, 0.0),
+        )
+        r_squared[observations < 2] = np.nan  # noqa
+
+        degrees_of_freedom = observations - len(factors) - 1
+        residual_variance = (
+            sum_squared_residuals
+            / np.where(degrees_of_freedom > 0, degrees_of_freedom, np.nan)[:, None]
+        )
+
+        slopes_standard_error = np.sqrt(
+            residual_variance[:, None, :]
+            * np.diagonal(gram_inverse, axis1=1, axis2=2)[:, :, None]
+        )
+        intercept_standard_error = np.sqrt(
+            residual_variance
+            * (
+                1 / observations
+                + np.einsum("pi,pij,pj->p", x_mean, gram_inverse, x_mean)
+            )[:, None]
+        )
+
+        intercept_t_statistic = intercept / intercept_standard_error
+        slopes_t_statistic = slopes / slopes_standard_error
+
+    parameters = {
+        "Intercept": intercept,
+        **{f"{factor} Slope": slopes[:, i] for i, factor in enumerate(factors)},
+        "Mean Squared Error (MSE)": sum_squared_residuals / observations[:, None],
+        "R Squared": r_squared,
+        "Intercept T-Statistic": intercept_t_statistic,
+        **{
+            f"{factor} Slope T-Statistic": slopes_t_statistic[:, i]
+            for i, factor in enumerate(factors)
+        },
+    }
+
+    regression_results = pd.DataFrame(
+        np.stack(list(parameters.values()), axis=2).reshape(len(periods), -1),
+        index=periods,
+        columns=pd.MultiIndex.from_product([excess_returns.columns, parameters]),
+    )
+
+    residuals_unsorted = np.empty_like(residuals)
+    residuals_unsorted[order] = residuals
+
+    residuals = pd.DataFrame(
+        residuals_unsorted, index=excess_returns.index, columns=excess_returns.columns
+    )
+
+    return regression_results, residuals
+
+
+def get_fama_and_french_model_single_batch(
+    excess_returns: pd.DataFrame,
+    factor: pd.Series,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Performs the Simple Linear Regression of the Fama and French model for every asset and every
+    period at once. This is equivalent to calling get_fama_and_french_model_single for each asset
+    and period but the regression statistics are derived from sums over each period which means
+    no separate regression needs to be performed.
+
+    The formula is as follows:
+
+        - Excess Return = Intercept + Slope * Factor Value + Residuals
+
+    Next to the regression parameters, the T-Statistic of the slope is returned which is defined
+    as the slope divided by its standard error.
+
+    Args:
+        excess_returns (pd.DataFrame): the excess returns with each asset in a column and a
+            Multi Index of the period and the dates within that period.
+        factor (pd.Series): the factor series with the same index as the excess returns.
+
+    Returns:
+        pd.DataFrame: the regression results with the periods as index and the assets and
+            parameters as columns.
+        pd.DataFrame: the residuals with the same shape as the excess returns.
+    """
+    periods, order, codes, starts, observations = _group_periods(excess_returns.index)
+
+    x = excess_returns.to_numpy(dtype=float)[order]
+    y = factor.to_numpy(dtype=float)[order][:, None]
+
+    x_mean = np.add.reduceat(x, starts, axis=0) / observations[:, None]
+    y_mean = np.add.reduceat(y, starts, axis=0) / observations[:, None]
+    x_centered = x - x_mean[codes]
+    y_centered = y - y_mean[codes]
+
+    ssxm = np.add.reduceat(x_centered**2, starts, axis=0) / observations[:, None]
+    ssym = np.add.reduceat(y_centered**2, starts, axis=0) / observations[:, None]
+    ssxym = (
+        np.add.reduceat(x_centered * y_centered, starts, axis=0) / observations[:, None]
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_value = np.where(
+            (ssxm == 0) | (ssym == 0), 0.0, ssxym / np.sqrt(ssxm * ssym)
+        ).clip(-1, 1)
+
+        slope = ssxym / ssxm
+        intercept = y_mean - slope * x_mean
+
+        # This is identical to the approach of scipy's linregress including the special
+        # case in which only two observations are available
+        degrees_of_freedom = (observations - 2)[:, None]
+        t_statistic = r_value * np.sqrt(
+            degrees_of_freedom / ((1.0 - r_value + 1e-20) * (1.0 + r_value + 1e-20))
+        )
+        p_value = 2 * stats.t.sf(np.abs(t_statistic), degrees_of_freedom)
+        standard_error = np.sqrt((1 - r_value**2) * ssym / ssxm / degrees_of_freedom)
+
+    two_observations = observations == 2  # noqa
+    p_value[two_observations] = np.where(ssym[two_observations] == 0, 1.0, 0.0)
+    standard_error[two_observations] = 0.0
+
+    parameters = {
+        "Intercept": intercept,
+        "Slope": slope,
+        "R Squared": r_value**2,
+        "P Value": p_value,
+        "Standard Error": standard_error,
+        "T Statistic": t_statistic,
+    }
+
+    regression_results = pd.DataFrame(
+        np.stack(list(parameters.values()), axis=2).reshape(len(periods), -1),
+        index=periods,
+        columns=pd.MultiIndex.from_product([excess_returns.columns, parameters]),
+    )
+
+    factor_values = factor.to_numpy(dtype=float)[:, None]
+    period_codes = np.empty_like(codes)
+    period_codes[order] = codes
+
+    residuals = excess_returns - (
+        slope[period_codes] * factor_values + intercept[period_codes]
+    )
+
+    return regression_results, residuals
+
+
 def get_alpha(
     asset_returns: pd.Series | float,
     benchmark_returns: pd.Series | float,
@@ -3,6 +3,8 @@
 import numpy as np
 import pandas as pd
 
+from financetoolkit.utilities import kernel_model
+
 # pylint: disable=too-many-locals
 
 # Matches up with currency codes EUR, USD, JPY etc. This is used for
@@ -554,6 +556,9 @@ def create_profit_and_loss_overview(
         method (str, optional): Method for inventory valuation.
             Can be 'FIFO', 'LIFO', or 'AVERAGE'. Default is 'FIFO'.
 
+    Raises:
+        ValueError: If the method is not 'FIFO', 'LIFO' or 'AVERAGE'.
+
     Returns:
         pd.DataFrame: DataFrame with additional columns for 'PnL' (realized profit and loss per transaction)
         and 'Cumulative PnL' (cumulative profit and loss).
@@ -564,78 +569,24 @@ def create_profit_and_loss_overview(
         - AVERAGE: Uses the average cost of all assets in inventory for PnL calculation.
     """
 
-    def process_group(group):
-        inventory = []  # For FIFO or LIFO methods
-        avg_cost = 0  # For Average method
-        total_volume = 0  # For Average method
-        pnl = []  # Store PnL for each row in the group
-
-        for _, row in group.iterrows():
-            volume = row[volume_column]
-            price = row[price_column]
-
-            if volume > 0:  # Buy order
-                if method == "AVERAGE":
-                    # Update average cost
-                    total_cost = avg_cost * total_volume
-                    total_cost += volume * price
-                    total_volume += volume
-                    avg_cost = total_cost / total_volume
-                else:
-                    # Add to inventory for FIFO or LIFO
-                    inventory.append((volume, price))
-                pnl.append(0)  # No PnL for buy orders
-
-            elif volume < 0:  # Sell order
-                sell_volume = -volume
-                realized_pnl = 0
-
-                if method == "FIFO":
-                    # Process FIFO: Sell the earliest assets first
-                    while sell_volume > 0 and inventory:
-                        fifo_volume, fifo_price = inventory[0]
-                        if fifo_volume <= sell_volume:
-                            realized_pnl += fifo_volume * (price - fifo_price)
-                            sell_volume -= fifo_volume
-                            inventory.pop(0)
-                        else:
-                            realized_pnl += sell_volume * (price - fifo_price)
-                            inventory[0] = (fifo_volume - sell_volume, fifo_price)
-                            sell_volume = 0
-
-                elif method == "LIFO":
-                    # Process LIFO: Sell the most recently purchased assets first
-                    while sell_volume > 0 and inventory:
-                        lifo_volume, lifo_price = inventory.pop()
-                        if lifo_volume <= sell_volume:
-                            realized_pnl += lifo_volume * (price - lifo_price)
-                            sell_volume -= lifo_volume
-                        else:
-                            realized_pnl += sell_volume * (price - lifo_price)
-                            inventory.append((lifo_volume - sell_volume, lifo_price))
-                            sell_volume = 0
-
-                elif method == "AVERAGE":
-                    # Calculate PnL based on average cost
-                    if total_volume >= sell_volume:
-                        realized_pnl = sell_volume * (price - avg_cost)
-                        total_volume -= sell_volume
-                    else:
-                        realized_pnl = total_volume * (price - avg_cost)
-                        total_volume = 0
-
-                pnl.append(realized_pnl)
-
-            else:
-                pnl.append(0)  # No action for zero volume
-
-        group["PnL"] = pnl
-        return group
-
-    # Process each ticker group independently
-    transactions_overview = transactions_overview.groupby(
-        ticker_column, group_keys=False, observed=True
-    ).apply(process_group)
-    transactions_overview["Cumulative PnL"] = transactions_overview["PnL"].cumsum()
-
-    return transactions_overview[["PnL", "Cumulative PnL"]]
+    volumes = transactions_overview[volume_column].to_numpy(dtype=np.float64)
+    prices = transactions_overview[price_column].to_numpy(dtype=np.float64)
+    pnl = np.zeros(len(transactions_overview))
+
+    # Process each ticker independently, the lots are matched by the kernel backend
+    # (Numba or NumPy) rather than iterating over the rows of each ticker with pandas
+    for positions in transactions_overview.groupby(
+        ticker_column, observed=True, sort=False
+    ).indices.values():
+        pnl[positions] = kernel_model.get_lot_matching(
+            volumes[positions], prices[positions], method=method
+        )
+
+    profit_and_loss_overview = pd.DataFrame(
+        {"PnL": pnl}, index=transactions_overview.index
+    )
+    profit_and_loss_overview["Cumulative PnL"] = profit_and_loss_overview[
+        "PnL"
+    ].cumsum()
+
+    return profit_and_loss_overview
@@ -6,9 +6,11 @@ from importlib import resources
 
 import pandas as pd
 
+from financetoolkit.helpers import round_dataset
 from financetoolkit.portfolio import helpers, overview_model, portfolio_model
 from financetoolkit.toolkit_controller import Toolkit
 from financetoolkit.utilities import logger_model
+from financetoolkit.utilities.metrics_model import measure_methods
 
 logger = logger_model.get_logger()
 
@@ -17,6 +19,7 @@ logger = logger_model.get_logger()
 # ruff: noqa: E501
 
 
+@measure_methods
 class Portfolio:
     """
     A class for managing and analyzing your portfolio.
@@ -104,7 +107,11 @@ class Portfolio:
             )
         )
 
-        if not portfolio_dataset and not example:
+        if (
+            not isinstance(portfolio_dataset, pd.DataFrame)
+            and not portfolio_dataset
+            and not example
+        ):
             example = True
             logger.info(
                 "No portfolio dataset provided thus loading the example portfolio for demonstration purposes.\n"
@@ -868,7 +875,7 @@ class Portfolio:
                         else self._daily_currency_data[column]
                     )
 
-        self._daily_historical_data = round(
+        self._daily_historical_data = round_dataset(
             self._daily_historical_data, rounding if rounding else self._rounding
         )
 
@@ -1012,8 +1019,8 @@ class Portfolio:
                     f"Failed to create positions overview due to {error}"
                 ) from error
 
-        self._positions_overview = self._positions_overview.round(
-            rounding if rounding else self._rounding
+        self._positions_overview = round_dataset(
+            self._positions_overview, rounding if rounding else self._rounding
         )
 
         return self._positions_overview
@@ -1174,8 +1181,8 @@ class Portfolio:
                 self._portfolio_overview["Volume"] > 0
             ]
 
-        self._portfolio_overview = self._portfolio_overview.round(
-            rounding if rounding else self._rounding
+        self._portfolio_overview = round_dataset(
+            self._portfolio_overview, rounding if rounding else self._rounding
         )
 
         return self._portfolio_overview
@@ -1305,8 +1312,8 @@ class Portfolio:
                 self._portfolio_performance["Volume"] > 0
             ]
 
-        self._portfolio_performance = self._portfolio_performance.round(
-            rounding if rounding else self._rounding
+        self._portfolio_performance = round_dataset(
+            self._portfolio_performance, rounding if rounding else self._rounding
         )
 
         return self._portfolio_performance
@@ -1445,8 +1452,8 @@ class Portfolio:
                 self._transactions_overview["Volume"] > 0
             ]
 
-        self._transactions_overview = self._transactions_overview.round(
-            rounding if rounding else self._rounding
+        self._transactions_overview = round_dataset(
+            self._transactions_overview, rounding if rounding else self._rounding
         )
 
         return self._transactions_overview
@@ -1591,8 +1598,8 @@ class Portfolio:
                 self._transactions_performance["Volume"] > 0
             ]
 
-        self._transactions_performance = self._transactions_performance.round(
-            rounding if rounding else self._rounding
+        self._transactions_performance = round_dataset(
+            self._transactions_performance, rounding if rounding else self._rounding
         )
 
         return self._transactions_performance
@@ -226,8 +226,10 @@ def format_portfolio_dataset(
         ValueError: If the currency column contains values other than 3-letter currency codes.
         ValueError: If the provided currency code is not a 3-letter code.
     """
-    # Clean trailing spaces if applicable
-    dataset.columns = [column.strip() for column in dataset.columns]
+    # Clean trailing spaces if applicable and match the column names case-insensitively
+    # as is done when reading the portfolio dataset from a file. The columns are renamed
+    # on a new DataFrame so that a DataFrame passed to the Portfolio is never altered.
+    dataset = dataset.rename(columns=lambda column: column.strip().lower())
 
     date_columns = [column.lower() for column in date_columns]
     date_column_match = [column for column in date_columns if column in dataset.columns]
@@ -0,0 +1,155 @@
+"""Custom Ratios Module"""
+
+__docformat__ = "google"
+
+import ast
+import operator
+import re
+from collections.abc import Callable
+
+import numpy as np
+
+# The operators that can be used in the formulas of the custom ratios. Given that the names
+# of the financial statement items contain spaces, any of these characters splits names.
+OPERATORS_PATTERN = re.compile(r"(\*\*|//|==|!=|>=|<=|[-+*/%<>()])")
+
+BINARY_OPERATORS: dict[type, Callable] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+UNARY_OPERATORS: dict[type, Callable] = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+COMPARISON_OPERATORS: dict[type, Callable] = {
+    ast.Lt: operator.lt,
+    ast.Gt: operator.gt,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.GtE: operator.ge,
+    ast.LtE: operator.le,
+}
+
+
+def compile_formula(formula: str) -> tuple[Callable, list[str]]:
+    """
+    Compiles the formula of a custom ratio, e.g. "(Working Capital / Net Income) * 100",
+    into a function. The names in the formula are resolved once and replaced by the
+    arguments of the function in the order these are returned.
+
+    Args:
+        formula (str): the formula of the custom ratio.
+
+    Raises:
+        ValueError: If the formula can not be parsed or uses unsupported operations.
+
+    Returns:
+        tuple[Callable, list[str]]: the function that calculates the custom ratio and the
+            names of the items it requires.
+    """
+    names: list[str] = []
+    expression = ""
+
+    for section in OPERATORS_PATTERN.split(formula):
+        section_stripped = section.strip()
+
+        if not section_stripped or OPERATORS_PATTERN.fullmatch(section_stripped):
+            expression += f" {section_stripped}"
+            continue
+
+        try:
+            expression += f" {float(section_stripped)!r}"
+        except ValueError:
+            if section_stripped not in names:
+                names.append(section_stripped)
+
+            expression += f" _{names.index(section_stripped)}"
+
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as error:
+        raise ValueError(f"The formula {formula} is not a valid formula.") from error
+
+    calculate = compile_expression(tree.body, formula)
+
+    return lambda *values: calculate(values), names
+
+
+def compile_expression(node: ast.AST, formula: str) -> Callable:
+    """
+    Compiles a node of the parsed formula into a function that receives the values of
+    the items in the formula. Only arithmetic and single comparisons are supported.
+
+    Args:
+        node (ast.AST): the node of the parsed formula.
+        formula (str): the formula, used to report unsupported operations.
+
+    Raises:
+        ValueError: If the node is an unsupported operation.
+
+    Returns:
+        Callable: the function that calculates the value of the node.
+    """
+    if isinstance(node, ast.Constant) and isinstance(node.value, float):
+        value = node.value
+
+        return lambda _: value
+
+    if isinstance(node, ast.Name):
+        position = int(node.id[1:])
+
+        return lambda values: values[position]
+
+    if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPERATORS:
+        binary_operator = BINARY_OPERATORS[type(node.op)]
+        left = compile_expression(node.left, formula)
+        right = compile_expression(node.right, formula)
+
+        return lambda values: binary_operator(left(values), right(values))
+
+    if isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPERATORS:
+        unary_operator = UNARY_OPERATORS[type(node.op)]
+        operand = compile_expression(node.operand, formula)
+
+        return lambda values: unary_operator(operand(values))
+
+    if (
+        isinstance(node, ast.Compare)
+        and len(node.ops) == 1
+        and type(node.ops[0]) in COMPARISON_OPERATORS
+    ):
+        comparison_operator = COMPARISON_OPERATORS[type(node.ops[0])]
+        left = compile_expression(node.left, formula)
+        right = compile_expression(node.comparators[0], formula)
+
+        return lambda values: comparison_operator(left(values), right(values))
+
+    raise ValueError(
+        f"The formula {formula} contains an unsupported operation ({ast.unparse(node)})."
+    )
+
+
+def calculate_custom_ratio(
+    function: Callable, shape: tuple[int, int], *values: np.ndarray
+) -> np.ndarray:
+    """
+    Calculates a custom ratio for all tickers and periods at once. Divisions by zero
+    result in infinite values and comparisons in 1 (True) or 0 (False).
+
+    Args:
+        function (Callable): the function as returned by compile_formula.
+        shape (tuple[int, int]): the number of tickers and periods, used when the
+            formula only contains numbers.
+        *values (np.ndarray): the values of the items with the tickers as rows and the
+            periods as columns.
+
+    Returns:
+        np.ndarray: the custom ratio with the tickers as rows and the periods as columns.
+    """
+    with np.errstate(all="ignore"):
+        return np.broadcast_to(np.asarray(function(*values), dtype=np.float64), shape)
@@ -0,0 +1,112 @@
+"""Graph Module"""
+
+__docformat__ = "google"
+
+import graphlib
+from collections.abc import Callable
+
+import pandas as pd
+
+
+class RatioGraph:
+    """
+    The Ratio Graph contains the intermediates that the ratios are calculated from, e.g. a
+    statement item, its trailing sum or its average, together with the intermediates that
+    each of these depends on. Requesting intermediates results in a plan that orders all of
+    the dependencies topologically so that each intermediate is evaluated exactly once. By
+    providing a cache, the evaluated intermediates are shared between consecutive requests.
+    """
+
+    def __init__(self):
+        """
+        Initializes the Ratio Graph Class.
+        """
+        self._nodes: dict[str, tuple[Callable, tuple[str, ...]]] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def add_node(
+        self, name: str, function: Callable, inputs: list[str] | None = None
+    ) -> None:
+        """
+        Adds an intermediate to the graph. The function is called with the values of the
+        inputs, in the order these are defined, once the intermediate is evaluated.
+
+        Args:
+            name (str): the name of the intermediate.
+            function (Callable): the function that calculates the intermediate.
+            inputs (list[str] | None): the names of the intermediates the function depends
+                on. Defaults to None which means the intermediate has no dependencies.
+        """
+        self._nodes[name] = (function, tuple(inputs) if inputs else ())
+
+    def plan(self, names: list[str]) -> list[str]:
+        """
+        Determines the order in which the intermediates need to be evaluated to obtain
+        the requested intermediates. Only the intermediates the request depends on are
+        included and dependencies always precede the intermediates that require them.
+
+        Args:
+            names (list[str]): the names of the requested intermediates.
+
+        Raises:
+            ValueError: If an intermediate is not part of the graph or when the
+                dependencies are circular.
+
+        Returns:
+            list[str]: the intermediates in the order these are evaluated.
+        """
+        sorter: graphlib.TopologicalSorter = graphlib.TopologicalSorter()
+        pending = list(names)
+        visited = set()
+
+        while pending:
+            name = pending.pop()
+
+            if name in visited:
+                continue
+
+            if name not in self._nodes:
+                raise ValueError(f"The intermediate {name} is not part of the graph.")
+
+            visited.add(name)
+            inputs = self._nodes[name][1]
+
+            sorter.add(name, *inputs)
+            pending.extend(inputs)
+
+        try:
+            return list(sorter.static_order())
+        except graphlib.CycleError as error:
+            raise ValueError(
+                f"The intermediates {', '.join(error.args[1])} depend on each other."
+            ) from error
+
+    def evaluate(
+        self, names: list[str], cache: dict[str, pd.DataFrame] | None = None
+    ) -> list[pd.DataFrame]:
+        """
+        Evaluates the requested intermediates following the plan. Intermediates that are
+        already part of the cache are not evaluated again and the evaluated intermediates
+        are added to the cache.
+
+        Args:
+            names (list[str]): the names of the requested intermediates.
+            cache (dict[str, pd.DataFrame] | None): the previously evaluated intermediates.
+                Defaults to None which means nothing is shared between requests.
+
+        Returns:
+            list[pd.DataFrame]: the values of the requested intermediates.
+        """
+        values = {} if cache is None else cache
+
+        for name in self.plan(names):
+            if name not in values:
+                function, inputs = self._nodes[name]
+                values[name] = function(*[values[input_name] for input_name in inputs])
+
+        return [values[name] for name in names]
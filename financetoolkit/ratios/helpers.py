@@ -1,5 +1,6 @@
 """Ratios Helper Module"""
 
+import numpy as np
 import pandas as pd
 
 
@@ -17,22 +18,61 @@ def map_period_data_to_daily_data(
     Returns:
         pandas.DataFrame: Daily values aligned with daily dates.
     """
-    daily_period = pd.DataFrame(columns=period_data.index, index=daily_dates)
+    frequency = "Q" if quarterly else "Y"
 
-    # Convert the dates to Quarterly or Yearly periods
-    daily_period.index = pd.PeriodIndex(
-        daily_period.index, freq="Q" if quarterly else "Y"
+    # When a period occurs more than once, the last occurrence is used
+    period_data = period_data.loc[:, ~period_data.columns.duplicated(keep="last")]
+    periods = (
+        period_data.columns
+        if isinstance(period_data.columns, pd.PeriodIndex)
+        else pd.PeriodIndex(period_data.columns, freq=frequency)
     )
 
-    # Fill the results into the daily_period DataFrame
-    for period in period_data.columns:
-        if period in daily_period.index:
-            daily_period.loc[period, :] = period_data[period].to_numpy()
+    # The values are selected and filled once per period of the (sorted) daily dates after
+    # which each daily date receives the values of the period it belongs to
+    daily_positions, daily_periods = pd.factorize(
+        pd.PeriodIndex(daily_dates, freq=frequency)
+    )
+    positions = periods.get_indexer(daily_periods)
+    available = positions >= 0
+
+    values = np.full((len(daily_periods), len(period_data.index)), np.nan)
+    values[available] = period_data.to_numpy(dtype=np.float64).T[positions[available]]
 
     # Fill missing values using backward and forward fill
-    daily_period = daily_period.astype(float).bfill().ffill()
+    values = pd.DataFrame(values).bfill().ffill().to_numpy()
+
+    return pd.DataFrame(
+        values[daily_positions], index=daily_dates, columns=period_data.index
+    )
+
+
+def calculate_trailing_values(
+    dataset: pd.DataFrame, window: int, method: str = "sum"
+) -> pd.DataFrame:
+    """
+    Calculates the trailing sum or mean over the columns, e.g. the periods of a financial
+    statement, for all rows at once. This equals `dataset.T.rolling(window).sum().T` (or
+    `.mean()`) which means the first columns, and any window that contains a missing value,
+    are NaN. Where the latter rolls over each row separately, this is a single vectorized pass.
+
+    Args:
+        dataset (pandas.DataFrame): The dataset, e.g. a financial statement with the periods
+            as columns.
+        window (int): The number of periods to include, e.g. 4 for the TTM of quarterly data.
+        method (str, optional): Whether to calculate the "sum" or the "mean". Defaults to "sum".
+
+    Returns:
+        pandas.DataFrame: The trailing values.
+    """
+    values = dataset.to_numpy(dtype=np.float64)
+    trailing_values = np.full(values.shape, np.nan)
+
+    if 0 < window <= values.shape[1]:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=1)
 
-    # Restore original daily date index
-    daily_period.index = daily_dates
+        trailing_values[:, window - 1 :] = (
+            windows.mean(axis=2) if method == "mean" else windows.sum(axis=2)
+        )
 
-    return daily_period
+    return pd.DataFrame(trailing_values, index=dataset.index, columns=dataset.columns)
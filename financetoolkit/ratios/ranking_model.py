@@ -0,0 +1,70 @@
+"""Ranking Module"""
+
+__docformat__ = "google"
+
+import numpy as np
+import pandas as pd
+
+RANKING_MEASURES = ["Rank", "Percentile", "Z-Score"]
+
+
+def get_cross_sectional_rankings(
+    ratios: pd.DataFrame, groups: pd.Series | None = None
+) -> pd.DataFrame:
+    """
+    Calculate the rank, percentile and z-score of each ratio for each period across all
+    tickers, optionally within groups of tickers such as sectors or industries. The
+    highest value receives rank 1, the percentile is the share of tickers with a value
+    equal to or lower than the value and the z-score is the amount of standard deviations
+    the value is removed from the mean of the group.
+
+    All rankings are calculated at once by grouping the rows on the ratio (and group)
+    rather than ranking the tickers of each ratio and period separately. Infinite values
+    are not ranked and tickers without a group are excluded from the rankings.
+
+    Args:
+        ratios (pd.DataFrame): the ratios with the tickers and ratio names as index and
+            the periods as columns, as returned by collect_all_ratios.
+        groups (pd.Series | None): the group of each ticker, e.g. the sector, with the
+            tickers as index. Defaults to None which ranks across all tickers.
+
+    Returns:
+        pd.DataFrame: the rankings with the tickers, ratio names and the measures (Rank,
+            Percentile and Z-Score) as index and the periods as columns.
+    """
+    values = ratios.astype(np.float64).replace([np.inf, -np.inf], np.nan)
+    keys = [values.index.get_level_values(1)]
+
+    if groups is not None:
+        keys.append(groups.reindex(values.index.get_level_values(0)).to_numpy())
+
+    grouped_values = values.groupby(keys, sort=False, dropna=True)
+
+    rank = grouped_values.rank(method="min", ascending=False).to_numpy()
+    count = grouped_values.transform("count").to_numpy()
+    mean = grouped_values.transform("mean").to_numpy()
+    standard_deviation = grouped_values.transform("std").to_numpy()
+
+    rankings = np.stack(
+        [
+            rank,
+            (count - rank + 1) / count,
+            (values.to_numpy() - mean) / standard_deviation,
+        ],
+        axis=1,
+    )
+
+    # The measures are added as the last level of the index by repeating the codes of
+    # the existing levels which is considerably faster than recreating the index
+    index = pd.MultiIndex(
+        levels=[*values.index.levels, RANKING_MEASURES],
+        codes=[
+            *[codes.repeat(len(RANKING_MEASURES)) for codes in values.index.codes],
+            np.tile(np.arange(len(RANKING_MEASURES)), len(values.index)),
+        ],
+        verify_integrity=False,
+    )
+
+    return pd.DataFrame(
+        rankings.reshape(len(index), -1), index=index, columns=values.columns
+    )
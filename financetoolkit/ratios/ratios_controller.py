@@ -4,21 +4,34 @@ __docformat__ = "google"
 
 
 import warnings
+from functools import partial
 
 import numpy as np
 import pandas as pd
 
-from financetoolkit.helpers import calculate_growth, handle_portfolio
+from financetoolkit.helpers import calculate_growth, handle_portfolio, round_dataset
 from financetoolkit.ratios import (
+    custom_model,
     efficiency_model,
     liquidity_model,
     profitability_model,
+    ranking_model,
     solvency_model,
     valuation_model,
 )
-from financetoolkit.ratios.helpers import map_period_data_to_daily_data
-from financetoolkit.utilities import logger_model
+from financetoolkit.ratios.graph_model import RatioGraph
+from financetoolkit.ratios.helpers import (
+    calculate_trailing_values,
+    map_period_data_to_daily_data,
+)
+from financetoolkit.utilities import (
+    logger_model,
+    long_format_model,
+    parallel_model,
+)
+from financetoolkit.utilities.cache_model import share_intermediates
 from financetoolkit.utilities.error_model import handle_errors
+from financetoolkit.utilities.metrics_model import measure_methods
 
 logger = logger_model.get_logger()
 
@@ -27,9 +40,57 @@ logger = logger_model.get_logger()
 # for financial analysis purposes not an issue and should not be considered as a bug.
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
+# The financial statement items the ratios are calculated from. Over a trailing period,
+# the balance sheet items are averaged while the other items are summed.
+STATEMENT_ITEMS = {
+    "_balance_sheet_statement": [
+        "Cash and Cash Equivalents",
+        "Short Term Investments",
+        "Accounts Receivable",
+        "Inventory",
+        "Total Current Assets",
+        "Goodwill",
+        "Intangible Assets",
+        "Fixed Assets",
+        "Total Assets",
+        "Accounts Payable",
+        "Total Current Liabilities",
+        "Total Debt",
+        "Net Debt",
+        "Total Liabilities",
+        "Preferred Stock",
+        "Total Shareholder Equity",
+        "Total Equity",
+        "Minority Interest",
+    ],
+    "_income_statement": [
+        "Revenue",
+        "Cost of Goods Sold",
+        "Selling, General and Administrative Expenses",
+        "Operating Expenses",
+        "Interest Expense",
+        "EBITDA",
+        "Operating Income",
+        "Income Before Tax",
+        "Income Tax Expense",
+        "Net Income",
+        "Weighted Average Shares",
+        "Weighted Average Shares Diluted",
+    ],
+    "_cash_flow_statement": [
+        "Depreciation and Amortization",
+        "Cash Flow from Operations",
+        "Preferred Dividends Paid",
+        "Dividends Paid",
+        "Capital Expenditure",
+        "Free Cash Flow",
+    ],
+}
+
 # pylint: disable=too-many-lines,too-many-instance-attributes,too-many-public-methods,too-many-locals,eval-used
 
 
+@measure_methods
 class Ratios:
     """
     The Ratios Module contains over 50+ ratios that can be used to analyse companies.
@@ -47,6 +108,7 @@ class Ratios:
         cash: pd.DataFrame,
         quarterly: bool = False,
         rounding: int | None = 4,
+        profile: pd.DataFrame | None = None,
     ):
         """
         Initializes the Ratios Controller Class.
@@ -61,6 +123,9 @@ class Ratios:
             an optional parameter given that you can also define the custom ratios through the Toolkit initialization.
             quarterly (bool, optional): Whether to use quarterly data. Defaults to False.
             rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            profile (pd.DataFrame, optional): The profile data of the tickers, as obtained with
+                the get_profile function of the Toolkit, used to rank the ratios by sector or
+                industry. Defaults to None.
 
         As an example:
 
@@ -108,6 +173,14 @@ class Ratios:
         self._rounding: int | None = rounding
         self._quarterly: bool = quarterly
         self._portfolio_weights: dict | None = None
+        self._profile: pd.DataFrame = profile if profile is not None else pd.DataFrame()
+
+        # Initialization of the Ratio Graph and the Intermediates shared between Ratios
+        self._ratio_graphs: dict[int | None, RatioGraph] = {}
+        self._intermediates: dict[int | None, dict[str, pd.DataFrame]] | None = None
+        self._daily_intermediates: dict[
+            tuple[str, bool], tuple[pd.DataFrame, pd.DataFrame]
+        ] = {}
 
         # Initialization of Historical Data
         self._historical_data: pd.DataFrame = historical["period"]
@@ -127,6 +200,215 @@ class Ratios:
         self._valuation_ratios: pd.DataFrame = pd.DataFrame()
         self._valuation_ratios_growth: pd.DataFrame = pd.DataFrame()
 
+        # The arguments and datasets that each of the above ratios were collected with,
+        # which determines whether these can be reused by the collect methods
+        self._collected_arguments: dict[str, tuple[tuple, dict]] = {}
+
+    def _get_collected_datasets(self) -> tuple:
+        """
+        Returns the datasets that the ratios are calculated from.
+
+        Returns:
+            tuple: The financial statements and the historical data.
+        """
+        return (
+            self._balance_sheet_statement,
+            self._income_statement,
+            self._cash_flow_statement,
+            self._historical_data,
+            self._daily_historical_data,
+        )
+
+    def _set_collected_arguments(self, category: str, arguments: dict) -> None:
+        """
+        Records the arguments, and the datasets, that the ratios of a category (e.g.
+        "_efficiency_ratios" or "_all_ratios") were collected with.
+
+        Args:
+            category (str): The attribute that contains the collected ratios.
+            arguments (dict): The arguments the ratios were collected with.
+        """
+        self._collected_arguments[category] = (
+            self._get_collected_datasets(),
+            arguments,
+        )
+
+    def _is_collected(
+        self, category: str, arguments: dict, same_datasets: bool = True
+    ) -> bool:
+        """
+        Returns whether the ratios of a category were collected with the given arguments
+        and, optionally, from the current datasets. Only then the ratios can be reused.
+
+        Args:
+            category (str): The attribute that contains the collected ratios.
+            arguments (dict): The arguments the ratios are requested with.
+            same_datasets (bool, optional): Whether the ratios should also have been
+                collected from the current datasets. Defaults to True.
+
+        Returns:
+            bool: Whether the collected ratios can be reused.
+        """
+        if getattr(self, category).empty or category not in self._collected_arguments:
+            return False
+
+        datasets, collected_arguments = self._collected_arguments[category]
+
+        return collected_arguments == arguments and (
+            not same_datasets
+            or all(
+                dataset is collected_dataset
+                for dataset, collected_dataset in zip(
+                    self._get_collected_datasets(), datasets, strict=True
+                )
+            )
+        )
+
+    def _get_category_arguments(
+        self,
+        include_dividends: bool,
+        diluted: bool,
+        days: int | float,
+        trailing: int | None,
+    ) -> dict[str, dict]:
+        """
+        Returns the arguments that collect_all_ratios collects each category with.
+
+        Args:
+            include_dividends (bool): Whether to include dividends in the calculations.
+            diluted (bool): Whether to use diluted shares for the calculation.
+            days (int | float): The number of days to use for the calculation.
+            trailing (int | None): The trailing period.
+
+        Returns:
+            dict[str, dict]: The arguments of each category.
+        """
+        return {
+            "_efficiency_ratios": {
+                "days": days,
+                "rounding": None,
+                "trailing": trailing,
+            },
+            "_liquidity_ratios": {"rounding": None, "trailing": trailing},
+            "_profitability_ratios": {"rounding": None, "trailing": trailing},
+            "_solvency_ratios": {
+                "diluted": diluted,
+                "rounding": None,
+                "trailing": trailing,
+            },
+            "_valuation_ratios": {
+                "include_dividends": include_dividends,
+                "diluted": diluted,
+                "rounding": None,
+                "trailing": trailing,
+            },
+        }
+
+    def _get_ratio_graph(self, trailing: int | None = None) -> RatioGraph:
+        """
+        Creates the graph of the intermediates for the given trailing period. Each statement
+        item is accompanied by its average over two periods and, when a trailing period is
+        defined, its trailing value which is prefixed with "Average" and "Trailing" respectively.
+        Both are calculated from the statement item, which is therefore declared as their input.
+
+        Args:
+            trailing (int | None, optional): The trailing period. Defaults to None.
+
+        Returns:
+            RatioGraph: The graph of the intermediates.
+        """
+        if trailing in self._ratio_graphs:
+            return self._ratio_graphs[trailing]
+
+        graph = RatioGraph()
+
+        for statement, items in STATEMENT_ITEMS.items():
+            method = "mean" if statement == "_balance_sheet_statement" else "sum"
+
+            for item in items:
+                graph.add_node(
+                    item,
+                    lambda statement=statement, item=item: getattr(self, statement).loc[
+                        :, item, :
+                    ],
+                )
+                graph.add_node(
+                    f"Average {item}",
+                    partial(calculate_trailing_values, window=2, method="mean"),
+                    inputs=[item],
+                )
+
+                if trailing:
+                    graph.add_node(
+                        f"Trailing {item}",
+                        partial(
+                            calculate_trailing_values, window=trailing, method=method
+                        ),
+                        inputs=[item],
+                    )
+
+        self._ratio_graphs[trailing] = graph
+
+        return graph
+
+    def _get_intermediate(self, name: str, trailing: int | None = None) -> pd.DataFrame:
+        """
+        Evaluates an intermediate, e.g. "Revenue", "Average Total Assets" or "Trailing Revenue",
+        together with the intermediates it depends on. Within the collect methods, these are
+        cached so that intermediates shared between ratios are only evaluated once.
+
+        Args:
+            name (str): The name of the intermediate.
+            trailing (int | None, optional): The trailing period. Defaults to None.
+
+        Returns:
+            pd.DataFrame: The intermediate with the tickers as index and the periods as columns.
+        """
+        cache = (
+            self._intermediates.setdefault(trailing, {})
+            if self._intermediates is not None
+            else None
+        )
+
+        return self._get_ratio_graph(trailing).evaluate([name], cache)[0]
+
+    def _get_daily_intermediate(self, name: str, daily_dates: pd.Index) -> pd.DataFrame:
+        """
+        Maps a statement item, e.g. "Revenue", to the daily dates of the historical data. The
+        mapped item is reused for each daily ratio until the financial statement it is based
+        on is replaced or different daily dates are requested.
+
+        Args:
+            name (str): The name of the statement item.
+            daily_dates (pd.Index): The daily dates to map the statement item to.
+
+        Returns:
+            pd.DataFrame: The statement item with the daily dates as index and the tickers
+                as columns.
+        """
+        statement = next(
+            statement for statement, items in STATEMENT_ITEMS.items() if name in items
+        )
+        dataset = getattr(self, statement)
+        key = (name, self._quarterly)
+
+        if key in self._daily_intermediates:
+            cached_dataset, daily_data = self._daily_intermediates[key]
+
+            if cached_dataset is dataset and daily_data.index.equals(daily_dates):
+                return daily_data
+
+        daily_data = map_period_data_to_daily_data(
+            period_data=self._get_intermediate(name),
+            daily_dates=daily_dates,
+            quarterly=self._quarterly,
+        )
+
+        self._daily_intermediates[key] = (dataset, daily_data)
+
+        return daily_data
+
+    @share_intermediates
     def collect_all_ratios(
         self,
         include_dividends: bool = False,
@@ -136,6 +418,9 @@ class Ratios:
         growth: bool = False,
         lag: int | list[int] = 1,
         trailing: int | None = None,
+        n_jobs: int | None = None,
+        incremental: bool = False,
+        long_format: bool = False,
     ) -> pd.Series | pd.DataFrame:
         """
         Calculates and collects all ratios based on the provided data.
@@ -151,6 +436,16 @@ class Ratios:
             lag (int | str, optional): The lag to use for the growth calculation. Defaults to 1.
             trailing (int): Defines whether to select a trailing period.
             E.g. when selecting 4 with quarterly data, the TTM is calculated.
+            n_jobs (int | None, optional): The number of processes to divide the tickers over. A negative
+            number is subtracted from the number of CPU cores, e.g. -1 uses all cores. Defaults to None
+            which means the ratios are calculated within the current process.
+            incremental (bool, optional): Whether to only calculate the periods that are not yet part
+            of the previously collected ratios, e.g. after a new quarter is added to the financial
+            statements with update_financial_statements. When the previous ratios were collected
+            with other arguments, all periods are collected again. Defaults to False.
+            long_format (bool, optional): Whether to return the ratios in the long format with a row for
+            each ticker, ratio and period, which can be converted back with long_format_model.to_wide_format.
+            Defaults to False.
 
         Returns:
             pd.Series or pd.DataFrame: Ratios calculated based on the specified parameters.
@@ -173,31 +468,104 @@ class Ratios:
         if not days:
             days = 365 / 4 if self._quarterly else 365
 
-        if self._efficiency_ratios.empty:
+        category_arguments = self._get_category_arguments(
+            include_dividends=include_dividends,
+            diluted=diluted,
+            days=days,
+            trailing=trailing,
+        )
+
+        if incremental:
+            self._collect_new_periods(
+                include_dividends=include_dividends,
+                diluted=diluted,
+                days=days,
+                trailing=trailing,
+            )
+
+        # The categories that were collected before with the same arguments and datasets
+        # (e.g. after collecting incrementally) are reused and not collected again
+        shards = (
+            parallel_model.split_in_shards(self._tickers, n_jobs)
+            if not all(
+                self._is_collected(category, arguments)
+                for category, arguments in category_arguments.items()
+            )
+            else []
+        )
+
+        if shards:
+            ratio_categories = parallel_model.collect_in_parallel(
+                controller_class=Ratios,
+                arguments={
+                    "historical": {
+                        "period": self._historical_data,
+                        "daily": self._daily_historical_data,
+                    },
+                    "balance": self._balance_sheet_statement,
+                    "income": self._income_statement,
+                    "cash": self._cash_flow_statement,
+                    "quarterly": self._quarterly,
+                    "rounding": self._rounding,
+                },
+                method="collect_all_ratios",
+                method_arguments={
+                    "include_dividends": include_dividends,
+                    "diluted": diluted,
+                    "days": days,
+                    "rounding": rounding,
+                    "trailing": trailing,
+                },
+                shards=shards,
+                axis=0,
+                attributes=[
+                    "_efficiency_ratios",
+                    "_liquidity_ratios",
+                    "_profitability_ratios",
+                    "_solvency_ratios",
+                    "_valuation_ratios",
+                ],
+            )
+
+            for attribute, ratios in ratio_categories.items():
+                setattr(self, attribute, ratios)
+                self._set_collected_arguments(attribute, category_arguments[attribute])
+
+        if not self._is_collected(
+            "_efficiency_ratios", category_arguments["_efficiency_ratios"]
+        ):
             self.collect_efficiency_ratios(days=days, trailing=trailing)
-        if self._liquidity_ratios.empty:
+        if not self._is_collected(
+            "_liquidity_ratios", category_arguments["_liquidity_ratios"]
+        ):
             self.collect_liquidity_ratios(trailing=trailing)
-        if self._profitability_ratios.empty:
+        if not self._is_collected(
+            "_profitability_ratios", category_arguments["_profitability_ratios"]
+        ):
             self.collect_profitability_ratios(trailing=trailing)
-        if self._solvency_ratios.empty:
+        if not self._is_collected(
+            "_solvency_ratios", category_arguments["_solvency_ratios"]
+        ):
             self.collect_solvency_ratios(diluted=diluted, trailing=trailing)
-        if self._valuation_ratios.empty:
+        if not self._is_collected(
+            "_valuation_ratios", category_arguments["_valuation_ratios"]
+        ):
             self.collect_valuation_ratios(
                 include_dividends=include_dividends, diluted=diluted, trailing=trailing
             )
 
-        self._all_ratios = pd.concat(
-            [
-                self._efficiency_ratios,
-                self._liquidity_ratios,
-                self._profitability_ratios,
-                self._solvency_ratios,
-                self._valuation_ratios,
-            ]
-        )
+        ratio_categories = [
+            self._efficiency_ratios,
+            self._liquidity_ratios,
+            self._profitability_ratios,
+            self._solvency_ratios,
+            self._valuation_ratios,
+        ]
+
+        self._all_ratios = pd.concat(ratio_categories)
 
-        self._all_ratios = self._all_ratios.round(
-            rounding if rounding else self._rounding
+        self._all_ratios = round_dataset(
+            self._all_ratios, rounding if rounding else self._rounding
         )
 
         # In case sorting accidentally fails, the index is sorted again
@@ -209,6 +577,17 @@ class Ratios:
         ]
         self._all_ratios = self._all_ratios.reindex(available_columns, axis=1)
 
+        self._set_collected_arguments(
+            "_all_ratios",
+            {
+                "include_dividends": include_dividends,
+                "diluted": diluted,
+                "days": days,
+                "rounding": rounding,
+                "trailing": trailing,
+            },
+        )
+
         if growth:
             self._all_ratios_growth = calculate_growth(
                 self._all_ratios,
@@ -217,6 +596,13 @@ class Ratios:
                 axis="columns",
             )
 
+        if long_format:
+            # The long format is created after the ratios are stored so that the other
+            # methods, e.g. rank and collect_custom_ratios, reuse these regardless of the format
+            return long_format_model.collect_long_format(
+                [self._all_ratios_growth if growth else self._all_ratios]
+            )
+
         if len(self._tickers) == 1:
             return (
                 self._all_ratios_growth.loc[self._tickers[0]]
@@ -226,6 +612,153 @@ class Ratios:
 
         return self._all_ratios_growth if growth else self._all_ratios
 
+    def update_financial_statements(
+        self,
+        balance: pd.DataFrame | None = None,
+        income: pd.DataFrame | None = None,
+        cash: pd.DataFrame | None = None,
+        historical: pd.DataFrame | None = None,
+    ) -> None:
+        """
+        Replaces the financial statements and, optionally, the historical data of each period,
+        e.g. once a new quarter is reported. The previously collected ratios are kept so that
+        collect_all_ratios(incremental=True) only calculates the periods that were added.
+
+        Args:
+            balance (pd.DataFrame | None, optional): The balance sheet statement. Defaults to None.
+            income (pd.DataFrame | None, optional): The income statement. Defaults to None.
+            cash (pd.DataFrame | None, optional): The cash flow statement. Defaults to None.
+            historical (pd.DataFrame | None, optional): The historical data of each period.
+                Defaults to None.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(["AAPL", "TSLA"], api_key="FINANCIAL_MODELING_PREP_KEY", quarterly=True)
+
+        ratios = toolkit.ratios
+        ratios.collect_all_ratios()
+
+        # Once a new quarter is reported, only the new quarter is calculated
+        ratios.update_financial_statements(
+            balance=new_balance, income=new_income, cash=new_cash
+        )
+        ratios.collect_all_ratios(incremental=True)
+        ```
+        """
+        if balance is not None:
+            self._balance_sheet_statement = balance
+        if income is not None:
+            self._income_statement = income
+        if cash is not None:
+            self._cash_flow_statement = cash
+        if historical is not None:
+            self._historical_data = historical
+
+    def _collect_new_periods(
+        self,
+        include_dividends: bool,
+        diluted: bool,
+        days: int | float,
+        trailing: int | None,
+    ) -> None:
+        """
+        Calculates the ratios of the periods that are not yet part of the collected ratios and
+        adds these to each category. Only the new periods and the preceding periods that the
+        averages and trailing values of the new periods depend on are calculated.
+
+        The collected ratios are only extended when these were collected with the same
+        arguments. Otherwise, or when there are no new periods while the financial statements
+        were replaced, nothing is added and collect_all_ratios collects all periods again.
+
+        Args:
+            include_dividends (bool): Whether to include dividends in the calculations.
+            diluted (bool): Whether to use diluted shares for the calculation.
+            days (int | float): The number of days to use for the calculation.
+            trailing (int | None): The trailing period.
+        """
+        category_arguments = self._get_category_arguments(
+            include_dividends=include_dividends,
+            diluted=diluted,
+            days=days,
+            trailing=trailing,
+        )
+        categories = list(category_arguments)
+
+        if not all(
+            self._is_collected(category, arguments, same_datasets=False)
+            for category, arguments in category_arguments.items()
+        ):
+            return
+
+        # Only the periods after the last collected period are new given that periods
+        # without any values (e.g. the first trailing periods) are not collected
+        periods = self._income_statement.columns
+        first_new_period = (
+            max(
+                periods.get_indexer(getattr(self, category).columns).max()
+                for category in categories
+            )
+            + 1
+        )
+        new_periods = periods[first_new_period:]
+
+        if new_periods.empty:
+            return
+
+        # The averages and growth rates depend on the previous period and the trailing
+        # values on the previous trailing periods, of which the five year trailing growth
+        # of the Price-to-Earnings-Growth ratio reaches back the furthest
+        lookback = max(trailing if trailing else 1, 5 * 4 if self._quarterly else 5) + 1
+        required_periods = periods[max(first_new_period - lookback, 0) :]
+
+        ratios = Ratios(
+            tickers=self._tickers,
+            historical={
+                "period": self._historical_data,
+                "daily": self._daily_historical_data,
+            },
+            balance=self._balance_sheet_statement.loc[
+                :, self._balance_sheet_statement.columns.isin(required_periods)
+            ],
+            income=self._income_statement.loc[:, required_periods],
+            cash=self._cash_flow_statement.loc[
+                :, self._cash_flow_statement.columns.isin(required_periods)
+            ],
+            quarterly=self._quarterly,
+            rounding=self._rounding,
+            profile=self._profile,
+        )
+        ratios._portfolio_weights = self._portfolio_weights
+        ratios.collect_all_ratios(
+            include_dividends=include_dividends,
+            diluted=diluted,
+            days=days,
+            trailing=trailing,
+        )
+
+        for category in categories:
+            new_ratios = getattr(ratios, category)
+            collected_ratios = pd.concat(
+                [
+                    getattr(self, category),
+                    new_ratios.loc[:, new_ratios.columns.isin(new_periods)],
+                ],
+                axis=1,
+            )
+
+            setattr(
+                self,
+                category,
+                collected_ratios.reindex(
+                    [period for period in periods if period in collected_ratios],
+                    axis=1,
+                ),
+            )
+            self._set_collected_arguments(category, category_arguments[category])
+
     def collect_custom_ratios(
         self,
         custom_ratios_dict: dict | None = None,
@@ -240,6 +773,8 @@ class Ratios:
         Note that any of the following characters are considered as operators:
             +, -, *, /, **, %, //, <, >, ==, !=, >=, <=, (, )
         using any of the above characters as part of the column naming will result into an error.
+        Custom ratios can be used within other custom ratios regardless of the order in which
+        these are defined as long as the custom ratios do not depend on each other.
 
         Args:
             custom_ratios (dict): A dictionary containing the custom ratios to calculate.
@@ -326,112 +861,99 @@ class Ratios:
 
             return self._available_custom_ratios_options
 
-        custom_ratios = pd.DataFrame(
-            0,
-            index=pd.MultiIndex.from_product(
-                [self._tickers, custom_ratios_dict.keys()]  # type: ignore
-            ),
-            columns=self._balance_sheet_statement.columns,
-        )
+        sources = [
+            self._balance_sheet_statement,
+            self._income_statement,
+            self._cash_flow_statement,
+            self._all_ratios,
+        ]
+        source_items = [set(source.index.unique(level=1)) for source in sources]
+        columns = pd.concat([source.iloc[:0] for source in sources], axis=0).columns
+        shape = (len(self._tickers), len(columns))
+
+        def get_item(name: str) -> np.ndarray:
+            for source, items in zip(sources, source_items, strict=True):
+                if name in items:
+                    return (
+                        source.xs(name, level=1)
+                        .reindex(index=self._tickers, columns=columns)
+                        .to_numpy(dtype=np.float64)
+                    )
 
-        total_financials = pd.concat(
-            [
-                self._balance_sheet_statement,
-                self._income_statement,
-                self._cash_flow_statement,
-                self._all_ratios,
-                custom_ratios,
-            ],
-            axis=0,
-        )
+            return np.zeros(shape)
 
-        total_financials = total_financials[
-            ~total_financials.index.duplicated(keep="first")
-        ]
+        # Each custom ratio and each item it requires is a node in the graph so that
+        # the formulas are evaluated in the order of their dependencies and each item
+        # is only looked up once, regardless of how many formulas use it
+        graph = RatioGraph()
 
-        formula_dict = {}
         for name, formula in custom_ratios_dict.items():  # type: ignore
-            # Rearrange the formula dict in case a formula is dependent on another formula
-            # and the order would result into errors
-            for sub_name, sub_formula in custom_ratios_dict.items():  # type: ignore
-                if sub_name in formula:
-                    formula_dict[sub_name] = sub_formula
-
-            if name not in formula_dict:
-                formula_dict[name] = formula
-
-        for name, formula in formula_dict.items():
-            formula_names = formula
-
-            for operator in [
-                "+",
-                "-",
-                "*",
-                "/",
-                "**",
-                "%",
-                "//",
-                "<",
-                ">",
-                "==",
-                "!=",
-                ">=",
-                "<=",
-                "(",
-                ")",
-            ]:
-                formula_names = formula_names.replace(operator, "SPLIT")
-
-            formula_names = formula_names.split("SPLIT")
-
-            formula_names = [
-                clean_name
-                for clean_name in formula_names
-                if clean_name not in ["", " "]
-            ]
+            try:
+                function, formula_names = custom_model.compile_formula(formula)
+            except ValueError as error:
+                logger.error(
+                    "%s Use collect_custom_ratios(options=True) to see the available "
+                    "columns.",
+                    error,
+                )
+                graph.add_node(name, lambda: np.zeros(shape))
+                continue
 
-            formula_adjusted = formula
+            inputs = []
 
-            for formula_section in formula_names:
-                formula_section_stripped = formula_section.strip()
-                if formula_section_stripped in total_financials.index.get_level_values(
-                    1
+            for formula_name in formula_names:
+                if formula_name in custom_ratios_dict and formula_name != name:
+                    inputs.append(formula_name)
+                elif formula_name == name or any(
+                    formula_name in items for items in source_items
                 ):
-                    formula_adjusted = formula_adjusted.replace(
-                        formula_section_stripped,
-                        f"total_financials.loc[:, '{formula_section_stripped}', :]",
-                    )
+                    inputs.append(f"{formula_name} (Item)")
                 else:
-                    try:
-                        float(formula_section_stripped)
-                    except ValueError:
-                        formula_adjusted = None
-                        logger.error(
-                            "Column %s not found in total_financials and is not a number. "
-                            "Therefore the formula %s is invalid. Use collect_custom_ratios(options=True) "
-                            "to see the available columns.",
-                            formula_section_stripped,
-                            formula,
-                        )
-                        break
+                    logger.error(
+                        "Column %s is not found in the balance sheet statement, income statement, "
+                        "cash flow statement, ratios or custom ratios and is not a number. Therefore "
+                        "the formula %s is invalid. Use collect_custom_ratios(options=True) to see "
+                        "the available columns.",
+                        formula_name,
+                        formula,
+                    )
+                    inputs = None
+                    break
 
-            if formula_adjusted:
-                calculation = eval(formula_adjusted)  # noqa
+            if inputs is None:
+                graph.add_node(name, lambda: np.zeros(shape))
+                continue
 
-                total_financials.loc[:, name, :] = calculation.astype(
-                    np.float64
-                ).to_numpy()
+            for formula_name, node in zip(formula_names, inputs, strict=True):
+                if node not in graph and node != formula_name:
+                    graph.add_node(node, partial(get_item, formula_name))
 
-                self._custom_ratios = total_financials.loc[
-                    :, list(custom_ratios_dict.keys()), :  # type: ignore
-                ]
-                self._custom_ratios = self._custom_ratios.sort_index(
-                    axis=0, level=0, sort_remaining=False
-                )
+            graph.add_node(
+                name,
+                partial(custom_model.calculate_custom_ratio, function, shape),
+                inputs=inputs,
+            )
 
-                self._custom_ratios = self._custom_ratios.round(
-                    rounding if rounding else self._rounding
-                )
+        custom_ratio_names = list(custom_ratios_dict.keys())  # type: ignore
+
+        try:
+            custom_ratio_values = graph.evaluate(custom_ratio_names)
+        except ValueError as error:
+            logger.error("The custom ratios can not be calculated given that %s", error)
+            return None
+
+        self._custom_ratios = pd.DataFrame(
+            np.stack(custom_ratio_values, axis=1).reshape(-1, len(columns)),
+            index=pd.MultiIndex.from_product([self._tickers, custom_ratio_names]),
+            columns=columns,
+        )
+        self._custom_ratios = self._custom_ratios.sort_index(
+            axis=0, level=0, sort_remaining=False
+        )
+
+        self._custom_ratios = round_dataset(
+            self._custom_ratios, rounding if rounding else self._rounding
+        )
 
         if growth:
             self._custom_ratios_growth = calculate_growth(
@@ -451,6 +973,94 @@ class Ratios:
         return self._custom_ratios_growth if growth else self._custom_ratios
 
     @handle_errors
+    def rank(
+        self,
+        ratios: list[str] | None = None,
+        by: str | None = None,
+        rounding: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Ranks the ratios of each period across all tickers. For each ratio, the rank (1 being
+        the highest value), the percentile and the z-score (the amount of standard deviations
+        from the mean) are returned. When ranking by sector or industry, the tickers are only
+        compared with the tickers within the same sector or industry.
+
+        The rankings are based on the ratios as calculated with collect_all_ratios which is
+        called when the ratios are not yet available. Infinite values are not ranked.
+
+        Args:
+            ratios (list[str] | None, optional): The ratios to rank, e.g. ["Current Ratio",
+                "Return on Equity (ROE)"]. Defaults to None which ranks all ratios.
+            by (str | None, optional): Whether to rank within each "sector" or "industry" as
+                found in the profile data. Defaults to None which ranks across all tickers.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+
+        Returns:
+            pd.DataFrame: The rank, percentile and z-score of each ratio for each ticker.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "MSFT", "GOOGL", "AMZN"], api_key="FINANCIAL_MODELING_PREP_KEY"
+        )
+
+        toolkit.get_profile()
+
+        rankings = toolkit.ratios.rank(
+            ratios=["Current Ratio", "Return on Equity (ROE)"], by="sector"
+        )
+
+        rankings.loc["AAPL"]
+        ```
+        """
+        if self._all_ratios.empty:
+            self.collect_all_ratios()
+
+        groups = None
+
+        if by is not None:
+            if by.lower() not in ["sector", "industry"]:
+                raise ValueError(
+                    f"Ranking by {by} is not available, please choose between "
+                    "'sector' and 'industry'."
+                )
+
+            if self._profile.empty:
+                raise ValueError(
+                    "Ranking by sector or industry requires the profile data. Please "
+                    "obtain the profile data first with the get_profile function."
+                )
+
+            groups = self._profile.loc[by.capitalize()]
+
+        all_ratios = self._all_ratios.loc[self._tickers_without_portfolio]
+
+        if ratios is not None:
+            missing_ratios = [
+                ratio
+                for ratio in ratios
+                if ratio not in all_ratios.index.get_level_values(1)
+            ]
+
+            if missing_ratios:
+                raise ValueError(
+                    f"The ratios {', '.join(missing_ratios)} are not available. Use "
+                    "collect_all_ratios to see the available ratios."
+                )
+
+            all_ratios = all_ratios.loc[
+                all_ratios.index.get_level_values(1).isin(ratios)
+            ]
+
+        rankings = ranking_model.get_cross_sectional_rankings(all_ratios, groups)
+
+        return round_dataset(rankings, rounding if rounding else self._rounding)
+
+    @handle_errors
+    @share_intermediates
     def collect_efficiency_ratios(
         self,
         days: int | float | None = None,
@@ -543,8 +1153,8 @@ class Ratios:
         # Ensure the ticker order remains the same as in self._tickers
         self._efficiency_ratios = self._efficiency_ratios.loc[self._tickers]
 
-        self._efficiency_ratios = self._efficiency_ratios.round(
-            rounding if rounding else self._rounding
+        self._efficiency_ratios = round_dataset(
+            self._efficiency_ratios, rounding if rounding else self._rounding
         )
 
         # In case sorting accidentally fails, the index is sorted again
@@ -558,6 +1168,11 @@ class Ratios:
             available_columns, axis=1
         )
 
+        self._set_collected_arguments(
+            "_efficiency_ratios",
+            {"days": days, "rounding": rounding, "trailing": trailing},
+        )
+
         if growth:
             self._efficiency_ratios_growth = calculate_growth(
                 self._efficiency_ratios,
@@ -626,19 +1241,13 @@ class Ratios:
         """
         if trailing:
             asset_turnover_ratio = efficiency_model.get_asset_turnover_ratio(
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
-                self._balance_sheet_statement.loc[:, "Total Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate("Trailing Revenue", trailing=trailing),
+                self._get_intermediate("Trailing Total Assets", trailing=trailing),
             )
         else:
             asset_turnover_ratio = efficiency_model.get_asset_turnover_ratio(
-                self._income_statement.loc[:, "Revenue", :],
-                self._balance_sheet_statement.loc[:, "Total Assets", :]
-                .T.rolling(2)
-                .mean()
-                .T,
+                self._get_intermediate("Revenue"),
+                self._get_intermediate("Average Total Assets"),
             )
 
         if growth:
@@ -648,7 +1257,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return asset_turnover_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            asset_turnover_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -701,22 +1312,15 @@ class Ratios:
         """
         if trailing:
             inventory_turnover_ratio = efficiency_model.get_inventory_turnover_ratio(
-                self._income_statement.loc[:, "Cost of Goods Sold", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._balance_sheet_statement.loc[:, "Inventory", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate(
+                    "Trailing Cost of Goods Sold", trailing=trailing
+                ),
+                self._get_intermediate("Trailing Inventory", trailing=trailing),
             )
         else:
             inventory_turnover_ratio = efficiency_model.get_inventory_turnover_ratio(
-                self._income_statement.loc[:, "Cost of Goods Sold", :],
-                self._balance_sheet_statement.loc[:, "Inventory", :]
-                .T.rolling(2)
-                .mean()
-                .T,
+                self._get_intermediate("Cost of Goods Sold"),
+                self._get_intermediate("Average Inventory"),
             )
 
         if growth:
@@ -726,7 +1330,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return inventory_turnover_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            inventory_turnover_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -785,24 +1391,17 @@ class Ratios:
         if trailing:
             days_of_inventory_outstanding = (
                 efficiency_model.get_days_of_inventory_outstanding(
-                    self._balance_sheet_statement.loc[:, "Inventory", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
-                    self._income_statement.loc[:, "Cost of Goods Sold", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
+                    self._get_intermediate("Trailing Inventory", trailing=trailing),
+                    self._get_intermediate(
+                        "Trailing Cost of Goods Sold", trailing=trailing
+                    ),
                 )
             )
         else:
             days_of_inventory_outstanding = (
                 efficiency_model.get_days_of_inventory_outstanding(
-                    self._balance_sheet_statement.loc[:, "Inventory", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
-                    self._income_statement.loc[:, "Cost of Goods Sold", :],
+                    self._get_intermediate("Average Inventory"),
+                    self._get_intermediate("Cost of Goods Sold"),
                     days,
                 )
             )
@@ -814,8 +1413,8 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return days_of_inventory_outstanding.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            days_of_inventory_outstanding, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -875,19 +1474,15 @@ class Ratios:
 
         if trailing:
             days_of_sales_outstanding = efficiency_model.get_days_of_sales_outstanding(
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._get_intermediate(
+                    "Trailing Accounts Receivable", trailing=trailing
+                ),
+                self._get_intermediate("Trailing Revenue", trailing=trailing),
             )
         else:
             days_of_sales_outstanding = efficiency_model.get_days_of_sales_outstanding(
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(2)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Revenue", :],
+                self._get_intermediate("Average Accounts Receivable"),
+                self._get_intermediate("Revenue"),
                 days,
             )
 
@@ -898,7 +1493,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return days_of_sales_outstanding.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            days_of_sales_outstanding, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -955,41 +1552,31 @@ class Ratios:
 
         if trailing:
             days_of_inventory = efficiency_model.get_days_of_inventory_outstanding(
-                self._balance_sheet_statement.loc[:, "Inventory", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Cost of Goods Sold", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._get_intermediate("Trailing Inventory", trailing=trailing),
+                self._get_intermediate(
+                    "Trailing Cost of Goods Sold", trailing=trailing
+                ),
                 days,
             )
 
             days_of_sales = efficiency_model.get_days_of_sales_outstanding(
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .shift(axis=1)
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                calculate_trailing_values(
+                    self._get_intermediate("Accounts Receivable").shift(axis=1),
+                    trailing,
+                    "mean",
+                ),
+                self._get_intermediate("Trailing Revenue", trailing=trailing),
                 days,
             )
         else:
             days_of_inventory = efficiency_model.get_days_of_inventory_outstanding(
-                self._balance_sheet_statement.loc[:, "Inventory", :]
-                .T.rolling(2)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Cost of Goods Sold", :],
+                self._get_intermediate("Average Inventory"),
+                self._get_intermediate("Cost of Goods Sold"),
                 days,
             )
             days_of_sales = efficiency_model.get_days_of_sales_outstanding(
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(2)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Revenue", :],
+                self._get_intermediate("Average Accounts Receivable"),
+                self._get_intermediate("Revenue"),
                 days,
             )
 
@@ -1004,7 +1591,7 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return operating_cycle.round(rounding if rounding else self._rounding)
+        return round_dataset(operating_cycle, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -1057,24 +1644,19 @@ class Ratios:
         if trailing:
             accounts_payables_turnover_ratio = (
                 efficiency_model.get_accounts_payables_turnover_ratio(
-                    self._income_statement.loc[:, "Cost of Goods Sold", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Accounts Payable", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
+                    self._get_intermediate(
+                        "Trailing Cost of Goods Sold", trailing=trailing
+                    ),
+                    self._get_intermediate(
+                        "Trailing Accounts Payable", trailing=trailing
+                    ),
                 )
             )
         else:
             accounts_payables_turnover_ratio = (
                 efficiency_model.get_accounts_payables_turnover_ratio(
-                    self._income_statement.loc[:, "Cost of Goods Sold", :],
-                    self._balance_sheet_statement.loc[:, "Accounts Payable", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
+                    self._get_intermediate("Cost of Goods Sold"),
+                    self._get_intermediate("Average Accounts Payable"),
                 )
             )
 
@@ -1085,8 +1667,8 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return accounts_payables_turnover_ratio.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            accounts_payables_turnover_ratio, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -1146,24 +1728,19 @@ class Ratios:
         if trailing:
             days_of_accounts_payable_outstanding = (
                 efficiency_model.get_days_of_accounts_payable_outstanding(
-                    self._income_statement.loc[:, "Cost of Goods Sold", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Accounts Payable", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
+                    self._get_intermediate(
+                        "Trailing Cost of Goods Sold", trailing=trailing
+                    ),
+                    self._get_intermediate(
+                        "Trailing Accounts Payable", trailing=trailing
+                    ),
                 )
             )
         else:
             days_of_accounts_payable_outstanding = (
                 efficiency_model.get_days_of_accounts_payable_outstanding(
-                    self._income_statement.loc[:, "Cost of Goods Sold", :],
-                    self._balance_sheet_statement.loc[:, "Accounts Payable", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
+                    self._get_intermediate("Cost of Goods Sold"),
+                    self._get_intermediate("Average Accounts Payable"),
                     days,
                 )
             )
@@ -1175,8 +1752,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return days_of_accounts_payable_outstanding.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            days_of_accounts_payable_outstanding,
+            rounding if rounding else self._rounding,
         )
 
     @handle_portfolio
@@ -1234,64 +1812,48 @@ class Ratios:
 
         if trailing:
             days_of_inventory = efficiency_model.get_days_of_inventory_outstanding(
-                self._balance_sheet_statement.loc[:, "Inventory", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Cost of Goods Sold", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._get_intermediate("Trailing Inventory", trailing=trailing),
+                self._get_intermediate(
+                    "Trailing Cost of Goods Sold", trailing=trailing
+                ),
                 days,
             )
 
             days_of_sales = efficiency_model.get_days_of_sales_outstanding(
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._get_intermediate(
+                    "Trailing Accounts Receivable", trailing=trailing
+                ),
+                self._get_intermediate("Trailing Revenue", trailing=trailing),
                 days,
             )
 
             days_of_payables = (
                 efficiency_model.get_days_of_accounts_payable_outstanding(
-                    self._income_statement.loc[:, "Cost of Goods Sold", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Accounts Payable", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
+                    self._get_intermediate(
+                        "Trailing Cost of Goods Sold", trailing=trailing
+                    ),
+                    self._get_intermediate(
+                        "Trailing Accounts Payable", trailing=trailing
+                    ),
                     days,
                 )
             )
         else:
             days_of_inventory = efficiency_model.get_days_of_inventory_outstanding(
-                self._balance_sheet_statement.loc[:, "Inventory", :]
-                .T.rolling(2)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Cost of Goods Sold", :],
+                self._get_intermediate("Average Inventory"),
+                self._get_intermediate("Cost of Goods Sold"),
                 days,
             )
             days_of_sales = efficiency_model.get_days_of_sales_outstanding(
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(2)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Revenue", :],
+                self._get_intermediate("Average Accounts Receivable"),
+                self._get_intermediate("Revenue"),
                 days,
             )
 
             days_of_payables = (
                 efficiency_model.get_days_of_accounts_payable_outstanding(
-                    self._income_statement.loc[:, "Cost of Goods Sold", :],
-                    self._balance_sheet_statement.loc[:, "Accounts Payable", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
+                    self._get_intermediate("Cost of Goods Sold"),
+                    self._get_intermediate("Average Accounts Payable"),
                     days,
                 )
             )
@@ -1307,7 +1869,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return cash_conversion_cycle.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            cash_conversion_cycle, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -1361,21 +1925,17 @@ class Ratios:
         if trailing:
             cash_conversion_efficiency = (
                 efficiency_model.get_cash_conversion_efficiency(
-                    self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._income_statement.loc[:, "Revenue", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
+                    self._get_intermediate(
+                        "Trailing Cash Flow from Operations", trailing=trailing
+                    ),
+                    self._get_intermediate("Trailing Revenue", trailing=trailing),
                 )
             )
         else:
             cash_conversion_efficiency = (
                 efficiency_model.get_cash_conversion_efficiency(
-                    self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
-                    self._income_statement.loc[:, "Revenue", :],
+                    self._get_intermediate("Cash Flow from Operations"),
+                    self._get_intermediate("Revenue"),
                 )
             )
 
@@ -1386,8 +1946,8 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return cash_conversion_efficiency.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            cash_conversion_efficiency, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -1439,19 +1999,15 @@ class Ratios:
         """
         if trailing:
             receivables_turnover = efficiency_model.get_receivables_turnover(
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._get_intermediate(
+                    "Trailing Accounts Receivable", trailing=trailing
+                ),
+                self._get_intermediate("Trailing Revenue", trailing=trailing),
             )
         else:
             receivables_turnover = efficiency_model.get_receivables_turnover(
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(2)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Revenue", :],
+                self._get_intermediate("Average Accounts Receivable"),
+                self._get_intermediate("Revenue"),
             )
 
         if growth:
@@ -1461,7 +2017,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return receivables_turnover.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            receivables_turnover, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -1513,20 +2071,16 @@ class Ratios:
         """
         if trailing:
             sga_to_revenue_ratio = efficiency_model.get_sga_to_revenue_ratio(
-                self._income_statement.loc[
-                    :, "Selling, General and Administrative Expenses", :
-                ]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._get_intermediate(
+                    "Trailing Selling, General and Administrative Expenses",
+                    trailing=trailing,
+                ),
+                self._get_intermediate("Trailing Revenue", trailing=trailing),
             )
         else:
             sga_to_revenue_ratio = efficiency_model.get_sga_to_revenue_ratio(
-                self._income_statement.loc[
-                    :, "Selling, General and Administrative Expenses", :
-                ],
-                self._income_statement.loc[:, "Revenue", :],
+                self._get_intermediate("Selling, General and Administrative Expenses"),
+                self._get_intermediate("Revenue"),
             )
 
         if growth:
@@ -1536,7 +2090,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return sga_to_revenue_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            sga_to_revenue_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -1588,19 +2144,13 @@ class Ratios:
         """
         if trailing:
             fixed_asset_turnover = efficiency_model.get_fixed_asset_turnover(
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
-                self._balance_sheet_statement.loc[:, "Fixed Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate("Trailing Revenue", trailing=trailing),
+                self._get_intermediate("Trailing Fixed Assets", trailing=trailing),
             )
         else:
             fixed_asset_turnover = efficiency_model.get_fixed_asset_turnover(
-                self._income_statement.loc[:, "Revenue", :],
-                self._balance_sheet_statement.loc[:, "Fixed Assets", :]
-                .T.rolling(2)
-                .mean()
-                .T,
+                self._get_intermediate("Revenue"),
+                self._get_intermediate("Average Fixed Assets"),
             )
 
         if growth:
@@ -1610,7 +2160,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return fixed_asset_turnover.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            fixed_asset_turnover, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -1661,21 +2213,19 @@ class Ratios:
         """
         if trailing:
             operating_ratio = efficiency_model.get_operating_ratio(
-                self._income_statement.loc[:, "Operating Expenses", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Cost of Goods Sold", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._get_intermediate(
+                    "Trailing Operating Expenses", trailing=trailing
+                ),
+                self._get_intermediate(
+                    "Trailing Cost of Goods Sold", trailing=trailing
+                ),
+                self._get_intermediate("Trailing Revenue", trailing=trailing),
             )
         else:
             operating_ratio = efficiency_model.get_operating_ratio(
-                self._income_statement.loc[:, "Operating Expenses", :],
-                self._income_statement.loc[:, "Cost of Goods Sold", :],
-                self._income_statement.loc[:, "Revenue", :],
+                self._get_intermediate("Operating Expenses"),
+                self._get_intermediate("Cost of Goods Sold"),
+                self._get_intermediate("Revenue"),
             )
 
         if growth:
@@ -1685,8 +2235,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return operating_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(operating_ratio, rounding if rounding else self._rounding)
 
+    @share_intermediates
     def collect_liquidity_ratios(
         self,
         rounding: int | None = None,
@@ -1749,8 +2300,8 @@ class Ratios:
 
         self._liquidity_ratios = self._liquidity_ratios.loc[self._tickers]
 
-        self._liquidity_ratios = self._liquidity_ratios.round(
-            rounding if rounding else self._rounding
+        self._liquidity_ratios = round_dataset(
+            self._liquidity_ratios, rounding if rounding else self._rounding
         )
 
         # In case sorting accidentally fails, the index is sorted again
@@ -1764,6 +2315,10 @@ class Ratios:
             available_columns, axis=1
         )
 
+        self._set_collected_arguments(
+            "_liquidity_ratios", {"rounding": rounding, "trailing": trailing}
+        )
+
         if growth:
             self._liquidity_ratios_growth = calculate_growth(
                 self._liquidity_ratios,
@@ -1830,19 +2385,17 @@ class Ratios:
         """
         if trailing:
             current_ratio = liquidity_model.get_current_ratio(
-                self._balance_sheet_statement.loc[:, "Total Current Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate(
+                    "Trailing Total Current Assets", trailing=trailing
+                ),
+                self._get_intermediate(
+                    "Trailing Total Current Liabilities", trailing=trailing
+                ),
             )
         else:
             current_ratio = liquidity_model.get_current_ratio(
-                self._balance_sheet_statement.loc[:, "Total Current Assets", :],
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :],
+                self._get_intermediate("Total Current Assets"),
+                self._get_intermediate("Total Current Liabilities"),
             )
 
         if growth:
@@ -1852,7 +2405,7 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return current_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(current_ratio, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -1905,29 +2458,25 @@ class Ratios:
         """
         if trailing:
             quick_ratio = liquidity_model.get_quick_ratio(
-                self._balance_sheet_statement.loc[:, "Cash and Cash Equivalents", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Short Term Investments", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate(
+                    "Trailing Cash and Cash Equivalents", trailing=trailing
+                ),
+                self._get_intermediate(
+                    "Trailing Short Term Investments", trailing=trailing
+                ),
+                self._get_intermediate(
+                    "Trailing Accounts Receivable", trailing=trailing
+                ),
+                self._get_intermediate(
+                    "Trailing Total Current Liabilities", trailing=trailing
+                ),
             )
         else:
             quick_ratio = liquidity_model.get_quick_ratio(
-                self._balance_sheet_statement.loc[:, "Cash and Cash Equivalents", :],
-                self._balance_sheet_statement.loc[:, "Short Term Investments", :],
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :],
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :],
+                self._get_intermediate("Cash and Cash Equivalents"),
+                self._get_intermediate("Short Term Investments"),
+                self._get_intermediate("Accounts Receivable"),
+                self._get_intermediate("Total Current Liabilities"),
             )
 
         if growth:
@@ -1935,7 +2484,7 @@ class Ratios:
                 quick_ratio, lag=lag, rounding=rounding if rounding else self._rounding
             )
 
-        return quick_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(quick_ratio, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -1986,24 +2535,21 @@ class Ratios:
         """
         if trailing:
             cash_ratio = liquidity_model.get_cash_ratio(
-                self._balance_sheet_statement.loc[:, "Cash and Cash Equivalents", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Short Term Investments", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate(
+                    "Trailing Cash and Cash Equivalents", trailing=trailing
+                ),
+                self._get_intermediate(
+                    "Trailing Short Term Investments", trailing=trailing
+                ),
+                self._get_intermediate(
+                    "Trailing Total Current Liabilities", trailing=trailing
+                ),
             )
         else:
             cash_ratio = liquidity_model.get_cash_ratio(
-                self._balance_sheet_statement.loc[:, "Cash and Cash Equivalents", :],
-                self._balance_sheet_statement.loc[:, "Short Term Investments", :],
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :],
+                self._get_intermediate("Cash and Cash Equivalents"),
+                self._get_intermediate("Short Term Investments"),
+                self._get_intermediate("Total Current Liabilities"),
             )
 
         if growth:
@@ -2011,7 +2557,7 @@ class Ratios:
                 cash_ratio, lag=lag, rounding=rounding if rounding else self._rounding
             )
 
-        return cash_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(cash_ratio, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -2062,19 +2608,17 @@ class Ratios:
         """
         if trailing:
             working_capital = liquidity_model.get_working_capital(
-                self._balance_sheet_statement.loc[:, "Total Current Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate(
+                    "Trailing Total Current Assets", trailing=trailing
+                ),
+                self._get_intermediate(
+                    "Trailing Total Current Liabilities", trailing=trailing
+                ),
             )
         else:
             working_capital = liquidity_model.get_working_capital(
-                self._balance_sheet_statement.loc[:, "Total Current Assets", :],
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :],
+                self._get_intermediate("Total Current Assets"),
+                self._get_intermediate("Total Current Liabilities"),
             )
 
         if growth:
@@ -2084,7 +2628,7 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return working_capital.round(rounding if rounding else self._rounding)
+        return round_dataset(working_capital, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -2135,19 +2679,17 @@ class Ratios:
         """
         if trailing:
             operating_cash_flow_ratio = liquidity_model.get_operating_cash_flow_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate(
+                    "Trailing Cash Flow from Operations", trailing=trailing
+                ),
+                self._get_intermediate(
+                    "Trailing Total Current Liabilities", trailing=trailing
+                ),
             )
         else:
             operating_cash_flow_ratio = liquidity_model.get_operating_cash_flow_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :],
+                self._get_intermediate("Cash Flow from Operations"),
+                self._get_intermediate("Total Current Liabilities"),
             )
 
         if growth:
@@ -2157,7 +2699,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return operating_cash_flow_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            operating_cash_flow_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -2209,21 +2753,17 @@ class Ratios:
         if trailing:
             operating_cash_flow_sales_ratio = (
                 liquidity_model.get_operating_cash_flow_sales_ratio(
-                    self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._income_statement.loc[:, "Revenue", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
+                    self._get_intermediate(
+                        "Trailing Cash Flow from Operations", trailing=trailing
+                    ),
+                    self._get_intermediate("Trailing Revenue", trailing=trailing),
                 )
             )
         else:
             operating_cash_flow_sales_ratio = (
                 liquidity_model.get_operating_cash_flow_sales_ratio(
-                    self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
-                    self._income_statement.loc[:, "Revenue", :],
+                    self._get_intermediate("Cash Flow from Operations"),
+                    self._get_intermediate("Revenue"),
                 )
             )
 
@@ -2234,8 +2774,8 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return operating_cash_flow_sales_ratio.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            operating_cash_flow_sales_ratio, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -2277,29 +2817,21 @@ class Ratios:
         """
         if trailing:
             short_term_coverage_ratio = liquidity_model.get_short_term_coverage_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Inventory", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Accounts Payable", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate(
+                    "Trailing Cash Flow from Operations", trailing=trailing
+                ),
+                self._get_intermediate(
+                    "Trailing Accounts Receivable", trailing=trailing
+                ),
+                self._get_intermediate("Trailing Inventory", trailing=trailing),
+                self._get_intermediate("Trailing Accounts Payable", trailing=trailing),
             )
         else:
             short_term_coverage_ratio = liquidity_model.get_short_term_coverage_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :],
-                self._balance_sheet_statement.loc[:, "Inventory", :],
-                self._balance_sheet_statement.loc[:, "Accounts Payable", :],
+                self._get_intermediate("Cash Flow from Operations"),
+                self._get_intermediate("Accounts Receivable"),
+                self._get_intermediate("Inventory"),
+                self._get_intermediate("Accounts Payable"),
             )
 
         if growth:
@@ -2309,8 +2841,11 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return short_term_coverage_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            short_term_coverage_ratio, rounding if rounding else self._rounding
+        )
 
+    @share_intermediates
     def collect_profitability_ratios(
         self,
         rounding: int | None = None,
@@ -2404,8 +2939,8 @@ class Ratios:
 
         self._profitability_ratios = self._profitability_ratios.loc[self._tickers]
 
-        self._profitability_ratios = self._profitability_ratios.round(
-            rounding if rounding else self._rounding
+        self._profitability_ratios = round_dataset(
+            self._profitability_ratios, rounding if rounding else self._rounding
         )
 
         # In case sorting accidentally fails, the index is sorted again
@@ -2419,6 +2954,10 @@ class Ratios:
             available_columns, axis=1
         )
 
+        self._set_collected_arguments(
+            "_profitability_ratios", {"rounding": rounding, "trailing": trailing}
+        )
+
         if growth:
             self._profitability_ratios_growth = calculate_growth(
                 self._profitability_ratios,
@@ -2487,16 +3026,15 @@ class Ratios:
         """
         if trailing:
             gross_margin = profitability_model.get_gross_margin(
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
-                self._income_statement.loc[:, "Cost of Goods Sold", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._get_intermediate("Trailing Revenue", trailing=trailing),
+                self._get_intermediate(
+                    "Trailing Cost of Goods Sold", trailing=trailing
+                ),
             )
         else:
             gross_margin = profitability_model.get_gross_margin(
-                self._income_statement.loc[:, "Revenue", :],
-                self._income_statement.loc[:, "Cost of Goods Sold", :],
+                self._get_intermediate("Revenue"),
+                self._get_intermediate("Cost of Goods Sold"),
             )
 
         if growth:
@@ -2504,7 +3042,7 @@ class Ratios:
                 gross_margin, lag=lag, rounding=rounding if rounding else self._rounding
             )
 
-        return gross_margin.round(rounding if rounding else self._rounding)
+        return round_dataset(gross_margin, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -2555,16 +3093,13 @@ class Ratios:
         """
         if trailing:
             operating_margin = profitability_model.get_operating_margin(
-                self._income_statement.loc[:, "Operating Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._get_intermediate("Trailing Operating Income", trailing=trailing),
+                self._get_intermediate("Trailing Revenue", trailing=trailing),
             )
         else:
             operating_margin = profitability_model.get_operating_margin(
-                self._income_statement.loc[:, "Operating Income", :],
-                self._income_statement.loc[:, "Revenue", :],
+                self._get_intermediate("Operating Income"),
+                self._get_intermediate("Revenue"),
             )
 
         if growth:
@@ -2574,7 +3109,7 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return operating_margin.round(rounding if rounding else self._rounding)
+        return round_dataset(operating_margin, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -2625,16 +3160,13 @@ class Ratios:
         """
         if trailing:
             net_profit_margin = profitability_model.get_net_profit_margin(
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._get_intermediate("Trailing Net Income", trailing=trailing),
+                self._get_intermediate("Trailing Revenue", trailing=trailing),
             )
         else:
             net_profit_margin = profitability_model.get_net_profit_margin(
-                self._income_statement.loc[:, "Net Income", :],
-                self._income_statement.loc[:, "Revenue", :],
+                self._get_intermediate("Net Income"),
+                self._get_intermediate("Revenue"),
             )
 
         if growth:
@@ -2644,7 +3176,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return net_profit_margin.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            net_profit_margin, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -2699,19 +3233,13 @@ class Ratios:
         """
         if trailing:
             interest_burden_ratio = profitability_model.get_interest_coverage_ratio(
-                self._income_statement.loc[:, "Operating Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Interest Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._get_intermediate("Trailing Operating Income", trailing=trailing),
+                self._get_intermediate("Trailing Interest Expense", trailing=trailing),
             )
         else:
             interest_burden_ratio = profitability_model.get_interest_burden_ratio(
-                self._income_statement.loc[:, "Operating Income", :],
-                self._income_statement.loc[:, "Interest Expense", :],
+                self._get_intermediate("Operating Income"),
+                self._get_intermediate("Interest Expense"),
             )
 
         if growth:
@@ -2721,7 +3249,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return interest_burden_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            interest_burden_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -2772,21 +3302,17 @@ class Ratios:
         if trailing:
             income_before_tax_profit_margin = (
                 profitability_model.get_income_before_tax_profit_margin(
-                    self._income_statement.loc[:, "Income Before Tax", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._income_statement.loc[:, "Revenue", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
+                    self._get_intermediate(
+                        "Trailing Income Before Tax", trailing=trailing
+                    ),
+                    self._get_intermediate("Trailing Revenue", trailing=trailing),
                 )
             )
         else:
             income_before_tax_profit_margin = (
                 profitability_model.get_income_before_tax_profit_margin(
-                    self._income_statement.loc[:, "Income Before Tax", :],
-                    self._income_statement.loc[:, "Revenue", :],
+                    self._get_intermediate("Income Before Tax"),
+                    self._get_intermediate("Revenue"),
                 )
             )
 
@@ -2797,8 +3323,8 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return income_before_tax_profit_margin.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            income_before_tax_profit_margin, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -2849,19 +3375,15 @@ class Ratios:
         """
         if trailing:
             effective_tax_rate = profitability_model.get_effective_tax_rate(
-                self._income_statement.loc[:, "Income Tax Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Income Before Tax", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._get_intermediate(
+                    "Trailing Income Tax Expense", trailing=trailing
+                ),
+                self._get_intermediate("Trailing Income Before Tax", trailing=trailing),
             )
         else:
             effective_tax_rate = profitability_model.get_effective_tax_rate(
-                self._income_statement.loc[:, "Income Tax Expense", :],
-                self._income_statement.loc[:, "Income Before Tax", :],
+                self._get_intermediate("Income Tax Expense"),
+                self._get_intermediate("Income Before Tax"),
             )
 
         if growth:
@@ -2871,7 +3393,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return effective_tax_rate.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            effective_tax_rate, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -2922,22 +3446,13 @@ class Ratios:
         """
         if trailing:
             return_on_assets = profitability_model.get_return_on_assets(
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate("Trailing Net Income", trailing=trailing),
+                self._get_intermediate("Trailing Total Assets", trailing=trailing),
             )
         else:
             return_on_assets = profitability_model.get_return_on_assets(
-                self._income_statement.loc[:, "Net Income", :],
-                self._balance_sheet_statement.loc[:, "Total Assets", :]
-                .T.rolling(2)
-                .mean()
-                .T,
+                self._get_intermediate("Net Income"),
+                self._get_intermediate("Average Total Assets"),
             )
 
         if growth:
@@ -2947,7 +3462,7 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return return_on_assets.round(rounding if rounding else self._rounding)
+        return round_dataset(return_on_assets, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -3001,23 +3516,14 @@ class Ratios:
         """
         if trailing:
             return_on_equity = profitability_model.get_return_on_equity(
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Equity", :]
-                .T.rolling(window=trailing)
-                .mean()
-                .T,
+                self._get_intermediate("Trailing Net Income", trailing=trailing),
+                self._get_intermediate("Trailing Total Equity", trailing=trailing),
             )
 
         else:
             return_on_equity = profitability_model.get_return_on_equity(
-                self._income_statement.loc[:, "Net Income", :],
-                self._balance_sheet_statement.loc[:, "Total Equity", :]
-                .T.rolling(window=2)
-                .mean()
-                .T,
+                self._get_intermediate("Net Income"),
+                self._get_intermediate("Average Total Equity"),
             )
 
         if growth:
@@ -3027,7 +3533,7 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return return_on_equity.round(rounding if rounding else self._rounding)
+        return round_dataset(return_on_equity, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -3080,45 +3586,29 @@ class Ratios:
         if trailing:
             return_on_invested_capital = (
                 profitability_model.get_return_on_invested_capital(
-                    self._income_statement.loc[:, "Net Income", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
+                    self._get_intermediate("Trailing Net Income", trailing=trailing),
                     (
-                        self._cash_flow_statement.loc[:, "Dividends Paid", :]
-                        .T.rolling(trailing)
-                        .sum()
-                        .T
+                        self._get_intermediate(
+                            "Trailing Dividends Paid", trailing=trailing
+                        )
                         if dividend_adjusted
                         else 0
                     ),
-                    self._balance_sheet_statement.loc[:, "Total Equity", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Total Debt", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
+                    self._get_intermediate("Trailing Total Equity", trailing=trailing),
+                    self._get_intermediate("Trailing Total Debt", trailing=trailing),
                 )
             )
         else:
             return_on_invested_capital = (
                 profitability_model.get_return_on_invested_capital(
-                    self._income_statement.loc[:, "Net Income", :],
+                    self._get_intermediate("Net Income"),
                     (
-                        self._cash_flow_statement.loc[:, "Dividends Paid", :]
+                        self._get_intermediate("Dividends Paid")
                         if dividend_adjusted
                         else 0
                     ),
-                    self._balance_sheet_statement.loc[:, "Total Equity", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Total Debt", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
+                    self._get_intermediate("Average Total Equity"),
+                    self._get_intermediate("Average Total Debt"),
                 )
             )
 
@@ -3129,8 +3619,8 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return return_on_invested_capital.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            return_on_invested_capital, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -3182,19 +3672,15 @@ class Ratios:
         """
         if trailing:
             income_quality_ratio = profitability_model.get_income_quality_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._get_intermediate(
+                    "Trailing Cash Flow from Operations", trailing=trailing
+                ),
+                self._get_intermediate("Trailing Net Income", trailing=trailing),
             )
         else:
             income_quality_ratio = profitability_model.get_income_quality_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
-                self._income_statement.loc[:, "Net Income", :],
+                self._get_intermediate("Cash Flow from Operations"),
+                self._get_intermediate("Net Income"),
             )
 
         if growth:
@@ -3204,7 +3690,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return income_quality_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            income_quality_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -3255,40 +3743,23 @@ class Ratios:
         if trailing:
             return_on_tangible_assets = (
                 profitability_model.get_return_on_tangible_assets(
-                    self._income_statement.loc[:, "Net Income", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Total Assets", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Intangible Assets", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Total Liabilities", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
+                    self._get_intermediate("Trailing Net Income", trailing=trailing),
+                    self._get_intermediate("Trailing Total Assets", trailing=trailing),
+                    self._get_intermediate(
+                        "Trailing Intangible Assets", trailing=trailing
+                    ),
+                    self._get_intermediate(
+                        "Trailing Total Liabilities", trailing=trailing
+                    ),
                 )
             )
         else:
             return_on_tangible_assets = (
                 profitability_model.get_return_on_tangible_assets(
-                    self._income_statement.loc[:, "Net Income", :],
-                    self._balance_sheet_statement.loc[:, "Total Assets", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Intangible Assets", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Total Liabilities", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
+                    self._get_intermediate("Net Income"),
+                    self._get_intermediate("Average Total Assets"),
+                    self._get_intermediate("Average Intangible Assets"),
+                    self._get_intermediate("Average Total Liabilities"),
                 )
             )
 
@@ -3299,7 +3770,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return return_on_tangible_assets.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            return_on_tangible_assets, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -3349,38 +3822,27 @@ class Ratios:
         if trailing:
             return_on_capital_employed = (
                 profitability_model.get_return_on_capital_employed(
-                    self._income_statement.loc[:, "Net Income", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._income_statement.loc[:, "Interest Expense", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._income_statement.loc[:, "Income Tax Expense", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Total Assets", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Total Current Liabilities", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
+                    self._get_intermediate("Trailing Net Income", trailing=trailing),
+                    self._get_intermediate(
+                        "Trailing Interest Expense", trailing=trailing
+                    ),
+                    self._get_intermediate(
+                        "Trailing Income Tax Expense", trailing=trailing
+                    ),
+                    self._get_intermediate("Trailing Total Assets", trailing=trailing),
+                    self._get_intermediate(
+                        "Trailing Total Current Liabilities", trailing=trailing
+                    ),
                 )
             )
         else:
             return_on_capital_employed = (
                 profitability_model.get_return_on_capital_employed(
-                    self._income_statement.loc[:, "Net Income", :],
-                    self._income_statement.loc[:, "Interest Expense", :],
-                    self._income_statement.loc[:, "Income Tax Expense", :],
-                    self._balance_sheet_statement.loc[:, "Total Assets", :],
-                    self._balance_sheet_statement.loc[
-                        :, "Total Current Liabilities", :
-                    ],
+                    self._get_intermediate("Net Income"),
+                    self._get_intermediate("Interest Expense"),
+                    self._get_intermediate("Income Tax Expense"),
+                    self._get_intermediate("Total Assets"),
+                    self._get_intermediate("Total Current Liabilities"),
                 )
             )
 
@@ -3391,8 +3853,8 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return return_on_capital_employed.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            return_on_capital_employed, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -3444,19 +3906,15 @@ class Ratios:
         """
         if trailing:
             net_income_per_ebt = profitability_model.get_net_income_per_ebt(
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Income Tax Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._get_intermediate("Trailing Net Income", trailing=trailing),
+                self._get_intermediate(
+                    "Trailing Income Tax Expense", trailing=trailing
+                ),
             )
         else:
             net_income_per_ebt = profitability_model.get_net_income_per_ebt(
-                self._income_statement.loc[:, "Net Income", :],
-                self._income_statement.loc[:, "Income Tax Expense", :],
+                self._get_intermediate("Net Income"),
+                self._get_intermediate("Income Tax Expense"),
             )
 
         if growth:
@@ -3466,7 +3924,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return net_income_per_ebt.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            net_income_per_ebt, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -3517,21 +3977,19 @@ class Ratios:
         if trailing:
             free_cash_flow_operating_cash_flow_ratio = (
                 profitability_model.get_free_cash_flow_operating_cash_flow_ratio(
-                    self._cash_flow_statement.loc[:, "Free Cash Flow", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
+                    self._get_intermediate(
+                        "Trailing Free Cash Flow", trailing=trailing
+                    ),
+                    self._get_intermediate(
+                        "Trailing Cash Flow from Operations", trailing=trailing
+                    ),
                 )
             )
         else:
             free_cash_flow_operating_cash_flow_ratio = (
                 profitability_model.get_free_cash_flow_operating_cash_flow_ratio(
-                    self._cash_flow_statement.loc[:, "Free Cash Flow", :],
-                    self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
+                    self._get_intermediate("Free Cash Flow"),
+                    self._get_intermediate("Cash Flow from Operations"),
                 )
             )
 
@@ -3542,8 +4000,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return free_cash_flow_operating_cash_flow_ratio.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            free_cash_flow_operating_cash_flow_ratio,
+            rounding if rounding else self._rounding,
         )
 
     @handle_portfolio
@@ -3596,19 +4055,13 @@ class Ratios:
         """
         if trailing:
             tax_burden_ratio = profitability_model.get_tax_burden_ratio(
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Income Before Tax", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._get_intermediate("Trailing Net Income", trailing=trailing),
+                self._get_intermediate("Trailing Income Before Tax", trailing=trailing),
             )
         else:
             tax_burden_ratio = profitability_model.get_tax_burden_ratio(
-                self._income_statement.loc[:, "Net Income", :],
-                self._income_statement.loc[:, "Income Before Tax", :],
+                self._get_intermediate("Net Income"),
+                self._get_intermediate("Income Before Tax"),
             )
 
         if growth:
@@ -3618,7 +4071,7 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return tax_burden_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(tax_burden_ratio, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -3670,34 +4123,25 @@ class Ratios:
         """
         if trailing:
             EBT_to_EBIT = profitability_model.get_EBT_to_EBIT(
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T
-                + self._income_statement.loc[:, "Income Tax Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T
-                + self._income_statement.loc[:, "Income Tax Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T
-                + self._income_statement.loc[:, "Interest Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._get_intermediate("Trailing Net Income", trailing=trailing)
+                + self._get_intermediate(
+                    "Trailing Income Tax Expense", trailing=trailing
+                ),
+                self._get_intermediate("Trailing Net Income", trailing=trailing)
+                + self._get_intermediate(
+                    "Trailing Income Tax Expense", trailing=trailing
+                )
+                + self._get_intermediate(
+                    "Trailing Interest Expense", trailing=trailing
+                ),
             )
         else:
             EBT_to_EBIT = profitability_model.get_EBT_to_EBIT(
-                self._income_statement.loc[:, "Net Income", :]
-                + self._income_statement.loc[:, "Income Tax Expense", :],
-                self._income_statement.loc[:, "Net Income", :]
-                + self._income_statement.loc[:, "Income Tax Expense", :]
-                + self._income_statement.loc[:, "Interest Expense", :],
+                self._get_intermediate("Net Income")
+                + self._get_intermediate("Income Tax Expense"),
+                self._get_intermediate("Net Income")
+                + self._get_intermediate("Income Tax Expense")
+                + self._get_intermediate("Interest Expense"),
             )
 
         if growth:
@@ -3705,7 +4149,7 @@ class Ratios:
                 EBT_to_EBIT, lag=lag, rounding=rounding if rounding else self._rounding
             )
 
-        return EBT_to_EBIT.round(rounding if rounding else self._rounding)
+        return round_dataset(EBT_to_EBIT, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -3759,25 +4203,20 @@ class Ratios:
         """
         if trailing:
             EBIT_to_revenue = profitability_model.get_EBIT_to_revenue(
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T
-                + self._income_statement.loc[:, "Income Tax Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T
-                + self._income_statement.loc[:, "Interest Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._get_intermediate("Trailing Net Income", trailing=trailing)
+                + self._get_intermediate(
+                    "Trailing Income Tax Expense", trailing=trailing
+                )
+                + self._get_intermediate(
+                    "Trailing Interest Expense", trailing=trailing
+                ),
+                self._get_intermediate("Trailing Revenue", trailing=trailing),
             )
         EBIT_to_revenue = profitability_model.get_EBIT_to_revenue(
-            self._income_statement.loc[:, "Net Income", :]
-            + self._income_statement.loc[:, "Income Tax Expense", :]
-            + self._income_statement.loc[:, "Interest Expense", :],
-            self._income_statement.loc[:, "Revenue", :],
+            self._get_intermediate("Net Income")
+            + self._get_intermediate("Income Tax Expense")
+            + self._get_intermediate("Interest Expense"),
+            self._get_intermediate("Revenue"),
         )
 
         if growth:
@@ -3787,8 +4226,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return EBIT_to_revenue.round(rounding if rounding else self._rounding)
+        return round_dataset(EBIT_to_revenue, rounding if rounding else self._rounding)
 
+    @share_intermediates
     def collect_solvency_ratios(
         self,
         diluted: bool = True,
@@ -3865,8 +4305,8 @@ class Ratios:
 
         self._solvency_ratios = self._solvency_ratios.loc[self._tickers]
 
-        self._solvency_ratios = self._solvency_ratios.round(
-            rounding if rounding else self._rounding
+        self._solvency_ratios = round_dataset(
+            self._solvency_ratios, rounding if rounding else self._rounding
         )
 
         # In case sorting accidentally fails, the index is sorted again
@@ -3878,6 +4318,11 @@ class Ratios:
         ]
         self._solvency_ratios = self._solvency_ratios.reindex(available_columns, axis=1)
 
+        self._set_collected_arguments(
+            "_solvency_ratios",
+            {"diluted": diluted, "rounding": rounding, "trailing": trailing},
+        )
+
         if growth:
             self._solvency_ratios_growth = calculate_growth(
                 self._solvency_ratios,
@@ -3944,19 +4389,13 @@ class Ratios:
         """
         if trailing:
             debt_to_assets_ratio = solvency_model.get_debt_to_assets_ratio(
-                self._balance_sheet_statement.loc[:, "Total Debt", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate("Trailing Total Debt", trailing=trailing),
+                self._get_intermediate("Trailing Total Assets", trailing=trailing),
             )
         else:
             debt_to_assets_ratio = solvency_model.get_debt_to_assets_ratio(
-                self._balance_sheet_statement.loc[:, "Total Debt", :],
-                self._balance_sheet_statement.loc[:, "Total Assets", :],
+                self._get_intermediate("Total Debt"),
+                self._get_intermediate("Total Assets"),
             )
 
         if growth:
@@ -3966,7 +4405,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return debt_to_assets_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            debt_to_assets_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -4018,19 +4459,13 @@ class Ratios:
         """
         if trailing:
             debt_to_equity_ratio = solvency_model.get_debt_to_equity_ratio(
-                self._balance_sheet_statement.loc[:, "Total Debt", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Equity", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate("Trailing Total Debt", trailing=trailing),
+                self._get_intermediate("Trailing Total Equity", trailing=trailing),
             )
         else:
             debt_to_equity_ratio = solvency_model.get_debt_to_equity_ratio(
-                self._balance_sheet_statement.loc[:, "Total Debt", :],
-                self._balance_sheet_statement.loc[:, "Total Equity", :],
+                self._get_intermediate("Total Debt"),
+                self._get_intermediate("Total Equity"),
             )
 
         if growth:
@@ -4040,7 +4475,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return debt_to_equity_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            debt_to_equity_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -4091,24 +4528,17 @@ class Ratios:
         """
         if trailing:
             interest_coverage_ratio = solvency_model.get_interest_coverage_ratio(
-                self._income_statement.loc[:, "Operating Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._cash_flow_statement.loc[:, "Depreciation and Amortization", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Interest Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._get_intermediate("Trailing Operating Income", trailing=trailing),
+                self._get_intermediate(
+                    "Trailing Depreciation and Amortization", trailing=trailing
+                ),
+                self._get_intermediate("Trailing Interest Expense", trailing=trailing),
             )
         else:
             interest_coverage_ratio = solvency_model.get_interest_coverage_ratio(
-                self._income_statement.loc[:, "Operating Income", :],
-                self._cash_flow_statement.loc[:, "Depreciation and Amortization", :],
-                self._income_statement.loc[:, "Interest Expense", :],
+                self._get_intermediate("Operating Income"),
+                self._get_intermediate("Depreciation and Amortization"),
+                self._get_intermediate("Interest Expense"),
             )
 
         if growth:
@@ -4118,7 +4548,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return interest_coverage_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            interest_coverage_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -4169,25 +4601,13 @@ class Ratios:
         """
         if trailing:
             equity_multiplier = solvency_model.get_equity_multiplier(
-                self._balance_sheet_statement.loc[:, "Total Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Equity", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate("Trailing Total Assets", trailing=trailing),
+                self._get_intermediate("Trailing Total Equity", trailing=trailing),
             )
         else:
             equity_multiplier = solvency_model.get_equity_multiplier(
-                self._balance_sheet_statement.loc[:, "Total Assets", :]
-                .T.rolling(2)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Equity", :]
-                .T.rolling(2)
-                .mean()
-                .T,
+                self._get_intermediate("Average Total Assets"),
+                self._get_intermediate("Average Total Equity"),
             )
 
         if growth:
@@ -4197,7 +4617,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return equity_multiplier.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            equity_multiplier, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -4248,23 +4670,19 @@ class Ratios:
         if trailing:
             debt_service_coverage_ratio = (
                 solvency_model.get_debt_service_coverage_ratio(
-                    self._income_statement.loc[:, "Operating Income", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Total Current Liabilities", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
+                    self._get_intermediate(
+                        "Trailing Operating Income", trailing=trailing
+                    ),
+                    self._get_intermediate(
+                        "Trailing Total Current Liabilities", trailing=trailing
+                    ),
                 )
             )
         else:
             debt_service_coverage_ratio = (
                 solvency_model.get_debt_service_coverage_ratio(
-                    self._income_statement.loc[:, "Operating Income", :],
-                    self._balance_sheet_statement.loc[
-                        :, "Total Current Liabilities", :
-                    ],
+                    self._get_intermediate("Operating Income"),
+                    self._get_intermediate("Total Current Liabilities"),
                 )
             )
 
@@ -4275,8 +4693,8 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return debt_service_coverage_ratio.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            debt_service_coverage_ratio, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -4328,13 +4746,12 @@ class Ratios:
         free_cash_flow_yield_ratios = toolkit.ratios.get_free_cash_flow_yield()
         ```
         """
-        average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
-            if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+        shares = (
+            "Weighted Average Shares Diluted" if diluted else "Weighted Average Shares"
         )
+        average_shares = self._get_intermediate(shares)
 
-        free_cash_flow = self._cash_flow_statement.loc[:, "Free Cash Flow", :]
+        free_cash_flow = self._get_intermediate("Free Cash Flow")
 
         years = self._balance_sheet_statement.columns
         begin, end = str(years[0]), str(years[-1])
@@ -4344,16 +4761,10 @@ class Ratios:
                 self._tickers_without_portfolio
             ]
 
-            average_shares = map_period_data_to_daily_data(
-                period_data=average_shares,
-                daily_dates=share_prices.index,
-                quarterly=self._quarterly,
-            )
+            average_shares = self._get_daily_intermediate(shares, share_prices.index)
 
-            free_cash_flow = map_period_data_to_daily_data(
-                period_data=free_cash_flow,
-                daily_dates=share_prices.index,
-                quarterly=self._quarterly,
+            free_cash_flow = self._get_daily_intermediate(
+                "Free Cash Flow", share_prices.index
             )
         else:
             share_prices = self._historical_data.loc[begin:end, "Adj Close"][
@@ -4362,12 +4773,12 @@ class Ratios:
 
         if trailing:
             market_cap = valuation_model.get_market_cap(
-                share_prices.T.rolling(trailing).sum().T,
+                calculate_trailing_values(share_prices, trailing, "sum"),
                 average_shares,
             )
 
             free_cash_flow_yield = solvency_model.get_free_cash_flow_yield(
-                free_cash_flow.T.rolling(trailing).sum().T,
+                calculate_trailing_values(free_cash_flow, trailing, "sum"),
                 market_cap,
             )
         else:
@@ -4385,7 +4796,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return free_cash_flow_yield.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            free_cash_flow_yield, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -4434,24 +4847,17 @@ class Ratios:
         """
         if trailing:
             net_debt_to_ebitda_ratio = solvency_model.get_net_debt_to_ebitda_ratio(
-                self._income_statement.loc[:, "Operating Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._cash_flow_statement.loc[:, "Depreciation and Amortization", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._balance_sheet_statement.loc[:, "Net Debt", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate("Trailing Operating Income", trailing=trailing),
+                self._get_intermediate(
+                    "Trailing Depreciation and Amortization", trailing=trailing
+                ),
+                self._get_intermediate("Trailing Net Debt", trailing=trailing),
             )
         else:
             net_debt_to_ebitda_ratio = solvency_model.get_net_debt_to_ebitda_ratio(
-                self._income_statement.loc[:, "Operating Income", :],
-                self._cash_flow_statement.loc[:, "Depreciation and Amortization", :],
-                self._balance_sheet_statement.loc[:, "Net Debt", :],
+                self._get_intermediate("Operating Income"),
+                self._get_intermediate("Depreciation and Amortization"),
+                self._get_intermediate("Net Debt"),
             )
 
         if growth:
@@ -4461,7 +4867,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return net_debt_to_ebitda_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            net_debt_to_ebitda_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -4510,19 +4918,15 @@ class Ratios:
         """
         if trailing:
             cash_flow_coverage_ratio = solvency_model.get_cash_flow_coverage_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Debt", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate(
+                    "Trailing Cash Flow from Operations", trailing=trailing
+                ),
+                self._get_intermediate("Trailing Total Debt", trailing=trailing),
             )
         else:
             cash_flow_coverage_ratio = solvency_model.get_cash_flow_coverage_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
-                self._balance_sheet_statement.loc[:, "Total Debt", :],
+                self._get_intermediate("Cash Flow from Operations"),
+                self._get_intermediate("Total Debt"),
             )
 
         if growth:
@@ -4532,7 +4936,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return cash_flow_coverage_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            cash_flow_coverage_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -4583,19 +4989,17 @@ class Ratios:
         """
         if trailing:
             capex_coverage_ratio = solvency_model.get_capex_coverage_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._cash_flow_statement.loc[:, "Capital Expenditure", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._get_intermediate(
+                    "Trailing Cash Flow from Operations", trailing=trailing
+                ),
+                self._get_intermediate(
+                    "Trailing Capital Expenditure", trailing=trailing
+                ),
             )
         else:
             capex_coverage_ratio = solvency_model.get_capex_coverage_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
-                self._cash_flow_statement.loc[:, "Capital Expenditure", :],
+                self._get_intermediate("Cash Flow from Operations"),
+                self._get_intermediate("Capital Expenditure"),
             )
 
         if growth:
@@ -4605,7 +5009,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return capex_coverage_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            capex_coverage_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -4659,26 +5065,23 @@ class Ratios:
         if trailing:
             dividend_capex_coverage_ratio = (
                 solvency_model.get_dividend_capex_coverage_ratio(
-                    self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._cash_flow_statement.loc[:, "Capital Expenditure", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._cash_flow_statement.loc[:, "Dividends Paid", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
+                    self._get_intermediate(
+                        "Trailing Cash Flow from Operations", trailing=trailing
+                    ),
+                    self._get_intermediate(
+                        "Trailing Capital Expenditure", trailing=trailing
+                    ),
+                    self._get_intermediate(
+                        "Trailing Dividends Paid", trailing=trailing
+                    ),
                 )
             )
         else:
             dividend_capex_coverage_ratio = (
                 solvency_model.get_dividend_capex_coverage_ratio(
-                    self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
-                    self._cash_flow_statement.loc[:, "Capital Expenditure", :],
-                    self._cash_flow_statement.loc[:, "Dividends Paid", :],
+                    self._get_intermediate("Cash Flow from Operations"),
+                    self._get_intermediate("Capital Expenditure"),
+                    self._get_intermediate("Dividends Paid"),
                 )
             )
 
@@ -4689,10 +5092,11 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return dividend_capex_coverage_ratio.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            dividend_capex_coverage_ratio, rounding if rounding else self._rounding
         )
 
+    @share_intermediates
     def collect_valuation_ratios(
         self,
         include_dividends: bool = False,
@@ -4820,8 +5224,8 @@ class Ratios:
 
         self._valuation_ratios = self._valuation_ratios.loc[self._tickers]
 
-        self._valuation_ratios = self._valuation_ratios.round(
-            rounding if rounding else self._rounding
+        self._valuation_ratios = round_dataset(
+            self._valuation_ratios, rounding if rounding else self._rounding
         )
 
         # In case sorting accidentally fails, the index is sorted again
@@ -4835,6 +5239,16 @@ class Ratios:
             available_columns, axis=1
         )
 
+        self._set_collected_arguments(
+            "_valuation_ratios",
+            {
+                "include_dividends": include_dividends,
+                "diluted": diluted,
+                "rounding": rounding,
+                "trailing": trailing,
+            },
+        )
+
         if growth:
             self._valuation_ratios_growth = calculate_growth(
                 self._valuation_ratios,
@@ -4904,38 +5318,34 @@ class Ratios:
         ```
         """
         average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
+            self._get_intermediate("Weighted Average Shares Diluted")
             if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+            else self._get_intermediate("Weighted Average Shares")
         )
 
         if trailing:
             dividends = (
-                self._cash_flow_statement.loc[:, "Preferred Dividends Paid", :]
-                .T.rolling(trailing)
-                .sum()
-                .T
+                self._get_intermediate(
+                    "Trailing Preferred Dividends Paid", trailing=trailing
+                )
                 if include_dividends
                 else 0
             )
 
             earnings_per_share = valuation_model.get_earnings_per_share(
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._get_intermediate("Trailing Net Income", trailing=trailing),
                 dividends,
                 average_shares,
             )
         else:
             dividends = (
-                self._cash_flow_statement.loc[:, "Preferred Dividends Paid", :]
+                self._get_intermediate("Preferred Dividends Paid")
                 if include_dividends
                 else 0
             )
 
             earnings_per_share = valuation_model.get_earnings_per_share(
-                self._income_statement.loc[:, "Net Income", :],
+                self._get_intermediate("Net Income"),
                 dividends,
                 average_shares,
             )
@@ -4947,7 +5357,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return earnings_per_share.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            earnings_per_share, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -4999,19 +5411,19 @@ class Ratios:
         ```
         """
         average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
+            self._get_intermediate("Weighted Average Shares Diluted")
             if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+            else self._get_intermediate("Weighted Average Shares")
         )
 
         if trailing:
             revenue_per_share = valuation_model.get_revenue_per_share(
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._get_intermediate("Trailing Revenue", trailing=trailing),
                 average_shares,
             )
         else:
             revenue_per_share = valuation_model.get_revenue_per_share(
-                self._income_statement.loc[:, "Revenue", :], average_shares
+                self._get_intermediate("Revenue"), average_shares
             )
 
         if growth:
@@ -5021,7 +5433,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return revenue_per_share.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            revenue_per_share, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -5104,7 +5518,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return price_to_earnings_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            price_to_earnings_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -5161,11 +5577,8 @@ class Ratios:
         trailing_metric = 5 * 4 if self._quarterly else 5
 
         if use_ebitda_growth_rate:
-            growth_rate = (
-                self._income_statement.loc[:, "EBITDA", :]
-                .T.rolling(trailing_metric)
-                .sum()
-                .T
+            growth_rate = self._get_intermediate(
+                "Trailing EBITDA", trailing=trailing_metric
             )
 
             growth_rate = calculate_growth(growth_rate)
@@ -5194,8 +5607,8 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return price_to_earnings_growth_ratio.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            price_to_earnings_growth_ratio, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -5247,27 +5660,23 @@ class Ratios:
         ```
         """
         average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
+            self._get_intermediate("Weighted Average Shares Diluted")
             if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+            else self._get_intermediate("Weighted Average Shares")
         )
 
         if trailing:
             book_value_per_share = valuation_model.get_book_value_per_share(
-                self._balance_sheet_statement.loc[:, "Total Shareholder Equity", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Preferred Stock", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                average_shares.T.rolling(trailing).mean().T,
+                self._get_intermediate(
+                    "Trailing Total Shareholder Equity", trailing=trailing
+                ),
+                self._get_intermediate("Trailing Preferred Stock", trailing=trailing),
+                calculate_trailing_values(average_shares, trailing, "mean"),
             )
         else:
             book_value_per_share = valuation_model.get_book_value_per_share(
-                self._balance_sheet_statement.loc[:, "Total Shareholder Equity", :],
-                self._balance_sheet_statement.loc[:, "Preferred Stock", :],
+                self._get_intermediate("Total Shareholder Equity"),
+                self._get_intermediate("Preferred Stock"),
                 average_shares,
             )
 
@@ -5278,7 +5687,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return book_value_per_share.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            book_value_per_share, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -5363,7 +5774,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return price_to_book_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            price_to_book_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -5415,27 +5828,21 @@ class Ratios:
         ```
         """
         average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
+            self._get_intermediate("Weighted Average Shares Diluted")
             if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+            else self._get_intermediate("Weighted Average Shares")
         )
 
         if trailing:
             interest_debt_per_share = valuation_model.get_interest_debt_per_share(
-                self._income_statement.loc[:, "Interest Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Debt", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                average_shares.T.rolling(trailing).mean().T,
+                self._get_intermediate("Trailing Interest Expense", trailing=trailing),
+                self._get_intermediate("Trailing Total Debt", trailing=trailing),
+                calculate_trailing_values(average_shares, trailing, "mean"),
             )
         else:
             interest_debt_per_share = valuation_model.get_interest_debt_per_share(
-                self._income_statement.loc[:, "Interest Expense", :],
-                self._balance_sheet_statement.loc[:, "Total Debt", :],
+                self._get_intermediate("Interest Expense"),
+                self._get_intermediate("Total Debt"),
                 average_shares,
             )
 
@@ -5446,7 +5853,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return interest_debt_per_share.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            interest_debt_per_share, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -5498,22 +5907,21 @@ class Ratios:
         ```
         """
         average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
+            self._get_intermediate("Weighted Average Shares Diluted")
             if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+            else self._get_intermediate("Weighted Average Shares")
         )
 
         if trailing:
             capex_per_share = valuation_model.get_capex_per_share(
-                self._cash_flow_statement.loc[:, "Capital Expenditure", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._get_intermediate(
+                    "Trailing Capital Expenditure", trailing=trailing
+                ),
                 average_shares,
             )
         else:
             capex_per_share = valuation_model.get_capex_per_share(
-                self._cash_flow_statement.loc[:, "Capital Expenditure", :],
+                self._get_intermediate("Capital Expenditure"),
                 average_shares,
             )
 
@@ -5524,7 +5932,7 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return capex_per_share.round(rounding if rounding else self._rounding)
+        return round_dataset(capex_per_share, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -5591,7 +5999,11 @@ class Ratios:
             ].T
 
         dividend_yield = valuation_model.get_dividend_yield(
-            dividends.T.rolling(trailing).sum().T if trailing else dividends,
+            (
+                calculate_trailing_values(dividends, trailing, "sum")
+                if trailing
+                else dividends
+            ),
             share_prices,
         )
 
@@ -5602,7 +6014,7 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return dividend_yield.round(rounding if rounding else self._rounding)
+        return round_dataset(dividend_yield, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -5655,13 +6067,12 @@ class Ratios:
         weighted_dividend_yield = toolkit.ratios.get_weighted_dividend_yield()
         ```
         """
-        average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
-            if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+        shares = (
+            "Weighted Average Shares Diluted" if diluted else "Weighted Average Shares"
         )
+        average_shares = self._get_intermediate(shares)
 
-        dividends_paid = abs(self._cash_flow_statement.loc[:, "Dividends Paid", :])
+        dividends_paid = abs(self._get_intermediate("Dividends Paid"))
 
         years = self._cash_flow_statement.columns
         begin, end = str(years[0]), str(years[-1])
@@ -5671,16 +6082,10 @@ class Ratios:
                 self._tickers_without_portfolio
             ]
 
-            average_shares = map_period_data_to_daily_data(
-                period_data=average_shares,
-                daily_dates=share_prices.index,
-                quarterly=self._quarterly,
-            )
+            average_shares = self._get_daily_intermediate(shares, share_prices.index)
 
-            dividends_paid = map_period_data_to_daily_data(
-                period_data=dividends_paid,
-                daily_dates=share_prices.index,
-                quarterly=self._quarterly,
+            dividends_paid = abs(
+                self._get_daily_intermediate("Dividends Paid", share_prices.index)
             )
         else:
             share_prices = self._historical_data.loc[begin:end, "Adj Close"][
@@ -5689,7 +6094,7 @@ class Ratios:
 
         if trailing:
             weighted_dividend_yield = valuation_model.get_weighted_dividend_yield(
-                dividends_paid.T.rolling(trailing).sum().T,
+                calculate_trailing_values(dividends_paid, trailing, "sum"),
                 average_shares,
                 share_prices,
             )
@@ -5707,7 +6112,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return weighted_dividend_yield.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            weighted_dividend_yield, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -5760,15 +6167,12 @@ class Ratios:
         price_to_cash_flow_ratio = toolkit.ratios.get_price_to_cash_flow_ratio()
         ```
         """
-        average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
-            if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+        shares = (
+            "Weighted Average Shares Diluted" if diluted else "Weighted Average Shares"
         )
+        average_shares = self._get_intermediate(shares)
 
-        cash_flow_from_operations = self._cash_flow_statement.loc[
-            :, "Cash Flow from Operations", :
-        ]
+        cash_flow_from_operations = self._get_intermediate("Cash Flow from Operations")
 
         years = self._cash_flow_statement.columns
         begin, end = str(years[0]), str(years[-1])
@@ -5778,16 +6182,10 @@ class Ratios:
                 self._tickers_without_portfolio
             ]
 
-            average_shares = map_period_data_to_daily_data(
-                period_data=average_shares,
-                daily_dates=share_prices.index,
-                quarterly=self._quarterly,
-            )
+            average_shares = self._get_daily_intermediate(shares, share_prices.index)
 
-            cash_flow_from_operations = map_period_data_to_daily_data(
-                period_data=cash_flow_from_operations,
-                daily_dates=share_prices.index,
-                quarterly=self._quarterly,
+            cash_flow_from_operations = self._get_daily_intermediate(
+                "Cash Flow from Operations", share_prices.index
             )
         else:
             share_prices = self._historical_data.loc[begin:end, "Adj Close"][
@@ -5799,7 +6197,7 @@ class Ratios:
         if trailing:
             price_to_cash_flow_ratio = valuation_model.get_price_to_cash_flow_ratio(
                 market_cap,
-                cash_flow_from_operations.T.rolling(trailing).sum().T,
+                calculate_trailing_values(cash_flow_from_operations, trailing, "sum"),
             )
         else:
             price_to_cash_flow_ratio = valuation_model.get_price_to_cash_flow_ratio(
@@ -5813,7 +6211,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return price_to_cash_flow_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            price_to_cash_flow_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -5870,20 +6270,18 @@ class Ratios:
             show_daily=show_daily,
         )
 
-        free_cash_flow = self._cash_flow_statement.loc[:, "Free Cash Flow", :]
+        free_cash_flow = self._get_intermediate("Free Cash Flow")
 
         if show_daily:
-            free_cash_flow = map_period_data_to_daily_data(
-                period_data=free_cash_flow,
-                daily_dates=market_cap.index,
-                quarterly=self._quarterly,
+            free_cash_flow = self._get_daily_intermediate(
+                "Free Cash Flow", market_cap.index
             )
 
         if trailing:
             price_to_free_cash_flow_ratio = (
                 valuation_model.get_price_to_free_cash_flow_ratio(
                     market_cap,
-                    free_cash_flow.T.rolling(trailing).sum().T,
+                    calculate_trailing_values(free_cash_flow, trailing, "sum"),
                 )
             )
         else:
@@ -5900,8 +6298,8 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return price_to_free_cash_flow_ratio.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            price_to_free_cash_flow_ratio, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -5948,11 +6346,10 @@ class Ratios:
         market_cap = toolkit.ratios.get_market_cap()
         ```
         """
-        average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
-            if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+        shares = (
+            "Weighted Average Shares Diluted" if diluted else "Weighted Average Shares"
         )
+        average_shares = self._get_intermediate(shares)
 
         years = self._cash_flow_statement.columns
         begin, end = str(years[0]), str(years[-1])
@@ -5962,11 +6359,7 @@ class Ratios:
                 self._tickers_without_portfolio
             ]
 
-            average_shares = map_period_data_to_daily_data(
-                period_data=average_shares,
-                daily_dates=share_prices.index,
-                quarterly=self._quarterly,
-            )
+            average_shares = self._get_daily_intermediate(shares, share_prices.index)
         else:
             share_prices = self._historical_data.loc[begin:end, "Adj Close"][
                 self._tickers_without_portfolio
@@ -5985,7 +6378,7 @@ class Ratios:
                 market_cap, lag=lag, rounding=rounding if rounding else self._rounding
             )
 
-        return market_cap.round(rounding if rounding else self._rounding)
+        return round_dataset(market_cap, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -6032,12 +6425,10 @@ class Ratios:
         enterprise_value = toolkit.ratios.get_enterprise_value()
         ```
         """
-        total_debt = self._balance_sheet_statement.loc[:, "Total Debt", :]
-        minority_interest = self._balance_sheet_statement.loc[:, "Minority Interest", :]
-        preferred_stock = self._balance_sheet_statement.loc[:, "Preferred Stock", :]
-        cash_and_cash_equivalents = self._balance_sheet_statement.loc[
-            :, "Cash and Cash Equivalents", :
-        ]
+        total_debt = self._get_intermediate("Total Debt")
+        minority_interest = self._get_intermediate("Minority Interest")
+        preferred_stock = self._get_intermediate("Preferred Stock")
+        cash_and_cash_equivalents = self._get_intermediate("Cash and Cash Equivalents")
 
         market_cap = self.get_market_cap(
             diluted=diluted,
@@ -6046,37 +6437,27 @@ class Ratios:
         )
 
         if show_daily:
-            total_debt = map_period_data_to_daily_data(
-                period_data=total_debt,
-                daily_dates=market_cap.index,
-                quarterly=self._quarterly,
-            )
+            total_debt = self._get_daily_intermediate("Total Debt", market_cap.index)
 
-            minority_interest = map_period_data_to_daily_data(
-                period_data=minority_interest,
-                daily_dates=market_cap.index,
-                quarterly=self._quarterly,
+            minority_interest = self._get_daily_intermediate(
+                "Minority Interest", market_cap.index
             )
 
-            preferred_stock = map_period_data_to_daily_data(
-                period_data=preferred_stock,
-                daily_dates=market_cap.index,
-                quarterly=self._quarterly,
+            preferred_stock = self._get_daily_intermediate(
+                "Preferred Stock", market_cap.index
             )
 
-            cash_and_cash_equivalents = map_period_data_to_daily_data(
-                period_data=cash_and_cash_equivalents,
-                daily_dates=market_cap.index,
-                quarterly=self._quarterly,
+            cash_and_cash_equivalents = self._get_daily_intermediate(
+                "Cash and Cash Equivalents", market_cap.index
             )
 
         if trailing:
             enterprise_value = valuation_model.get_enterprise_value(
                 market_cap,
-                total_debt.T.rolling(trailing).mean().T,
-                minority_interest.T.rolling(trailing).mean().T,
-                preferred_stock.T.rolling(trailing).mean().T,
-                cash_and_cash_equivalents.T.rolling(trailing).mean().T,
+                calculate_trailing_values(total_debt, trailing, "mean"),
+                calculate_trailing_values(minority_interest, trailing, "mean"),
+                calculate_trailing_values(preferred_stock, trailing, "mean"),
+                calculate_trailing_values(cash_and_cash_equivalents, trailing, "mean"),
             )
         else:
             enterprise_value = valuation_model.get_enterprise_value(
@@ -6094,7 +6475,7 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return enterprise_value.round(rounding if rounding else self._rounding)
+        return round_dataset(enterprise_value, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -6147,19 +6528,15 @@ class Ratios:
             show_daily=show_daily,
         )
 
-        revenue = self._income_statement.loc[:, "Revenue", :]
+        revenue = self._get_intermediate("Revenue")
 
         if show_daily:
-            revenue = map_period_data_to_daily_data(
-                period_data=revenue,
-                daily_dates=enterprise_value.index,
-                quarterly=self._quarterly,
-            )
+            revenue = self._get_daily_intermediate("Revenue", enterprise_value.index)
 
         if trailing:
             ev_to_sales_ratio = valuation_model.get_ev_to_sales_ratio(
                 enterprise_value,
-                revenue.T.rolling(trailing).sum().T,
+                calculate_trailing_values(revenue, trailing, "sum"),
             )
         else:
             ev_to_sales_ratio = valuation_model.get_ev_to_sales_ratio(
@@ -6173,7 +6550,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return ev_to_sales_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            ev_to_sales_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -6224,29 +6603,27 @@ class Ratios:
             show_daily=show_daily,
         )
 
-        operating_income = self._income_statement.loc[:, "Operating Income", :]
-        depreciation_and_amortization = self._cash_flow_statement.loc[
-            :, "Depreciation and Amortization", :
-        ]
+        operating_income = self._get_intermediate("Operating Income")
+        depreciation_and_amortization = self._get_intermediate(
+            "Depreciation and Amortization"
+        )
 
         if show_daily:
-            operating_income = map_period_data_to_daily_data(
-                period_data=operating_income,
-                daily_dates=enterprise_value.index,
-                quarterly=self._quarterly,
+            operating_income = self._get_daily_intermediate(
+                "Operating Income", enterprise_value.index
             )
 
-            depreciation_and_amortization = map_period_data_to_daily_data(
-                period_data=depreciation_and_amortization,
-                daily_dates=enterprise_value.index,
-                quarterly=self._quarterly,
+            depreciation_and_amortization = self._get_daily_intermediate(
+                "Depreciation and Amortization", enterprise_value.index
             )
 
         if trailing:
             ev_to_ebitda_ratio = valuation_model.get_ev_to_ebitda_ratio(
                 enterprise_value,
-                operating_income.T.rolling(trailing).sum().T,
-                depreciation_and_amortization.T.rolling(trailing).sum().T,
+                calculate_trailing_values(operating_income, trailing, "sum"),
+                calculate_trailing_values(
+                    depreciation_and_amortization, trailing, "sum"
+                ),
             )
         else:
             ev_to_ebitda_ratio = valuation_model.get_ev_to_ebitda_ratio(
@@ -6260,7 +6637,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return ev_to_ebitda_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            ev_to_ebitda_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -6314,22 +6693,20 @@ class Ratios:
             show_daily=show_daily,
         )
 
-        cash_flow_from_operations = self._cash_flow_statement.loc[
-            :, "Cash Flow from Operations", :
-        ]
+        cash_flow_from_operations = self._get_intermediate("Cash Flow from Operations")
 
         if show_daily:
-            cash_flow_from_operations = map_period_data_to_daily_data(
-                period_data=cash_flow_from_operations,
-                daily_dates=enterprise_value.index,
-                quarterly=self._quarterly,
+            cash_flow_from_operations = self._get_daily_intermediate(
+                "Cash Flow from Operations", enterprise_value.index
             )
 
         if trailing:
             ev_to_operating_cashflow_ratio = (
                 valuation_model.get_ev_to_operating_cashflow_ratio(
                     enterprise_value,
-                    cash_flow_from_operations.T.rolling(trailing).sum().T,
+                    calculate_trailing_values(
+                        cash_flow_from_operations, trailing, "sum"
+                    ),
                 )
             )
         else:
@@ -6346,8 +6723,8 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return ev_to_operating_cashflow_ratio.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            ev_to_operating_cashflow_ratio, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -6429,7 +6806,7 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return earnings_yield.round(rounding if rounding else self._rounding)
+        return round_dataset(earnings_yield, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -6476,19 +6853,13 @@ class Ratios:
         """
         if trailing:
             payout_ratio = valuation_model.get_dividend_payout_ratio(
-                self._cash_flow_statement.loc[:, "Dividends Paid", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._get_intermediate("Trailing Dividends Paid", trailing=trailing),
+                self._get_intermediate("Trailing Net Income", trailing=trailing),
             )
         else:
             payout_ratio = valuation_model.get_dividend_payout_ratio(
-                self._cash_flow_statement.loc[:, "Dividends Paid", :],
-                self._income_statement.loc[:, "Net Income", :],
+                self._get_intermediate("Dividends Paid"),
+                self._get_intermediate("Net Income"),
             )
 
         if growth:
@@ -6496,7 +6867,7 @@ class Ratios:
                 payout_ratio, lag=lag, rounding=rounding if rounding else self._rounding
             )
 
-        return payout_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(payout_ratio, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -6559,7 +6930,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return reinvestment_ratio.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            reinvestment_ratio, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -6601,24 +6974,15 @@ class Ratios:
         """
         if trailing:
             tangible_asset_value = valuation_model.get_tangible_asset_value(
-                self._balance_sheet_statement.loc[:, "Total Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Liabilities", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Goodwill", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate("Trailing Total Assets", trailing=trailing),
+                self._get_intermediate("Trailing Total Liabilities", trailing=trailing),
+                self._get_intermediate("Trailing Goodwill", trailing=trailing),
             )
         else:
             tangible_asset_value = valuation_model.get_tangible_asset_value(
-                self._balance_sheet_statement.loc[:, "Total Assets", :],
-                self._balance_sheet_statement.loc[:, "Total Liabilities", :],
-                self._balance_sheet_statement.loc[:, "Goodwill", :],
+                self._get_intermediate("Total Assets"),
+                self._get_intermediate("Total Liabilities"),
+                self._get_intermediate("Goodwill"),
             )
 
         if growth:
@@ -6628,7 +6992,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return tangible_asset_value.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            tangible_asset_value, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -6670,19 +7036,17 @@ class Ratios:
         """
         if trailing:
             net_current_asset_value = valuation_model.get_net_current_asset_value(
-                self._balance_sheet_statement.loc[:, "Total Current Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._get_intermediate(
+                    "Trailing Total Current Assets", trailing=trailing
+                ),
+                self._get_intermediate(
+                    "Trailing Total Current Liabilities", trailing=trailing
+                ),
             )
         else:
             net_current_asset_value = valuation_model.get_net_current_asset_value(
-                self._balance_sheet_statement.loc[:, "Total Current Assets", :],
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :],
+                self._get_intermediate("Total Current Assets"),
+                self._get_intermediate("Total Current Liabilities"),
             )
 
         if growth:
@@ -6692,7 +7056,9 @@ class Ratios:
                 rounding=rounding if rounding else self._rounding,
             )
 
-        return net_current_asset_value.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            net_current_asset_value, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -6743,9 +7109,9 @@ class Ratios:
         )
 
         ebit = (
-            self._income_statement.loc[:, "Net Income", :]
-            + self._income_statement.loc[:, "Income Tax Expense", :]
-            + self._income_statement.loc[:, "Interest Expense", :]
+            self._get_intermediate("Net Income")
+            + self._get_intermediate("Income Tax Expense")
+            + self._get_intermediate("Interest Expense")
         )
 
         if show_daily:
@@ -6758,7 +7124,7 @@ class Ratios:
         if trailing:
             ev_to_ebit = valuation_model.get_ev_to_ebit(
                 enterprise_value,
-                ebit.T.rolling(trailing).sum().T,
+                calculate_trailing_values(ebit, trailing, "sum"),
             )
         else:
             ev_to_ebit = valuation_model.get_ev_to_ebit(enterprise_value, ebit)
@@ -6768,4 +7134,4 @@ class Ratios:
                 ev_to_ebit, lag=lag, rounding=rounding if rounding else self._rounding
             )
 
-        return ev_to_ebit.round(rounding if rounding else self._rounding)
+        return round_dataset(ev_to_ebit, rounding if rounding else self._rounding)
@@ -4,6 +4,8 @@ import numpy as np
 import pandas as pd
 from scipy import optimize
 
+from financetoolkit.utilities import kernel_model
+
 ALPHA_CONSTRAINT = 0.5
 
 # This is meant for calculations in which a Multi Index exists. This is the case
@@ -159,19 +161,9 @@ def get_garch(
         if time_steps is None:
             time_steps = len(returns)
 
-        # Initialize sigma2 with zeros and set the first value
-        sigma2 = np.zeros(time_steps)
-        sigma2[0] = returns[0] ** 2
-
-        # Calculate sigma2 values using a vectorized approach
-        for i in range(1, time_steps):
-            sigma2[i] = (
-                weights[0]
-                + weights[1] * returns[i - 1] ** 2
-                + weights[2] * sigma2[i - 1]
-            )
-
-        return sigma2
+        # The variance recursion is calculated by the kernel backend (Numba or NumPy)
+        # given that it is called many times while estimating the weights
+        return kernel_model.get_garch_variance(returns, weights, time_steps)
 
     raise TypeError("Expects pd.DataFrame or pd.Series or np.ndarry, no other value.")
 
@@ -237,10 +229,9 @@ def get_garch_forecast(
         sigma_l = weights[0] / (1 - weights[1] - weights[2])
         sigma_2 = np.zeros(time_steps)
         sigma_2[0] = garch_values[0]
-        for i in range(1, time_steps):
-            sigma_2[i] = sigma_l**2 + (garch_values[0] - sigma_l**2) * (
-                weights[1] + weights[2]
-            ) ** (i - 1)
+        sigma_2[1:] = sigma_l**2 + (garch_values[0] - sigma_l**2) * (
+            weights[1] + weights[2]
+        ) ** np.arange(time_steps - 1)
 
         return sigma_2
 
@@ -25,65 +25,103 @@ def determine_within_historical_data(
     daily_historical_data: pd.DataFrame,
     intraday_historical_data: pd.DataFrame,
     intraday_period: str | None,
-):
+    period: str,
+) -> pd.DataFrame:
     """
-    This function is a specific function solely related to the Ratios controller. It
-    therefore also requires a self instance to exists with specific parameters.
+    Determines the historical data within a period by adding the period each row belongs to
+    as an additional index level. E.g. for the weekly period, every daily row is labelled with
+    the week it falls into. This is done by converting the index directly instead of grouping
+    the data which would otherwise copy the entire dataset for each group.
 
     Args:
-        period (str): the period to return the data for.
-        within_period (bool): whether to return the data within the period or the
-        entire period.
-
-    Raises:
-        ValueError: if the period is not daily, monthly, weekly, quarterly, or yearly.
+        daily_historical_data (pd.DataFrame): the daily historical data.
+        intraday_historical_data (pd.DataFrame): the intraday historical data.
+        intraday_period (str | None): the intraday period, e.g. "1min" or "1hour".
+        period (str): the period to return the data for, e.g. "weekly" or "intraday".
 
     Returns:
-        pd.Series: the returns for the period.
+        pd.DataFrame: the historical data with the period and the date as index levels.
     """
-    within_historical_data = {}
+    period_symbol = (
+        PERIOD_TRANSLATION[period][intraday_period]  # type: ignore
+        if period == "intraday"
+        else PERIOD_TRANSLATION[period]
+    )
 
-    for period, symbol in PERIOD_TRANSLATION.items():
-        if not intraday_period and period == "intraday":
-            continue
+    if not intraday_historical_data.empty and period in [
+        "intraday",
+        "daily",
+    ]:
+        historical_data = intraday_historical_data.dropna(how="all", axis=0)
+    else:
+        historical_data = daily_historical_data
 
-        period_symbol = (
-            symbol[intraday_period] if period == "intraday" else symbol  # type: ignore
-        )
+    dates = historical_data.index
 
-        if not intraday_historical_data.empty and period in [
-            "intraday",
-            "daily",
-        ]:
-            within_historical_data[period] = (
-                intraday_historical_data.groupby(pd.Grouper(freq=period_symbol))
-                .apply(lambda x: x)
-                .dropna(how="all", axis=0)
-            )
-        else:
-            within_historical_data[period] = daily_historical_data.groupby(
-                pd.Grouper(
-                    freq=(
-                        f"{period_symbol}E"
-                        if period_symbol in ["M", "Q", "Y"]
-                        else period_symbol
-                    )
-                )
-            ).apply(lambda x: x)
-
-        within_historical_data[period].index = within_historical_data[
-            period
-        ].index.set_levels(
-            [
-                pd.PeriodIndex(
-                    within_historical_data[period].index.levels[0],
-                    freq=period_symbol,
-                ),
-                pd.PeriodIndex(
-                    within_historical_data[period].index.levels[1],
-                    freq="D" if period != "intraday" else "min",
-                ),
-            ],
-        )
+    if isinstance(dates, pd.PeriodIndex):
+        dates = dates.to_timestamp()
+
+    # A shallow copy is sufficient given that only the index is replaced
+    within_historical_data = historical_data.copy(deep=False)
+    within_historical_data.index = pd.MultiIndex.from_arrays(
+        [
+            dates.to_period(period_symbol),  # type: ignore
+            dates.to_period("D" if period != "intraday" else "min"),  # type: ignore
+        ],
+        names=[historical_data.index.name, historical_data.index.name],
+    )
 
     return within_historical_data
+
+
+class WithinHistoricalData(dict):
+    """
+    A dictionary that determines the historical data within each period only once that
+    period is requested. This prevents the data of every period from being determined
+    when initializing the Performance and Risk classes while only a single period is used.
+    """
+
+    def __init__(
+        self,
+        daily_historical_data: pd.DataFrame,
+        intraday_historical_data: pd.DataFrame,
+        intraday_period: str | None,
+        fill_nan: bool = False,
+    ):
+        """
+        Initializes the Within Historical Data Dictionary.
+
+        Args:
+            daily_historical_data (pd.DataFrame): the daily historical data.
+            intraday_historical_data (pd.DataFrame): the intraday historical data.
+            intraday_period (str | None): the intraday period, e.g. "1min" or "1hour".
+            fill_nan (bool, optional): whether to fill NaN values with zero. Defaults to False.
+        """
+        super().__init__()
+
+        self._daily_historical_data = daily_historical_data
+        self._intraday_historical_data = intraday_historical_data
+        self._intraday_period = intraday_period
+        self._fill_nan = fill_nan
+
+    def __missing__(self, period: str) -> pd.DataFrame:
+        if period not in PERIOD_TRANSLATION or (
+            period == "intraday" and not self._intraday_period
+        ):
+            raise KeyError(period)
+
+        daily_historical_data = self._daily_historical_data
+        intraday_historical_data = self._intraday_historical_data
+
+        if self._fill_nan:
+            daily_historical_data = daily_historical_data.fillna(0)
+            intraday_historical_data = intraday_historical_data.fillna(0)
+
+        self[period] = determine_within_historical_data(
+            daily_historical_data=daily_historical_data,
+            intraday_historical_data=intraday_historical_data,
+            intraday_period=self._intraday_period,
+            period=period,
+        )
+
+        return self[period]
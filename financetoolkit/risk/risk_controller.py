@@ -6,7 +6,7 @@ import warnings
 
 import pandas as pd
 
-from financetoolkit.helpers import calculate_growth, handle_portfolio
+from financetoolkit.helpers import calculate_growth, handle_portfolio, round_dataset
 from financetoolkit.risk import (
     cvar_model,
     evar_model,
@@ -14,8 +14,10 @@ from financetoolkit.risk import (
     risk_model,
     var_model,
 )
-from financetoolkit.risk.helpers import determine_within_historical_data
+from financetoolkit.risk.helpers import WithinHistoricalData
+from financetoolkit.utilities import long_format_model, parallel_model
 from financetoolkit.utilities.error_model import handle_errors
+from financetoolkit.utilities.metrics_model import measure_methods
 
 # Runtime errors are ignored on purpose given the nature of the calculations
 # sometimes leading to division by zero or other mathematical errors. This is however
@@ -26,6 +28,7 @@ warnings.filterwarnings("ignore", category=RuntimeWarning)
 # pylint: disable=too-many-boolean-expressions
 
 
+@measure_methods
 class Risk:
     """
     The Risk module is meant to calculate important risk metrics such
@@ -90,25 +93,15 @@ class Risk:
         self._tickers = tickers
         self._quarterly = quarterly
         self._rounding: int | None = rounding
+        self._intraday_period: str | None = intraday_period
         self._portfolio_weights: dict | None = None
 
-        # Within Return Calculations
-        daily_historical_data = self._historical_data["daily"].copy().fillna(0)
-        intraday_historical_data = self._historical_data["intraday"].copy().fillna(0)
-
-        daily_historical_data.index = pd.DatetimeIndex(
-            daily_historical_data.to_timestamp().index
-        )
-
-        if not self._historical_data["intraday"].empty:
-            intraday_historical_data.index = pd.DatetimeIndex(
-                intraday_historical_data.to_timestamp().index
-            )
-
-        self._within_historical_data = determine_within_historical_data(
-            daily_historical_data=daily_historical_data,
-            intraday_historical_data=intraday_historical_data,
+        # Within Return Calculations, these are determined once a period is requested
+        self._within_historical_data = WithinHistoricalData(
+            daily_historical_data=self._historical_data["daily"],
+            intraday_historical_data=self._historical_data["intraday"],
             intraday_period=intraday_period,
+            fill_nan=True,
         )
 
     @handle_portfolio
@@ -119,6 +112,8 @@ class Risk:
         rounding: int | None = None,
         growth: bool = False,
         lag: int | list[int] = 1,
+        n_jobs: int | None = None,
+        long_format: bool = False,
     ):
         """
         Calculates and collects all risk metrics.
@@ -129,6 +124,12 @@ class Risk:
             lag (int | str, optional): The lag to use for the growth calculation. Defaults to 1.
             trailing (int): Defines whether to select a trailing period.
             E.g. when selecting 4 with quarterly data, the TTM is calculated.
+            n_jobs (int | None, optional): The number of processes to divide the tickers over. A negative
+            number is subtracted from the number of CPU cores, e.g. -1 uses all cores. Defaults to None
+            which means the metrics are calculated within the current process.
+            long_format (bool, optional): Whether to return the metrics in the long format with a row for
+            each ticker, metric and period, which can be converted back with long_format_model.to_wide_format.
+            Defaults to False.
 
         Returns:
             pd.Series or pd.DataFrame: Risk metrics calculated based on the specified parameters.
@@ -159,34 +160,67 @@ class Risk:
 
         rounding = rounding if rounding else self._rounding
 
-        risk_metrics = {
-            "Value at Risk": self.get_value_at_risk(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "Conditional Value at Risk": self.get_conditional_value_at_risk(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "Entropic Value at Risk": self.get_entropic_value_at_risk(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "Maximum Drawdown": self.get_maximum_drawdown(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "Ulcer Index": self.get_ulcer_index(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "GARCH": self.get_garch(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "Skewness": self.get_skewness(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-            "Kurtosis": self.get_kurtosis(
-                period=period, rounding=rounding, growth=growth, lag=lag
-            ),
-        }
-
-        risk_metrics = pd.concat(risk_metrics, axis=1)
+        shards = parallel_model.split_in_shards(self._tickers, n_jobs)
+
+        if shards:
+            risk_metrics = parallel_model.collect_in_parallel(
+                controller_class=Risk,
+                arguments={
+                    "historical_data": self._historical_data,
+                    "intraday_period": self._intraday_period,
+                    "quarterly": self._quarterly,
+                    "rounding": self._rounding,
+                },
+                method="collect_all_metrics",
+                method_arguments={
+                    "period": period,
+                    "rounding": rounding,
+                    "growth": growth,
+                    "lag": lag,
+                },
+                shards=shards,
+                axis=1,
+            )
+
+            if long_format:
+                return long_format_model.collect_long_format_from_metrics(
+                    {
+                        metric: risk_metrics[metric]
+                        for metric in risk_metrics.columns.unique(level=0)
+                    }
+                )
+        else:
+            risk_metrics = {
+                "Value at Risk": self.get_value_at_risk(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "Conditional Value at Risk": self.get_conditional_value_at_risk(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "Entropic Value at Risk": self.get_entropic_value_at_risk(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "Maximum Drawdown": self.get_maximum_drawdown(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "Ulcer Index": self.get_ulcer_index(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "GARCH": self.get_garch(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "Skewness": self.get_skewness(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+                "Kurtosis": self.get_kurtosis(
+                    period=period, rounding=rounding, growth=growth, lag=lag
+                ),
+            }
+
+            if long_format:
+                return long_format_model.collect_long_format_from_metrics(risk_metrics)
+
+            risk_metrics = pd.concat(risk_metrics, axis=1)
 
         if len(self._tickers) == 1:
             risk_metrics = risk_metrics.xs(self._tickers[0], level=1, axis=1)
@@ -299,7 +333,7 @@ class Risk:
                 axis="index",
             )
 
-        return value_at_risk.round(rounding if rounding else self._rounding)
+        return round_dataset(value_at_risk, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -411,7 +445,9 @@ class Risk:
                 axis="index",
             )
 
-        return conditional_value_at_risk.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            conditional_value_at_risk, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -507,7 +543,9 @@ class Risk:
                 axis="index",
             )
 
-        return entropic_value_at_risk.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            entropic_value_at_risk, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -599,7 +637,7 @@ class Risk:
                 axis="index",
             )
 
-        return maximum_drawdown.round(rounding if rounding else self._rounding)
+        return round_dataset(maximum_drawdown, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -688,7 +726,7 @@ class Risk:
                 axis="index",
             )
 
-        return ulcer_index.round(rounding if rounding else self._rounding)
+        return round_dataset(ulcer_index, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -788,7 +826,7 @@ class Risk:
                 axis="index",
             )
 
-        return garch_sigma_2.round(rounding if rounding else self._rounding)  # type: ignore
+        return round_dataset(garch_sigma_2, rounding if rounding else self._rounding)  # type: ignore
 
     @handle_portfolio
     @handle_errors
@@ -910,7 +948,7 @@ class Risk:
                 axis="index",
             )
 
-        return sigma_2_forecast.round(rounding if rounding else self._rounding)
+        return round_dataset(sigma_2_forecast, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -998,7 +1036,7 @@ class Risk:
                 axis="index",
             )
 
-        return skewness.round(rounding if rounding else self._rounding)
+        return round_dataset(skewness, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -1091,4 +1129,4 @@ class Risk:
                 axis="index",
             )
 
-        return kurtosis.round(rounding if rounding else self._rounding)
+        return round_dataset(kurtosis, rounding if rounding else self._rounding)
@@ -46,18 +46,25 @@ def get_advancers_decliners(prices_close: pd.Series) -> pd.Series:
     return advancers - decliners
 
 
-def get_on_balance_volume(prices_close: pd.Series, volumes: pd.Series) -> pd.Series:
+def get_on_balance_volume(
+    prices_close: pd.Series,
+    volumes: pd.Series,
+    *,
+    price_difference: pd.Series | None = None,
+) -> pd.Series:
     """
     Calculate the On-Balance Volume (OBV) of a given price series.
 
     Args:
         prices_close (pd.Series): Series of closing prices.
         volumes (pd.Series): Series of trading volumes.
+        price_difference (pd.Series | None): The previously calculated difference between
+            consecutive closing prices. Defaults to None.
 
     Returns:
         pd.Series: OBV values.
     """
-    price_diff = prices_close.diff(1)
+    price_diff = prices_close.diff(1) if price_difference is None else price_difference
     obv = (price_diff / abs(price_diff)) * volumes
 
     return obv.cumsum()
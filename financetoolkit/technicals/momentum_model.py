@@ -2,12 +2,72 @@
 
 __docformat__ = "google"
 
+import numpy as np
 import pandas as pd
 
 from financetoolkit.technicals.overlap_model import (
     get_exponential_moving_average,
     get_moving_average,
 )
+from financetoolkit.technicals.volatility_model import get_true_range
+
+
+def get_typical_price(
+    prices_high: pd.Series, prices_low: pd.Series, prices_close: pd.Series
+) -> pd.Series:
+    """
+    Calculate the typical price, the average of the high, low and closing prices.
+
+    Args:
+        prices_high (pd.Series): Series of high prices.
+        prices_low (pd.Series): Series of low prices.
+        prices_close (pd.Series): Series of closing prices.
+
+    Returns:
+        pd.Series: Typical prices.
+    """
+    return (prices_high + prices_low + prices_close) / 3
+
+
+def get_highest_high(prices_high: pd.Series, window: int) -> pd.Series:
+    """
+    Calculate the highest high price over a rolling window.
+
+    Args:
+        prices_high (pd.Series): Series of high prices.
+        window (int): Number of periods of the rolling window.
+
+    Returns:
+        pd.Series: Highest high prices.
+    """
+    return prices_high.rolling(window=window).max()
+
+
+def get_lowest_low(prices_low: pd.Series, window: int) -> pd.Series:
+    """
+    Calculate the lowest low price over a rolling window.
+
+    Args:
+        prices_low (pd.Series): Series of low prices.
+        window (int): Number of periods of the rolling window.
+
+    Returns:
+        pd.Series: Lowest low prices.
+    """
+    return prices_low.rolling(window=window).min()
+
+
+def get_price_difference(prices: pd.Series) -> pd.Series:
+    """
+    Calculate the difference between consecutive prices.
+
+    Args:
+        prices (pd.Series): Series of prices.
+
+    Returns:
+        pd.Series: Price differences.
+    """
+    return prices.diff(1)
 
 
 def get_money_flow_index(
@@ -16,6 +76,8 @@ def get_money_flow_index(
     prices_close: pd.Series,
     volumes: pd.Series,
     window: int,
+    *,
+    typical_prices: pd.Series | None = None,
 ) -> pd.Series:
     """
     Calculate the Money Flow Index (MFI) indicator for a given price series.
@@ -26,11 +88,14 @@ def get_money_flow_index(
         prices_close (pd.Series): Series of closing prices.
         volumes (pd.Series): Series of trading volumes.
         window (int): Number of periods for MFI calculation.
+        typical_prices (pd.Series | None): The previously calculated typical prices.
+            Defaults to None.
 
     Returns:
         pd.Series: MFI values.
     """
-    typical_prices = (prices_high + prices_low + prices_close) / 3
+    if typical_prices is None:
+        typical_prices = get_typical_price(prices_high, prices_low, prices_close)
     raw_money_flow = typical_prices * volumes
 
     positive_money_flow = (
@@ -51,7 +116,13 @@ def get_money_flow_index(
 
 
 def get_williams_percent_r(
-    prices_high: pd.Series, prices_low: pd.Series, prices_close: pd.Series, window: int
+    prices_high: pd.Series,
+    prices_low: pd.Series,
+    prices_close: pd.Series,
+    window: int,
+    *,
+    highest_high: pd.Series | None = None,
+    lowest_low: pd.Series | None = None,
 ) -> pd.Series:
     """
     Calculate the Williams %R indicator for a given price series.
@@ -61,17 +132,69 @@ def get_williams_percent_r(
         prices_low (pd.Series): Series of low prices.
         prices_close (pd.Series): Series of closing prices.
         window (int): Number of periods for %R calculation.
+        highest_high (pd.Series | None): The previously calculated highest high prices
+            over the window. Defaults to None.
+        lowest_low (pd.Series | None): The previously calculated lowest low prices
+            over the window. Defaults to None.
 
     Returns:
         pd.Series: Williams %R values.
     """
-    highest_high = prices_high.rolling(window=window).max()
-    lowest_low = prices_low.rolling(window=window).min()
+    if highest_high is None:
+        highest_high = get_highest_high(prices_high, window)
+    if lowest_low is None:
+        lowest_low = get_lowest_low(prices_low, window)
 
     percent_r = -((highest_high - prices_close) / (highest_high - lowest_low)) * 100
     return percent_r
 
 
+def get_rolling_extreme_position(
+    prices: pd.Series | pd.DataFrame, window: int, highest: bool = True
+) -> pd.Series | pd.DataFrame:
+    """
+    Calculate the position of the highest (or lowest) price within each rolling window,
+    with 0 being the oldest price of the window. When the extreme occurs more than once,
+    the first occurrence is used. Windows that contain missing prices result in NaN.
+
+    The positions are determined for all windows (and tickers) at once through a sliding
+    window view of the prices, which does not copy the prices.
+
+    Args:
+        prices (pd.Series | pd.DataFrame): Series or DataFrame (with the tickers as
+            columns) of prices.
+        window (int): Number of periods in each window.
+        highest (bool, optional): Whether to find the highest or lowest price.
+            Defaults to True.
+
+    Returns:
+        pd.Series | pd.DataFrame: The position of the extreme within each window.
+    """
+    values = prices.to_numpy(dtype=np.float64)
+    positions = np.full(values.shape, np.nan)
+
+    if len(values) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+        extreme_positions = (
+            windows.argmax(axis=-1) if highest else windows.argmin(axis=-1)
+        )
+
+        # The amount of missing prices within each window, based on the cumulative count
+        missing_prices = np.concatenate(
+            [np.zeros((1, *values.shape[1:])), np.isnan(values).cumsum(axis=0)]
+        )
+        missing_in_window = missing_prices[window:] - missing_prices[:-window]
+
+        positions[window - 1 :] = np.where(
+            missing_in_window > 0, np.nan, extreme_positions
+        )
+
+    if isinstance(prices, pd.DataFrame):
+        return pd.DataFrame(positions, index=prices.index, columns=prices.columns)
+
+    return pd.Series(positions, index=prices.index, name=prices.name)
+
+
 def get_aroon_indicator(
     prices_high: pd.Series, prices_low: pd.Series, window: int
 ) -> pd.DataFrame:
@@ -87,18 +210,12 @@ def get_aroon_indicator(
         pd.DataFrame: Aroon Up and Aroon Down values.
     """
     aroon_up = (
-        (
-            window
-            - prices_high.rolling(window=window).apply(lambda x: x.argmax(), raw=True)
-        )
+        (window - get_rolling_extreme_position(prices_high, window, highest=True))
         / window
         * 100
     )
     aroon_down = (
-        (
-            window
-            - prices_low.rolling(window=window).apply(lambda x: x.argmin(), raw=True)
-        )
+        (window - get_rolling_extreme_position(prices_low, window, highest=False))
         / window
         * 100
     )
@@ -112,6 +229,8 @@ def get_commodity_channel_index(
     prices_close: pd.Series,
     window: int,
     constant: float = 0.015,
+    *,
+    typical_prices: pd.Series | None = None,
 ) -> pd.Series:
     """
     Calculate the Commodity Channel Index (CCI) for a given price series.
@@ -122,11 +241,14 @@ def get_commodity_channel_index(
         prices_close (pd.Series): Series of closing prices.
         window (int): Number of periods for CCI calculation.
         constant (float): Constant multiplier for CCI.
+        typical_prices (pd.Series | None): The previously calculated typical prices.
+            Defaults to None.
 
     Returns:
         pd.Series: CCI values.
     """
-    typical_prices = (prices_high + prices_low + prices_close) / 3
+    if typical_prices is None:
+        typical_prices = get_typical_price(prices_high, prices_low, prices_close)
     sma_typical_prices = typical_prices.rolling(window=window).mean()
 
     mean_deviation = (
@@ -169,7 +291,11 @@ def get_relative_vigor_index(
 
 
 def get_force_index(
-    prices_close: pd.Series, volumes: pd.Series, window: int
+    prices_close: pd.Series,
+    volumes: pd.Series,
+    window: int,
+    *,
+    price_difference: pd.Series | None = None,
 ) -> pd.Series:
     """
     Calculate the Force Index for a given price series.
@@ -178,11 +304,16 @@ def get_force_index(
         prices_close (pd.Series): Series of closing prices.
         volumes (pd.Series): Series of trading volumes.
         window (int): Number of periods for Force Index calculation.
+        price_difference (pd.Series | None): The previously calculated difference between
+            consecutive closing prices. Defaults to None.
 
     Returns:
         pd.Series: Force Index values.
     """
-    return prices_close.diff(1) * volumes.rolling(window=window).sum()
+    if price_difference is None:
+        price_difference = get_price_difference(prices_close)
+
+    return price_difference * volumes.rolling(window=window).sum()
 
 
 def get_ultimate_oscillator(
@@ -192,6 +323,8 @@ def get_ultimate_oscillator(
     window_1: int,
     window_2: int,
     window_3: int,
+    *,
+    true_range: pd.Series | None = None,
 ) -> pd.Series:
     """
     Calculate the Ultimate Oscillator for a given price series.
@@ -203,26 +336,19 @@ def get_ultimate_oscillator(
         window_1 (int): Number of periods for the first time period.
         window_2 (int): Number of periods for the second time period.
         window_3 (int): Number of periods for the third time period.
+        true_range (pd.Series | None): The previously calculated true range. Defaults to None.
 
     Returns:
         pd.Series: Ultimate Oscillator values.
     """
-    true_range = pd.concat(
-        [
-            prices_high - prices_low,
-            abs(prices_high - prices_close.shift(1)),
-            abs(prices_low - prices_close.shift(1)),
-        ],
-        axis=1,
-    ).max(axis=1)
+    if true_range is None:
+        true_range = get_true_range(prices_high, prices_low, prices_close)
 
     avg_true_range_1 = true_range.rolling(window=window_1).mean()
     avg_true_range_2 = true_range.rolling(window=window_2).mean()
     avg_true_range_3 = true_range.rolling(window=window_3).mean()
 
-    buying_pressure = prices_close - pd.concat(
-        [prices_low.shift(1), prices_close.shift(1)], axis=1
-    ).min(axis=1)
+    buying_pressure = prices_close - np.fmin(prices_low.shift(1), prices_close.shift(1))
 
     avg_buying_pressure_1 = buying_pressure.rolling(window=window_1).sum()
     avg_buying_pressure_2 = buying_pressure.rolling(window=window_2).sum()
@@ -238,7 +364,12 @@ def get_ultimate_oscillator(
 
 
 def get_percentage_price_oscillator(
-    prices_close: pd.Series, short_window: int, long_window: int
+    prices_close: pd.Series,
+    short_window: int,
+    long_window: int,
+    *,
+    short_ema: pd.Series | None = None,
+    long_ema: pd.Series | None = None,
 ) -> pd.Series:
     """
     Calculate the Percentage Price Oscillator (PPO) for a given price series.
@@ -247,12 +378,18 @@ def get_percentage_price_oscillator(
         prices_close (pd.Series): Series of closing prices.
         short_window (int): Number of periods for the short-term EMA.
         long_window (int): Number of periods for the long-term EMA.
+        short_ema (pd.Series | None): The previously calculated short-term EMA.
+            Defaults to None.
+        long_ema (pd.Series | None): The previously calculated long-term EMA.
+            Defaults to None.
 
     Returns:
         pd.Series: PPO values.
     """
-    short_ema = get_exponential_moving_average(prices_close, short_window)
-    long_ema = get_exponential_moving_average(prices_close, long_window)
+    if short_ema is None:
+        short_ema = get_exponential_moving_average(prices_close, short_window)
+    if long_ema is None:
+        long_ema = get_exponential_moving_average(prices_close, long_window)
 
     ppo = ((short_ema - long_ema) / long_ema) * 100
     return ppo
@@ -286,7 +423,12 @@ def get_detrended_price_oscillator(
 
 
 def get_average_directional_index(
-    prices_high: pd.Series, prices_low: pd.Series, prices_close: pd.Series, window: int
+    prices_high: pd.Series,
+    prices_low: pd.Series,
+    prices_close: pd.Series,
+    window: int,
+    *,
+    true_range: pd.Series | None = None,
 ) -> pd.Series:
     """
     Calculate the Average Directional Movement Index (ADX) of a given price series.
@@ -300,29 +442,20 @@ def get_average_directional_index(
         prices_low (pd.Series): Series of low prices.
         prices_close (pd.Series): Series of closing prices.
         window (int): Number of periods to consider for ADX calculation.
+        true_range (pd.Series | None): The previously calculated true range.
+            Defaults to None.
 
     Returns:
         pd.Series: ADX values.
     """
-    high_low = prices_high - prices_low
-    high_close_prev = abs(prices_high - prices_close.shift(1))
-    low_close_prev = abs(prices_low - prices_close.shift(1))
-
-    tr = pd.DataFrame(
-        {
-            "high_low": high_low,
-            "high_close_prev": high_close_prev,
-            "low_close_prev": low_close_prev,
-        },
-        index=prices_high.index,
-    )
+    if true_range is None:
+        true_range = get_true_range(prices_high, prices_low, prices_close)
 
-    tr["true_range"] = tr[["high_low", "high_close_prev", "low_close_prev"]].max(axis=1)
+    # Only the upward (downward) movements count, the first period has no movement
+    plus_dm = prices_high.diff().clip(lower=0).fillna(0)
+    minus_dm = -prices_low.diff().clip(upper=0).fillna(0)
 
-    plus_dm = prices_high.diff().apply(lambda x: x if x > 0 else 0)
-    minus_dm = -prices_low.diff().apply(lambda x: x if x < 0 else 0)
-
-    atr = tr["true_range"].rolling(window=window).mean()
+    atr = true_range.rolling(window=window).mean()
     plus_di = 100 * (plus_dm.rolling(window=window).mean() / atr)
     minus_di = 100 * (minus_dm.rolling(window=window).mean() / atr)
 
@@ -333,18 +466,26 @@ def get_average_directional_index(
     return adx
 
 
-def get_chande_momentum_oscillator(prices_close: pd.Series, window: int) -> pd.Series:
+def get_chande_momentum_oscillator(
+    prices_close: pd.Series, window: int, *, price_difference: pd.Series | None = None
+) -> pd.Series:
     """
     Calculate the Chande Momentum Oscillator (CMO) for a given price series.
 
     Args:
         prices_close (pd.Series): Series of closing prices.
         window (int): Number of periods for CMO calculation.
+        price_difference (pd.Series | None): The previously calculated difference between
+            consecutive closing prices. Defaults to None.
 
     Returns:
         pd.Series: CMO values.
     """
-    price_diff = prices_close.diff(1)
+    price_diff = (
+        get_price_difference(prices_close)
+        if price_difference is None
+        else price_difference
+    )
 
     up_sum = price_diff.where(price_diff > 0, 0).rolling(window=window).sum()
     down_sum = abs(price_diff.where(price_diff < 0, 0)).rolling(window=window).sum()
@@ -404,6 +545,9 @@ def get_stochastic_oscillator(
     prices_close: pd.Series,
     window: int,
     smooth_window: int,
+    *,
+    highest_high: pd.Series | None = None,
+    lowest_low: pd.Series | None = None,
 ) -> pd.DataFrame:
     """
     Calculate the Stochastic Oscillator of a given price series.
@@ -414,12 +558,18 @@ def get_stochastic_oscillator(
         prices_close (pd.Series): Series of closing prices.
         window (int): Number of periods for the stochastic calculation.
         smooth_window (int): Number of periods for smoothing the %K values.
+        highest_high (pd.Series | None): The previously calculated highest high prices
+            over the window. Defaults to None.
+        lowest_low (pd.Series | None): The previously calculated lowest low prices
+            over the window. Defaults to None.
 
     Returns:
         pd.DataFrame: Stochastic Oscillator (%K and %D).
     """
-    lowest_low = prices_low.rolling(window=window).min()
-    highest_high = prices_high.rolling(window=window).max()
+    if lowest_low is None:
+        lowest_low = get_lowest_low(prices_low, window)
+    if highest_high is None:
+        highest_high = get_highest_high(prices_high, window)
 
     stochastic_k = ((prices_close - lowest_low) / (highest_high - lowest_low)) * 100
     stochastic_d = stochastic_k.rolling(window=smooth_window).mean()
@@ -430,7 +580,13 @@ def get_stochastic_oscillator(
 
 
 def get_moving_average_convergence_divergence(
-    prices: pd.Series, short_window: int, long_window: int, signal_window: int
+    prices: pd.Series,
+    short_window: int,
+    long_window: int,
+    signal_window: int,
+    *,
+    short_ema: pd.Series | None = None,
+    long_ema: pd.Series | None = None,
 ) -> pd.Series:
     """
     Calculate the Moving Average Convergence Divergence (MACD) of a given price series.
@@ -440,12 +596,18 @@ def get_moving_average_convergence_divergence(
         short_window (int): Number of periods for the short-term moving average.
         long_window (int): Number of periods for the long-term moving average.
         signal_window (int): Number of periods for the signal line moving average.
+        short_ema (pd.Series | None): The previously calculated short-term EMA.
+            Defaults to None.
+        long_ema (pd.Series | None): The previously calculated long-term EMA.
+            Defaults to None.
 
     Returns:
         pd.Series: MACD values.
     """
-    short_ema = prices.ewm(span=short_window, min_periods=1, adjust=False).mean()
-    long_ema = prices.ewm(span=long_window, min_periods=1, adjust=False).mean()
+    if short_ema is None:
+        short_ema = get_exponential_moving_average(prices, short_window)
+    if long_ema is None:
+        long_ema = get_exponential_moving_average(prices, long_window)
 
     macd_line = short_ema - long_ema
     signal_line = macd_line.ewm(span=signal_window, min_periods=1, adjust=False).mean()
@@ -455,19 +617,25 @@ def get_moving_average_convergence_divergence(
     )
 
 
-def get_relative_strength_index(prices: pd.Series, window: int) -> pd.Series:
+def get_relative_strength_index(
+    prices: pd.Series, window: int, *, price_difference: pd.Series | None = None
+) -> pd.Series:
     """
     Calculate the Relative Strength Index (RSI) of a given price series.
 
     Args:
         prices (pd.Series): Series of prices.
         window (int): Number of periods to consider for RSI calculation.
+        price_difference (pd.Series | None): The previously calculated difference between
+            consecutive prices. Defaults to None.
 
     Returns:
         pd.Series: RSI values.
     """
     # Calculate price changes
-    price_diff = prices.diff(1)
+    price_diff = (
+        get_price_difference(prices) if price_difference is None else price_difference
+    )
 
     # Calculate upward and downward price changes
     up_changes = price_diff.where(price_diff > 0, 0)
@@ -35,36 +35,58 @@ def get_exponential_moving_average(prices: pd.Series, window: int) -> pd.Series:
     return prices.ewm(span=window, min_periods=1, adjust=False).mean()
 
 
-def get_double_exponential_moving_average(prices: pd.Series, window: int) -> pd.Series:
+def get_double_exponential_moving_average(
+    prices: pd.Series,
+    window: int,
+    *,
+    exponential_moving_average: pd.Series | None = None,
+) -> pd.Series:
     """
     Calculate the Double Exponential Moving Average (DEMA) of a given price series.
 
     Args:
         prices (pd.Series): Series of prices.
         window (int): Number of periods to consider for DEMA calculation.
+        exponential_moving_average (pd.Series | None): The previously calculated EMA of the
+            prices over the window. Defaults to None.
 
     Returns:
         pd.Series: DEMA values.
     """
-    ema_first = prices.ewm(span=window, min_periods=1, adjust=False).mean()
+    ema_first = (
+        get_exponential_moving_average(prices, window)
+        if exponential_moving_average is None
+        else exponential_moving_average
+    )
     ema_second = ema_first.ewm(span=window, min_periods=1, adjust=False).mean()
     dema = 2 * ema_first - ema_second
 
     return dema
 
 
-def get_trix(prices_close: pd.Series, window: int) -> pd.Series:
+def get_trix(
+    prices_close: pd.Series,
+    window: int,
+    *,
+    exponential_moving_average: pd.Series | None = None,
+) -> pd.Series:
     """
     Calculate the Trix Indicator for a given price series.
 
     Args:
         prices_close (pd.Series): Series of closing prices.
         window (int): Number of periods for Trix calculation.
+        exponential_moving_average (pd.Series | None): The previously calculated EMA of the
+            closing prices over the window. Defaults to None.
 
     Returns:
         pd.Series: Trix Indicator values.
     """
-    ema_1 = get_exponential_moving_average(prices_close, window)
+    ema_1 = (
+        get_exponential_moving_average(prices_close, window)
+        if exponential_moving_average is None
+        else exponential_moving_average
+    )
     ema_2 = get_exponential_moving_average(ema_1, window)
     ema_3 = get_exponential_moving_average(ema_2, window)
 
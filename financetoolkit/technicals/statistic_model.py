@@ -6,6 +6,8 @@ import numpy as np
 import pandas as pd
 import scipy
 
+from financetoolkit.utilities import kernel_model
+
 
 def get_beta(returns: pd.Series, benchmark_returns: pd.Series) -> pd.Series:
     """
@@ -253,17 +255,9 @@ def get_ar(
         else:
             raise ValueError("Method must be 'lsm' or 'yw'.")
 
-    predictions = np.zeros(steps)
-    recent_values = list(data[-p:])
-
-    for i in range(steps):
-        next_value = c + phi @ recent_values
-        predictions[i] = next_value
-
-        recent_values.append(next_value)
-        recent_values.pop(0)
-
-    return predictions
+    # Each prediction becomes an observation for the next prediction, this recursion is
+    # calculated by the kernel backend (Numba or NumPy)
+    return kernel_model.get_autoregressive_forecast(data[-p:], phi, c, steps)
 
 
 def ma_likelihood(params, data: np.ndarray) -> float:
@@ -2,10 +2,11 @@
 
 __docformat__ = "google"
 
+from collections.abc import Callable
 
 import pandas as pd
 
-from financetoolkit.helpers import calculate_growth, handle_portfolio
+from financetoolkit.helpers import calculate_growth, handle_portfolio, round_dataset
 from financetoolkit.technicals import (
     breadth_model,
     momentum_model,
@@ -13,11 +14,47 @@ from financetoolkit.technicals import (
     volatility_model,
 )
 from financetoolkit.technicals.helpers import handle_errors
+from financetoolkit.utilities.cache_model import share_intermediates
+from financetoolkit.utilities.metrics_model import measure_methods
 
 # pylint: disable=too-many-lines,too-many-instance-attributes,too-many-public-methods,too-many-locals,eval-used
 # pylint: disable=too-many-boolean-expressions
 
+# The intermediates that several indicators depend on. Each intermediate is calculated for
+# all tickers at once from the historical data, the close column and, optionally, the window.
+INTERMEDIATES: dict[str, Callable] = {
+    "True Range": lambda historical_data, close_column, _: (
+        volatility_model.get_true_range(
+            historical_data["High"],
+            historical_data["Low"],
+            historical_data[close_column],
+        )
+    ),
+    "Typical Price": lambda historical_data, close_column, _: (
+        momentum_model.get_typical_price(
+            historical_data["High"],
+            historical_data["Low"],
+            historical_data[close_column],
+        )
+    ),
+    "Highest High": lambda historical_data, _, window: momentum_model.get_highest_high(
+        historical_data["High"], window
+    ),
+    "Lowest Low": lambda historical_data, _, window: momentum_model.get_lowest_low(
+        historical_data["Low"], window
+    ),
+    "Exponential Moving Average": lambda historical_data, close_column, window: (
+        overlap_model.get_exponential_moving_average(
+            historical_data[close_column], window
+        )
+    ),
+    "Price Difference": lambda historical_data, close_column, _: (
+        momentum_model.get_price_difference(historical_data[close_column])
+    ),
+}
+
 
+@measure_methods
 class Technicals:
     """
     The Technicals Module contains 30+ Technical Indicators that can
@@ -85,6 +122,10 @@ class Technicals:
         self._end_date: str | None = end_date
         self._portfolio_weights: dict | None = None
 
+        # The intermediates that are shared between the indicators while collecting
+        # these, see share_intermediates
+        self._intermediates: dict | None = None
+
         # Technical Indicators
         self._all_indicators: pd.DataFrame = pd.DataFrame()
         self._all_indicators_growth: pd.DataFrame = pd.DataFrame()
@@ -97,6 +138,39 @@ class Technicals:
         self._volatility_indicators: pd.DataFrame = pd.DataFrame()
         self._volatility_indicators_growth: pd.DataFrame = pd.DataFrame()
 
+    def _get_intermediate(
+        self, name: str, period: str, close_column: str, window: int | None = None
+    ) -> pd.DataFrame:
+        """
+        Returns an intermediate that several indicators depend on, e.g. the true range or
+        the exponential moving average of the close prices, for all tickers. While the
+        indicators are collected, each intermediate is calculated once per period, close
+        column and window and shared between the indicators.
+
+        Args:
+            name (str): The name of the intermediate as defined in INTERMEDIATES.
+            period (str): The period of the historical data.
+            close_column (str): The name of the column containing the close prices.
+            window (int | None, optional): The window of the intermediate. Defaults to None.
+
+        Returns:
+            pd.DataFrame: The intermediate with the dates as index and the tickers as columns.
+        """
+        key = (name, period, close_column, window)
+
+        if self._intermediates is not None and key in self._intermediates:
+            return self._intermediates[key]
+
+        intermediate = INTERMEDIATES[name](
+            self._historical_data[period], close_column, window
+        )
+
+        if self._intermediates is not None:
+            self._intermediates[key] = intermediate
+
+        return intermediate
+
+    @share_intermediates
     def collect_all_indicators(
         self,
         period: str = "daily",
@@ -169,8 +243,8 @@ class Technicals:
             axis=1,
         )
 
-        self._all_indicators = self._all_indicators.round(
-            rounding if rounding else self._rounding
+        self._all_indicators = round_dataset(
+            self._all_indicators, rounding if rounding else self._rounding
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -183,6 +257,7 @@ class Technicals:
 
         return self._all_indicators_growth if growth else self._all_indicators
 
+    @share_intermediates
     def collect_breadth_indicators(
         self,
         period: str = "daily",
@@ -265,8 +340,8 @@ class Technicals:
 
         self._breadth_indicators = pd.concat(breadth_indicators, axis=1)
 
-        self._breadth_indicators = self._breadth_indicators.round(
-            rounding if rounding else self._rounding
+        self._breadth_indicators = round_dataset(
+            self._breadth_indicators, rounding if rounding else self._rounding
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -368,13 +443,9 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        mcclellan_oscillator = pd.DataFrame(
-            index=historical_data.loc[self._start_date : self._end_date].index
-        )
-        for ticker in historical_data[close_column].columns:
-            mcclellan_oscillator[ticker] = breadth_model.get_mcclellan_oscillator(
-                historical_data[close_column][ticker], short_ema_window, long_ema_window
-            ).loc[self._start_date : self._end_date]
+        mcclellan_oscillator = breadth_model.get_mcclellan_oscillator(
+            historical_data[close_column], short_ema_window, long_ema_window
+        ).loc[self._start_date : self._end_date]
 
         if growth:
             return calculate_growth(
@@ -384,7 +455,9 @@ class Technicals:
                 axis="index",
             )
 
-        return mcclellan_oscillator.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            mcclellan_oscillator, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -470,7 +543,9 @@ class Technicals:
                 axis="index",
             )
 
-        return advancers_decliners.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            advancers_decliners, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -546,6 +621,9 @@ class Technicals:
         on_balance_volume = breadth_model.get_on_balance_volume(
             historical_data[close_column],
             historical_data["Volume"],
+            price_difference=self._get_intermediate(
+                "Price Difference", period, close_column
+            ),
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -556,7 +634,9 @@ class Technicals:
                 axis="index",
             )
 
-        return on_balance_volume.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            on_balance_volume, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -630,18 +710,14 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        accumulation_distribution_line = pd.DataFrame(
-            index=historical_data.loc[self._start_date : self._end_date].index
+        accumulation_distribution_line = (
+            breadth_model.get_accumulation_distribution_line(
+                historical_data["High"],
+                historical_data["Low"],
+                historical_data[close_column],
+                historical_data["Volume"],
+            ).loc[self._start_date : self._end_date]
         )
-        for ticker in historical_data[close_column].columns:
-            accumulation_distribution_line[ticker] = (
-                breadth_model.get_accumulation_distribution_line(
-                    historical_data["High"][ticker],
-                    historical_data["Low"][ticker],
-                    historical_data[close_column][ticker],
-                    historical_data["Volume"][ticker],
-                ).loc[self._start_date : self._end_date]
-            )
 
         if growth:
             return calculate_growth(
@@ -651,8 +727,8 @@ class Technicals:
                 axis="index",
             )
 
-        return accumulation_distribution_line.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            accumulation_distribution_line, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -750,8 +826,11 @@ class Technicals:
                 axis="index",
             )
 
-        return chaikin_oscillator.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            chaikin_oscillator, rounding if rounding else self._rounding
+        )
 
+    @share_intermediates
     def collect_momentum_indicators(
         self,
         period: str = "daily",
@@ -902,8 +981,8 @@ class Technicals:
 
         self._momentum_indicators = pd.concat(momentum_indicators, axis=1)
 
-        self._momentum_indicators = self._momentum_indicators.round(
-            rounding if rounding else self._rounding
+        self._momentum_indicators = round_dataset(
+            self._momentum_indicators, rounding if rounding else self._rounding
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -1008,6 +1087,9 @@ class Technicals:
             historical_data[close_column],
             historical_data["Volume"],
             window,
+            typical_prices=self._get_intermediate(
+                "Typical Price", period, close_column
+            ),
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -1018,7 +1100,7 @@ class Technicals:
                 axis="index",
             )
 
-        return money_flow_index.round(rounding if rounding else self._rounding)
+        return round_dataset(money_flow_index, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -1099,6 +1181,12 @@ class Technicals:
             historical_data["Low"],
             historical_data[close_column],
             window,
+            highest_high=self._get_intermediate(
+                "Highest High", period, close_column, window
+            ),
+            lowest_low=self._get_intermediate(
+                "Lowest Low", period, close_column, window
+            ),
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -1109,7 +1197,9 @@ class Technicals:
                 axis="index",
             )
 
-        return williams_percent_r.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            williams_percent_r, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -1175,27 +1265,20 @@ class Technicals:
             raise ValueError(
                 "Period must be intraday, daily, weekly, monthly, quarterly, or yearly."
             )
-        if period == "intraday":
-            if self._historical_data[period].empty:
-                raise ValueError(
-                    "Please define the 'intraday_period' parameter when initializing the Toolkit."
-                )
-            close_column = "Close"
+        if period == "intraday" and self._historical_data[period].empty:
+            raise ValueError(
+                "Please define the 'intraday_period' parameter when initializing the Toolkit."
+            )
 
         historical_data = self._historical_data[period]
 
-        aroon_indicator_dict = {}
-
-        for ticker in historical_data[close_column].columns:
-            aroon_indicator_dict[ticker] = momentum_model.get_aroon_indicator(
-                historical_data["High"][ticker], historical_data["Low"][ticker], window
-            )
-
         aroon_indicator = (
-            pd.concat(aroon_indicator_dict, axis=1)
-            .swaplevel(1, 0, axis=1)
+            momentum_model.get_aroon_indicator(
+                historical_data["High"], historical_data["Low"], window
+            )
             .sort_index(axis=1)
-        ).loc[self._start_date : self._end_date]
+            .loc[self._start_date : self._end_date]
+        )
 
         if growth:
             aroon_indicator_growth = calculate_growth(
@@ -1207,7 +1290,7 @@ class Technicals:
 
             return aroon_indicator_growth
 
-        return aroon_indicator.round(rounding if rounding else self._rounding)
+        return round_dataset(aroon_indicator, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -1286,20 +1369,16 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        commodity_channel_index = pd.DataFrame(
-            index=historical_data.loc[self._start_date : self._end_date].index
-        )
-
-        for ticker in historical_data[close_column].columns:
-            commodity_channel_index[ticker] = (
-                momentum_model.get_commodity_channel_index(
-                    historical_data["High"][ticker],
-                    historical_data["Low"][ticker],
-                    historical_data[close_column][ticker],
-                    window,
-                    constant,
-                ).loc[self._start_date : self._end_date]
-            )
+        commodity_channel_index = momentum_model.get_commodity_channel_index(
+            historical_data["High"],
+            historical_data["Low"],
+            historical_data[close_column],
+            window,
+            constant,
+            typical_prices=self._get_intermediate(
+                "Typical Price", period, close_column
+            ),
+        ).loc[self._start_date : self._end_date]
 
         if growth:
             return calculate_growth(
@@ -1309,7 +1388,9 @@ class Technicals:
                 axis="index",
             )
 
-        return commodity_channel_index.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            commodity_channel_index, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -1400,7 +1481,9 @@ class Technicals:
                 axis="index",
             )
 
-        return relative_vigor_index.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            relative_vigor_index, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -1479,6 +1562,9 @@ class Technicals:
             historical_data[close_column],
             historical_data["Volume"],
             window,
+            price_difference=self._get_intermediate(
+                "Price Difference", period, close_column
+            ),
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -1489,7 +1575,7 @@ class Technicals:
                 axis="index",
             )
 
-        return force_index.round(rounding if rounding else self._rounding)
+        return round_dataset(force_index, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -1571,18 +1657,15 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        ultimate_oscillator = pd.DataFrame(
-            index=historical_data.loc[self._start_date : self._end_date].index
-        )
-        for ticker in historical_data[close_column].columns:
-            ultimate_oscillator[ticker] = momentum_model.get_ultimate_oscillator(
-                historical_data["High"][ticker],
-                historical_data["Low"][ticker],
-                historical_data[close_column][ticker],
-                window_1,
-                window_2,
-                window_3,
-            ).loc[self._start_date : self._end_date]
+        ultimate_oscillator = momentum_model.get_ultimate_oscillator(
+            historical_data["High"],
+            historical_data["Low"],
+            historical_data[close_column],
+            window_1,
+            window_2,
+            window_3,
+            true_range=self._get_intermediate("True Range", period, close_column),
+        ).loc[self._start_date : self._end_date]
 
         if growth:
             ultimate_oscillator_growth = calculate_growth(
@@ -1593,7 +1676,9 @@ class Technicals:
             )
             return ultimate_oscillator_growth
 
-        return ultimate_oscillator.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            ultimate_oscillator, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -1676,6 +1761,12 @@ class Technicals:
             historical_data[close_column],
             short_window,
             long_window,
+            short_ema=self._get_intermediate(
+                "Exponential Moving Average", period, close_column, short_window
+            ),
+            long_ema=self._get_intermediate(
+                "Exponential Moving Average", period, close_column, long_window
+            ),
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -1687,8 +1778,8 @@ class Technicals:
             )
             return ppo_growth
 
-        return percentage_price_oscillator.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            percentage_price_oscillator, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -1778,8 +1869,8 @@ class Technicals:
             )
             return dpo_growth
 
-        return detrended_price_oscillator.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            detrended_price_oscillator, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -1856,18 +1947,13 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        average_directional_index = pd.DataFrame(
-            index=historical_data.loc[self._start_date : self._end_date].index
-        )
-        for ticker in historical_data[close_column].columns:
-            average_directional_index[ticker] = (
-                momentum_model.get_average_directional_index(
-                    historical_data["High"][ticker],
-                    historical_data["Low"][ticker],
-                    historical_data[close_column][ticker],
-                    window,
-                ).loc[self._start_date : self._end_date]
-            )
+        average_directional_index = momentum_model.get_average_directional_index(
+            historical_data["High"],
+            historical_data["Low"],
+            historical_data[close_column],
+            window,
+            true_range=self._get_intermediate("True Range", period, close_column),
+        ).loc[self._start_date : self._end_date]
 
         if growth:
             adx_growth = calculate_growth(
@@ -1878,7 +1964,9 @@ class Technicals:
             )
             return adx_growth
 
-        return average_directional_index.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            average_directional_index, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -1956,7 +2044,11 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         chande_momentum_oscillator = momentum_model.get_chande_momentum_oscillator(
-            historical_data[close_column], window
+            historical_data[close_column],
+            window,
+            price_difference=self._get_intermediate(
+                "Price Difference", period, close_column
+            ),
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -1968,8 +2060,8 @@ class Technicals:
             )
             return cmo_growth
 
-        return chande_momentum_oscillator.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            chande_momentum_oscillator, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -2044,29 +2136,22 @@ class Technicals:
             raise ValueError(
                 "Period must be intraday, daily, weekly, monthly, quarterly, or yearly."
             )
-        if period == "intraday":
-            if self._historical_data[period].empty:
-                raise ValueError(
-                    "Please define the 'intraday_period' parameter when initializing the Toolkit."
-                )
-            close_column = "Close"
+        if period == "intraday" and self._historical_data[period].empty:
+            raise ValueError(
+                "Please define the 'intraday_period' parameter when initializing the Toolkit."
+            )
 
         historical_data = self._historical_data[period]
 
-        ichimoku_cloud_dict = {}
-
-        for ticker in historical_data[close_column].columns:
-            ichimoku_cloud_dict[ticker] = momentum_model.get_ichimoku_cloud(
-                historical_data["High"][ticker],
-                historical_data["Low"][ticker],
+        ichimoku_cloud = (
+            momentum_model.get_ichimoku_cloud(
+                historical_data["High"],
+                historical_data["Low"],
                 conversion_window,
                 base_window,
                 lead_span_b_window,
-            ).loc[self._start_date : self._end_date]
-
-        ichimoku_cloud = (
-            pd.concat(ichimoku_cloud_dict, axis=1)
-            .swaplevel(1, 0, axis=1)
+            )
+            .loc[self._start_date : self._end_date]
             .sort_index(axis=1)
         )
 
@@ -2080,7 +2165,7 @@ class Technicals:
 
             return ichimoku_cloud_growth
 
-        return ichimoku_cloud.round(rounding if rounding else self._rounding)
+        return round_dataset(ichimoku_cloud, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -2162,22 +2247,21 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        stochastic_oscillator_dict = {}
-
-        for ticker in historical_data[close_column].columns:
-            stochastic_oscillator_dict[ticker] = (
-                momentum_model.get_stochastic_oscillator(
-                    historical_data["High"][ticker],
-                    historical_data["Low"][ticker],
-                    historical_data[close_column][ticker],
-                    window,
-                    smooth_widow,
-                ).loc[self._start_date : self._end_date]
-            )
-
         stochastic_oscillator = (
-            pd.concat(stochastic_oscillator_dict, axis=1)
-            .swaplevel(1, 0, axis=1)
+            momentum_model.get_stochastic_oscillator(
+                historical_data["High"],
+                historical_data["Low"],
+                historical_data[close_column],
+                window,
+                smooth_widow,
+                highest_high=self._get_intermediate(
+                    "Highest High", period, close_column, window
+                ),
+                lowest_low=self._get_intermediate(
+                    "Lowest Low", period, close_column, window
+                ),
+            )
+            .loc[self._start_date : self._end_date]
             .sort_index(axis=1)
         )
 
@@ -2191,7 +2275,9 @@ class Technicals:
 
             return stochastic_oscillator_growth
 
-        return stochastic_oscillator.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            stochastic_oscillator, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -2276,19 +2362,22 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        macd_dict = {}
-
-        for ticker in historical_data[close_column].columns:
-            macd_dict[ticker] = (
-                momentum_model.get_moving_average_convergence_divergence(
-                    historical_data[close_column][ticker],
-                    short_window,
-                    long_window,
-                    signal_window,
-                ).loc[self._start_date : self._end_date]
+        macd = (
+            momentum_model.get_moving_average_convergence_divergence(
+                historical_data[close_column],
+                short_window,
+                long_window,
+                signal_window,
+                short_ema=self._get_intermediate(
+                    "Exponential Moving Average", period, close_column, short_window
+                ),
+                long_ema=self._get_intermediate(
+                    "Exponential Moving Average", period, close_column, long_window
+                ),
             )
-
-        macd = pd.concat(macd_dict, axis=1).swaplevel(1, 0, axis=1).sort_index(axis=1)
+            .loc[self._start_date : self._end_date]
+            .sort_index(axis=1)
+        )
 
         if growth:
             macd_growth = calculate_growth(
@@ -2300,7 +2389,7 @@ class Technicals:
 
             return macd_growth
 
-        return macd.round(rounding if rounding else self._rounding)
+        return round_dataset(macd, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -2378,7 +2467,11 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         relative_strength_index = momentum_model.get_relative_strength_index(
-            historical_data[close_column], window
+            historical_data[close_column],
+            window,
+            price_difference=self._get_intermediate(
+                "Price Difference", period, close_column
+            ),
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -2389,7 +2482,9 @@ class Technicals:
                 axis="index",
             )
 
-        return relative_strength_index.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            relative_strength_index, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -2478,8 +2573,9 @@ class Technicals:
                 axis="index",
             )
 
-        return balance_of_power.round(rounding if rounding else self._rounding)
+        return round_dataset(balance_of_power, rounding if rounding else self._rounding)
 
+    @share_intermediates
     def collect_overlap_indicators(
         self,
         period: str = "daily",
@@ -2570,8 +2666,8 @@ class Technicals:
 
         self._overlap_indicators = pd.concat(overlap_indicators, axis=1)
 
-        self._overlap_indicators = self._overlap_indicators.round(
-            rounding if rounding else self._rounding
+        self._overlap_indicators = round_dataset(
+            self._overlap_indicators, rounding if rounding else self._rounding
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -2680,7 +2776,7 @@ class Technicals:
                 axis="index",
             )
 
-        return moving_average.round(rounding if rounding else self._rounding)
+        return round_dataset(moving_average, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -2755,10 +2851,8 @@ class Technicals:
                 )
             close_column = "Close"
 
-        historical_data = self._historical_data[period]
-
-        exponential_moving_average = overlap_model.get_exponential_moving_average(
-            historical_data[close_column], window
+        exponential_moving_average = self._get_intermediate(
+            "Exponential Moving Average", period, close_column, window
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -2769,8 +2863,8 @@ class Technicals:
                 axis="index",
             )
 
-        return exponential_moving_average.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            exponential_moving_average, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -2850,7 +2944,11 @@ class Technicals:
 
         double_exponential_moving_average = (
             overlap_model.get_double_exponential_moving_average(
-                historical_data[close_column], window
+                historical_data[close_column],
+                window,
+                exponential_moving_average=self._get_intermediate(
+                    "Exponential Moving Average", period, close_column, window
+                ),
             ).loc[self._start_date : self._end_date]
         )
 
@@ -2862,8 +2960,8 @@ class Technicals:
                 axis="index",
             )
 
-        return double_exponential_moving_average.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            double_exponential_moving_average, rounding if rounding else self._rounding
         )
 
     @handle_portfolio
@@ -2945,9 +3043,13 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        trix = overlap_model.get_trix(historical_data[close_column], window).loc[
-            self._start_date : self._end_date
-        ]
+        trix = overlap_model.get_trix(
+            historical_data[close_column],
+            window,
+            exponential_moving_average=self._get_intermediate(
+                "Exponential Moving Average", period, close_column, window
+            ),
+        ).loc[self._start_date : self._end_date]
 
         if growth:
             return calculate_growth(
@@ -2957,7 +3059,7 @@ class Technicals:
                 axis="index",
             )
 
-        return trix.round(rounding if rounding else self._rounding)
+        return round_dataset(trix, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -3041,16 +3143,11 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        bollinger_bands_dict = {}
-
-        for ticker in historical_data[close_column].columns:
-            bollinger_bands_dict[ticker] = volatility_model.get_bollinger_bands(
-                historical_data[close_column][ticker], window, num_std_dev
-            ).loc[self._start_date : self._end_date]
-
         bollinger_bands = (
-            pd.concat(bollinger_bands_dict, axis=1)
-            .swaplevel(1, 0, axis=1)
+            volatility_model.get_bollinger_bands(
+                historical_data[close_column], window, num_std_dev
+            )
+            .loc[self._start_date : self._end_date]
             .sort_index(axis=1)
         )
 
@@ -3064,7 +3161,7 @@ class Technicals:
 
             return bollinger_bands_growth
 
-        return bollinger_bands.round(rounding if rounding else self._rounding)
+        return round_dataset(bollinger_bands, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -3152,7 +3249,9 @@ class Technicals:
                 axis="index",
             )
 
-        return triangular_moving_average.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            triangular_moving_average, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -3254,10 +3353,11 @@ class Technicals:
             .sort_index(axis=1)
         )
 
-        return support_resistance_levels_df.round(
-            rounding if rounding else self._rounding
+        return round_dataset(
+            support_resistance_levels_df, rounding if rounding else self._rounding
         )
 
+    @share_intermediates
     def collect_volatility_indicators(
         self,
         period: str = "daily",
@@ -3348,8 +3448,8 @@ class Technicals:
 
         self._volatility_indicators = pd.concat(volatility_indicators, axis=1)
 
-        self._volatility_indicators = self._volatility_indicators.round(
-            rounding if rounding else self._rounding
+        self._volatility_indicators = round_dataset(
+            self._volatility_indicators, rounding if rounding else self._rounding
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -3445,17 +3545,9 @@ class Technicals:
                 )
             close_column = "Close"
 
-        historical_data = self._historical_data[period]
-
-        true_range = pd.DataFrame(
-            index=historical_data.loc[self._start_date : self._end_date].index
-        )
-        for ticker in historical_data[close_column].columns:
-            true_range[ticker] = volatility_model.get_true_range(
-                historical_data["High"][ticker],
-                historical_data["Low"][ticker],
-                historical_data[close_column][ticker],
-            ).loc[self._start_date : self._end_date]
+        true_range = self._get_intermediate("True Range", period, close_column).loc[
+            self._start_date : self._end_date
+        ]
 
         if growth:
             return calculate_growth(
@@ -3465,7 +3557,7 @@ class Technicals:
                 axis="index",
             )
 
-        return true_range.round(rounding if rounding else self._rounding)
+        return round_dataset(true_range, rounding if rounding else self._rounding)
 
     @handle_portfolio
     @handle_errors
@@ -3548,16 +3640,13 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        average_true_range = pd.DataFrame(
-            index=historical_data.loc[self._start_date : self._end_date].index
-        )
-        for ticker in historical_data[close_column].columns:
-            average_true_range[ticker] = volatility_model.get_average_true_range(
-                historical_data["High"][ticker],
-                historical_data["Low"][ticker],
-                historical_data[close_column][ticker],
-                window,
-            ).loc[self._start_date : self._end_date]
+        average_true_range = volatility_model.get_average_true_range(
+            historical_data["High"],
+            historical_data["Low"],
+            historical_data[close_column],
+            window,
+            true_range=self._get_intermediate("True Range", period, close_column),
+        ).loc[self._start_date : self._end_date]
 
         if growth:
             return calculate_growth(
@@ -3567,7 +3656,9 @@ class Technicals:
                 axis="index",
             )
 
-        return average_true_range.round(rounding if rounding else self._rounding)
+        return round_dataset(
+            average_true_range, rounding if rounding else self._rounding
+        )
 
     @handle_portfolio
     @handle_errors
@@ -3654,21 +3745,20 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        keltner_channels_dict = {}
-
-        for ticker in historical_data[close_column].columns:
-            keltner_channels_dict[ticker] = volatility_model.get_keltner_channels(
-                historical_data["High"][ticker],
-                historical_data["Low"][ticker],
-                historical_data[close_column][ticker],
+        kelter_channels = (
+            volatility_model.get_keltner_channels(
+                historical_data["High"],
+                historical_data["Low"],
+                historical_data[close_column],
                 window,
                 atr_window,
                 atr_multiplier,
-            ).loc[self._start_date : self._end_date]
-
-        kelter_channels = (
-            pd.concat(keltner_channels_dict, axis=1)
-            .swaplevel(1, 0, axis=1)
+                true_range=self._get_intermediate("True Range", period, close_column),
+                exponential_moving_average=self._get_intermediate(
+                    "Exponential Moving Average", period, close_column, window
+                ),
+            )
+            .loc[self._start_date : self._end_date]
             .sort_index(axis=1)
         )
 
@@ -3682,4 +3772,4 @@ class Technicals:
 
             return kelter_channels_growth
 
-        return kelter_channels.round(rounding if rounding else self._rounding)
+        return round_dataset(kelter_channels, rounding if rounding else self._rounding)
@@ -2,6 +2,7 @@
 
 __docformat__ = "google"
 
+import numpy as np
 import pandas as pd
 
 from financetoolkit.technicals.overlap_model import get_exponential_moving_average
@@ -11,31 +12,33 @@ def get_true_range(
     prices_high: pd.Series, prices_low: pd.Series, prices_close: pd.Series
 ) -> pd.Series:
     """
-    Calculate the Average True Range (ATR) of a given price series.
+    Calculate the True Range (TR) of a given price series.
 
     Args:
         prices_high (pd.Series): Series of high prices.
         prices_low (pd.Series): Series of low prices.
         prices_close (pd.Series): Series of closing prices.
-        window (int): Number of periods for ATR calculation.
 
     Returns:
-        pd.Series: ATR values.
+        pd.Series: TR values.
     """
-    true_range = pd.concat(
-        [
-            prices_high - prices_low,
-            abs(prices_high - prices_close.shift(1)),
-            abs(prices_low - prices_close.shift(1)),
-        ],
-        axis=1,
-    ).max(axis=1)
+    # The maximum is taken element-wise, ignoring missing values, so that the true range
+    # can be calculated for the prices of all tickers at once
+    true_range = np.fmax(
+        np.fmax(prices_high - prices_low, abs(prices_high - prices_close.shift(1))),
+        abs(prices_low - prices_close.shift(1)),
+    )
 
     return true_range
 
 
 def get_average_true_range(
-    prices_high: pd.Series, prices_low: pd.Series, prices_close: pd.Series, window: int
+    prices_high: pd.Series,
+    prices_low: pd.Series,
+    prices_close: pd.Series,
+    window: int,
+    *,
+    true_range: pd.Series | None = None,
 ) -> pd.Series:
     """
     Calculate the Average True Range (ATR) of a given price series.
@@ -45,11 +48,13 @@ def get_average_true_range(
         prices_low (pd.Series): Series of low prices.
         prices_close (pd.Series): Series of closing prices.
         window (int): Number of periods for ATR calculation.
+        true_range (pd.Series | None): The previously calculated true range. Defaults to None.
 
     Returns:
         pd.Series: ATR values.
     """
-    true_range = get_true_range(prices_high, prices_low, prices_close)
+    if true_range is None:
+        true_range = get_true_range(prices_high, prices_low, prices_close)
 
     atr = true_range.rolling(window=window, min_periods=1).mean()
 
@@ -63,6 +68,9 @@ def get_keltner_channels(
     window: int,
     atr_window: int,
     atr_multiplier: float,
+    *,
+    true_range: pd.Series | None = None,
+    exponential_moving_average: pd.Series | None = None,
 ) -> pd.DataFrame:
     """
     Calculate the Keltner Channels for a given price series.
@@ -74,14 +82,21 @@ def get_keltner_channels(
         window (int): Number of periods for the moving average.
         atr_window (int): Number of periods for ATR calculation.
         atr_multiplier (float): Multiplier for ATR to determine channel width.
+        true_range (pd.Series | None): The previously calculated true range. Defaults to None.
+        exponential_moving_average (pd.Series | None): The previously calculated EMA of the
+            closing prices over the window. Defaults to None.
 
     Returns:
         pd.DataFrame: Keltner Channels (upper, middle, lower).
     """
     average_true_range = get_average_true_range(
-        prices_high, prices_low, prices_close, atr_window
+        prices_high, prices_low, prices_close, atr_window, true_range=true_range
+    )
+    middle_line = (
+        get_exponential_moving_average(prices_close, window)
+        if exponential_moving_average is None
+        else exponential_moving_average
     )
-    middle_line = get_exponential_moving_average(prices_close, window)
 
     upper_line = middle_line + atr_multiplier * average_true_range
     lower_line = middle_line - atr_multiplier * average_true_range
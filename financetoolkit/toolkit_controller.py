@@ -7,12 +7,11 @@ import re
 import warnings
 from collections import Counter
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
 import pandas as pd
 
 from financetoolkit import currencies_model, helpers
-from financetoolkit.economics.economics_controller import Economics
-from financetoolkit.fixedincome.fixedincome_controller import FixedIncome
 from financetoolkit.fmp_model import (
     get_analyst_estimates as _get_analyst_estimates,
     get_dividend_calendar as _get_dividend_calendar,
@@ -29,18 +28,25 @@ from financetoolkit.historical_model import (
     convert_daily_to_other_period as _convert_daily_to_other_period,
     get_historical_data as _get_historical_data,
     get_historical_statistics as _get_historical_statistics,
+    select_historical_data as _select_historical_data,
 )
-from financetoolkit.models.models_controller import Models
 from financetoolkit.normalization_model import (
     copy_normalization_files as _copy_normalization_files,
     initialize_statements_and_normalization as _initialize_statements_and_normalization,
 )
-from financetoolkit.options.options_controller import Options
-from financetoolkit.performance.performance_controller import Performance
-from financetoolkit.ratios.ratios_controller import Ratios
-from financetoolkit.risk.risk_controller import Risk
-from financetoolkit.technicals.technicals_controller import Technicals
-from financetoolkit.utilities import cache_model, logger_model
+from financetoolkit.utilities import cache_model, logger_model, plan_model
+from financetoolkit.utilities.metrics_model import measure_methods, metrics
+
+# The controllers are imported once they are accessed to keep importing the Toolkit fast
+if TYPE_CHECKING:
+    from financetoolkit.economics.economics_controller import Economics
+    from financetoolkit.fixedincome.fixedincome_controller import FixedIncome
+    from financetoolkit.models.models_controller import Models
+    from financetoolkit.options.options_controller import Options
+    from financetoolkit.performance.performance_controller import Performance
+    from financetoolkit.ratios.ratios_controller import Ratios
+    from financetoolkit.risk.risk_controller import Risk
+    from financetoolkit.technicals.technicals_controller import Technicals
 
 # Set up logger, this is meant to display useful messages, warnings or errors when
 # the Finance Toolkit runs into issues or does something that might not be entirely
@@ -54,8 +60,8 @@ logger = logger_model.get_logger()
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
 # pylint: disable=too-many-instance-attributes,too-many-lines,line-too-long,too-many-locals
-# pylint: disable=too-many-function-args,too-many-public-methods
-# ruff: noqa: E501
+# pylint: disable=too-many-function-args,too-many-public-methods,import-outside-toplevel
+# ruff: noqa: E501, PLC0415
 
 TICKER_LIMIT = 20
 
@@ -67,6 +73,7 @@ except ImportError:
     ENABLE_TQDM = False
 
 
+@measure_methods
 class Toolkit:
     """
     The Finance Toolkit is an open-source toolkit in which
@@ -101,6 +108,8 @@ class Toolkit:
         remove_invalid_tickers: bool = False,
         sleep_timer: bool | None = None,
         progress_bar: bool = True,
+        copy_on_write: bool = False,
+        dtype: str = "float64",
     ):
         """
         Initializes a Toolkit object with a ticker or a list of tickers. The way the Toolkit is initialized
@@ -149,15 +158,28 @@ class Toolkit:
             intraday_period (str | None): Intraday data interval ('1min', '5min', '15min', '30min', '1hour').
             Enables short-term analysis using Risk, Performance, and Technicals modules. Requires FMP Premium.
             Defaults to None (no intraday data).
-            rounding (int | None): Number of decimal places for results. Defaults to 4.
+            rounding (int | None): Number of decimal places for results. Set to None to skip every intermediate
+            rounding step and keep the full precision, rounding is then only applied when a rounding value is passed
+            to the function that returns the results. Defaults to 4.
             remove_invalid_tickers (bool): Remove tickers that fail data retrieval. Defaults to False.
             sleep_timer (bool | None): Enable sleep timer on FMP rate limit (requires Premium).
             Defaults to None (determined by FMP plan: True for Premium, False for Free).
             progress_bar (bool): Show progress bar for operations involving multiple tickers. Defaults to True.
+            copy_on_write (bool): Return historical data as views on the stored data instead of copies when pandas
+            Copy-on-Write is enabled with pd.set_option("mode.copy_on_write", True). This lowers the memory usage
+            for large sets of tickers. Copy-on-Write is not enabled by the Toolkit given that it changes the
+            behaviour of chained assignment for pandas as a whole. Whenever it is not enabled, copies are returned
+            as usual. Defaults to False.
+            dtype (str): The dtype used to store the historical data and financial statements, either 'float64' or
+            'float32' (also available as 'compact'). The float32 dtype halves the memory usage but only holds
+            approximately 7 significant digits which results in relative differences of around 1e-6 in the results.
+            Cumulative products and regressions are always calculated with float64. Defaults to "float64".
 
         As an example:
 
         ```python
+        import pandas as pd
+
         from financetoolkit import Toolkit
 
         # Simple example
@@ -192,6 +214,14 @@ class Toolkit:
             api_key="FINANCIAL_MODELING_PREP_KEY",
             use_cached_data=True)
 
+        # Returning views instead of copies for a large set of tickers
+        pd.set_option("mode.copy_on_write", True)
+
+        toolkit = Toolkit(
+            tickers=["AAPL", "MSFT", "GOOGL", "AMZN"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            copy_on_write=True)
+
         # Changing the benchmark and risk free rate
         toolkit = Toolkit(
             tickers="AMZN",
@@ -203,6 +233,7 @@ class Toolkit:
         self._api_key = api_key
         self._risk_free_rate = risk_free_rate
         self._rounding = rounding
+        self._copy_on_write = copy_on_write
         self._remove_invalid_tickers = remove_invalid_tickers
         self._invalid_tickers: list = []
 
@@ -227,6 +258,13 @@ class Toolkit:
                 f"Please ensure the start date {start_date} is before the end date {end_date}"
             )
 
+        if dtype not in helpers.DTYPE_OPTIONS:
+            raise ValueError(
+                f"Please select a valid dtype ({', '.join(helpers.DTYPE_OPTIONS)})"
+            )
+
+        self._dtype = helpers.DTYPE_OPTIONS[dtype]
+
         if risk_free_rate not in [
             "13w",
             "5y",
@@ -490,6 +528,10 @@ class Toolkit:
             )
         )
 
+        self._daily_historical_data = helpers.convert_dtype(
+            self._daily_historical_data, dtype=self._dtype
+        )
+
         # Initialize other periods as empty DataFrames. They will be populated on demand.
         self._weekly_historical_data: pd.DataFrame = pd.DataFrame()
         self._monthly_historical_data: pd.DataFrame = pd.DataFrame()
@@ -525,6 +567,16 @@ class Toolkit:
             quarterly=self._quarterly,
         )
 
+        self._balance_sheet_statement = helpers.convert_dtype(
+            self._balance_sheet_statement, dtype=self._dtype
+        )
+        self._income_statement = helpers.convert_dtype(
+            self._income_statement, dtype=self._dtype
+        )
+        self._cash_flow_statement = helpers.convert_dtype(
+            self._cash_flow_statement, dtype=self._dtype
+        )
+
         self._balance_sheet_statement_growth: pd.DataFrame = pd.DataFrame()
         self._income_statement_growth: pd.DataFrame = pd.DataFrame()
         self._cash_flow_statement_growth: pd.DataFrame = pd.DataFrame()
@@ -560,10 +612,132 @@ class Toolkit:
         # Initialization of the Portfolio Variables
         self._portfolio_weights: dict | None = None
 
+        # Initialization of the Controller Cache, this keeps the Ratios, Models, Technicals,
+        # Performance and Risk classes (and their calculated results) alive between calls
+        self._controllers: dict[str, tuple] = {}
+
         pd.set_option("display.float_format", str)
 
+    def _get_controller_settings(self) -> tuple:
+        """
+        Returns the settings of the Toolkit that are passed on to the controllers. If any
+        of these change, the cached controllers are no longer valid.
+
+        Returns:
+            tuple: the settings used to initialize the controllers.
+        """
+        return (
+            tuple(self._tickers),
+            self._start_date,
+            self._end_date,
+            self._quarterly,
+            self._rounding,
+            self._intraday_period,
+            self._progress_bar,
+        )
+
+    def _get_controller_datasets(self, name: str) -> tuple:
+        """
+        Returns the datasets a controller depends on. Given that these datasets are replaced
+        (and not altered) whenever new data is obtained, comparing them by identity is sufficient
+        to determine whether the controller needs to be rebuilt.
+
+        Args:
+            name (str): the name of the controller, e.g. "ratios".
+
+        Returns:
+            tuple: the datasets the controller depends on.
+        """
+        statements = (
+            self._balance_sheet_statement,
+            self._income_statement,
+            self._cash_flow_statement,
+        )
+
+        if name == "ratios":
+            return (
+                *statements,
+                self._daily_historical_data,
+                self._portfolio_weights,
+                getattr(self, "_profile", None),
+            )
+        if name == "models":
+            return (
+                *statements,
+                self._daily_historical_data,
+                self._daily_risk_free_rate,
+            )
+        if name == "technicals":
+            return (
+                self._daily_historical_data,
+                self._intraday_historical_data,
+                self._portfolio_weights,
+            )
+
+        return (
+            self._daily_historical_data,
+            self._intraday_historical_data,
+            self._daily_risk_free_rate,
+            self._portfolio_weights,
+        )
+
+    def _get_cached_controller(self, name: str):
+        """
+        Returns a previously initialized controller if the datasets it was initialized with
+        are still the exact same objects and the Toolkit settings did not change. This makes
+        sure that the results calculated within the controller are reused and the controller
+        is only rebuilt when the underlying statements or historical data change.
+
+        Args:
+            name (str): the name of the controller, e.g. "ratios".
+
+        Returns:
+            Ratios | Models | Technicals | Performance | Risk | None: the cached controller
+            or None if there is no valid controller available.
+        """
+        if name not in self._controllers:
+            metrics.record_cache(f"{name} controller", hit=False)
+            return None
+
+        cached_datasets, cached_settings, controller = self._controllers[name]
+
+        if cached_settings != self._get_controller_settings():
+            metrics.record_cache(f"{name} controller", hit=False)
+            return None
+
+        for cached_dataset, dataset in zip(
+            cached_datasets, self._get_controller_datasets(name), strict=True
+        ):
+            if cached_dataset is not dataset:
+                metrics.record_cache(f"{name} controller", hit=False)
+                return None
+
+        metrics.record_cache(f"{name} controller", hit=True)
+
+        return controller
+
+    def _set_cached_controller(self, name: str, controller):
+        """
+        Stores the controller together with the datasets and settings it was initialized with
+        so that it can be reused by subsequent calls through _get_cached_controller.
+
+        Args:
+            name (str): the name of the controller, e.g. "ratios".
+            controller (Ratios | Models | Technicals | Performance | Risk): the controller.
+
+        Returns:
+            Ratios | Models | Technicals | Performance | Risk: the controller.
+        """
+        self._controllers[name] = (
+            self._get_controller_datasets(name),
+            self._get_controller_settings(),
+            controller,
+        )
+
+        return controller
+
     @property
-    def ratios(self) -> Ratios:
+    def ratios(self) -> "Ratios":
         """
         The Ratios Module contains over 50+ ratios that can be used to analyse companies. These ratios
         are divided into 5 categories which are efficiency, liquidity, profitability, solvency and
@@ -613,6 +787,8 @@ class Toolkit:
         | EBIT to Revenue                             | 0.286688 | 0.26641  | 0.254864 | 0.305759 | 0.309473 |
 
         """
+        from financetoolkit.ratios.ratios_controller import Ratios
+
         empty_data: list = []
 
         if (
@@ -671,6 +847,11 @@ class Toolkit:
                 f"{self._balance_sheet_statement.columns[-1].year + 5}-01-01"
             )
 
+        cached_ratios = self._get_cached_controller(name="ratios")
+
+        if cached_ratios is not None:
+            return cached_ratios
+
         if self._quarterly:
             self.get_historical_data(period="quarterly")
         else:
@@ -699,15 +880,16 @@ class Toolkit:
             cash=self._cash_flow_statement,
             quarterly=self._quarterly,
             rounding=self._rounding,
+            profile=getattr(self, "_profile", None),
         )
 
         if self._portfolio_weights:
             ratios._portfolio_weights = self._portfolio_weights
 
-        return ratios
+        return self._set_cached_controller(name="ratios", controller=ratios)
 
     @property
-    def models(self) -> Models:
+    def models(self) -> "Models":
         """
         Gives access to the Models module. The Models module is meant to execute well-known models
         such as DUPONT and the Discounted Cash Flow (DCF) model. These models are also directly
@@ -738,6 +920,8 @@ class Toolkit:
         | Equity Multiplier       | nan         | 3.15403   |  3.14263    | 3.08433   | 2.91521   |
         | Return on Equity        | nan         | 0.0213618 |  0.00196098 | 0.0211066 | 0.0417791 |
         """
+        from financetoolkit.models.models_controller import Models
+
         empty_data: list = []
 
         if not self._api_key and (
@@ -792,6 +976,11 @@ class Toolkit:
                 f"{self._balance_sheet_statement.columns[-1].year + 5}-01-01"
             )
 
+        cached_models = self._get_cached_controller(name="models")
+
+        if cached_models is not None:
+            return cached_models
+
         for period in ["daily", "weekly", "monthly", "quarterly", "yearly"]:
             self.get_historical_data(period=period)
 
@@ -815,7 +1004,7 @@ class Toolkit:
             self._balance_sheet_statement.index.get_level_values(0).unique().tolist()
         )
 
-        return Models(
+        models = Models(
             tickers=tickers,
             historical_data=historical_data,
             risk_free_rate_data=risk_free_rate_data,
@@ -826,8 +1015,10 @@ class Toolkit:
             rounding=self._rounding,
         )
 
+        return self._set_cached_controller(name="models", controller=models)
+
     @property
-    def options(self) -> Options:
+    def options(self) -> "Options":
         """
         This gives access to the Options module. The Options Module is meant to provide Options valuations
         based on real market data. This includes the Black-Scholes model and in the future the Binomial model
@@ -880,6 +1071,8 @@ class Toolkit:
         |            290 |  0      |      -0      | 0      | -0      | 0      |   -0      |   2.401  |  0      |       0      |  0      |  -0      |  0      |  0      |    0      | 0      |  0      |  0      |  0      |   0      |
         |            295 |  0      |      -0      | 0      | -0      | 0      |   -0      |   2.595  |  0      |       0      |  0      |  -0      |  0      |  0      |    0      | 0      |  0      |  0      |  0      |   0      |
         """
+        from financetoolkit.options.options_controller import Options
+
         if not self._start_date:
             self._start_date = (datetime.today() - timedelta(days=365 * 10)).strftime(
                 "%Y-%m-%d"
@@ -900,7 +1093,7 @@ class Toolkit:
         )
 
     @property
-    def technicals(self) -> Technicals:
+    def technicals(self) -> "Technicals":
         """
         This gives access to the Technicals module. The Technicals Module contains
         nearly 50 Technical Indicators that can be used to analyse companies. These indicators are
@@ -936,6 +1129,8 @@ class Toolkit:
         | 2023-08-25 | 63.4837 | 32.3323 |
 
         """
+        from financetoolkit.technicals.technicals_controller import Technicals
+
         if not self._start_date:
             self._start_date = (datetime.today() - timedelta(days=365 * 10)).strftime(
                 "%Y-%m-%d"
@@ -943,6 +1138,11 @@ class Toolkit:
         if not self._end_date:
             self._end_date = datetime.today().strftime("%Y-%m-%d")
 
+        cached_technicals = self._get_cached_controller(name="technicals")
+
+        if cached_technicals is not None:
+            return cached_technicals
+
         for period in ["daily", "weekly", "monthly", "quarterly", "yearly"]:
             self.get_historical_data(period=period)
 
@@ -980,10 +1180,10 @@ class Toolkit:
         if self._portfolio_weights:
             technicals._portfolio_weights = self._portfolio_weights
 
-        return technicals
+        return self._set_cached_controller(name="technicals", controller=technicals)
 
     @property
-    def performance(self) -> Performance:
+    def performance(self) -> "Performance":
         """
         This gives access to the Performance module. The Performance Module is meant to calculate metrics related
         to the risk-return relationship. These are things such as Beta, Sharpe Ratio, Sortino Ratio, CAPM,
@@ -1015,6 +1215,8 @@ class Toolkit:
         | 2023Q2 |  0.0922 |  0.1342 |
         | 2023Q3 |  0.0052 | -0.0482 |
         """
+        from financetoolkit.performance.performance_controller import Performance
+
         if not self._start_date:
             self._start_date = (datetime.today() - timedelta(days=365 * 10)).strftime(
                 "%Y-%m-%d"
@@ -1022,6 +1224,11 @@ class Toolkit:
         if not self._end_date:
             self._end_date = datetime.today().strftime("%Y-%m-%d")
 
+        cached_performance = self._get_cached_controller(name="performance")
+
+        if cached_performance is not None:
+            return cached_performance
+
         for period in ["daily", "weekly", "monthly", "quarterly", "yearly"]:
             self.get_historical_data(period=period)
 
@@ -1074,10 +1281,10 @@ class Toolkit:
         if self._portfolio_weights:
             performance._portfolio_weights = self._portfolio_weights
 
-        return performance
+        return self._set_cached_controller(name="performance", controller=performance)
 
     @property
-    def risk(self) -> Risk:
+    def risk(self) -> "Risk":
         """
         This gives access to the Risk module. The Risk Module is meant to calculate metrics related to risk such
         as Value at Risk (VaR), Conditional Value at Risk (cVaR), EMWA/GARCH models and similar models.
@@ -1115,6 +1322,8 @@ class Toolkit:
         | 2022   | -0.8026 | -1.0046 |
         | 2023   |  1.8549 |  1.8238 |
         """
+        from financetoolkit.risk.risk_controller import Risk
+
         if not self._start_date:
             self._start_date = (datetime.today() - timedelta(days=365 * 10)).strftime(
                 "%Y-%m-%d"
@@ -1122,6 +1331,11 @@ class Toolkit:
         if not self._end_date:
             self._end_date = datetime.today().strftime("%Y-%m-%d")
 
+        cached_risk = self._get_cached_controller(name="risk")
+
+        if cached_risk is not None:
+            return cached_risk
+
         for period in ["daily", "weekly", "monthly", "quarterly", "yearly"]:
             self.get_historical_data(period=period)
 
@@ -1159,10 +1373,10 @@ class Toolkit:
         if self._portfolio_weights:
             risk._portfolio_weights = self._portfolio_weights
 
-        return risk
+        return self._set_cached_controller(name="risk", controller=risk)
 
     @property
-    def fixedincome(self) -> FixedIncome:
+    def fixedincome(self) -> "FixedIncome":
         """
         This gives access to the Fixed Income module. This module contains a wide variety of fixed income
         related calculations such as the Effective Yield, the Macaulay Duration, the Modified Duration,
@@ -1207,6 +1421,8 @@ class Toolkit:
         | 2024-01-12 | 0.0451 | 0.0467 | 0.0502 | 0.0534 | 0.0613 | 0.0753 | 0.1338 |
         | 2024-01-15 | 0.0451 | 0.0467 | 0.0501 | 0.0533 | 0.0611 | 0.0751 | 0.1328 |
         """
+        from financetoolkit.fixedincome.fixedincome_controller import FixedIncome
+
         return FixedIncome(
             start_date=self._start_date,
             end_date=self._end_date,
@@ -1215,7 +1431,7 @@ class Toolkit:
         )
 
     @property
-    def economics(self) -> Economics:
+    def economics(self) -> "Economics":
         """
         This gives access to the Economics module. This module contains a wide variety of economic data
         obtained from OECD. These include things such as the Consumer Price Index (CPI), the Producer
@@ -1253,6 +1469,8 @@ class Toolkit:
         | 2021 |         114.325 |       110.387 | 101.561  |
         | 2022 |         123.474 |       121.427 | 104.098  |
         """
+        from financetoolkit.economics.economics_controller import Economics
+
         return Economics(
             start_date=self._start_date,
             end_date=self._end_date,
@@ -1715,8 +1933,8 @@ class Toolkit:
                     file_name="earnings_calendar.pickle",
                 )
 
-        earnings_calendar = self._earnings_calendar.round(
-            rounding if rounding else self._rounding
+        earnings_calendar = helpers.round_dataset(
+            self._earnings_calendar, rounding if rounding else self._rounding
         )
 
         if self._remove_invalid_tickers:
@@ -2053,6 +2271,10 @@ class Toolkit:
                     file_name="daily_historical_data.pickle",
                 )
 
+            self._daily_historical_data = helpers.convert_dtype(
+                self._daily_historical_data, dtype=self._dtype
+            )
+
         if self._remove_invalid_tickers:
             self._tickers = [
                 ticker
@@ -2064,10 +2286,12 @@ class Toolkit:
             return pd.DataFrame()
 
         if period == "daily":
-            historical_data = self._daily_historical_data.loc[
-                self._start_date : self._end_date, :
-            ].copy()
-            historical_data.loc[historical_data.index[0], "Return"] = 0
+            historical_data = _select_historical_data(
+                historical_data=self._daily_historical_data,
+                start=self._start_date,
+                end=self._end_date,
+                copy_on_write=self._copy_on_write,
+            )
 
             if len(self._tickers) == 1 and not self._benchmark_ticker:
                 return historical_data.xs(self._tickers[0], level=1, axis="columns")
@@ -2089,10 +2313,12 @@ class Toolkit:
                 rounding=rounding if rounding else self._rounding,
             )
 
-            historical_data = self._weekly_historical_data.loc[
-                self._start_date : self._end_date, :
-            ].copy()
-            historical_data.loc[historical_data.index[0], "Return"] = 0
+            historical_data = _select_historical_data(
+                historical_data=self._weekly_historical_data,
+                start=self._start_date,
+                end=self._end_date,
+                copy_on_write=self._copy_on_write,
+            )
 
             if len(self._tickers) == 1 and not self._benchmark_ticker:
                 return historical_data.xs(self._tickers[0], level=1, axis="columns")
@@ -2114,10 +2340,12 @@ class Toolkit:
                 rounding=rounding if rounding else self._rounding,
             )
 
-            historical_data = self._monthly_historical_data.loc[
-                self._start_date : self._end_date, :
-            ].copy()
-            historical_data.loc[historical_data.index[0], "Return"] = 0
+            historical_data = _select_historical_data(
+                historical_data=self._monthly_historical_data,
+                start=self._start_date,
+                end=self._end_date,
+                copy_on_write=self._copy_on_write,
+            )
 
             if len(self._tickers) == 1 and not self._benchmark_ticker:
                 return historical_data.xs(self._tickers[0], level=1, axis="columns")
@@ -2139,10 +2367,12 @@ class Toolkit:
                 rounding=rounding if rounding else self._rounding,
             )
 
-            historical_data = self._quarterly_historical_data.loc[
-                self._start_date : self._end_date, :
-            ].copy()
-            historical_data.loc[historical_data.index[0], "Return"] = 0
+            historical_data = _select_historical_data(
+                historical_data=self._quarterly_historical_data,
+                start=self._start_date,
+                end=self._end_date,
+                copy_on_write=self._copy_on_write,
+            )
 
             if len(self._tickers) == 1 and not self._benchmark_ticker:
                 return historical_data.xs(self._tickers[0], level=1, axis="columns")
@@ -2164,10 +2394,12 @@ class Toolkit:
                 rounding=rounding if rounding else self._rounding,
             )
 
-            historical_data = self._yearly_historical_data.loc[
-                self._start_date : self._end_date, :
-            ].copy()
-            historical_data.loc[historical_data.index[0], "Return"] = 0
+            historical_data = _select_historical_data(
+                historical_data=self._yearly_historical_data,
+                start=self._start_date,
+                end=self._end_date,
+                copy_on_write=self._copy_on_write,
+            )
 
             if len(self._tickers) == 1 and not self._benchmark_ticker:
                 return historical_data.xs(self._tickers[0], level=1, axis="columns")
@@ -2302,6 +2534,10 @@ class Toolkit:
                     file_name="intraday_historical_data.pickle",
                 )
 
+            self._intraday_historical_data = helpers.convert_dtype(
+                self._intraday_historical_data, dtype=self._dtype
+            )
+
         # Save the period to prevent having to reacquire the data
         self._intraday_period = period
 
@@ -2320,11 +2556,12 @@ class Toolkit:
                 if ticker not in self._invalid_tickers
             ]
 
-        historical_data = self._intraday_historical_data.loc[
-            self._start_date : self._end_date, :
-        ].copy()
-
-        historical_data.loc[historical_data.index[0], "Return"] = 0
+        historical_data = _select_historical_data(
+            historical_data=self._intraday_historical_data,
+            start=self._start_date,
+            end=self._end_date,
+            copy_on_write=self._copy_on_write,
+        )
 
         if len(self._tickers) == 1 and not self._benchmark_ticker:
             return historical_data.xs(self._tickers[0], level=1, axis="columns")
@@ -2421,8 +2658,8 @@ class Toolkit:
                     file_name="dividend_calendar.pickle",
                 )
 
-        dividend_calendar = self._dividend_calendar.round(
-            rounding if rounding else self._rounding
+        dividend_calendar = helpers.round_dataset(
+            self._dividend_calendar, rounding if rounding else self._rounding
         )
 
         if self._remove_invalid_tickers:
@@ -2537,7 +2774,9 @@ class Toolkit:
                 user_subscription=self._fmp_plan,
             )
 
-        esg_scores = self._esg_scores.round(rounding if rounding else self._rounding)
+        esg_scores = helpers.round_dataset(
+            self._esg_scores, rounding if rounding else self._rounding
+        )
 
         if self._remove_invalid_tickers:
             self._tickers = [
@@ -2986,10 +3225,12 @@ class Toolkit:
                 )
 
         if period == "daily":
-            historical_data = self._daily_exchange_rate_data.loc[
-                self._start_date : self._end_date, :
-            ].copy()
-            historical_data.loc[historical_data.index[0], "Return"] = 0
+            historical_data = _select_historical_data(
+                historical_data=self._daily_exchange_rate_data,
+                start=self._start_date,
+                end=self._end_date,
+                copy_on_write=self._copy_on_write,
+            )
 
             if len(self._currencies) == 1:
                 return historical_data.xs(self._currencies[0], level=1, axis="columns")
@@ -3006,10 +3247,12 @@ class Toolkit:
                 rounding=rounding if rounding else self._rounding,
             )
 
-            historical_data = self._weekly_exchange_rate_data.loc[
-                self._start_date : self._end_date, :
-            ].copy()
-            historical_data.loc[historical_data.index[0], "Return"] = 0
+            historical_data = _select_historical_data(
+                historical_data=self._weekly_exchange_rate_data,
+                start=self._start_date,
+                end=self._end_date,
+                copy_on_write=self._copy_on_write,
+            )
 
             if len(self._currencies) == 1:
                 return historical_data.xs(self._currencies[0], level=1, axis="columns")
@@ -3026,10 +3269,12 @@ class Toolkit:
                 rounding=rounding if rounding else self._rounding,
             )
 
-            historical_data = self._monthly_exchange_rate_data.loc[
-                self._start_date : self._end_date, :
-            ].copy()
-            historical_data.loc[historical_data.index[0], "Return"] = 0
+            historical_data = _select_historical_data(
+                historical_data=self._monthly_exchange_rate_data,
+                start=self._start_date,
+                end=self._end_date,
+                copy_on_write=self._copy_on_write,
+            )
 
             if len(self._currencies) == 1:
                 return historical_data.xs(self._currencies[0], level=1, axis="columns")
@@ -3046,10 +3291,12 @@ class Toolkit:
                 rounding=rounding if rounding else self._rounding,
             )
 
-            historical_data = self._quarterly_exchange_rate_data.loc[
-                self._start_date : self._end_date, :
-            ].copy()
-            historical_data.loc[historical_data.index[0], "Return"] = 0
+            historical_data = _select_historical_data(
+                historical_data=self._quarterly_exchange_rate_data,
+                start=self._start_date,
+                end=self._end_date,
+                copy_on_write=self._copy_on_write,
+            )
 
             if len(self._currencies) == 1:
                 return historical_data.xs(self._currencies[0], level=1, axis="columns")
@@ -3066,10 +3313,12 @@ class Toolkit:
                 rounding=rounding if rounding else self._rounding,
             )
 
-            historical_data = self._yearly_exchange_rate_data.loc[
-                self._start_date : self._end_date, :
-            ].copy()
-            historical_data.loc[historical_data.index[0], "Return"] = 0
+            historical_data = _select_historical_data(
+                historical_data=self._yearly_exchange_rate_data,
+                start=self._start_date,
+                end=self._end_date,
+                copy_on_write=self._copy_on_write,
+            )
 
             return historical_data
 
@@ -3262,6 +3511,10 @@ class Toolkit:
                     file_name="balance_sheet_statement.pickle",
                 )
 
+            self._balance_sheet_statement = helpers.convert_dtype(
+                self._balance_sheet_statement, dtype=self._dtype
+            )
+
         if self._remove_invalid_tickers:
             self._tickers = [
                 ticker
@@ -3279,8 +3532,8 @@ class Toolkit:
                 axis="columns",
             )
 
-        balance_sheet_statement = balance_sheet_statement.round(
-            rounding if rounding else self._rounding
+        balance_sheet_statement = helpers.round_dataset(
+            balance_sheet_statement, rounding if rounding else self._rounding
         )
 
         if len(self._tickers) == 1 and not self._balance_sheet_statement.empty:
@@ -3466,6 +3719,10 @@ class Toolkit:
                     file_name="income_statement.pickle",
                 )
 
+            self._income_statement = helpers.convert_dtype(
+                self._income_statement, dtype=self._dtype
+            )
+
         if self._remove_invalid_tickers:
             self._tickers = [
                 ticker
@@ -3499,8 +3756,8 @@ class Toolkit:
                 axis="columns",
             )
 
-        income_statement = income_statement.round(
-            rounding if rounding else self._rounding
+        income_statement = helpers.round_dataset(
+            income_statement, rounding if rounding else self._rounding
         )
 
         if len(self._tickers) == 1 and not self._income_statement.empty:
@@ -3675,6 +3932,10 @@ class Toolkit:
                     file_name="cash_flow_statement.pickle",
                 )
 
+            self._cash_flow_statement = helpers.convert_dtype(
+                self._cash_flow_statement, dtype=self._dtype
+            )
+
         if self._remove_invalid_tickers:
             self._tickers = [
                 ticker
@@ -3695,8 +3956,8 @@ class Toolkit:
                 axis="columns",
             )
 
-        cash_flow_statement = cash_flow_statement.round(
-            rounding if rounding else self._rounding
+        cash_flow_statement = helpers.round_dataset(
+            cash_flow_statement, rounding if rounding else self._rounding
         )
 
         if len(self._tickers) == 1 and not self._cash_flow_statement.empty:
@@ -3841,3 +4102,159 @@ class Toolkit:
             _copy_normalization_files(path)
         else:
             _copy_normalization_files()
+
+    def plan(
+        self,
+        datasets: list[str] | str,
+        requests_per_minute: int | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Lists every HTTP request that would be made to collect the given datasets without
+        executing any of them. This makes it possible to predict whether a job fits within
+        the daily quota of FinancialModelingPrep before starting it.
+
+        The plan takes into account which datasets are already available (e.g. loaded from
+        the cache or provided at initialization), the subscription plan, whether quarterly
+        or yearly data is collected and the fallback to YahooFinance. Next to datasets, the
+        modules that require them can be planned, e.g. "ratios" which requires the financial
+        statements, the treasury data and the historical data.
+
+        Note that the fallback to YahooFinance only occurs when FinancialModelingPrep returns
+        no data which can not be known beforehand. These requests are therefore only listed
+        as fallback, except for quarterly financial statements on the Free plan which always
+        fall back to YahooFinance. The exchange rates that are collected for the currency
+        conversion depend on the currencies reported and are not included.
+
+        Args:
+            datasets (list[str] | str): The datasets or modules to plan the requests for. Choose
+                from balance, income, cashflow, treasury, historical, historical_statistics, profile,
+                quote, rating, ratios, models, technicals, performance and risk.
+            requests_per_minute (int | None): The rate limit of FinancialModelingPrep used to
+                estimate the duration. Defaults to None which uses the rate limit that belongs
+                to the subscription plan.
+
+        Returns:
+            dict[str, pd.DataFrame]: The "Requests" that would be made, with the API key left
+            out of the URLs, and the "Summary" with the amount of requests per provider and the
+            estimated duration in seconds for each dataset.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(["AAPL", "TSLA"], api_key="FINANCIAL_MODELING_PREP_KEY")
+
+        toolkit.plan(["ratios", "profile"])["Summary"]
+        ```
+        """
+        tickers = [ticker for ticker in self._tickers if ticker != "Portfolio"]
+        collect_statements = False
+        planned_datasets: dict[str, bool] = {}
+        requests: list[dict] = []
+
+        for dataset in plan_model.expand_datasets(datasets):
+            if dataset in plan_model.STATEMENTS:
+                cached = not {
+                    "balance": self._balance_sheet_statement,
+                    "income": self._income_statement,
+                    "cashflow": self._cash_flow_statement,
+                }[dataset].empty
+                collect_statements = collect_statements or not cached
+            elif dataset == "treasury":
+                cached = not self._daily_treasury_data.empty
+            elif dataset == "historical":
+                cached = not self._daily_historical_data.empty
+            elif dataset == "historical_statistics":
+                cached = not self._historical_statistics.empty
+            else:
+                cached = not getattr(self, f"_{dataset}", pd.DataFrame()).empty
+
+            planned_datasets[dataset] = cached
+
+            if cached:
+                continue
+
+            requests.extend(
+                plan_model.plan_dataset_requests(
+                    dataset=dataset,
+                    tickers=(
+                        tickers + [self._benchmark_ticker]
+                        if dataset == "historical" and self._benchmark_ticker
+                        else tickers
+                    ),
+                    api_key=self._api_key,
+                    quarter=self._quarterly,
+                    start_date=self._start_date,
+                    end_date=self._end_date,
+                    user_subscription=self._fmp_plan,
+                    enforce_source=self._enforce_source,
+                )
+            )
+
+        # The currencies of the financial statements are determined with the historical statistics
+        if (
+            collect_statements
+            and self._convert_currency
+            and "historical_statistics" not in planned_datasets
+            and self._historical_statistics.empty
+        ):
+            planned_datasets["historical_statistics"] = False
+            requests.extend(
+                plan_model.plan_dataset_requests(
+                    dataset="historical_statistics",
+                    tickers=tickers,
+                    api_key=self._api_key,
+                )
+            )
+
+        planned_requests = pd.DataFrame(
+            requests,
+            columns=["Dataset", "Ticker", "Provider", "Endpoint", "URL", "Fallback"],
+        )
+
+        return {
+            "Requests": planned_requests,
+            "Summary": plan_model.summarize_requests(
+                requests=planned_requests,
+                datasets=planned_datasets,
+                user_subscription=self._fmp_plan,
+                requests_per_minute=requests_per_minute,
+            ),
+        }
+
+    def stats(self, prometheus: bool = False) -> dict[str, pd.DataFrame] | str:
+        """
+        Returns the metrics collected while using the Finance Toolkit. These are the HTTP requests
+        per provider and endpoint (including the failed requests, responses that indicate the quota
+        is reached, retries and bytes downloaded), the cache hits and misses and the wall time of each
+        public method. This gives insight into where time and API quota are spent.
+
+        Note that the metrics are shared by all Toolkit instances within the process. They can
+        also be accessed through `financetoolkit.metrics` which allows resetting them with
+        `financetoolkit.metrics.reset()`.
+
+        Args:
+            prometheus (bool): Whether to return the metrics in the Prometheus text format so that
+            these can be exposed on the metrics endpoint of a service. Defaults to False.
+
+        Returns:
+            dict[str, pd.DataFrame] | str: The "Requests", "Cache" and "Latency" metrics or the
+            metrics in the Prometheus text format.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(["AAPL", "TSLA"], api_key="FINANCIAL_MODELING_PREP_KEY")
+
+        toolkit.ratios.collect_all_ratios()
+
+        toolkit.stats()["Requests"]
+        ```
+        """
+        if prometheus:
+            return metrics.to_prometheus()
+
+        return metrics.get_stats()
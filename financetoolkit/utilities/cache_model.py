@@ -4,10 +4,12 @@ __docformat__ = "google"
 
 import os
 import pickle
+from functools import wraps
 
 import pandas as pd
 
 from financetoolkit.utilities import logger_model
+from financetoolkit.utilities.metrics_model import metrics
 
 logger = logger_model.get_logger()
 
@@ -41,9 +43,13 @@ def load_cached_data(
         else:
             raise ValueError("The method should be either 'pandas' or 'pickle'.")
 
+        metrics.record_cache(file_name, hit=True)
+
         return cached_data
 
     except FileNotFoundError:
+        metrics.record_cache(file_name, hit=False)
+
         return return_empty_type
 
 
@@ -80,3 +86,32 @@ def save_cached_data(
                 )
         except Exception as error:  # pylint: disable=broad-except
             logger.error("An error occurred while saving the data: %s", error)
+
+
+def share_intermediates(func):
+    """
+    Decorator that shares the intermediates between all calculations within the decorated
+    method, e.g. the ratios or technical indicators. The intermediates are cached in the
+    `_intermediates` attribute and the cache is removed once the outermost decorated
+    method finishes so that changes to the underlying data are always reflected.
+
+    Args:
+        func (function): The function to be decorated.
+
+    Returns:
+        function: The decorated function.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self._intermediates is not None:
+            return func(self, *args, **kwargs)
+
+        self._intermediates = {}
+
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._intermediates = None
+
+    return wrapper
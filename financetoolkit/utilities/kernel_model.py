@@ -0,0 +1,363 @@
+"""Kernel Module"""
+
+__docformat__ = "google"
+
+from collections.abc import Callable
+
+import numpy as np
+from scipy import signal
+
+try:
+    import numba
+
+    ENABLE_NUMBA = True
+except ImportError:
+    ENABLE_NUMBA = False
+
+# The recursive calculations, in which each value depends on the previous value, can not be
+# vectorized with pandas. These are compiled to machine code with Numba when it is installed
+# and otherwise calculated with NumPy (and SciPy) or, when there is no vectorized equivalent,
+# with the same loop in Python.
+KERNEL_BACKENDS = ["numba", "numpy"]
+SETTINGS = {"backend": "numba" if ENABLE_NUMBA else "numpy"}
+
+# The lot matching methods are passed to the kernel as integers given that Numba can not
+# use dictionaries (or strings) from the module within compiled functions
+FIFO_METHOD = 0
+LIFO_METHOD = 1
+AVERAGE_METHOD = 2
+LOT_MATCHING_METHODS = {
+    "FIFO": FIFO_METHOD,
+    "LIFO": LIFO_METHOD,
+    "AVERAGE": AVERAGE_METHOD,
+}
+
+# pylint: disable=too-many-branches
+
+
+def garch_variance_loop(
+    returns: np.ndarray, omega: float, alpha: float, beta: float, time_steps: int
+) -> np.ndarray:
+    """
+    Calculates the GARCH(1, 1) variance recursion, one time step at a time.
+
+    Args:
+        returns (np.ndarray): the returns.
+        omega (float): the weight of the long-run variance.
+        alpha (float): the weight of the squared return of the previous time step.
+        beta (float): the weight of the variance of the previous time step.
+        time_steps (int): the amount of time steps to calculate the variance for.
+
+    Returns:
+        np.ndarray: the variance of each time step.
+    """
+    sigma2 = np.zeros(time_steps)
+    sigma2[0] = returns[0] ** 2
+
+    for i in range(1, time_steps):
+        sigma2[i] = omega + alpha * returns[i - 1] ** 2 + beta * sigma2[i - 1]
+
+    return sigma2
+
+
+def garch_variance_filter(
+    returns: np.ndarray, omega: float, alpha: float, beta: float, time_steps: int
+) -> np.ndarray:
+    """
+    Calculates the GARCH(1, 1) variance recursion as a linear filter. Given that the
+    variance only depends linearly on the variance of the previous time step, the
+    recursion is equal to filtering the (weighted) squared returns with the weight beta.
+
+    Args:
+        returns (np.ndarray): the returns.
+        omega (float): the weight of the long-run variance.
+        alpha (float): the weight of the squared return of the previous time step.
+        beta (float): the weight of the variance of the previous time step.
+        time_steps (int): the amount of time steps to calculate the variance for.
+
+    Returns:
+        np.ndarray: the variance of each time step.
+    """
+    shocks = np.empty(time_steps)
+    shocks[0] = returns[0] ** 2
+    shocks[1:] = omega + alpha * returns[: time_steps - 1] ** 2
+
+    return signal.lfilter([1.0], [1.0, -beta], shocks)
+
+
+def autoregressive_forecast_loop(
+    recent_values: np.ndarray, phi: np.ndarray, c: float, steps: int
+) -> np.ndarray:
+    """
+    Forecasts the values of an AR(p) model in which each forecast becomes an observation
+    for the forecasts that follow.
+
+    Args:
+        recent_values (np.ndarray): the last p observations, oldest first.
+        phi (np.ndarray): the parameters of the AR model.
+        c (float): the constant term of the AR model.
+        steps (int): the amount of time steps to forecast.
+
+    Returns:
+        np.ndarray: the forecasts.
+    """
+    order = len(phi)
+    values = np.empty(order + steps)
+    values[:order] = recent_values
+
+    for i in range(steps):
+        values[order + i] = c + np.dot(phi, values[i : order + i])
+
+    return values[order:]
+
+
+def lot_matching_loop(
+    volumes: np.ndarray, prices: np.ndarray, method: int
+) -> np.ndarray:
+    """
+    Matches the sell transactions of a single ticker with the lots that were bought
+    before and returns the realized profit and loss of each transaction. The lots are
+    kept in preallocated arrays rather than a list so that the loop can be compiled.
+
+    Args:
+        volumes (np.ndarray): the volume of each transaction, positive for buys and
+            negative for sells.
+        prices (np.ndarray): the price of each transaction.
+        method (int): the lot matching method as defined in LOT_MATCHING_METHODS.
+
+    Returns:
+        np.ndarray: the realized profit and loss of each transaction.
+    """
+    pnl = np.zeros(len(volumes))
+
+    # The lots that are still held, from first_lot (oldest) up to last_lot (newest)
+    lot_volumes = np.zeros(len(volumes))
+    lot_prices = np.zeros(len(volumes))
+    first_lot = 0
+    last_lot = 0
+
+    average_cost = 0.0
+    total_volume = 0.0
+
+    for i in range(len(volumes)):  # pylint: disable=consider-using-enumerate
+        volume = volumes[i]
+        price = prices[i]
+
+        if volume > 0:
+            if method == AVERAGE_METHOD:
+                total_cost = average_cost * total_volume + volume * price
+                total_volume += volume
+                average_cost = total_cost / total_volume
+            else:
+                lot_volumes[last_lot] = volume
+                lot_prices[last_lot] = price
+                last_lot += 1
+
+        elif volume < 0:
+            sell_volume = -volume
+            realized_pnl = 0.0
+
+            if method == FIFO_METHOD:
+                while sell_volume > 0 and first_lot < last_lot:
+                    if lot_volumes[first_lot] <= sell_volume:
+                        realized_pnl += lot_volumes[first_lot] * (
+                            price - lot_prices[first_lot]
+                        )
+                        sell_volume -= lot_volumes[first_lot]
+                        first_lot += 1
+                    else:
+                        realized_pnl += sell_volume * (price - lot_prices[first_lot])
+                        lot_volumes[first_lot] -= sell_volume
+                        sell_volume = 0.0
+
+            elif method == LIFO_METHOD:
+                while sell_volume > 0 and first_lot < last_lot:
+                    if lot_volumes[last_lot - 1] <= sell_volume:
+                        realized_pnl += lot_volumes[last_lot - 1] * (
+                            price - lot_prices[last_lot - 1]
+                        )
+                        sell_volume -= lot_volumes[last_lot - 1]
+                        last_lot -= 1
+                    else:
+                        realized_pnl += sell_volume * (price - lot_prices[last_lot - 1])
+                        lot_volumes[last_lot - 1] -= sell_volume
+                        sell_volume = 0.0
+
+            elif total_volume >= sell_volume:
+                realized_pnl = sell_volume * (price - average_cost)
+                total_volume -= sell_volume
+            else:
+                realized_pnl = total_volume * (price - average_cost)
+                total_volume = 0.0
+
+            pnl[i] = realized_pnl
+
+    return pnl
+
+
+KERNELS: dict[str, dict[str, Callable]] = {
+    "numpy": {
+        "garch_variance": garch_variance_filter,
+        "autoregressive_forecast": autoregressive_forecast_loop,
+        "lot_matching": lot_matching_loop,
+    },
+}
+
+if ENABLE_NUMBA:
+    # The kernels are compiled the first time these are called and cached on disk
+    KERNELS["numba"] = {
+        "garch_variance": numba.njit(cache=True)(garch_variance_loop),
+        "autoregressive_forecast": numba.njit(cache=True)(autoregressive_forecast_loop),
+        "lot_matching": numba.njit(cache=True)(lot_matching_loop),
+    }
+
+
+def get_backend() -> str:
+    """
+    Returns the backend that is used to calculate the recursive kernels.
+
+    Returns:
+        str: the backend, either "numba" or "numpy".
+    """
+    return SETTINGS["backend"]
+
+
+def set_backend(backend: str):
+    """
+    Sets the backend that is used to calculate the recursive kernels. By default, Numba
+    is used when it is installed and NumPy otherwise.
+
+    Args:
+        backend (str): the backend, either "numba" or "numpy".
+
+    Raises:
+        ValueError: If the backend is not one of the kernel backends.
+        ImportError: If the backend is "numba" and Numba is not installed.
+    """
+    # Raises an error when the backend is not available
+    get_kernels(backend)
+
+    SETTINGS["backend"] = backend
+
+
+def get_kernels(backend: str | None = None) -> dict[str, Callable]:
+    """
+    Returns the kernels of a backend.
+
+    Args:
+        backend (str | None): the backend, either "numba" or "numpy". Defaults to None
+            which uses the backend as set with set_backend.
+
+    Raises:
+        ValueError: If the backend is not one of the kernel backends.
+        ImportError: If the backend is "numba" and Numba is not installed.
+
+    Returns:
+        dict[str, Callable]: the kernels by name.
+    """
+    backend = SETTINGS["backend"] if backend is None else backend
+
+    if backend not in KERNEL_BACKENDS:
+        raise ValueError(
+            f"The backend must be one of {', '.join(KERNEL_BACKENDS)}, not {backend}."
+        )
+    if backend not in KERNELS:
+        raise ImportError(
+            "The numba backend requires Numba, install it with: pip install numba"
+        )
+
+    return KERNELS[backend]
+
+
+def get_garch_variance(
+    returns: np.ndarray,
+    weights: np.ndarray | list,
+    time_steps: int,
+    backend: str | None = None,
+) -> np.ndarray:
+    """
+    Calculates the GARCH(1, 1) variance of each time step.
+
+    Args:
+        returns (np.ndarray): the returns.
+        weights (np.ndarray | list): the values for omega, alpha and beta.
+        time_steps (int): the amount of time steps to calculate the variance for.
+        backend (str | None): the backend to use. Defaults to None which uses the
+            backend as set with set_backend.
+
+    Returns:
+        np.ndarray: the variance of each time step.
+    """
+    return get_kernels(backend)["garch_variance"](
+        np.asarray(returns, dtype=np.float64),
+        float(weights[0]),
+        float(weights[1]),
+        float(weights[2]),
+        int(time_steps),
+    )
+
+
+def get_autoregressive_forecast(
+    recent_values: np.ndarray,
+    phi: np.ndarray,
+    c: float,
+    steps: int,
+    backend: str | None = None,
+) -> np.ndarray:
+    """
+    Forecasts the values of an AR(p) model.
+
+    Args:
+        recent_values (np.ndarray): the last p observations, oldest first.
+        phi (np.ndarray): the parameters of the AR model.
+        c (float): the constant term of the AR model.
+        steps (int): the amount of time steps to forecast.
+        backend (str | None): the backend to use. Defaults to None which uses the
+            backend as set with set_backend.
+
+    Returns:
+        np.ndarray: the forecasts.
+    """
+    return get_kernels(backend)["autoregressive_forecast"](
+        np.asarray(recent_values, dtype=np.float64),
+        np.ascontiguousarray(phi, dtype=np.float64),
+        float(c),
+        int(steps),
+    )
+
+
+def get_lot_matching(
+    volumes: np.ndarray,
+    prices: np.ndarray,
+    method: str = "FIFO",
+    backend: str | None = None,
+) -> np.ndarray:
+    """
+    Calculates the realized profit and loss of each transaction of a single ticker by
+    matching the sell transactions with the lots that were bought before.
+
+    Args:
+        volumes (np.ndarray): the volume of each transaction, positive for buys and
+            negative for sells.
+        prices (np.ndarray): the price of each transaction.
+        method (str): the lot matching method, either "FIFO", "LIFO" or "AVERAGE".
+            Defaults to "FIFO".
+        backend (str | None): the backend to use. Defaults to None which uses the
+            backend as set with set_backend.
+
+    Raises:
+        ValueError: If the method is not one of the lot matching methods.
+
+    Returns:
+        np.ndarray: the realized profit and loss of each transaction.
+    """
+    if method not in LOT_MATCHING_METHODS:
+        raise ValueError(
+            f"The method must be one of {', '.join(LOT_MATCHING_METHODS)}, not {method}."
+        )
+
+    return get_kernels(backend)["lot_matching"](
+        np.asarray(volumes, dtype=np.float64),
+        np.asarray(prices, dtype=np.float64),
+        LOT_MATCHING_METHODS[method],
+    )
@@ -0,0 +1,244 @@
+"""Long Format Module"""
+
+__docformat__ = "google"
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+
+    ENABLE_PYARROW = True
+except ImportError:
+    ENABLE_PYARROW = False
+
+LONG_FORMAT_COLUMNS = ["Ticker", "Metric", "Period", "Value"]
+
+
+def create_long_format(
+    labels: dict[str, tuple[np.ndarray, pd.Index]],
+    values: np.ndarray,
+    dropna: bool = False,
+) -> pd.DataFrame:
+    """
+    Creates the long format, with a row for each ticker, metric and period, from the codes
+    and labels of each column. The labels are stored once as categoricals, which are
+    written as dictionary encoded Arrow arrays to Parquet, and the values are backed by an
+    Arrow array when pyarrow is installed.
+
+    Args:
+        labels (dict[str, tuple[np.ndarray, pd.Index]]): the codes and labels of the
+            Ticker, Metric and Period columns.
+        values (np.ndarray): the values that belong to the codes.
+        dropna (bool): whether to exclude the rows without a value. Defaults to False
+            which keeps the rows so that the original shape can always be restored.
+
+    Returns:
+        pd.DataFrame: the long format with the Ticker, Metric, Period and Value columns.
+    """
+    if dropna:
+        available = ~np.isnan(values)
+        values = values[available]
+        labels = {
+            column: (codes[available], categories)
+            for column, (codes, categories) in labels.items()
+        }
+
+    long_format = {
+        column: pd.Categorical.from_codes(codes, categories)
+        for column, (codes, categories) in labels.items()
+    }
+    long_format["Value"] = (
+        pd.arrays.ArrowExtensionArray(pa.array(values, from_pandas=True))
+        if ENABLE_PYARROW
+        else values
+    )
+
+    return pd.DataFrame(long_format, columns=LONG_FORMAT_COLUMNS, copy=False)
+
+
+def collect_long_format(
+    datasets: list[pd.DataFrame],
+    periods: pd.Index | None = None,
+    rounding: int | None = None,
+    dropna: bool = False,
+) -> pd.DataFrame:
+    """
+    Collects the long format of datasets with the tickers and metrics as index and the
+    periods as columns, e.g. each category of the ratios. The values of the datasets are
+    combined directly which avoids concatenating and sorting the wide datasets first.
+
+    Args:
+        datasets (list[pd.DataFrame]): the datasets with the tickers and metrics as index
+            and the periods as columns.
+        periods (pd.Index | None): the periods to include, in order. Defaults to None
+            which includes the periods of all datasets.
+        rounding (int | None): the number of decimals to round to. Defaults to None.
+        dropna (bool): whether to exclude the rows without a value. Defaults to False.
+
+    Raises:
+        ValueError: If a dataset does not have the tickers and metrics as index.
+
+    Returns:
+        pd.DataFrame: the long format with the Ticker, Metric, Period and Value columns.
+    """
+    if any(dataset.index.nlevels != 2 for dataset in datasets):  # noqa: PLR2004
+        raise ValueError(
+            "The long format requires the tickers and metrics as index, which is not the "
+            "case when collecting the growth for multiple lags."
+        )
+
+    if periods is None:
+        periods = datasets[0].columns
+
+        for dataset in datasets[1:]:
+            periods = periods.append(dataset.columns.difference(periods, sort=False))
+
+    ticker_codes, tickers = pd.factorize(
+        np.concatenate(
+            [dataset.index.get_level_values(0).to_numpy() for dataset in datasets]
+        )
+    )
+    metric_codes, metrics = pd.factorize(
+        np.concatenate(
+            [dataset.index.get_level_values(1).to_numpy() for dataset in datasets]
+        )
+    )
+    values = np.concatenate(
+        [
+            dataset.reindex(columns=periods).to_numpy(dtype=np.float64)
+            for dataset in datasets
+        ]
+    )
+
+    if rounding is not None:
+        values = np.round(values, rounding)
+
+    return create_long_format(
+        labels={
+            "Ticker": (ticker_codes.repeat(len(periods)), pd.Index(tickers)),
+            "Metric": (metric_codes.repeat(len(periods)), pd.Index(metrics)),
+            "Period": (np.tile(np.arange(len(periods)), len(values)), periods),
+        },
+        values=values.ravel(),
+        dropna=dropna,
+    )
+
+
+def collect_long_format_from_metrics(
+    metrics: dict[str, pd.DataFrame], dropna: bool = False
+) -> pd.DataFrame:
+    """
+    Collects the long format of metrics that each have the periods as index and the
+    tickers as columns, e.g. the risk and performance metrics. The values of the metrics
+    are combined directly which avoids concatenating the metrics into a wide dataset first.
+
+    Args:
+        metrics (dict[str, pd.DataFrame]): the metrics, by name, with the periods as index
+            and the tickers as columns.
+        dropna (bool): whether to exclude the rows without a value. Defaults to False.
+
+    Raises:
+        ValueError: If a metric does not have the tickers as columns.
+
+    Returns:
+        pd.DataFrame: the long format with the Ticker, Metric, Period and Value columns.
+    """
+    if any(metric.columns.nlevels != 1 for metric in metrics.values()):
+        raise ValueError(
+            "The long format requires the tickers as columns, which is not the case "
+            "when collecting the growth for multiple lags."
+        )
+
+    periods = None
+
+    for metric in metrics.values():
+        if periods is None:
+            periods = metric.index
+        elif not periods.equals(metric.index):
+            periods = periods.union(metric.index)
+
+    return collect_long_format(
+        [
+            pd.DataFrame(
+                metric.reindex(periods).to_numpy(dtype=np.float64).T,
+                index=pd.MultiIndex.from_product([metric.columns, [name]]),
+                columns=periods,
+            )
+            for name, metric in metrics.items()
+        ],
+        periods=periods,
+        dropna=dropna,
+    )
+
+
+def get_codes(column: pd.Series) -> tuple[np.ndarray, pd.Index]:
+    """
+    Returns the codes and labels of a column of the long format, in the order the labels
+    first appear.
+
+    Args:
+        column (pd.Series): the Ticker, Metric or Period column.
+
+    Returns:
+        tuple[np.ndarray, pd.Index]: the codes and the labels.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.codes.to_numpy(dtype=np.int64), column.cat.categories
+
+    codes, labels = pd.factorize(column)
+
+    return codes, pd.Index(labels)
+
+
+def to_wide_format(long_format: pd.DataFrame, axis: str = "columns") -> pd.DataFrame:
+    """
+    Converts the long format back to the wide format that the collectors return by
+    default.
+
+    Args:
+        long_format (pd.DataFrame): the long format with the Ticker, Metric, Period and
+            Value columns.
+        axis (str): the axis of the periods. When "columns", the tickers and metrics are
+            the index, as with the ratios. When "index", the metrics and tickers are the
+            columns, as with the risk and performance metrics. Defaults to "columns".
+
+    Raises:
+        ValueError: If the axis is not "columns" or "index".
+
+    Returns:
+        pd.DataFrame: the wide format.
+    """
+    if axis not in ["columns", "index"]:
+        raise ValueError("The axis must be either 'columns' or 'index'.")
+
+    ticker_codes, tickers = get_codes(long_format["Ticker"])
+    metric_codes, metrics = get_codes(long_format["Metric"])
+    period_codes, periods = get_codes(long_format["Period"])
+
+    # Each combination of ticker and metric becomes a row, in the order these appear
+    row_codes, rows = pd.factorize(ticker_codes * len(metrics) + metric_codes)
+
+    values = np.full((len(rows), len(periods)), np.nan)
+    values[row_codes, period_codes] = long_format["Value"].to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+
+    if axis == "index":
+        return pd.DataFrame(
+            values.T,
+            index=periods,
+            columns=pd.MultiIndex(
+                levels=[metrics, tickers],
+                codes=[rows % len(metrics), rows // len(metrics)],
+            ),
+        )
+
+    return pd.DataFrame(
+        values,
+        index=pd.MultiIndex(
+            levels=[tickers, metrics],
+            codes=[rows // len(metrics), rows % len(metrics)],
+        ),
+        columns=periods,
+    )
@@ -0,0 +1,403 @@
+"""Metrics Module"""
+
+__docformat__ = "google"
+
+import inspect
+import re
+import threading
+import time
+from collections import defaultdict
+from functools import wraps
+from urllib.parse import urlparse
+
+import pandas as pd
+
+PROMETHEUS_PREFIX = "financetoolkit"
+
+# The methods that report the metrics themselves are not measured
+UNMEASURED_METHODS = ["stats"]
+
+# The endpoints that contain the symbol within the path are templated so that each
+# endpoint results in a single label regardless of the amount of tickers
+ENDPOINT_TEMPLATES = [
+    (re.compile(r"^(/v\d+/finance/chart)/[^/]+$"), r"\1/{symbol}"),
+]
+
+# pylint: disable=too-many-instance-attributes
+
+
+class MetricsRegistry:
+    """
+    The Metrics Registry keeps track of the HTTP requests per provider and endpoint, the
+    responses that indicate the quota is reached, the retries, the cache hits and misses,
+    the bytes downloaded and the wall time of each public method. The registry is shared
+    by the entire process given that the quota of a provider is shared as well.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Resets all metrics to zero."""
+        with self._lock:
+            self._requests: defaultdict[tuple[str, str, str], int] = defaultdict(int)
+            self._quota_limited: defaultdict[tuple[str, str], int] = defaultdict(int)
+            self._retries: defaultdict[tuple[str, str, str], int] = defaultdict(int)
+            self._downloaded_bytes: defaultdict[tuple[str, str], int] = defaultdict(int)
+            self._cache_hits: defaultdict[str, int] = defaultdict(int)
+            self._cache_misses: defaultdict[str, int] = defaultdict(int)
+            self._durations: dict[str, list[float]] = {}
+
+    def record_request(
+        self,
+        provider: str,
+        endpoint: str,
+        status: int | str = "ok",
+        size: int = 0,
+    ):
+        """
+        Records a request to a data provider.
+
+        Args:
+            provider (str): the name of the provider, e.g. "FinancialModelingPrep".
+            endpoint (str): the endpoint of the request, e.g. "/stable/profile".
+            status (int | str): the status code of the response or "error" when no
+                response was received. Defaults to "ok" for providers that do not
+                expose the status code.
+            size (int): the amount of bytes downloaded. Defaults to 0.
+        """
+        with self._lock:
+            self._requests[provider, endpoint, str(status)] += 1
+            self._downloaded_bytes[provider, endpoint] += size
+
+    def record_response(self, provider: str, url: str, response):
+        """
+        Records a request based on the response of the requests package. Only the path of the
+        URL is used as endpoint so that tickers and API keys within the query are never stored.
+
+        Args:
+            provider (str): the name of the provider, e.g. "FinancialModelingPrep".
+            url (str): the URL of the request.
+            response (requests.Response): the response of the request.
+        """
+        self.record_request(
+            provider=provider,
+            endpoint=get_endpoint(url),
+            status=response.status_code,
+            size=len(response.content),
+        )
+
+    def record_quota_limited(self, provider: str, endpoint: str):
+        """
+        Records a response that indicates the quota or rate limit of the provider is reached.
+
+        Args:
+            provider (str): the name of the provider.
+            endpoint (str): the endpoint of the request.
+        """
+        with self._lock:
+            self._quota_limited[provider, endpoint] += 1
+
+    def record_retry(self, provider: str, endpoint: str, reason: str):
+        """
+        Records a retry of a request.
+
+        Args:
+            provider (str): the name of the provider.
+            endpoint (str): the endpoint of the request.
+            reason (str): the reason for the retry, e.g. "limit" or "connection".
+        """
+        with self._lock:
+            self._retries[provider, endpoint, reason] += 1
+
+    def record_cache(self, cache: str, hit: bool):
+        """
+        Records a cache hit or miss.
+
+        Args:
+            cache (str): the name of the cache, e.g. the file name of the cached data.
+            hit (bool): whether the data was found within the cache.
+        """
+        with self._lock:
+            if hit:
+                self._cache_hits[cache] += 1
+            else:
+                self._cache_misses[cache] += 1
+
+    def record_duration(self, method: str, duration: float):
+        """
+        Records the wall time of a method.
+
+        Args:
+            method (str): the name of the method, e.g. "Ratios.collect_all_ratios".
+            duration (float): the wall time in seconds.
+        """
+        with self._lock:
+            if method not in self._durations:
+                # The amount of calls, the total time and the maximum time
+                self._durations[method] = [0, 0.0, 0.0]
+
+            durations = self._durations[method]
+            durations[0] += 1
+            durations[1] += duration
+            durations[2] = max(durations[2], duration)
+
+    def get_stats(self) -> dict[str, pd.DataFrame]:
+        """
+        Returns the metrics as DataFrames.
+
+        Returns:
+            dict[str, pd.DataFrame]: the metrics of the requests per provider and endpoint,
+                the cache hits and misses and the wall time of each method.
+        """
+        with self._lock:
+            requests: defaultdict[tuple[str, str], dict[str, int]] = defaultdict(
+                lambda: {
+                    "Requests": 0,
+                    "Failed Requests": 0,
+                    "Quota Limited": 0,
+                    "Retries": 0,
+                    "Bytes Downloaded": 0,
+                }
+            )
+
+            for (provider, endpoint, status), count in self._requests.items():
+                requests[provider, endpoint]["Requests"] += count
+
+                if not (status == "ok" or status.startswith("2")):
+                    requests[provider, endpoint]["Failed Requests"] += count
+
+            for key, count in self._quota_limited.items():
+                requests[key]["Quota Limited"] += count
+            for (provider, endpoint, _), count in self._retries.items():
+                requests[provider, endpoint]["Retries"] += count
+            for key, size in self._downloaded_bytes.items():
+                requests[key]["Bytes Downloaded"] += size
+
+            cache = {
+                name: {
+                    "Hits": self._cache_hits.get(name, 0),
+                    "Misses": self._cache_misses.get(name, 0),
+                }
+                for name in sorted(set(self._cache_hits) | set(self._cache_misses))
+            }
+
+            latency = {
+                method: {
+                    "Calls": calls,
+                    "Total Time": total_time,
+                    "Average Time": total_time / calls,
+                    "Maximum Time": maximum_time,
+                }
+                for method, (calls, total_time, maximum_time) in sorted(
+                    self._durations.items()
+                )
+            }
+
+        requests_stats = pd.DataFrame.from_dict(
+            dict(sorted(requests.items())),
+            orient="index",
+            columns=[
+                "Requests",
+                "Failed Requests",
+                "Quota Limited",
+                "Retries",
+                "Bytes Downloaded",
+            ],
+        )
+        requests_stats.index = pd.MultiIndex.from_tuples(
+            requests_stats.index, names=["Provider", "Endpoint"]
+        )
+
+        cache_stats = pd.DataFrame.from_dict(
+            cache, orient="index", columns=["Hits", "Misses"]
+        ).rename_axis("Cache")
+        latency_stats = pd.DataFrame.from_dict(
+            latency,
+            orient="index",
+            columns=["Calls", "Total Time", "Average Time", "Maximum Time"],
+        ).rename_axis("Method")
+
+        return {
+            "Requests": requests_stats,
+            "Cache": cache_stats,
+            "Latency": latency_stats,
+        }
+
+    def to_prometheus(self) -> str:
+        """
+        Exports the metrics in the Prometheus text format so that these can be
+        exposed on a metrics endpoint of a service.
+
+        Returns:
+            str: the metrics in the Prometheus text format.
+        """
+        with self._lock:
+            counters = [
+                (
+                    "http_requests_total",
+                    "The amount of HTTP requests per provider, endpoint and status.",
+                    ["provider", "endpoint", "status"],
+                    dict(self._requests),
+                ),
+                (
+                    "http_quota_limited_total",
+                    "The amount of responses that indicate the quota is reached.",
+                    ["provider", "endpoint"],
+                    dict(self._quota_limited),
+                ),
+                (
+                    "http_retries_total",
+                    "The amount of retried requests per provider, endpoint and reason.",
+                    ["provider", "endpoint", "reason"],
+                    dict(self._retries),
+                ),
+                (
+                    "http_downloaded_bytes_total",
+                    "The amount of bytes downloaded per provider and endpoint.",
+                    ["provider", "endpoint"],
+                    dict(self._downloaded_bytes),
+                ),
+                (
+                    "cache_hits_total",
+                    "The amount of times the data was found within the cache.",
+                    ["cache"],
+                    {(cache,): count for cache, count in self._cache_hits.items()},
+                ),
+                (
+                    "cache_misses_total",
+                    "The amount of times the data was not found within the cache.",
+                    ["cache"],
+                    {(cache,): count for cache, count in self._cache_misses.items()},
+                ),
+            ]
+            durations = {
+                method: tuple(values) for method, values in self._durations.items()
+            }
+
+        lines = []
+
+        for name, description, labels, values in counters:
+            lines.append(f"# HELP {PROMETHEUS_PREFIX}_{name} {description}")
+            lines.append(f"# TYPE {PROMETHEUS_PREFIX}_{name} counter")
+
+            for label_values, value in sorted(values.items()):
+                lines.append(
+                    f"{PROMETHEUS_PREFIX}_{name}"
+                    f"{format_labels(labels, label_values)} {value}"
+                )
+
+        name = f"{PROMETHEUS_PREFIX}_method_duration_seconds"
+        lines.append(f"# HELP {name} The wall time of each public method.")
+        lines.append(f"# TYPE {name} summary")
+
+        for method, (calls, total_time, _) in sorted(durations.items()):
+            labels = format_labels(["method"], (method,))
+            lines.append(f"{name}_count{labels} {calls}")
+            lines.append(f"{name}_sum{labels} {total_time}")
+
+        return "\n".join(lines) + "\n"
+
+
+def get_endpoint(url: str) -> str:
+    """
+    Returns the endpoint of a URL which is the path without the query. When the path
+    contains the symbol, e.g. /v8/finance/chart/AAPL, the symbol is replaced by {symbol}.
+
+    Args:
+        url (str): the URL of the request.
+
+    Returns:
+        str: the endpoint.
+    """
+    endpoint = urlparse(url).path or url
+
+    for pattern, template in ENDPOINT_TEMPLATES:
+        endpoint = pattern.sub(template, endpoint)
+
+    return endpoint
+
+
+def format_labels(names: list[str], values: tuple) -> str:
+    """
+    Formats the labels of a metric following the Prometheus text format.
+
+    Args:
+        names (list[str]): the names of the labels.
+        values (tuple): the values of the labels.
+
+    Returns:
+        str: the formatted labels.
+    """
+    formatted_labels = ",".join(
+        f'{name}="{escape_label_value(str(value))}"'
+        for name, value in zip(names, values, strict=True)
+    )
+
+    return f"{{{formatted_labels}}}"
+
+
+def escape_label_value(value: str) -> str:
+    """
+    Escapes a label value following the Prometheus text format.
+
+    Args:
+        value (str): the label value.
+
+    Returns:
+        str: the escaped label value.
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+metrics = MetricsRegistry()
+
+
+def measure_methods(cls):
+    """
+    Class decorator that records the wall time of each public method of the class
+    within the metrics registry. Nested calls, e.g. the ratios that are calculated
+    as part of collect_all_ratios, are recorded as well.
+
+    Args:
+        cls (type): the class to measure the methods of.
+
+    Returns:
+        type: the same class with the public methods wrapped.
+    """
+    for name, function in list(vars(cls).items()):
+        if (
+            name.startswith("_")
+            or name in UNMEASURED_METHODS
+            or not inspect.isfunction(function)
+        ):
+            continue
+
+        setattr(cls, name, measure_method(function, f"{cls.__name__}.{name}"))
+
+    return cls
+
+
+def measure_method(function, method: str):
+    """
+    Wraps a function to record its wall time within the metrics registry.
+
+    Args:
+        function (Callable): the function to wrap.
+        method (str): the name the wall time is recorded under.
+
+    Returns:
+        Callable: the wrapped function.
+    """
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            metrics.record_duration(method, time.perf_counter() - start)
+
+    return wrapper
@@ -0,0 +1,400 @@
+"""Parallel Module"""
+
+__docformat__ = "google"
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+BENCHMARK_NAME = "Benchmark"
+
+# The controllers drop the ticker level from the results when there is a single ticker,
+# each shard therefore contains at least two tickers to be able to reassemble the results
+MINIMUM_SHARD_SIZE = 2
+
+# pylint: disable=too-many-arguments,too-few-public-methods
+
+
+def split_in_shards(tickers: list[str], n_jobs: int | None) -> list[list[str]]:
+    """
+    Splits the tickers into contiguous shards, one for each process. When the tickers
+    can not be split up, e.g. because there are too few tickers or the portfolio is
+    included (which requires all tickers at once), an empty list is returned to
+    indicate the calculations should run within the current process.
+
+    Args:
+        tickers (list[str]): the tickers to split.
+        n_jobs (int | None): the amount of processes to use. A negative number is
+            subtracted from the amount of CPU cores, e.g. -1 uses all cores.
+
+    Returns:
+        list[list[str]]: the tickers of each shard or an empty list.
+    """
+    if n_jobs is None or n_jobs in [0, 1] or "Portfolio" in tickers:
+        return []
+
+    if n_jobs < 0:
+        n_jobs = max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+
+    n_shards = min(n_jobs, len(tickers) // MINIMUM_SHARD_SIZE)
+
+    if n_shards <= 1:
+        return []
+
+    return [list(shard) for shard in np.array_split(np.array(tickers), n_shards)]
+
+
+def get_ticker_axis(dataset: pd.DataFrame) -> int | None:
+    """
+    Determines the axis that contains the tickers. The historical data has the tickers
+    as the second level of the columns and the financial statements have the tickers
+    as the first level of the index.
+
+    Args:
+        dataset (pd.DataFrame): the dataset to determine the ticker axis for.
+
+    Returns:
+        int | None: 1 for the columns, 0 for the index and None if the dataset does not
+            contain tickers.
+    """
+    if dataset.empty:
+        return None
+    if isinstance(dataset.columns, pd.MultiIndex):
+        return 1
+    if isinstance(dataset.index, pd.MultiIndex):
+        return 0
+
+    return None
+
+
+class SharedSlice:
+    """
+    The part of a shared DataFrame that belongs to a single shard. Only the positions
+    and labels of the shard are pickled when sent to a process, the values are read
+    from the shared memory block once the DataFrame is restored.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        shape: tuple[int, int],
+        dtype: np.dtype,
+        axis: int,
+        positions: np.ndarray,
+        index: pd.Index,
+        columns: pd.Index,
+        dtypes: pd.Series,
+    ):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+        self.axis = axis
+        self.positions = positions
+        self.index = index
+        self.columns = columns
+        self.dtypes = dtypes
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Reads the values of the shard from shared memory and returns these as a DataFrame.
+
+        Returns:
+            pd.DataFrame: the dataset with only the tickers of the shard.
+        """
+        block = shared_memory.SharedMemory(name=self.name)
+
+        try:
+            values = np.ndarray(self.shape, dtype=self.dtype, buffer=block.buf)
+            values = np.take(values, self.positions, axis=self.axis)
+        finally:
+            block.close()
+
+        dataset = pd.DataFrame(values)
+
+        # The values are stored with a single data type and are therefore converted
+        # back to the original data types, e.g. the volume which is an integer
+        if (self.dtypes != self.dtype).any():
+            dataset = dataset.astype(dict(enumerate(self.dtypes)), copy=False)
+
+        dataset.index = self.index
+        dataset.columns = self.columns
+
+        return dataset
+
+
+class SharedDataFrame:
+    """
+    Stores the values of a DataFrame in a shared memory block so that each process
+    can read its own tickers without the full DataFrame being pickled. Numeric columns
+    with different data types are stored with a common data type.
+    """
+
+    def __init__(self, dataset: pd.DataFrame, axis: int):
+        values = dataset.to_numpy()
+
+        self._dataset = dataset
+        self._axis = axis
+        self._block = shared_memory.SharedMemory(
+            create=True, size=max(values.nbytes, 1)
+        )
+
+        np.ndarray(values.shape, dtype=values.dtype, buffer=self._block.buf)[:] = values
+
+        self._shape = values.shape
+        self._dtype = values.dtype
+
+    def select(self, tickers: list[str]) -> SharedSlice:
+        """
+        Selects the tickers of a shard. For the historical data, the benchmark is
+        kept as well given that it is required for the calculations.
+
+        Args:
+            tickers (list[str]): the tickers of the shard.
+
+        Returns:
+            SharedSlice: the description of the shard within the shared memory block.
+        """
+        labels = (
+            self._dataset.columns.get_level_values(1)
+            if self._axis == 1
+            else self._dataset.index.get_level_values(0)
+        )
+        selected_tickers = [*tickers, BENCHMARK_NAME] if self._axis == 1 else tickers
+        positions = np.flatnonzero(labels.isin(selected_tickers))
+
+        return SharedSlice(
+            name=self._block.name,
+            shape=self._shape,
+            dtype=self._dtype,
+            axis=self._axis,
+            positions=positions,
+            index=(
+                self._dataset.index[positions]
+                if self._axis == 0
+                else self._dataset.index
+            ),
+            columns=(
+                self._dataset.columns[positions]
+                if self._axis == 1
+                else self._dataset.columns
+            ),
+            dtypes=(
+                self._dataset.dtypes.iloc[positions]
+                if self._axis == 1
+                else self._dataset.dtypes
+            ),
+        )
+
+    def close(self):
+        """Releases the shared memory block."""
+        self._block.close()
+        self._block.unlink()
+
+
+def share_arguments(
+    arguments: dict, tickers: list[str], shared_datasets: dict[int, SharedDataFrame]
+) -> dict:
+    """
+    Replaces the DataFrames that contain tickers with the slice of the shard. Each
+    DataFrame is placed in shared memory once and reused for the other shards.
+
+    Args:
+        arguments (dict): the arguments used to initialize the controller.
+        tickers (list[str]): the tickers of the shard.
+        shared_datasets (dict[int, SharedDataFrame]): the DataFrames that are already
+            placed in shared memory.
+
+    Returns:
+        dict: the arguments for the shard.
+    """
+    shard_arguments = {}
+
+    for name, value in arguments.items():
+        if isinstance(value, dict):
+            shard_arguments[name] = share_arguments(value, tickers, shared_datasets)
+            continue
+
+        axis = get_ticker_axis(value) if isinstance(value, pd.DataFrame) else None
+
+        # Non-numeric data types can not be stored in a shared memory
+        # block, these are sliced and pickled instead
+        if axis is not None and not all(
+            pd.api.types.is_numeric_dtype(dtype) for dtype in value.dtypes
+        ):
+            labels = value.columns if axis == 1 else value.index
+            selected_tickers = [*tickers, BENCHMARK_NAME] if axis == 1 else tickers
+            shard_arguments[name] = value.loc(axis=axis)[
+                labels.get_level_values(axis).isin(selected_tickers)
+            ]
+        elif axis is not None:
+            if id(value) not in shared_datasets:
+                shared_datasets[id(value)] = SharedDataFrame(value, axis=axis)
+
+            shard_arguments[name] = shared_datasets[id(value)].select(tickers)
+        else:
+            shard_arguments[name] = value
+
+    return shard_arguments
+
+
+def restore_arguments(arguments: dict) -> dict:
+    """
+    Restores the DataFrames of a shard from shared memory.
+
+    Args:
+        arguments (dict): the arguments of the shard.
+
+    Returns:
+        dict: the arguments used to initialize the controller.
+    """
+    return {
+        name: (
+            restore_arguments(value)
+            if isinstance(value, dict)
+            else value.to_dataframe() if isinstance(value, SharedSlice) else value
+        )
+        for name, value in arguments.items()
+    }
+
+
+def collect_shard(
+    controller_class: type,
+    tickers: list[str],
+    arguments: dict,
+    method: str,
+    method_arguments: dict,
+    attributes: list[str] | None = None,
+) -> pd.DataFrame | dict[str, pd.DataFrame]:
+    """
+    Initializes the controller for the tickers of a shard and collects the results.
+    This function is executed within each process.
+
+    Args:
+        controller_class (type): the controller class, e.g. Ratios or Risk.
+        tickers (list[str]): the tickers of the shard.
+        arguments (dict): the arguments of the shard used to initialize the controller.
+        method (str): the name of the method to call.
+        method_arguments (dict): the arguments passed to the method.
+        attributes (list[str] | None): the attributes of the controller to return
+            instead of the result of the method. Defaults to None.
+
+    Returns:
+        pd.DataFrame | dict[str, pd.DataFrame]: the results of the shard.
+    """
+    controller = controller_class(tickers=tickers, **restore_arguments(arguments))
+
+    results = getattr(controller, method)(**method_arguments)
+
+    if attributes:
+        return {attribute: getattr(controller, attribute) for attribute in attributes}
+
+    return results
+
+
+def combine_shards(
+    results: list[pd.DataFrame], tickers: list[str], axis: int
+) -> pd.DataFrame:
+    """
+    Combines the results of each shard in the original order of the tickers.
+
+    Args:
+        results (list[pd.DataFrame]): the results of each shard.
+        tickers (list[str]): the tickers in the original order.
+        axis (int): the axis that contains the tickers, 0 when the tickers are the first
+            level of the index and 1 when the tickers are the second level of the columns.
+
+    Returns:
+        pd.DataFrame: the combined results.
+    """
+    # The shards are contiguous so combining these keeps the order of the tickers
+    if axis == 0:
+        return pd.concat(results)
+
+    combined_results = pd.concat(results, axis=1)
+
+    # Each shard includes the benchmark, which is therefore only kept once
+    combined_results = combined_results.loc[:, ~combined_results.columns.duplicated()]
+
+    metrics = results[0].columns.get_level_values(0).unique()
+    columns = [
+        (metric, ticker)
+        for metric in metrics
+        for ticker in dict.fromkeys([*tickers, BENCHMARK_NAME])
+        if (metric, ticker) in combined_results.columns
+    ]
+
+    return combined_results.loc[:, columns]
+
+
+def collect_in_parallel(
+    controller_class: type,
+    arguments: dict,
+    method: str,
+    method_arguments: dict,
+    shards: list[list[str]],
+    axis: int,
+    attributes: list[str] | None = None,
+) -> pd.DataFrame | dict[str, pd.DataFrame]:
+    """
+    Collects the results of a controller method by dividing the tickers over a process
+    pool. The DataFrames that contain tickers are placed in shared memory once after
+    which each process only reads the tickers of its own shard. The results are
+    combined in the original order of the tickers.
+
+    Note that on platforms that start new processes by spawning (e.g. Windows and macOS),
+    the code that calls this function should be guarded by `if __name__ == "__main__":`.
+
+    Args:
+        controller_class (type): the controller class, e.g. Ratios or Risk.
+        arguments (dict): the arguments used to initialize the controller
+            excluding the tickers.
+        method (str): the name of the method to call.
+        method_arguments (dict): the arguments passed to the method.
+        shards (list[list[str]]): the tickers of each shard as returned by split_in_shards.
+        axis (int): the axis of the results that contains the tickers.
+        attributes (list[str] | None): the attributes of the controller to combine
+            instead of the result of the method, e.g. the separate categories of the
+            ratios. Defaults to None.
+
+    Returns:
+        pd.DataFrame | dict[str, pd.DataFrame]: the combined results or, when attributes
+            are given, the combined results of each attribute.
+    """
+    shared_datasets: dict[int, SharedDataFrame] = {}
+
+    try:
+        shard_arguments = [
+            share_arguments(arguments, shard, shared_datasets) for shard in shards
+        ]
+
+        with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+            results = list(
+                executor.map(
+                    collect_shard,
+                    repeat(controller_class),
+                    shards,
+                    shard_arguments,
+                    repeat(method),
+                    repeat(method_arguments),
+                    repeat(attributes),
+                )
+            )
+    finally:
+        for shared_dataset in shared_datasets.values():
+            shared_dataset.close()
+
+    tickers = [ticker for shard in shards for ticker in shard]
+
+    if attributes:
+        return {
+            attribute: combine_shards(
+                [result[attribute] for result in results], tickers=tickers, axis=axis
+            )
+            for attribute in attributes
+        }
+
+    return combine_shards(results, tickers=tickers, axis=axis)
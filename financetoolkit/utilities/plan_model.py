@@ -0,0 +1,307 @@
+"""Plan Module"""
+
+__docformat__ = "google"
+
+import importlib.util
+
+import pandas as pd
+
+from financetoolkit import fmp_model, yfinance_model
+from financetoolkit.utilities import logger_model
+from financetoolkit.utilities.metrics_model import get_endpoint
+
+logger = logger_model.get_logger()
+
+# Check if yfinance is installed
+yf_spec = importlib.util.find_spec("yfinance")
+ENABLE_YFINANCE = yf_spec is not None
+
+FMP_PROVIDER = "FinancialModelingPrep"
+YF_PROVIDER = "YahooFinance"
+
+# The API key is never part of the planned URLs
+API_KEY_PLACEHOLDER = "API_KEY"
+
+# Each ticker is collected in a separate thread which is started after a sleep of 0.1 seconds
+TICKER_INTERVAL = 0.1
+
+# The Toolkit does not distinguish between the paid plans of FinancialModelingPrep, the rate
+# limit of the Starter plan is therefore used as the most conservative estimate
+REQUESTS_PER_MINUTE = {"Free": 300, "Premium": 300}
+DAILY_REQUEST_LIMIT = {"Free": 250}
+
+TREASURY_TICKERS = ["^IRX", "^FVX", "^TNX", "^TYX"]
+
+STATEMENTS = ["balance", "income", "cashflow"]
+HISTORICAL_DATASETS = ["treasury", "historical"]
+COMPANY_DATASETS = {
+    "profile": fmp_model.get_profile_url,
+    "quote": fmp_model.get_quote_url,
+    "rating": fmp_model.get_rating_url,
+}
+MODULE_DATASETS = {
+    "ratios": [*STATEMENTS, *HISTORICAL_DATASETS],
+    "models": [*STATEMENTS, *HISTORICAL_DATASETS],
+    "technicals": HISTORICAL_DATASETS,
+    "performance": HISTORICAL_DATASETS,
+    "risk": HISTORICAL_DATASETS,
+}
+DATASETS = [
+    *STATEMENTS,
+    *HISTORICAL_DATASETS,
+    "historical_statistics",
+    *COMPANY_DATASETS,
+]
+
+
+def expand_datasets(datasets: list[str] | str) -> list[str]:
+    """
+    Expands the modules, e.g. "ratios", into the datasets these modules require
+    and removes duplicates while keeping the order in which these are collected.
+
+    Args:
+        datasets (list[str] | str): the datasets and/or modules.
+
+    Raises:
+        ValueError: If a dataset or module is not recognized.
+
+    Returns:
+        list[str]: the datasets.
+    """
+    if isinstance(datasets, str):
+        datasets = [datasets]
+
+    expanded_datasets: list[str] = []
+
+    for dataset in datasets:
+        if dataset in MODULE_DATASETS:
+            expanded_datasets.extend(MODULE_DATASETS[dataset])
+        elif dataset == "historical":
+            # The treasury data is always collected first as it contains the risk free rate
+            expanded_datasets.extend(HISTORICAL_DATASETS)
+        elif dataset in DATASETS:
+            expanded_datasets.append(dataset)
+        else:
+            raise ValueError(
+                f"The dataset {dataset} is not recognized. Please choose from "
+                f"{', '.join([*DATASETS, *MODULE_DATASETS])}."
+            )
+
+    return list(dict.fromkeys(expanded_datasets))
+
+
+def plan_dataset_requests(
+    dataset: str,
+    tickers: list[str],
+    api_key: str = "",
+    quarter: bool = False,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    user_subscription: str = "Free",
+    enforce_source: str | None = None,
+) -> list[dict]:
+    """
+    Lists the requests that are made to collect a dataset for the given tickers. This follows
+    the same logic as the collection itself: FinancialModelingPrep is used when an API key is
+    provided and YahooFinance is used when no API key is provided, when it is enforced or as a
+    fallback when FinancialModelingPrep returns no data.
+
+    Args:
+        dataset (str): the dataset, e.g. "balance", "historical" or "profile".
+        tickers (list[str]): the tickers to collect the dataset for.
+        api_key (str): the API key of FinancialModelingPrep. Defaults to "".
+        quarter (bool): whether quarterly data is collected. Defaults to False.
+        start_date (str | None): the start date in 'YYYY-MM-DD' format. Defaults to None.
+        end_date (str | None): the end date in 'YYYY-MM-DD' format. Defaults to None.
+        user_subscription (str): the subscription plan of FinancialModelingPrep. Defaults to "Free".
+        enforce_source (str | None): the enforced source. Defaults to None.
+
+    Returns:
+        list[dict]: the requests with the dataset, ticker, provider, endpoint, URL and the
+            provider that is used as fallback.
+    """
+    use_fmp = bool(api_key) and enforce_source in [None, FMP_PROVIDER]
+    use_yf = enforce_source != FMP_PROVIDER and ENABLE_YFINANCE
+    fallback = YF_PROVIDER if use_fmp and use_yf else None
+
+    requests: list[dict] = []
+
+    def add_request(ticker: str, provider: str, url: str | None, endpoint: str = ""):
+        requests.append(
+            {
+                "Dataset": dataset,
+                "Ticker": ticker,
+                "Provider": provider,
+                "Endpoint": get_endpoint(url) if url else endpoint,
+                "URL": url,
+                "Fallback": fallback if provider == FMP_PROVIDER else None,
+            }
+        )
+
+    if dataset in STATEMENTS:
+        for ticker in tickers:
+            if use_fmp:
+                add_request(
+                    ticker,
+                    FMP_PROVIDER,
+                    fmp_model.get_financial_statement_url(
+                        ticker=ticker,
+                        statement=dataset,
+                        api_key=API_KEY_PLACEHOLDER,
+                        quarter=quarter,
+                        start_date=start_date,
+                        end_date=end_date,
+                        user_subscription=user_subscription,
+                    ),
+                )
+
+            # Quarterly statements are a premium query parameter and therefore
+            # always result in a fallback to YahooFinance on the Free plan
+            if use_yf and (not use_fmp or (quarter and user_subscription == "Free")):
+                add_request(ticker, YF_PROVIDER, None, endpoint=dataset)
+    elif dataset in HISTORICAL_DATASETS:
+        start, end = fmp_model.get_historical_period(start=start_date, end=end_date)
+
+        for ticker in TREASURY_TICKERS if dataset == "treasury" else tickers:
+            if use_fmp:
+                add_request(
+                    ticker,
+                    FMP_PROVIDER,
+                    fmp_model.get_historical_data_url(
+                        ticker=ticker,
+                        api_key=API_KEY_PLACEHOLDER,
+                        start_date=start,
+                        end_date=end,
+                    ),
+                )
+                add_request(
+                    ticker,
+                    FMP_PROVIDER,
+                    fmp_model.get_dividend_url(
+                        ticker=ticker,
+                        api_key=API_KEY_PLACEHOLDER,
+                        user_subscription=user_subscription,
+                    ),
+                )
+            elif use_yf:
+                add_request(ticker, YF_PROVIDER, None, endpoint="history")
+    elif dataset == "historical_statistics":
+        # YahooFinance is tried first given that it contains more statistics
+        fallback = FMP_PROVIDER if api_key else None
+
+        for ticker in tickers:
+            requests.append(
+                {
+                    "Dataset": dataset,
+                    "Ticker": ticker,
+                    "Provider": YF_PROVIDER,
+                    "Endpoint": "/v8/finance/chart",
+                    "URL": yfinance_model.get_historical_statistics_url(ticker=ticker),
+                    "Fallback": fallback,
+                }
+            )
+    elif dataset in COMPANY_DATASETS and api_key:
+        # The company data is only available from FinancialModelingPrep
+        fallback = None
+        get_url = COMPANY_DATASETS[dataset]
+
+        for ticker in tickers:
+            add_request(
+                ticker,
+                FMP_PROVIDER,
+                (
+                    get_url(
+                        ticker=ticker,
+                        api_key=API_KEY_PLACEHOLDER,
+                        user_subscription=user_subscription,
+                    )
+                    if dataset == "rating"
+                    else get_url(ticker=ticker, api_key=API_KEY_PLACEHOLDER)
+                ),
+            )
+
+    return requests
+
+
+def summarize_requests(
+    requests: pd.DataFrame,
+    datasets: dict[str, bool],
+    user_subscription: str = "Free",
+    requests_per_minute: int | None = None,
+) -> pd.DataFrame:
+    """
+    Summarizes the requests per dataset and estimates the duration of the collection. The
+    datasets are collected one after another while the tickers of a dataset are collected
+    in parallel. The duration of a dataset is therefore determined by the interval between
+    the tickers or, when more requests are made, the rate limit of FinancialModelingPrep.
+    The time it takes to receive a response is not included.
+
+    Args:
+        requests (pd.DataFrame): the requests as returned by plan_dataset_requests.
+        datasets (dict[str, bool]): the datasets and whether these are already cached.
+        user_subscription (str): the subscription plan of FinancialModelingPrep. Defaults to "Free".
+        requests_per_minute (int | None): the rate limit of FinancialModelingPrep. Defaults to
+            None which uses the rate limit that belongs to the subscription plan.
+
+    Returns:
+        pd.DataFrame: the amount of requests per provider and the estimated duration in
+            seconds for each dataset, including the total.
+    """
+    if requests_per_minute is None:
+        requests_per_minute = REQUESTS_PER_MINUTE.get(user_subscription, 300)
+
+    summary = {}
+
+    for dataset, cached in datasets.items():
+        dataset_requests = (
+            requests[requests["Dataset"] == dataset] if not requests.empty else requests
+        )
+        fmp_requests = (
+            int((dataset_requests["Provider"] == FMP_PROVIDER).sum())
+            if not dataset_requests.empty
+            else 0
+        )
+        yf_requests = len(dataset_requests) - fmp_requests
+        tickers = (
+            dataset_requests["Ticker"].nunique() if not dataset_requests.empty else 0
+        )
+
+        summary[dataset] = {
+            "Cached": cached,
+            FMP_PROVIDER: fmp_requests,
+            YF_PROVIDER: yf_requests,
+            "Estimated Duration": round(
+                max(tickers * TICKER_INTERVAL, fmp_requests / requests_per_minute * 60),
+                2,
+            ),
+        }
+
+    summary["Total"] = {
+        "Cached": all(dataset["Cached"] for dataset in summary.values()),
+        FMP_PROVIDER: sum(dataset[FMP_PROVIDER] for dataset in summary.values()),
+        YF_PROVIDER: sum(dataset[YF_PROVIDER] for dataset in summary.values()),
+        "Estimated Duration": round(
+            sum(dataset["Estimated Duration"] for dataset in summary.values()), 2
+        ),
+    }
+
+    summary_df = pd.DataFrame.from_dict(
+        summary,
+        orient="index",
+        columns=["Cached", FMP_PROVIDER, YF_PROVIDER, "Estimated Duration"],
+    ).rename_axis("Dataset")
+
+    daily_request_limit = DAILY_REQUEST_LIMIT.get(user_subscription)
+    total_fmp_requests = summary["Total"][FMP_PROVIDER]
+
+    if daily_request_limit and total_fmp_requests > daily_request_limit:
+        logger.warning(
+            "The plan requires %s requests to FinancialModelingPrep which exceeds the daily "
+            "limit of %s requests of the %s plan. Consider upgrading your plan: "
+            "https://www.jeroenbouma.com/fmp",
+            total_fmp_requests,
+            daily_request_limit,
+            user_subscription,
+        )
+
+    return summary_df
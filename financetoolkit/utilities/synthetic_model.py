@@ -0,0 +1,832 @@
+"""Synthetic Module"""
+
+__docformat__ = "google"
+
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from financetoolkit.normalization_model import read_normalization_file
+
+BENCHMARK_NAME = "Benchmark"
+TICKER_PREFIX = "SYN"
+TRADING_DAYS = 252
+
+# Every dataset, and every ticker within a dataset, is drawn from an independent stream of
+# the seed. The data of a ticker therefore does not depend on the amount of tickers which
+# means that a small universe is a subset of a larger universe with the same seed.
+STATEMENTS_STREAM = 0
+HISTORICAL_STREAM = 1
+MARKET_STREAM = 2
+TREASURY_STREAM = 3
+PORTFOLIO_STREAM = 4
+VALUATION_STREAM = 5
+
+# The amount of random numbers that are drawn for each ticker, this is more than the
+# statements require so that adding a line item does not change the other line items
+PARAMETER_DRAWS = 96
+NOISE_DRAWS = 96
+
+# The spread of each maturity over the 13 week treasury rate
+TREASURY_SPREADS = {
+    "13 Week": 0.0,
+    "5 Year": 0.004,
+    "10 Year": 0.007,
+    "30 Year": 0.01,
+}
+RISK_FREE_RATES = {
+    "13w": "13 Week",
+    "5y": "5 Year",
+    "10y": "10 Year",
+    "30y": "30 Year",
+}
+
+# Dividends are paid on the first trading day of these months
+DIVIDEND_MONTHS = [2, 5, 8, 11]
+
+# pylint: disable=too-many-locals,too-many-statements,too-many-arguments
+
+
+def get_generator(seed: int, stream: int, index: int = 0) -> np.random.Generator:
+    """
+    Returns the random generator of a stream and index of the seed, e.g. the
+    generator of the historical data of the fifth ticker.
+
+    Args:
+        seed (int): the seed of the universe.
+        stream (int): the stream, e.g. STATEMENTS_STREAM or HISTORICAL_STREAM.
+        index (int): the index of the ticker within the stream. Defaults to 0.
+
+    Returns:
+        np.random.Generator: the random generator.
+    """
+    return np.random.default_rng(
+        np.random.SeedSequence(seed, spawn_key=(stream, index))
+    )
+
+
+def create_tickers(tickers: int | list[str]) -> list[str]:
+    """
+    Creates the ticker names of the synthetic universe, e.g. SYN0000, SYN0001, etc.
+
+    Args:
+        tickers (int | list[str]): the amount of tickers or the ticker names.
+
+    Returns:
+        list[str]: the ticker names.
+    """
+    if isinstance(tickers, list):
+        return tickers
+
+    return [f"{TICKER_PREFIX}{index:04d}" for index in range(tickers)]
+
+
+def generate_financial_statements(
+    tickers: int | list[str],
+    years: int = 5,
+    quarterly: bool = False,
+    end_year: int = 2023,
+    seed: int = 0,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Generates the balance sheet, income and cash flow statements for the tickers. The line
+    items are the generic names from the normalization files and follow the accounting
+    identities, e.g. the total assets equal the total liabilities and equity and the
+    gross profit equals the revenue minus the cost of goods sold.
+
+    Each company has its own size, growth and margins which fluctuate over time so that
+    the ratios and models result in a realistic spread of values.
+
+    Args:
+        tickers (int | list[str]): the amount of tickers or the ticker names.
+        years (int): the amount of years. Defaults to 5.
+        quarterly (bool): whether to generate quarterly statements. Defaults to False.
+        end_year (int): the last year of the statements. Defaults to 2023.
+        seed (int): the seed, the same seed always results in the same statements. Defaults to 0.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: the balance sheet, income and
+            cash flow statements with the tickers and line items as index and the periods
+            as columns.
+    """
+    tickers = create_tickers(tickers)
+    periods_per_year = 4 if quarterly else 1
+    periods = pd.period_range(
+        end=pd.Period(str(end_year), freq="Y").asfreq(
+            "Q" if quarterly else "Y", how="end"
+        ),
+        periods=years * periods_per_year,
+        name="date",
+    )
+
+    uniform = np.empty((len(tickers), PARAMETER_DRAWS))
+    normal = np.empty((len(tickers), NOISE_DRAWS, len(periods)))
+
+    for index in range(len(tickers)):
+        generator = get_generator(seed, STATEMENTS_STREAM, index)
+        uniform[index] = generator.random(PARAMETER_DRAWS)
+        normal[index] = generator.standard_normal((NOISE_DRAWS, len(periods)))
+
+    parameter_counter = itertools.count()
+    noise_counter = itertools.count()
+
+    def draw(low: float, high: float) -> np.ndarray:
+        """Draws a value for each company that is constant over time."""
+        return low + (high - low) * uniform[:, [next(parameter_counter)]]
+
+    def noise(scale: float) -> np.ndarray:
+        """Draws a value for each company and period."""
+        return scale * normal[:, next(noise_counter)]
+
+    def vary(value: np.ndarray, scale: float = 0.05) -> np.ndarray:
+        """Lets a value fluctuate over time."""
+        return value * (1 + noise(scale))
+
+    def allocate(total: np.ndarray, shares: dict[str, tuple[float, float]]) -> dict:
+        """Divides a total over the line items based on the range of their share."""
+        weights = {name: vary(draw(*share)) for name, share in shares.items()}
+        total_weight = sum(weights.values())
+
+        return {name: total * weight / total_weight for name, weight in weights.items()}
+
+    def change(value: np.ndarray) -> np.ndarray:
+        """Calculates the change compared to the previous period."""
+        previous = np.concatenate(
+            [value[:, :1] / (1 + period_growth[:, :1]), value[:, :-1]], axis=1
+        )
+
+        return value - previous
+
+    annual_growth = np.clip(draw(-0.05, 0.2) + noise(0.1), -0.5, None)
+    period_growth = (1 + annual_growth) ** (1 / periods_per_year) - 1
+    revenue = (
+        10 ** draw(8, 11) / periods_per_year * np.cumprod(1 + period_growth, axis=1)
+    )
+
+    # Balance Sheet Statement, the stocks are based on the annualized revenue
+    total_assets = revenue * periods_per_year * vary(draw(0.5, 2.5), 0.02)
+    assets = allocate(
+        total_assets,
+        {
+            "Cash and Cash Equivalents": (0.03, 0.15),
+            "Short Term Investments": (0, 0.1),
+            "Accounts Receivable": (0.03, 0.15),
+            " Other Receivables": (0, 0.03),
+            "Inventory": (0, 0.15),
+            "Prepaids": (0, 0.02),
+            "Other Current Assets": (0, 0.05),
+            "Property, Plant and Equipment": (0.1, 0.4),
+            "Goodwill": (0, 0.15),
+            "Intangible Assets": (0, 0.1),
+            "Long Term Investments": (0, 0.15),
+            "Tax Assets": (0, 0.03),
+            "Other Fixed Assets": (0, 0.02),
+            "Other Assets": (0, 0.05),
+        },
+    )
+
+    total_liabilities = total_assets * vary(draw(0.3, 0.8), 0.02)
+    liabilities = allocate(
+        total_liabilities,
+        {
+            "Accounts Payable": (0.05, 0.2),
+            "Other Payables": (0, 0.03),
+            "Accrued Expenses": (0.01, 0.08),
+            "Short Term Debt": (0, 0.1),
+            "Current Capital Lease Obligations Current": (0, 0.02),
+            "Tax Payables": (0, 0.03),
+            "Deferred Revenue": (0, 0.05),
+            "Other Current Liabilities": (0, 0.05),
+            " Capital Lease Obligations Non Current": (0, 0.05),
+            "Long Term Debt": (0.1, 0.5),
+            "Deferred Revenue Non Current": (0, 0.03),
+            "Deferred Tax Liabilities": (0, 0.05),
+            "Other Non Current Liabilities": (0, 0.05),
+        },
+    )
+
+    balance = {**assets, **liabilities}
+    balance["Cash and Short Term Investments"] = (
+        balance["Cash and Cash Equivalents"] + balance["Short Term Investments"]
+    )
+    balance["Net Receivables"] = (
+        balance["Accounts Receivable"] + balance[" Other Receivables"]
+    )
+    balance["Total Current Assets"] = (
+        balance["Cash and Short Term Investments"]
+        + balance["Net Receivables"]
+        + balance["Inventory"]
+        + balance["Prepaids"]
+        + balance["Other Current Assets"]
+    )
+    balance["Goodwill and Intangible Assets"] = (
+        balance["Goodwill"] + balance["Intangible Assets"]
+    )
+    balance["Fixed Assets"] = (
+        balance["Property, Plant and Equipment"]
+        + balance["Goodwill and Intangible Assets"]
+        + balance["Long Term Investments"]
+        + balance["Tax Assets"]
+        + balance["Other Fixed Assets"]
+    )
+    balance["Total Assets"] = total_assets
+    balance["Total Payables"] = balance["Accounts Payable"] + balance["Other Payables"]
+    balance["Total Current Liabilities"] = (
+        balance["Total Payables"]
+        + balance["Accrued Expenses"]
+        + balance["Short Term Debt"]
+        + balance["Current Capital Lease Obligations Current"]
+        + balance["Tax Payables"]
+        + balance["Deferred Revenue"]
+        + balance["Other Current Liabilities"]
+    )
+    balance["Total Non Current Liabilities"] = (
+        balance[" Capital Lease Obligations Non Current"]
+        + balance["Long Term Debt"]
+        + balance["Deferred Revenue Non Current"]
+        + balance["Deferred Tax Liabilities"]
+        + balance["Other Non Current Liabilities"]
+    )
+    balance["Other Liabilities"] = np.zeros_like(total_assets)
+    balance["Capital Lease Obligations"] = (
+        balance["Current Capital Lease Obligations Current"]
+        + balance[" Capital Lease Obligations Non Current"]
+    )
+    balance["Total Debt"] = balance["Short Term Debt"] + balance["Long Term Debt"]
+    balance["Net Debt"] = balance["Total Debt"] - balance["Cash and Cash Equivalents"]
+    balance["Total Investments"] = (
+        balance["Short Term Investments"] + balance["Long Term Investments"]
+    )
+    balance["Total Liabilities"] = total_liabilities
+
+    total_equity = total_assets - total_liabilities
+    balance["Minority Interest"] = total_equity * draw(0, 0.03)
+    balance["Total Shareholder Equity"] = total_equity - balance["Minority Interest"]
+    balance[" Treasury Stock"] = -balance["Total Shareholder Equity"] * draw(0, 0.2)
+    balance["Preferred Stock"] = np.zeros_like(total_assets)
+    balance["Common Stock"] = balance["Total Shareholder Equity"] * draw(0.01, 0.1)
+    balance["Additional Paid In Capital"] = balance["Total Shareholder Equity"] * draw(
+        0.1, 0.5
+    )
+    balance["Accumulated Other Comprehensive Income"] = balance[
+        "Total Shareholder Equity"
+    ] * noise(0.02)
+    balance["Other Total Shareholder Equity"] = np.zeros_like(total_assets)
+    balance["Retained Earnings"] = balance["Total Shareholder Equity"] - (
+        balance[" Treasury Stock"]
+        + balance["Preferred Stock"]
+        + balance["Common Stock"]
+        + balance["Additional Paid In Capital"]
+        + balance["Accumulated Other Comprehensive Income"]
+        + balance["Other Total Shareholder Equity"]
+    )
+    balance["Total Equity"] = total_equity
+    balance["Total Liabilities and Shareholder Equity"] = total_assets
+    balance["Total Liabilities and Equity"] = total_assets
+
+    # Income Statement
+    income = {"Revenue": revenue}
+    income["Cost of Goods Sold"] = revenue * vary(draw(0.3, 0.8), 0.02)
+    income["Gross Profit"] = revenue - income["Cost of Goods Sold"]
+    income["Research and Development Expenses"] = revenue * vary(draw(0, 0.15))
+    income["General and Administrative Expenses"] = revenue * vary(draw(0.02, 0.1))
+    income["Selling and Marketing Expenses"] = revenue * vary(draw(0.02, 0.1))
+    income["Selling, General and Administrative Expenses"] = (
+        income["General and Administrative Expenses"]
+        + income["Selling and Marketing Expenses"]
+    )
+    income["Other Expenses"] = revenue * noise(0.005)
+    income["Operating Expenses"] = (
+        income["Research and Development Expenses"]
+        + income["Selling, General and Administrative Expenses"]
+        + income["Other Expenses"]
+    )
+    income["Cost and Expenses"] = (
+        income["Cost of Goods Sold"] + income["Operating Expenses"]
+    )
+    income["Interest Income"] = (
+        balance["Cash and Short Term Investments"]
+        * draw(0.005, 0.03)
+        / periods_per_year
+    )
+    income["Interest Expense"] = (
+        balance["Total Debt"] * vary(draw(0.02, 0.06)) / periods_per_year
+    )
+    income["Net Interest Income"] = (
+        income["Interest Income"] - income["Interest Expense"]
+    )
+    income["Depreciation and Amortization"] = revenue * vary(draw(0.02, 0.08))
+    income["Operating Income"] = income["Gross Profit"] - income["Operating Expenses"]
+    income["EBIT"] = income["Operating Income"]
+    income["EBITDA"] = income["EBIT"] + income["Depreciation and Amortization"]
+    income["Non Operating Income Excluding Interest"] = revenue * noise(0.005)
+    income["Total Other Income Expenses"] = (
+        income["Net Interest Income"]
+        + income["Non Operating Income Excluding Interest"]
+    )
+    income["Income Before Tax"] = (
+        income["Operating Income"] + income["Total Other Income Expenses"]
+    )
+    income["Income Tax Expense"] = np.maximum(income["Income Before Tax"], 0) * draw(
+        0.15, 0.3
+    )
+    income["Net Income from Continuing Operations"] = (
+        income["Income Before Tax"] - income["Income Tax Expense"]
+    )
+    income["Net Income from Discontinued Operations"] = np.zeros_like(revenue)
+    income["Other Adjustments to Net Income"] = np.zeros_like(revenue)
+    income["Net Income before Deductions"] = income[
+        "Net Income from Continuing Operations"
+    ]
+    income["Net Income Deductions"] = np.zeros_like(revenue)
+    income["Net Income"] = income["Net Income before Deductions"]
+    # The share count is based on the revenue per share to obtain realistic share prices
+    income["Weighted Average Shares"] = (
+        revenue[:, :1]
+        * periods_per_year
+        / 10 ** draw(0.5, 2.2)
+        * np.cumprod(1 + noise(0.01), axis=1)
+    )
+    income["Weighted Average Shares Diluted"] = income[
+        "Weighted Average Shares"
+    ] * draw(1, 1.02)
+    income["EPS"] = income["Net Income"] / income["Weighted Average Shares"]
+    income["EPS Diluted"] = (
+        income["Net Income"] / income["Weighted Average Shares Diluted"]
+    )
+
+    # Cash Flow Statement
+    cash = {
+        "Net Income": income["Net Income"],
+        "Depreciation and Amortization": income["Depreciation and Amortization"],
+        "Deferred Income Tax": revenue * noise(0.005),
+        "Stock Based Compensation": revenue * vary(draw(0, 0.04)),
+        "Change in Accounts Receivables": -change(balance["Accounts Receivable"]),
+        "Change in Inventory": -change(balance["Inventory"]),
+        "Change in Accounts Payables": change(balance["Accounts Payable"]),
+        "Change in Other Working Capital": revenue * noise(0.01),
+        "Other Non Cash Items": revenue * noise(0.005),
+    }
+    cash["Change in Working Capital"] = (
+        cash["Change in Accounts Receivables"]
+        + cash["Change in Inventory"]
+        + cash["Change in Accounts Payables"]
+        + cash["Change in Other Working Capital"]
+    )
+    cash["Cash Flow from Operations"] = (
+        cash["Net Income"]
+        + cash["Depreciation and Amortization"]
+        + cash["Deferred Income Tax"]
+        + cash["Stock Based Compensation"]
+        + cash["Change in Working Capital"]
+        + cash["Other Non Cash Items"]
+    )
+    cash["Operating Cash Flow"] = cash["Cash Flow from Operations"]
+    cash["Capital Expenditure"] = -revenue * vary(draw(0.02, 0.1))
+    cash["Property, Plant and Equipment"] = cash["Capital Expenditure"]
+    cash["Acquisitions"] = -revenue * np.maximum(noise(0.05), 0)
+    cash["Purchases of Investments"] = -revenue * vary(draw(0, 0.05))
+    cash["Sales of Investments"] = revenue * vary(draw(0, 0.05))
+    cash["Other Investing Activities"] = revenue * noise(0.005)
+    cash["Cash Flow from Investing"] = (
+        cash["Property, Plant and Equipment"]
+        + cash["Acquisitions"]
+        + cash["Purchases of Investments"]
+        + cash["Sales of Investments"]
+        + cash["Other Investing Activities"]
+    )
+    cash["Long Term Debt Issued"] = revenue * vary(draw(0, 0.05))
+    cash["Short Term Debt Issued"] = revenue * vary(draw(0, 0.02))
+    cash["Debt Repayment"] = -revenue * vary(draw(0, 0.06))
+    cash["Net Debt Issued"] = (
+        cash["Long Term Debt Issued"]
+        + cash["Short Term Debt Issued"]
+        + cash["Debt Repayment"]
+    )
+    cash["Common Stock Issued"] = revenue * vary(draw(0, 0.01))
+    cash["Common Stock Purchased"] = -revenue * vary(draw(0, 0.05))
+    cash["Net Common Stock Issued"] = (
+        cash["Common Stock Issued"] + cash["Common Stock Purchased"]
+    )
+    cash["Net Preferred Stock Issued"] = np.zeros_like(revenue)
+    cash["Net Stock Issued"] = (
+        cash["Net Common Stock Issued"] + cash["Net Preferred Stock Issued"]
+    )
+    cash["Common Dividends Paid"] = -np.maximum(income["Net Income"], 0) * draw(0, 0.6)
+    cash["Preferred Dividends Paid"] = np.zeros_like(revenue)
+    cash["Dividends Paid"] = (
+        cash["Common Dividends Paid"] + cash["Preferred Dividends Paid"]
+    )
+    cash["Other Financing Activities"] = revenue * noise(0.005)
+    cash["Cash Flow from Financing"] = (
+        cash["Net Debt Issued"]
+        + cash["Net Stock Issued"]
+        + cash["Dividends Paid"]
+        + cash["Other Financing Activities"]
+    )
+    cash["Forex Changes on Cash"] = revenue * noise(0.001)
+    cash["Net Change in Cash"] = (
+        cash["Cash Flow from Operations"]
+        + cash["Cash Flow from Investing"]
+        + cash["Cash Flow from Financing"]
+        + cash["Forex Changes on Cash"]
+    )
+    cash["Cash End of Period"] = balance["Cash and Cash Equivalents"]
+    cash["Cash Beginning of Period"] = (
+        cash["Cash End of Period"] - cash["Net Change in Cash"]
+    )
+    cash["Free Cash Flow"] = cash["Operating Cash Flow"] + cash["Capital Expenditure"]
+    cash["Income Taxes Paid"] = vary(income["Income Tax Expense"])
+    cash["Interest Paid"] = income["Interest Expense"]
+
+    def to_statement(line_items: dict[str, np.ndarray], statement: str):
+        """Orders the line items following the normalization file of the statement."""
+        names = read_normalization_file(statement).to_numpy()
+        data = np.stack([line_items[name] for name in names], axis=1)
+
+        return pd.DataFrame(
+            data.reshape(-1, len(periods)),
+            index=pd.MultiIndex.from_product([tickers, names]),
+            columns=periods,
+        )
+
+    return (
+        to_statement(balance, "balance"),
+        to_statement(income, "income"),
+        to_statement(cash, "cash"),
+    )
+
+
+def generate_treasury_data(
+    start: str,
+    end: str,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Generates the daily treasury rates of the 13 week, 5 year, 10 year and 30 year maturities.
+    The 13 week rate follows a mean reverting process and the other maturities follow the
+    13 week rate with a fluctuating spread. The rates are expressed as decimals.
+
+    Args:
+        start (str): the start date in 'YYYY-MM-DD' format.
+        end (str): the end date in 'YYYY-MM-DD' format.
+        seed (int): the seed, the same seed always results in the same rates. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: the treasury data in the same format as Toolkit.get_treasury_data.
+    """
+    dates = pd.bdate_range(start, end)
+    generator = get_generator(seed, TREASURY_STREAM)
+
+    def simulate(start_level: float, mean: float, volatility: float) -> np.ndarray:
+        """Simulates a mean reverting process."""
+        shocks = generator.normal(0, volatility, len(dates))
+        levels = np.empty(len(dates))
+        level = start_level
+
+        for day, shock in enumerate(shocks):
+            level += 0.01 * (mean - level) + shock
+            levels[day] = level
+
+        return levels
+
+    short_rate = simulate(
+        generator.uniform(0.005, 0.05), generator.uniform(0.01, 0.05), 0.0008
+    )
+    rates = pd.DataFrame(
+        {
+            maturity: np.maximum(
+                short_rate + simulate(spread, spread, 0.0003) * (spread > 0), 0.0001
+            )
+            for maturity, spread in TREASURY_SPREADS.items()
+        },
+        index=pd.PeriodIndex(dates, freq="D", name="date"),
+    )
+
+    high_noise = np.abs(generator.normal(0, 0.0002, rates.shape))
+    low_noise = np.abs(generator.normal(0, 0.0002, rates.shape))
+    opening_rates = rates.shift(1).fillna(rates)
+    returns = rates.pct_change()
+
+    return pd.concat(
+        {
+            "Open": opening_rates,
+            "High": np.maximum(opening_rates, rates) + high_noise,
+            "Low": np.maximum(np.minimum(opening_rates, rates) - low_noise, 0),
+            "Close": rates,
+            "Adj Close": rates,
+            "Volume": rates * 0,
+            "Dividends": rates * 0,
+            "Return": returns,
+            "Volatility": rates * 0 + returns.std(),
+            "Cumulative Return": (1 + returns.fillna(0)).cumprod(),
+        },
+        axis=1,
+    )
+
+
+def generate_historical_data(
+    tickers: int | list[str],
+    start: str,
+    end: str,
+    risk_free_rate: pd.DataFrame = pd.DataFrame(),
+    prices: pd.Series | None = None,
+    benchmark: bool = True,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Generates the daily historical data of the tickers including dividends. The returns of each
+    ticker follow the returns of the market, which is also used as benchmark, based on the beta
+    of the ticker with an additional ticker specific return. Approximately a third of the
+    tickers does not pay dividends, the others pay a dividend each quarter.
+
+    Args:
+        tickers (int | list[str]): the amount of tickers or the ticker names.
+        start (str): the start date in 'YYYY-MM-DD' format.
+        end (str): the end date in 'YYYY-MM-DD' format.
+        risk_free_rate (pd.DataFrame): the risk free rate which is used to calculate the excess
+            return and excess volatility. Defaults to an empty DataFrame.
+        prices (pd.Series | None): the price of each ticker on the first day. Defaults to None
+            which draws a random price.
+        benchmark (bool): whether to include the benchmark. Defaults to True.
+        seed (int): the seed, the same seed always results in the same data. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: the historical data in the same format as Toolkit.get_historical_data.
+    """
+    tickers = create_tickers(tickers)
+    dates = pd.bdate_range(start, end)
+    days = len(dates)
+
+    market_generator = get_generator(seed, MARKET_STREAM)
+    market_returns = market_generator.normal(
+        0.07 / TRADING_DAYS, 0.18 / np.sqrt(TRADING_DAYS), days
+    )
+
+    dividend_dates = np.isin(dates.month, DIVIDEND_MONTHS) & np.append(
+        True, dates.month[1:] != dates.month[:-1]
+    )
+
+    columns = [*tickers, BENCHMARK_NAME] if benchmark else tickers
+    fields = {
+        field: np.empty((days, len(columns)))
+        for field in ["Open", "High", "Low", "Close", "Volume", "Dividends"]
+    }
+
+    for index, ticker in enumerate(columns):
+        if ticker == BENCHMARK_NAME:
+            generator = market_generator
+            returns = market_returns.copy()
+            price = 300.0
+            dividend_yield = 0.015
+        else:
+            generator = get_generator(seed, HISTORICAL_STREAM, index)
+            returns = (
+                generator.uniform(-0.05, 0.1) / TRADING_DAYS
+                + generator.uniform(0.5, 1.5) * market_returns
+                + generator.normal(
+                    0, generator.uniform(0.1, 0.4) / np.sqrt(TRADING_DAYS), days
+                )
+            )
+            price = 10 ** generator.uniform(1, 2.7)
+
+            if prices is not None:
+                price = prices[ticker]
+            dividend_yield = (
+                generator.uniform(0.005, 0.04) if generator.random() > 1 / 3 else 0
+            )
+
+        returns[0] = 0
+        close = price * np.cumprod(1 + returns)
+        previous_close = np.append(close[0], close[:-1])
+        opening = previous_close * (1 + generator.normal(0, 0.005, days))
+
+        fields["Open"][:, index] = opening
+        fields["Close"][:, index] = close
+        fields["High"][:, index] = np.maximum(opening, close) * (
+            1 + np.abs(generator.normal(0, 0.005, days))
+        )
+        fields["Low"][:, index] = np.minimum(opening, close) * (
+            1 - np.abs(generator.normal(0, 0.005, days))
+        )
+        fields["Volume"][:, index] = np.round(
+            10 ** generator.uniform(5, 7.5) * generator.lognormal(0, 0.3, days)
+        )
+        fields["Dividends"][:, index] = (
+            previous_close * dividend_yield / len(DIVIDEND_MONTHS) * dividend_dates
+        )
+
+    index = pd.PeriodIndex(dates, freq="D", name="date")
+    frames = {
+        field: pd.DataFrame(values, index=index, columns=columns)
+        for field, values in fields.items()
+    }
+
+    for field in ["Open", "High", "Low", "Close", "Dividends"]:
+        frames[field] = frames[field].round(2)
+
+    # The adjusted close corrects the prices before each dividend for the dividend paid
+    adjustment = 1 - frames["Dividends"] / frames["Close"].shift(1).fillna(
+        frames["Close"]
+    )
+    adjustment_factor = adjustment.iloc[::-1].cumprod().iloc[::-1].shift(-1).fillna(1)
+    frames["Adj Close"] = frames["Close"] * adjustment_factor
+
+    returns = frames["Adj Close"].pct_change()
+    historical = {
+        "Open": frames["Open"],
+        "High": frames["High"],
+        "Low": frames["Low"],
+        "Close": frames["Close"],
+        "Adj Close": frames["Adj Close"],
+        "Volume": frames["Volume"],
+        "Dividends": frames["Dividends"],
+        "Return": returns,
+        "Volatility": returns * 0 + returns.std(),
+    }
+
+    if not risk_free_rate.empty:
+        excess_returns = returns.sub(risk_free_rate["Adj Close"], axis=0)
+
+        historical["Excess Return"] = excess_returns
+        historical["Excess Volatility"] = excess_returns * 0 + excess_returns.std()
+
+    historical["Cumulative Return"] = (1 + returns.fillna(0)).cumprod()
+
+    return pd.concat(historical, axis=1)
+
+
+def generate_portfolio_dataset(
+    historical: pd.DataFrame,
+    transactions: int = 5,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Generates a transaction ledger in the format of the Portfolio with the given amount of
+    transactions for each ticker within the historical data. The first transaction of each
+    ticker is a purchase, the other transactions are purchases or sales of at most the
+    amount held at that moment. The price of each transaction is the close price of that day.
+
+    Args:
+        historical (pd.DataFrame): the historical data as returned by generate_historical_data.
+        transactions (int): the amount of transactions for each ticker. Defaults to 5.
+        seed (int): the seed, the same seed always results in the same ledger. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: the transactions with the date, identifier, currency, volume, price
+            and costs which can be passed to the Portfolio as portfolio_dataset.
+    """
+    tickers = [
+        ticker
+        for ticker in historical.columns.get_level_values(1).unique()
+        if ticker != BENCHMARK_NAME
+    ]
+    close = historical["Close"]
+    ledger = []
+
+    for index, ticker in enumerate(tickers):
+        generator = get_generator(seed, PORTFOLIO_STREAM, index)
+        dates = np.sort(
+            generator.choice(
+                len(close.index) - 1,
+                size=min(transactions, len(close.index) - 1),
+                replace=False,
+            )
+        )
+        position = 0
+
+        for date in dates:
+            volume = int(generator.integers(1, 20))
+
+            if position and generator.random() < 1 / 4:
+                volume = -int(generator.integers(1, position + 1))
+
+            position += volume
+
+            ledger.append(
+                {
+                    "Date": close.index[date].strftime("%Y-%m-%d"),
+                    "Identifier": ticker,
+                    "Currency": "USD",
+                    "Volume": volume,
+                    "Price": float(close.iloc[date][ticker]),
+                    "Costs": -int(generator.integers(0, 5)),
+                }
+            )
+
+    return (
+        pd.DataFrame(
+            ledger,
+            columns=["Date", "Identifier", "Currency", "Volume", "Price", "Costs"],
+        )
+        .sort_values("Date", kind="stable")
+        .reset_index(drop=True)
+    )
+
+
+def generate_universe(
+    tickers: int | list[str] = 10,
+    years: int = 5,
+    quarterly: bool = False,
+    end_year: int = 2023,
+    risk_free_rate: str = "10y",
+    transactions: int = 5,
+    seed: int = 0,
+) -> dict:
+    """
+    Generates a synthetic universe that consists of the financial statements, historical data,
+    treasury rates and a transaction ledger. This makes it possible to use the Toolkit for
+    any amount of tickers without an API key or internet connection, e.g. to test how the
+    calculations scale. The same seed always results in the same universe.
+
+    The datasets can be passed to the Toolkit directly:
+
+    ```python
+    from financetoolkit import Toolkit
+    from financetoolkit.utilities import synthetic_model
+
+    universe = synthetic_model.generate_universe(tickers=100, years=5)
+
+    toolkit = Toolkit(
+        tickers=universe["tickers"],
+        balance=universe["balance"],
+        income=universe["income"],
+        cash=universe["cash"],
+        historical=universe["historical"],
+        start_date=universe["start_date"],
+        end_date=universe["end_date"],
+        convert_currency=False,
+        sleep_timer=False,
+    )
+
+    # The treasury rates are set beforehand to prevent these from being retrieved
+    toolkit._daily_treasury_data = universe["treasury"]
+    toolkit._daily_risk_free_rate = universe["risk_free_rate"]
+    ```
+
+    Args:
+        tickers (int | list[str]): the amount of tickers or the ticker names. Defaults to 10.
+        years (int): the amount of years. Defaults to 5.
+        quarterly (bool): whether to generate quarterly statements. Defaults to False.
+        end_year (int): the last year of the universe. Defaults to 2023.
+        risk_free_rate (str): the maturity used as risk free rate ('13w', '5y', '10y', '30y').
+            Defaults to "10y".
+        transactions (int): the amount of transactions for each ticker. Defaults to 5.
+        seed (int): the seed, the same seed always results in the same universe. Defaults to 0.
+
+    Raises:
+        ValueError: If the risk free rate is not recognized.
+
+    Returns:
+        dict: the tickers, the start and end date and the balance, income, cash, historical,
+            treasury, risk_free_rate and portfolio datasets.
+    """
+    if risk_free_rate not in RISK_FREE_RATES:
+        raise ValueError(
+            f"Please choose from {', '.join(RISK_FREE_RATES)} as risk_free_rate."
+        )
+
+    tickers = create_tickers(tickers)
+    start = f"{end_year - years + 1}-01-01"
+    end = f"{end_year}-12-31"
+
+    balance, income, cash = generate_financial_statements(
+        tickers, years=years, quarterly=quarterly, end_year=end_year, seed=seed
+    )
+    treasury = generate_treasury_data(start, end, seed=seed)
+    risk_free_rate_data = treasury.xs(RISK_FREE_RATES[risk_free_rate], level=1, axis=1)
+
+    # The first price is based on the price-to-sales ratio so that the market
+    # capitalization, and therefore the valuation ratios, are realistic
+    first_period = income.columns[0]
+    revenue_per_share = (
+        income.xs("Revenue", level=1)[first_period]
+        * (4 if quarterly else 1)
+        / income.xs("Weighted Average Shares", level=1)[first_period]
+    )
+    price_to_sales = get_generator(seed, VALUATION_STREAM).uniform(0.5, 4, len(tickers))
+
+    historical = generate_historical_data(
+        tickers,
+        start,
+        end,
+        risk_free_rate=risk_free_rate_data,
+        prices=revenue_per_share * price_to_sales,
+        seed=seed,
+    )
+
+    return {
+        "tickers": tickers,
+        "start_date": start,
+        "end_date": end,
+        "balance": balance,
+        "income": income,
+        "cash": cash,
+        "historical": historical,
+        "treasury": treasury,
+        "risk_free_rate": risk_free_rate_data,
+        "portfolio": generate_portfolio_dataset(
+            historical, transactions=transactions, seed=seed
+        ),
+    }
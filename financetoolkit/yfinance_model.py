@@ -10,13 +10,15 @@ from urllib.error import HTTPError, URLError
 import numpy as np
 import pandas as pd
 import requests
-import yfinance as yf
 
 from financetoolkit import helpers
 from financetoolkit.utilities import logger_model
+from financetoolkit.utilities.metrics_model import metrics
 
 logger = logger_model.get_logger()
 
+# pylint: disable=import-outside-toplevel
+
 
 def get_financial_statement(
     ticker: str, statement: str, quarter: bool = False, fallback: bool = False
@@ -38,6 +40,9 @@ def get_financial_statement(
                       Returns an empty DataFrame if the data cannot be retrieved or if the
                       ticker is invalid.
     """
+    # yfinance is imported here given that importing it takes a significant amount of time
+    import yfinance as yf  # noqa: PLC0415
+
     period = "quarterly" if quarter else "yearly"
 
     if statement not in ["balance", "income", "cashflow"]:
@@ -72,8 +77,11 @@ def get_financial_statement(
         IndexError,
         AttributeError,
     ):
+        metrics.record_request("YahooFinance", statement, status="error")
         return pd.DataFrame()
     except yf.exceptions.YFRateLimitError:
+        metrics.record_request("YahooFinance", statement, status="error")
+        metrics.record_quota_limited("YahooFinance", statement)
         error_code = (
             "YFINANCE RATE LIMIT REACHED FALLBACK"
             if fallback
@@ -81,6 +89,8 @@ def get_financial_statement(
         )
         return pd.DataFrame(columns=[error_code])
 
+    metrics.record_request("YahooFinance", statement)
+
     if financial_statement.empty:
         error_code = (
             "YFINANCE RATE LIMIT OR NO DATA FOUND FALLBACK"
@@ -143,6 +153,9 @@ def get_historical_data(
         The index of the DataFrame is the date of the data and the columns are a multi-index
         with the ticker symbol(s) as the first level and the OHLC data as the second level.
     """
+    # yfinance is imported here given that importing it takes a significant amount of time
+    import yfinance as yf  # noqa: PLC0415
+
     if end is not None:
         # Additional data is collected to ensure return calculations are correct
         end_date = datetime.strptime(end, "%Y-%m-%d") + timedelta(days=1 * 365)
@@ -189,11 +202,16 @@ def get_historical_data(
             ].to_numpy()
 
     except (HTTPError, URLError, RemoteDisconnected, IndexError):
+        metrics.record_request("YahooFinance", "history", status="error")
         return pd.DataFrame()
     except yf.exceptions.YFRateLimitError:
+        metrics.record_request("YahooFinance", "history", status="error")
+        metrics.record_quota_limited("YahooFinance", "history")
         error_code = "YFINANCE RATE LIMIT REACHED" + " FALLBACK" if fallback else ""
         return pd.DataFrame(columns=[error_code])
 
+    metrics.record_request("YahooFinance", "history")
+
     if not historical_data.empty and historical_data.loc[start:end].empty:
         logger.warning(
             "The given start and end date result in no data found for %s", ticker
@@ -245,6 +263,22 @@ def get_historical_data(
     return historical_data
 
 
+def get_historical_statistics_url(ticker: str) -> str:
+    """
+    Constructs the URL to retrieve the statistics about a ticker's historical data.
+
+    Args:
+        ticker (str): the ticker to retrieve statistics for.
+
+    Returns:
+        str: the URL of the statistics.
+    """
+    return (
+        f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+        "?interval=1d&range=None"
+    )
+
+
 def get_historical_statistics(ticker: str) -> pd.Series:
     """
     Retrieve statistics about each ticker's historical data. This is especially useful to understand why certain
@@ -267,14 +301,16 @@ def get_historical_statistics(ticker: str) -> pd.Series:
     Returns:
         pd.Series: A Sries containing the statistics for the given ticker.
     """
+    url = get_historical_statistics_url(ticker=ticker)
     response = requests.get(
-        f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}?interval=1d&range=None",
+        url,
         timeout=60,
         headers={
             "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit"
             "/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36"
         },
     )
+    metrics.record_response("YahooFinance", url, response)
 
     if response.status_code == 200:  # noqa
         data = response.json()
@@ -0,0 +1,22 @@
+"""Options Helpers Tests"""
+
+import pandas as pd
+
+from financetoolkit.options import helpers
+
+# pylint: disable=missing-function-docstring
+
+
+def test_define_strike_prices():
+    strike_prices = helpers.define_strike_prices(
+        tickers=["A", "B", "C"],
+        stock_price=pd.Series({"A": 100.0, "B": 3.0, "C": 12.0}),
+        strike_step_size=5,
+        strike_price_range=0.25,
+    )
+
+    assert strike_prices["A"] == [75, 80, 85, 90, 95, 100, 105, 110, 115, 120]
+
+    # A strike price of zero is never included
+    assert strike_prices["B"] == []
+    assert strike_prices["C"] == [10]
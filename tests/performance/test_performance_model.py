@@ -1,5 +1,6 @@
 """Performance Model Tests"""
 
+import numpy as np
 import pandas as pd
 
 from financetoolkit.performance import performance_model
@@ -91,6 +92,93 @@ def test_get_fama_and_french_model_single(recorder):
     recorder.capture(pd.DataFrame(result))
 
 
+def test_get_fama_and_french_model_multi_batch():
+    """Test that the batched regression matches a separate regression per period."""
+    dates = pd.period_range("2020-01-01", periods=180, freq="D")
+    index = pd.MultiIndex.from_arrays([dates.asfreq("M"), dates])
+    rng = np.random.default_rng(0)
+    factors = pd.DataFrame(
+        rng.normal(size=(180, 3)), index=index, columns=["Mkt-RF", "SMB", "HML"]
+    )
+    excess_returns = pd.DataFrame(
+        rng.normal(size=(180, 2)), index=index, columns=["AAPL", "MSFT"]
+    )
+
+    regression_results, residuals = (
+        performance_model.get_fama_and_french_model_multi_batch(
+            excess_returns=excess_returns, factor_dataset=factors
+        )
+    )
+
+    for period in regression_results.index:
+        for ticker in excess_returns.columns:
+            expected_results, expected_residuals, _ = (
+                performance_model.get_fama_and_french_model_multi(
+                    excess_returns=excess_returns.loc[period, ticker],
+                    factor_dataset=factors.loc[period],
+                )
+            )
+
+            for parameter, value in expected_results.items():
+                assert np.isclose(
+                    regression_results.loc[period, (ticker, parameter)], value
+                )
+
+            assert np.allclose(residuals.loc[period, ticker], expected_residuals)
+
+    # The T-Statistics are compared to the textbook Ordinary Least Squares definition
+    x = np.column_stack([np.ones(31), factors.loc["2020-01"]])
+    y = excess_returns.loc["2020-01", "MSFT"].to_numpy()
+    coefficients = np.linalg.lstsq(x, y, rcond=None)[0]
+    residual_variance = ((y - x @ coefficients) ** 2).sum() / (31 - 4)
+    standard_errors = np.sqrt(residual_variance * np.diag(np.linalg.inv(x.T @ x)))
+
+    assert np.allclose(
+        regression_results.loc["2020-01"]["MSFT"][
+            [
+                "Intercept T-Statistic",
+                "Mkt-RF Slope T-Statistic",
+                "SMB Slope T-Statistic",
+                "HML Slope T-Statistic",
+            ]
+        ],
+        coefficients / standard_errors,
+    )
+
+
+def test_get_fama_and_french_model_single_batch():
+    """Test that the batched regression matches a separate regression per period."""
+    dates = pd.period_range("2020-01-01", periods=120, freq="D")
+    index = pd.MultiIndex.from_arrays([dates.asfreq("M"), dates])
+    rng = np.random.default_rng(0)
+    factor = pd.Series(rng.normal(size=120), index=index)
+    excess_returns = pd.DataFrame(
+        rng.normal(size=(120, 2)), index=index, columns=["AAPL", "MSFT"]
+    )
+
+    regression_results, residuals = (
+        performance_model.get_fama_and_french_model_single_batch(
+            excess_returns=excess_returns, factor=factor
+        )
+    )
+
+    for period in regression_results.index:
+        for ticker in excess_returns.columns:
+            expected_results, expected_residuals = (
+                performance_model.get_fama_and_french_model_single(
+                    excess_returns=excess_returns.loc[period, ticker],
+                    factor=factor.loc[period],
+                )
+            )
+
+            for parameter, value in expected_results.items():
+                assert np.isclose(
+                    regression_results.loc[period, (ticker, parameter)], value
+                )
+
+            assert np.allclose(residuals.loc[period, ticker], expected_residuals)
+
+
 def test_get_alpha(recorder):
     recorder.capture(
         performance_model.get_alpha(
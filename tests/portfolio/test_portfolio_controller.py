@@ -54,6 +54,35 @@ def test_read_portfolio_dataset(recorder):
     recorder.capture(portfolio.read_portfolio_dataset(adjust_duplicates=False))
 
 
+def test_portfolio_dataset_as_dataframe():
+    dataset = pd.read_excel("tests/datasets/portfolio_test.xlsx")
+
+    pd.testing.assert_frame_equal(
+        Portfolio(
+            portfolio_dataset=dataset.rename(columns=str.lower)
+        )._portfolio_dataset,
+        Portfolio(
+            portfolio_dataset="tests/datasets/portfolio_test.xlsx"
+        )._portfolio_dataset,
+    )
+
+    # The column names of a DataFrame are matched case-insensitively, as with a file
+    pd.testing.assert_frame_equal(
+        Portfolio(portfolio_dataset=dataset)._portfolio_dataset,
+        Portfolio(
+            portfolio_dataset="tests/datasets/portfolio_test.xlsx"
+        )._portfolio_dataset,
+    )
+
+    # The DataFrame of the caller keeps its columns and values
+    upper_case_dataset = dataset.rename(columns=str.upper)
+    original_dataset = upper_case_dataset.copy()
+
+    Portfolio(portfolio_dataset=upper_case_dataset)
+
+    pd.testing.assert_frame_equal(upper_case_dataset, original_dataset)
+
+
 def test_collect_benchmark_historical_data(recorder):
     with warnings.catch_warnings():
         warnings.filterwarnings(
@@ -162,3 +162,30 @@ def test_read_portfolio_dataset_edge_cases():
             )
 
     os.unlink(tmp.name)
+
+
+def test_format_portfolio_dataset_with_capitalized_columns(sample_portfolio_data):
+    """Test formatting a portfolio dataset that is provided as DataFrame"""
+    dataset, date_column, *_ = format_portfolio_dataset(
+        dataset=sample_portfolio_data,
+        date_columns=["Date"],
+        date_format_options=["%Y-%m-%d"],
+        name_columns=["Name"],
+        tickers_columns=["Ticker"],
+        price_columns=["Price"],
+        volume_columns=["Volume"],
+        currency_columns=["Currency"],
+        costs_columns=["Costs"],
+        column_mapping={
+            "date": "Date",
+            "name": "Name",
+            "identifier": "Ticker",
+            "price": "Price",
+            "volume": "Volume",
+            "currency": "Currency",
+            "costs": "Costs",
+        },
+    )
+
+    assert date_column == "Date"
+    assert dataset["Ticker"].tolist() == ["AAPL", "MSFT", "AMZN"]
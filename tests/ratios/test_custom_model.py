@@ -0,0 +1,73 @@
+"""Custom Model Tests"""
+
+# ruff: noqa: PLR2004
+
+import numpy as np
+import pytest
+
+from financetoolkit.ratios import custom_model
+
+# pylint: disable=missing-function-docstring
+
+
+def test_compile_formula():
+    function, names = custom_model.compile_formula(
+        "(Working Capital / Net Income) * 100"
+    )
+
+    assert names == ["Working Capital", "Net Income"]
+    np.testing.assert_allclose(
+        function(np.array([50.0, 30.0]), np.array([25.0, 60.0])), [200.0, 50.0]
+    )
+
+    function, names = custom_model.compile_formula(
+        "Cost of Goods Sold + Selling, General and Administrative Expenses "
+        "- Cost of Goods Sold * 2 ** 2"
+    )
+
+    assert names == [
+        "Cost of Goods Sold",
+        "Selling, General and Administrative Expenses",
+    ]
+    assert function(3.0, 10.0) == 3 + 10 - 3 * 4
+
+    function, names = custom_model.compile_formula("-Revenue // 7 + 10 % 4")
+
+    assert names == ["Revenue"]
+    assert function(20.0) == -20 // 7 + 10 % 4
+
+
+def test_compile_formula_invalid():
+    with pytest.raises(ValueError, match="not a valid formula"):
+        custom_model.compile_formula("(Revenue / Net Income")
+
+    with pytest.raises(ValueError, match="unsupported operation"):
+        custom_model.compile_formula("0 < Revenue < 1000")
+
+    with pytest.raises(ValueError, match="unsupported operation"):
+        custom_model.compile_formula("(Revenue) (10)")
+
+
+def test_calculate_custom_ratio():
+    revenue = np.array([[500.0, 2000.0], [0.0, np.nan]])
+    net_income = np.array([[50.0, 100.0], [10.0, 10.0]])
+
+    function, _ = custom_model.compile_formula("Revenue > 1000")
+
+    np.testing.assert_array_equal(
+        custom_model.calculate_custom_ratio(function, (2, 2), revenue),
+        [[0.0, 1.0], [0.0, 0.0]],
+    )
+
+    function, _ = custom_model.compile_formula("Net Income / Revenue")
+
+    np.testing.assert_array_equal(
+        custom_model.calculate_custom_ratio(function, (2, 2), net_income, revenue),
+        [[0.1, 0.05], [np.inf, np.nan]],
+    )
+
+    function, _ = custom_model.compile_formula("365 / 4")
+
+    np.testing.assert_array_equal(
+        custom_model.calculate_custom_ratio(function, (2, 2)), np.full((2, 2), 91.25)
+    )
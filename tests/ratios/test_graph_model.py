@@ -0,0 +1,95 @@
+"""Graph Model Tests"""
+
+# ruff: noqa: PLR2004
+
+import pandas as pd
+import pytest
+
+from financetoolkit.ratios import graph_model
+
+# pylint: disable=missing-function-docstring,protected-access
+
+
+def create_graph(evaluations: list[str]) -> graph_model.RatioGraph:
+    graph = graph_model.RatioGraph()
+
+    def add_node(name, function, inputs=None):
+        def evaluate(*values):
+            evaluations.append(name)
+            return function(*values)
+
+        graph.add_node(name, evaluate, inputs=inputs)
+
+    add_node("Revenue", lambda: pd.DataFrame({"2022": [10.0], "2023": [20.0]}))
+    add_node("Total Assets", lambda: pd.DataFrame({"2022": [50.0], "2023": [70.0]}))
+    add_node(
+        "Average Total Assets",
+        lambda values: values.T.rolling(2).mean().T,
+        inputs=["Total Assets"],
+    )
+    add_node(
+        "Asset Turnover Ratio",
+        lambda revenue, total_assets: revenue / total_assets,
+        inputs=["Revenue", "Average Total Assets"],
+    )
+
+    return graph
+
+
+def test_plan():
+    graph = create_graph([])
+
+    plan = graph.plan(["Asset Turnover Ratio"])
+
+    assert len(graph) == 4
+    assert "Revenue" in graph
+    assert sorted(plan) == sorted(
+        ["Revenue", "Total Assets", "Average Total Assets", "Asset Turnover Ratio"]
+    )
+    assert plan.index("Total Assets") < plan.index("Average Total Assets")
+    assert plan.index("Average Total Assets") < plan.index("Asset Turnover Ratio")
+    assert plan[-1] == "Asset Turnover Ratio"
+
+    # Only the intermediates the request depends on are planned
+    assert graph.plan(["Average Total Assets"]) == [
+        "Total Assets",
+        "Average Total Assets",
+    ]
+
+    with pytest.raises(ValueError, match="not part of the graph"):
+        graph.plan(["Inventory"])
+
+    graph.add_node("Total Assets", lambda value: value, inputs=["Asset Turnover Ratio"])
+
+    with pytest.raises(ValueError, match="depend on each other"):
+        graph.plan(["Asset Turnover Ratio"])
+
+
+def test_evaluate():
+    evaluations: list[str] = []
+    graph = create_graph(evaluations)
+
+    (asset_turnover_ratio,) = graph.evaluate(["Asset Turnover Ratio"])
+
+    assert asset_turnover_ratio.loc[0, "2023"] == 20 / 60
+    assert len(evaluations) == 4
+
+    # Without a cache, each request evaluates its intermediates again
+    graph.evaluate(["Average Total Assets"])
+
+    assert len(evaluations) == 6
+
+    # With a cache, the shared intermediates are evaluated only once
+    evaluations.clear()
+    cache: dict = {}
+
+    revenue, average_total_assets = graph.evaluate(
+        ["Revenue", "Average Total Assets"], cache
+    )
+    graph.evaluate(["Asset Turnover Ratio"], cache)
+
+    assert sorted(evaluations) == sorted(
+        ["Revenue", "Total Assets", "Average Total Assets", "Asset Turnover Ratio"]
+    )
+    assert cache["Revenue"] is revenue
+    assert cache["Average Total Assets"] is average_total_assets
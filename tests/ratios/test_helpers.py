@@ -0,0 +1,71 @@
+"""Ratios Helpers Tests"""
+
+# ruff: noqa: PLR2004
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from financetoolkit.ratios import helpers
+from financetoolkit.utilities import synthetic_model
+
+# pylint: disable=missing-function-docstring
+
+
+def test_map_period_data_to_daily_data():
+    period_data = pd.DataFrame(
+        [[1.0, 2.0, np.nan, 4.0], [5.0, 6.0, 7.0, 8.0]],
+        index=["AAPL", "MSFT"],
+        columns=pd.period_range("2021Q1", periods=4, freq="Q"),
+    )
+    daily_dates = pd.date_range("2020-12-30", "2022-01-03", freq="D")
+
+    daily_data = helpers.map_period_data_to_daily_data(
+        period_data, daily_dates=daily_dates, quarterly=True
+    )
+
+    assert daily_data.index.equals(daily_dates)
+    assert daily_data.columns.tolist() == ["AAPL", "MSFT"]
+    assert daily_data.loc["2021-05-15"].tolist() == [2.0, 6.0]
+    assert daily_data.loc["2021-08-15"].tolist() == [4.0, 7.0]
+
+    # The dates outside of the periods are filled with the nearest period
+    assert daily_data.loc["2020-12-30"].tolist() == [1.0, 5.0]
+    assert daily_data.loc["2022-01-03"].tolist() == [4.0, 8.0]
+
+    yearly_data = helpers.map_period_data_to_daily_data(
+        pd.DataFrame({"2021": [1.0], "2022": [2.0]}, index=["AAPL"]),
+        daily_dates=daily_dates,
+    )
+
+    assert yearly_data["AAPL"].tolist() == [1.0] * 367 + [2.0] * 3
+
+
+@pytest.mark.parametrize("window", [1, 2, 4, 30])
+@pytest.mark.parametrize("method", ["sum", "mean"])
+def test_calculate_trailing_values(window, method):
+    _, income, _ = synthetic_model.generate_financial_statements(
+        tickers=3, years=5, quarterly=True
+    )
+    income.iloc[4, 6] = np.nan
+
+    trailing_values = helpers.calculate_trailing_values(
+        income, window=window, method=method
+    )
+
+    pd.testing.assert_frame_equal(
+        trailing_values, getattr(income.T.rolling(window), method)().T, rtol=1e-12
+    )
+
+
+def test_calculate_trailing_values_ttm():
+    dataset = pd.DataFrame(
+        [[1.0, 2.0, 3.0, 4.0, 5.0], [10.0, np.nan, 30.0, 40.0, 50.0]],
+        columns=pd.period_range("2022Q1", periods=5, freq="Q"),
+    )
+
+    trailing_values = helpers.calculate_trailing_values(dataset, window=4)
+
+    assert trailing_values.iloc[0].tolist()[3:] == [10.0, 14.0]
+    assert trailing_values.iloc[:, :3].isna().all().all()
+    assert trailing_values.iloc[1].isna().all()
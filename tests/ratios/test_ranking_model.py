@@ -0,0 +1,74 @@
+"""Ranking Model Tests"""
+
+# ruff: noqa: PLR2004
+
+import numpy as np
+import pandas as pd
+
+from financetoolkit.ratios import ranking_model
+
+# pylint: disable=missing-function-docstring
+
+
+def create_ratios() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            pd.Period("2022", freq="Y"): [1.0, 10.0, 2.0, 20.0, 3.0, np.inf, 2.0, 40.0],
+            pd.Period("2023", freq="Y"): [4.0, 5.0, 3.0, 6.0, np.nan, 7.0, 1.0, 8.0],
+        },
+        index=pd.MultiIndex.from_product(
+            [["AAPL", "MSFT", "XOM", "CVX"], ["Current Ratio", "Debt Ratio"]]
+        ),
+    )
+
+
+def test_get_cross_sectional_rankings():
+    rankings = ranking_model.get_cross_sectional_rankings(create_ratios())
+
+    assert rankings.index.get_level_values(2).tolist()[:3] == [
+        "Rank",
+        "Percentile",
+        "Z-Score",
+    ]
+    assert rankings.shape == (24, 2)
+
+    current_ratio = (
+        rankings.xs("Current Ratio", level=1)["2022"]
+        .unstack()
+        .loc[["AAPL", "MSFT", "XOM", "CVX"]]
+    )
+
+    # Ties receive the highest rank and a percentile that includes all tied values
+    assert current_ratio["Rank"].tolist() == [4, 2, 1, 2]
+    assert current_ratio["Percentile"].tolist() == [0.25, 0.75, 1.0, 0.75]
+
+    values = np.array([1.0, 2.0, 3.0, 2.0])
+
+    np.testing.assert_allclose(
+        current_ratio["Z-Score"], (values - values.mean()) / values.std(ddof=1)
+    )
+
+    # Infinite and missing values are not ranked
+    assert np.isnan(rankings.loc[("XOM", "Debt Ratio", "Rank"), "2022"])
+    assert np.isnan(rankings.loc[("XOM", "Current Ratio", "Rank"), "2023"])
+    assert rankings.loc[("CVX", "Debt Ratio", "Percentile"), "2022"] == 1.0
+
+
+def test_get_cross_sectional_rankings_by_group():
+    groups = pd.Series(
+        ["Technology", "Technology", "Energy", np.nan],
+        index=["AAPL", "MSFT", "XOM", "CVX"],
+    )
+
+    rankings = ranking_model.get_cross_sectional_rankings(create_ratios(), groups)
+
+    debt_ratio = rankings.xs("Debt Ratio", level=1)["2023"].unstack()
+
+    assert debt_ratio.loc["MSFT", "Rank"] == 1
+    assert debt_ratio.loc["AAPL", "Percentile"] == 0.5
+    assert debt_ratio.loc["XOM", "Rank"] == 1
+
+    # A single ticker within a group has no z-score and tickers without a group
+    # are not ranked
+    assert np.isnan(debt_ratio.loc["XOM", "Z-Score"])
+    assert debt_ratio.loc["CVX"].isna().all()
@@ -2,6 +2,8 @@
 import pandas as pd
 
 from financetoolkit import Toolkit
+from financetoolkit.ratios.ratios_controller import Ratios
+from financetoolkit.utilities import long_format_model
 
 balance_dataset = pd.read_pickle("tests/datasets/balance_dataset.pickle")
 income_dataset = pd.read_pickle("tests/datasets/income_dataset.pickle")
@@ -353,3 +355,209 @@ def test_get_tangible_asset_value(recorder):
 
 def test_get_net_current_asset_value(recorder):
     recorder.capture(ratios_module.get_net_current_asset_value())
+
+
+def test_ratio_graph():
+    ratios = toolkit.ratios
+    graph = ratios._get_ratio_graph(trailing=2)
+
+    # The average and trailing values are calculated from the statement item
+    plan = graph.plan(["Average Total Assets", "Trailing Revenue"])
+
+    assert sorted(plan) == [
+        "Average Total Assets",
+        "Revenue",
+        "Total Assets",
+        "Trailing Revenue",
+    ]
+    assert plan.index("Total Assets") < plan.index("Average Total Assets")
+    assert plan.index("Revenue") < plan.index("Trailing Revenue")
+
+    average_total_assets, trailing_revenue = graph.evaluate(
+        ["Average Total Assets", "Trailing Revenue"]
+    )
+
+    pd.testing.assert_frame_equal(
+        average_total_assets,
+        ratios._balance_sheet_statement.loc[:, "Total Assets", :].T.rolling(2).mean().T,
+    )
+    pd.testing.assert_frame_equal(
+        trailing_revenue,
+        ratios._income_statement.loc[:, "Revenue", :].T.rolling(2).sum().T,
+    )
+
+
+def test_daily_intermediates():
+    ratios = toolkit.ratios
+    ratios._daily_intermediates.clear()
+
+    daily_dates = ratios._daily_historical_data.loc["2020":].index
+    daily_revenue = ratios._get_daily_intermediate("Revenue", daily_dates)
+
+    assert ratios._get_daily_intermediate("Revenue", daily_dates) is daily_revenue
+    assert daily_revenue.loc["2021-06-30", "AAPL"] == (
+        income_dataset.loc[("AAPL", "Revenue"), "2021"]
+    )
+
+    # Other daily dates result in the item being mapped again
+    assert ratios._get_daily_intermediate("Revenue", daily_dates[1:]) is not (
+        daily_revenue
+    )
+
+
+def test_collect_custom_ratios():
+    custom_ratios = ratios_module.collect_custom_ratios(
+        custom_ratios_dict={
+            "Daily Cash Op Expenses": "Cash Op Expenses / 365",
+            "Cash Op Expenses": "Cost of Goods Sold + Operating Expenses",
+            "Large Revenues": "Revenue > 1000000000",
+            "Invalid Ratio": "Revenue / Unknown Item",
+        }
+    )
+
+    assert custom_ratios.loc["AAPL"].index.tolist() == [
+        "Daily Cash Op Expenses",
+        "Cash Op Expenses",
+        "Large Revenues",
+        "Invalid Ratio",
+    ]
+
+    cash_op_expenses = (
+        income_dataset.loc[("MSFT", "Cost of Goods Sold"), "2021"]
+        + income_dataset.loc[("MSFT", "Operating Expenses"), "2021"]
+    )
+
+    assert custom_ratios.loc[("MSFT", "Cash Op Expenses"), "2021"] == round(
+        cash_op_expenses, 4
+    )
+    assert custom_ratios.loc[("MSFT", "Daily Cash Op Expenses"), "2021"] == round(
+        cash_op_expenses / 365, 4
+    )
+    assert (custom_ratios.xs("Large Revenues", level=1) == 1).all().all()
+    assert (custom_ratios.xs("Invalid Ratio", level=1) == 0).all().all()
+
+    # Custom ratios that depend on each other can not be calculated
+    assert (
+        ratios_module.collect_custom_ratios(
+            custom_ratios_dict={"A": "B + 1", "B": "A * 2"}
+        )
+        is None
+    )
+
+
+def test_collect_all_ratios_incremental():
+    def create_ratios(periods):
+        return Ratios(
+            tickers=["AAPL", "MSFT"],
+            historical={
+                "period": ratios_module._historical_data,
+                "daily": ratios_module._daily_historical_data,
+            },
+            balance=ratios_module._balance_sheet_statement.loc[:, periods],
+            income=ratios_module._income_statement.loc[:, periods],
+            cash=ratios_module._cash_flow_statement.loc[:, periods],
+        )
+
+    periods = ratios_module._income_statement.columns
+
+    ratios = create_ratios(periods[:-1])
+    ratios.collect_all_ratios()
+
+    assert periods[-1] not in ratios._all_ratios.columns
+
+    ratios.update_financial_statements(
+        balance=ratios_module._balance_sheet_statement,
+        income=ratios_module._income_statement,
+        cash=ratios_module._cash_flow_statement,
+    )
+
+    pd.testing.assert_frame_equal(
+        ratios.collect_all_ratios(incremental=True),
+        create_ratios(periods).collect_all_ratios(),
+    )
+
+    # Ratios collected with other arguments are collected again rather than extended
+    ratios = create_ratios(periods[:-1])
+    ratios.collect_all_ratios()
+    ratios.update_financial_statements(
+        balance=ratios_module._balance_sheet_statement,
+        income=ratios_module._income_statement,
+        cash=ratios_module._cash_flow_statement,
+    )
+
+    pd.testing.assert_frame_equal(
+        ratios.collect_all_ratios(incremental=True, trailing=2),
+        create_ratios(periods).collect_all_ratios(trailing=2),
+    )
+
+
+def test_collect_all_ratios_long_format():
+    long_format = ratios_module.collect_all_ratios(long_format=True)
+
+    assert long_format.columns.tolist() == ["Ticker", "Metric", "Period", "Value"]
+
+    pd.testing.assert_frame_equal(
+        long_format_model.to_wide_format(long_format),
+        ratios_module.collect_all_ratios(),
+        check_names=False,
+    )
+
+    # The collected ratios are stored regardless of the format these are returned in
+    ratios = Ratios(
+        tickers=["AAPL", "MSFT"],
+        historical={
+            "period": ratios_module._historical_data,
+            "daily": ratios_module._daily_historical_data,
+        },
+        balance=ratios_module._balance_sheet_statement,
+        income=ratios_module._income_statement,
+        cash=ratios_module._cash_flow_statement,
+    )
+    long_format = ratios.collect_all_ratios(long_format=True)
+
+    assert ratios._is_collected(
+        "_all_ratios",
+        {
+            "include_dividends": False,
+            "diluted": True,
+            "days": 365,
+            "rounding": None,
+            "trailing": None,
+        },
+    )
+    pd.testing.assert_frame_equal(
+        long_format_model.to_wide_format(long_format),
+        ratios._all_ratios,
+        check_names=False,
+    )
+
+
+def test_rank():
+    rankings = ratios_module.rank(ratios=["Current Ratio", "Debt-to-Assets Ratio"])
+
+    assert rankings.loc["AAPL"].index.tolist() == [
+        ("Current Ratio", "Rank"),
+        ("Current Ratio", "Percentile"),
+        ("Current Ratio", "Z-Score"),
+        ("Debt-to-Assets Ratio", "Rank"),
+        ("Debt-to-Assets Ratio", "Percentile"),
+        ("Debt-to-Assets Ratio", "Z-Score"),
+    ]
+    assert sorted(
+        rankings.xs(("Current Ratio", "Rank"), level=[1, 2])["2022"].tolist()
+    ) == [1, 2]
+
+    # Ranking by sector requires the profile data
+    assert ratios_module.rank(by="sector").empty
+
+    ratios_module._profile = pd.DataFrame(
+        {"AAPL": ["Technology"], "MSFT": ["Software"]}, index=["Sector"]
+    )
+
+    try:
+        rankings = ratios_module.rank(ratios=["Current Ratio"], by="sector")
+    finally:
+        ratios_module._profile = pd.DataFrame()
+
+    # Each sector contains a single ticker which is therefore ranked first
+    assert (rankings.xs("Rank", level=2).dropna(axis=1) == 1).all().all()
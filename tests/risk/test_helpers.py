@@ -0,0 +1,58 @@
+"""Risk Helpers Tests"""
+
+import pandas as pd
+import pytest
+
+from financetoolkit.risk import helpers
+
+historical = pd.read_pickle("tests/datasets/historical_dataset.pickle")
+
+# pylint: disable=missing-function-docstring
+
+
+def test_determine_within_historical_data():
+    """Test that every row is labelled with the period it falls into."""
+    within_historical_data = helpers.determine_within_historical_data(
+        daily_historical_data=historical,
+        intraday_historical_data=pd.DataFrame(),
+        intraday_period=None,
+        period="quarterly",
+    )
+
+    expected = (
+        historical.to_timestamp().groupby(pd.Grouper(freq="QE")).apply(lambda x: x)
+    )
+
+    assert within_historical_data.index.get_level_values(0).freqstr == "Q-DEC"
+    assert within_historical_data.index.get_level_values(1).freqstr == "D"
+    assert (within_historical_data.to_numpy() == expected.to_numpy()).all()
+    assert (
+        within_historical_data.index.get_level_values(0)
+        .to_timestamp(how="end")
+        .normalize()
+        == expected.index.get_level_values(0)
+    ).all()
+
+
+def test_within_historical_data_is_lazy():
+    """Test that periods are only determined once requested."""
+    within_historical_data = helpers.WithinHistoricalData(
+        daily_historical_data=historical,
+        intraday_historical_data=pd.DataFrame(),
+        intraday_period=None,
+        fill_nan=True,
+    )
+
+    assert not within_historical_data
+
+    weekly = within_historical_data["weekly"]
+
+    assert list(within_historical_data) == ["weekly"]
+    assert within_historical_data["weekly"] is weekly
+    assert len(weekly) == len(historical)
+
+    with pytest.raises(KeyError):
+        within_historical_data["intraday"]  # pylint: disable=pointless-statement
+
+    with pytest.raises(KeyError):
+        within_historical_data["daily"]  # pylint: disable=pointless-statement
@@ -2,6 +2,7 @@
 import pandas as pd
 
 from financetoolkit import Toolkit
+from financetoolkit.utilities import long_format_model
 
 historical = pd.read_pickle("tests/datasets/historical_dataset.pickle")
 risk_free_rate = pd.read_pickle("tests/datasets/risk_free_rate.pickle")
@@ -94,3 +95,18 @@ def test_get_kurtosis(recorder):
     recorder.capture(risk_module.get_kurtosis(period="monthly"))
     recorder.capture(risk_module.get_kurtosis(growth=True))
     recorder.capture(risk_module.get_kurtosis(growth=True, lag=[1, 2, 3]))
+
+
+def test_collect_all_metrics_long_format():
+    long_format = risk_module.collect_all_metrics(long_format=True)
+
+    assert long_format["Metric"].unique().tolist()[:2] == [
+        "Value at Risk",
+        "Conditional Value at Risk",
+    ]
+
+    pd.testing.assert_frame_equal(
+        long_format_model.to_wide_format(long_format, axis="index"),
+        risk_module.collect_all_metrics(),
+        check_names=False,
+    )
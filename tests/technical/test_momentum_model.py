@@ -1,5 +1,6 @@
 """Momentum Model Tests"""
 
+import numpy as np
 import pandas as pd
 
 from financetoolkit.technicals import momentum_model
@@ -40,6 +41,30 @@ def test_get_aroon_indicator(recorder):
     )
 
 
+def test_get_rolling_extreme_position():
+    prices = pd.DataFrame(
+        {
+            "AAPL": [1.0, 3.0, 3.0, 2.0, np.nan, 5.0, 4.0, 1.0, 1.0],
+            "MSFT": [9.0, 8.0, 7.0, 8.0, 9.0, 9.0, 1.0, 2.0, 3.0],
+        }
+    )
+
+    # The positions equal those of the (much slower) rolling apply, including the first
+    # occurrence for ties and NaN for windows with missing prices
+    for highest, function in [(True, np.argmax), (False, np.argmin)]:
+        pd.testing.assert_frame_equal(
+            momentum_model.get_rolling_extreme_position(prices, 3, highest=highest),
+            prices.rolling(window=3).apply(function, raw=True),
+        )
+
+    pd.testing.assert_series_equal(
+        momentum_model.get_rolling_extreme_position(prices["AAPL"], 3),
+        prices["AAPL"].rolling(window=3).apply(np.argmax, raw=True),
+    )
+
+    assert momentum_model.get_rolling_extreme_position(prices, 10).isna().all().all()
+
+
 def test_get_commodity_channel_index(recorder):
     recorder.capture(
         momentum_model.get_commodity_channel_index(
@@ -32,6 +32,38 @@ def test_collect_all_indicators(recorder):
     )
 
 
+def test_collect_all_indicators_intermediates():
+    momentum_indicators = technical_module.collect_momentum_indicators()
+
+    # The intermediates are only shared while collecting the indicators
+    assert technical_module._intermediates is None
+
+    for name, getter in [
+        ("Relative Strength Index", technical_module.get_relative_strength_index),
+        (
+            "Stochastic %K",
+            lambda: technical_module.get_stochastic_oscillator()["Stochastic %K"],
+        ),
+        (
+            "MACD Line",
+            lambda: technical_module.get_moving_average_convergence_divergence()[
+                "MACD Line"
+            ],
+        ),
+    ]:
+        pd.testing.assert_frame_equal(
+            momentum_indicators[name], getter(), check_names=False
+        )
+
+    volatility_indicators = technical_module.collect_volatility_indicators()
+
+    pd.testing.assert_frame_equal(
+        volatility_indicators["Average True Range"],
+        technical_module.get_average_true_range(),
+        check_names=False,
+    )
+
+
 def test_collect_breadth_indicators(recorder):
     recorder.capture(technical_module.collect_breadth_indicators().round(0))
     recorder.capture(technical_module.collect_breadth_indicators(growth=True).round(0))
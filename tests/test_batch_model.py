@@ -0,0 +1,133 @@
+"""Batch Model Tests"""
+
+import pandas as pd
+import pytest
+
+from financetoolkit import batch_model
+from financetoolkit.utilities import long_format_model
+
+balance_dataset = pd.read_pickle("tests/datasets/balance_dataset.pickle")
+income_dataset = pd.read_pickle("tests/datasets/income_dataset.pickle")
+cash_dataset = pd.read_pickle("tests/datasets/cash_dataset.pickle")
+historical_dataset = pd.read_pickle("tests/datasets/historical_dataset.pickle")
+risk_free_rate = pd.read_pickle("tests/datasets/risk_free_rate.pickle")
+treasury_data = pd.read_pickle("tests/datasets/treasury_data.pickle")
+
+toolkit_settings = {
+    "balance": balance_dataset,
+    "income": income_dataset,
+    "cash": cash_dataset,
+    "historical": historical_dataset,
+    "convert_currency": False,
+    "start_date": "2019-12-31",
+    "end_date": "2023-01-01",
+    "sleep_timer": False,
+}
+
+# pylint: disable=missing-function-docstring
+
+
+def test_split_in_batches():
+    assert batch_model.split_in_batches(["A", "B", "C", "D", "E"], batch_size=2) == [
+        ["A", "B"],
+        ["C", "D"],
+        ["E"],
+    ]
+
+    with pytest.raises(ValueError):
+        batch_model.split_in_batches(["A"], batch_size=0)
+
+
+def test_select_tickers():
+    balance = batch_model.select_tickers(balance_dataset, "balance", ["MSFT"])
+    historical = batch_model.select_tickers(historical_dataset, "historical", ["MSFT"])
+
+    assert list(balance.index.get_level_values(0).unique()) == ["MSFT"]
+    assert list(historical.columns.get_level_values(1).unique()) == [
+        "MSFT",
+        "Benchmark",
+    ]
+
+
+def test_collect_in_batches_round_trip(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    collected_ratios = []
+
+    def collect_function(toolkit):
+        toolkit._daily_risk_free_rate = risk_free_rate
+        toolkit._daily_treasury_data = treasury_data
+
+        collected_ratios.append(toolkit.ratios.collect_all_ratios())
+
+        return {"ratios": collected_ratios[-1]}
+
+    datasets = batch_model.collect_in_batches(
+        tickers=["AAPL", "MSFT"],
+        output_location=str(tmp_path),
+        batch_size=2,
+        collect_function=collect_function,
+        progress_bar=False,
+        **toolkit_settings,
+    )
+
+    ratios = pd.read_parquet(datasets["ratios"])
+
+    assert ratios.columns.tolist() == long_format_model.LONG_FORMAT_COLUMNS
+
+    pd.testing.assert_frame_equal(
+        long_format_model.to_wide_format(ratios),
+        collected_ratios[0].set_axis(collected_ratios[0].columns.astype(str), axis=1),
+    )
+
+
+def test_collect_in_batches(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    collected_batches = []
+
+    def collect_function(toolkit):
+        toolkit._daily_risk_free_rate = risk_free_rate
+        toolkit._daily_treasury_data = treasury_data
+
+        collected_batches.append(toolkit._tickers)
+
+        if len(collected_batches) == 2:  # noqa: PLR2004
+            raise RuntimeError("Simulated crash")
+
+        return batch_model.collect_all_ratios(toolkit)
+
+    with pytest.raises(RuntimeError):
+        batch_model.collect_in_batches(
+            tickers=["AAPL", "MSFT"],
+            output_location=str(tmp_path),
+            batch_size=1,
+            collect_function=collect_function,
+            progress_bar=False,
+            **toolkit_settings,
+        )
+
+    # Resuming only collects the batch that did not finish
+    datasets = batch_model.collect_in_batches(
+        tickers=["AAPL", "MSFT"],
+        output_location=str(tmp_path),
+        batch_size=1,
+        collect_function=collect_function,
+        progress_bar=False,
+        **toolkit_settings,
+    )
+
+    assert collected_batches == [["AAPL"], ["MSFT"], ["MSFT"]]
+
+    ratios = pd.read_parquet(datasets["ratios"])
+
+    assert ratios["Ticker"].unique().tolist() == ["AAPL", "MSFT"]
+
+    with pytest.raises(ValueError):
+        batch_model.collect_in_batches(
+            tickers=["AAPL", "MSFT"],
+            output_location=str(tmp_path),
+            batch_size=2,
+            progress_bar=False,
+            **toolkit_settings,
+        )
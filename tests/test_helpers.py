@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pandas as pd
+import pytest
 import requests
 
 from financetoolkit import helpers
@@ -121,6 +122,44 @@ def test_calculate_growth_warnings_suppression():
         assert len(future_warnings) == 0
 
 
+def test_calculate_growth_list_lag_matches_single_lags():
+    """Test that each lag of a list of lags equals the growth of that lag alone."""
+    data = pd.DataFrame(
+        {
+            "2020": [100, np.nan, 50],
+            "2021": [110, 220, np.nan],
+            "2022": [121, 0, 60],
+            "2023": [133, 250, 70],
+        },
+        index=pd.MultiIndex.from_product([["AAPL"], ["Revenue", "Expenses", "Cash"]]),
+    )
+
+    filled = data.ffill(axis="columns")
+    filters = list(warnings.filters)
+    result = helpers.calculate_growth(data, lag=[1, 2])
+
+    # The global warning filters are left untouched
+    assert warnings.filters == filters
+    assert result.index.get_level_values(-1).tolist() == ["Lag 1", "Lag 2"] * 3
+    assert result.loc[("AAPL", "Expenses", "Lag 1"), "2023"] == np.inf
+
+    for lag in [1, 2]:
+        pd.testing.assert_frame_equal(
+            result.xs(f"Lag {lag}", level=2),
+            (filled / filled.shift(lag, axis=1) - 1).round(4),
+        )
+
+    result = helpers.calculate_growth(data.T, lag=[1, 2], axis="index")
+
+    assert result.columns.get_level_values(-1).tolist() == ["Lag 1", "Lag 2"] * 3
+
+    for lag in [1, 2]:
+        pd.testing.assert_frame_equal(
+            result.xs(f"Lag {lag}", level=2, axis=1),
+            helpers.calculate_growth(data.T, lag=lag, axis="index"),
+        )
+
+
 def test_combine_dataframes():
     """Test combining dataframes from different companies."""
     df1 = pd.DataFrame(
@@ -202,6 +241,23 @@ def test_equal_length_same_start():
     assert result2.equals(df2)
 
 
+def test_convert_dtype():
+    """Test that only the floating point columns are converted."""
+    data = pd.DataFrame(
+        {"Close": [100.5, 101.25], "Volume": [1000, 2000], "Return": [0.0, 0.0075]}
+    )
+
+    result = helpers.convert_dtype(data, dtype="float32")
+
+    assert result["Close"].dtype == "float32"
+    assert result["Return"].dtype == "float32"
+    assert result["Volume"].dtype == "int64"
+    np.testing.assert_allclose(result["Close"], data["Close"], rtol=1e-7)
+
+    # The default dtype returns the exact same object
+    assert helpers.convert_dtype(data) is data
+
+
 def test_convert_isin_to_ticker_valid_isin():
     """Test converting valid ISIN to ticker."""
     mock_response = MagicMock()
@@ -524,3 +580,63 @@ def test_handle_portfolio_decorator_multiindex_columns():
 
     # Should not add Portfolio column for MultiIndex columns
     assert len(result.columns) == 2
+
+
+def test_handle_portfolio_decorator_periods_as_columns():
+    """Test handle_portfolio decorator with positional arguments and cached weights."""
+
+    class MockSelf:
+        def __init__(self):
+            self._tickers = ["AAPL", "MSFT", "GOOGL", "Portfolio"]
+            self._rounding = 4
+            self._quarterly = False
+            self._portfolio_weights = {
+                "yearly": pd.DataFrame(
+                    {"AAPL": [0.6, 0.5], "MSFT": [0.3, 0.5], "AMZN": [0.1, np.nan]},
+                    index=pd.PeriodIndex(["2020", "2021"], freq="Y"),
+                )
+            }
+
+    @helpers.handle_portfolio
+    def test_function(self, rounding=None):
+        return pd.DataFrame(
+            {
+                pd.Period("2020", freq="Y"): [10.123, np.nan, 30.0],
+                pd.Period("2021", freq="Y"): [20.0, 25.0, 35.0],
+            },
+            index=["AAPL", "MSFT", "GOOGL"],
+        )
+
+    mock_self = MockSelf()
+    result = test_function(mock_self, 1)
+
+    # Missing values and tickers without weights do not contribute to the average
+    assert result.loc["Portfolio"].tolist() == [
+        round(0.6 * 10.123, 1),
+        0.5 * 20 + 0.5 * 25,
+    ]
+
+    aligned_weights = mock_self._portfolio_weights_cache["yearly"][2]
+
+    test_function(mock_self)
+
+    assert mock_self._portfolio_weights_cache["yearly"][2] is aligned_weights
+
+    # Periods without weights can not be averaged
+    mock_self._portfolio_weights["yearly"] = mock_self._portfolio_weights[
+        "yearly"
+    ].iloc[:1]
+
+    with pytest.raises(KeyError, match="no portfolio weights"):
+        test_function(mock_self)
+
+
+def test_round_dataset():
+    dataset = pd.DataFrame({"A": [1.123456, 2.987654]})
+
+    pd.testing.assert_frame_equal(
+        helpers.round_dataset(dataset, 2), pd.DataFrame({"A": [1.12, 2.99]})
+    )
+
+    # Without rounding, the same dataset is returned to prevent a copy
+    assert helpers.round_dataset(dataset, None) is dataset
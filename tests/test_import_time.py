@@ -0,0 +1,58 @@
+"""Import Time Tests"""
+
+import json
+import subprocess
+import sys
+
+import financetoolkit
+
+# pylint: disable=missing-function-docstring
+
+HEAVY_MODULES = ["scipy", "sklearn", "yfinance", "tqdm", "requests"]
+
+# Pandas is imported before the measurement starts given that it is always required. The
+# threshold is set generously to prevent flaky tests while still catching eager imports
+IMPORT_TIME_THRESHOLD = 1.0
+
+
+def measure_import(statement: str) -> dict:
+    """Measures the import in a fresh interpreter so that earlier imports do not interfere."""
+    code = (
+        "import json, sys, time\n"
+        "import pandas\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "duration = time.perf_counter() - start\n"
+        f"print(json.dumps({{'duration': duration, 'modules': "
+        f"[module for module in {HEAVY_MODULES} if module in sys.modules]}}))\n"
+    )
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_import_package():
+    result = measure_import("import financetoolkit")
+
+    assert result["modules"] == []
+    assert result["duration"] < IMPORT_TIME_THRESHOLD
+
+
+def test_import_toolkit():
+    result = measure_import("from financetoolkit import Toolkit")
+
+    for module in ["scipy", "sklearn", "yfinance"]:
+        assert module not in result["modules"]
+
+    assert result["duration"] < IMPORT_TIME_THRESHOLD
+
+
+def test_import_lazy_classes():
+    for name in financetoolkit.__all__:
+        assert getattr(financetoolkit, name).__name__ == name
@@ -1,7 +1,10 @@
 # ruff: noqa
 """Toolkit Controller Tests""" ""
+import numpy as np
 import pandas as pd
+import pytest
 
+import financetoolkit
 from financetoolkit import Toolkit
 
 balance_dataset = pd.read_pickle("tests/datasets/balance_dataset.pickle")
@@ -193,3 +196,284 @@ def test_toolkit_technicals(recorder):
     recorder.capture(
         toolkit.technicals.collect_all_indicators(growth=True, lag=[1, 2, 3]).round(0)
     )
+
+
+def test_toolkit_controller_cache(recorder):
+    toolkit = Toolkit(
+        tickers=["AAPL", "MSFT"],
+        balance=balance_dataset,
+        income=income_dataset,
+        cash=cash_dataset,
+        historical=historical_dataset,
+        convert_currency=False,
+        start_date="2019-12-31",
+        end_date="2023-01-01",
+        sleep_timer=False,
+    )
+
+    toolkit._daily_risk_free_rate = risk_free_rate
+    toolkit._daily_treasury_data = treasury_data
+
+    ratios_module = toolkit.ratios
+    ratios_module.collect_all_ratios()
+
+    recorder.capture(toolkit.ratios is ratios_module)
+    recorder.capture(toolkit.ratios._all_ratios.empty)
+    recorder.capture(toolkit.risk is toolkit.risk)
+
+    toolkit._income_statement = toolkit._income_statement.copy()
+
+    recorder.capture(toolkit.ratios is ratios_module)
+    recorder.capture(toolkit.ratios._all_ratios.empty)
+
+
+def test_toolkit_copy_on_write():
+    toolkit = Toolkit(
+        tickers=["AAPL", "MSFT"],
+        historical=historical_dataset,
+        start_date="2020-01-31",
+        end_date="2023-01-01",
+        sleep_timer=False,
+    )
+
+    toolkit._daily_risk_free_rate = risk_free_rate
+    toolkit._daily_treasury_data = treasury_data
+
+    expected_yearly = toolkit.get_historical_data(period="yearly")
+    expected_daily = toolkit.get_historical_data()
+
+    with pd.option_context("mode.copy_on_write", True):
+        toolkit_copy_on_write = Toolkit(
+            tickers=["AAPL", "MSFT"],
+            historical=historical_dataset,
+            start_date="2020-01-31",
+            end_date="2023-01-01",
+            sleep_timer=False,
+            copy_on_write=True,
+        )
+
+        toolkit_copy_on_write._daily_risk_free_rate = risk_free_rate
+        toolkit_copy_on_write._daily_treasury_data = treasury_data
+
+        yearly = toolkit_copy_on_write.get_historical_data(period="yearly")
+        daily = toolkit_copy_on_write.get_historical_data()
+
+        pd.testing.assert_frame_equal(daily, expected_daily)
+        pd.testing.assert_frame_equal(yearly, expected_yearly)
+
+        # The returned data is a view on the stored data until it is modified
+        stored_data = toolkit_copy_on_write._daily_historical_data
+
+        assert np.shares_memory(
+            daily["Close"].to_numpy(), stored_data["Close"].to_numpy()
+        )
+        assert stored_data.loc["2020-01-31", ("Return", "AAPL")] != 0
+
+        daily.loc[:, ("Close", "AAPL")] = 0
+
+        assert (stored_data.loc["2020-01-31":, ("Close", "AAPL")] != 0).all()
+
+    # Without Copy-on-Write enabled by the caller, copies are returned
+    with pd.option_context("mode.copy_on_write", False):
+        daily = toolkit_copy_on_write.get_historical_data()
+
+        pd.testing.assert_frame_equal(daily, expected_daily)
+
+        assert not np.shares_memory(
+            daily["Close"].to_numpy(), stored_data["Close"].to_numpy()
+        )
+
+        daily.loc[:, ("Close", "AAPL")] = 0
+
+        assert (stored_data.loc["2020-01-31":, ("Close", "AAPL")] != 0).all()
+
+        Toolkit(
+            tickers=["AAPL", "MSFT"],
+            historical=historical_dataset,
+            sleep_timer=False,
+            copy_on_write=True,
+        )
+
+        assert pd.get_option("mode.copy_on_write") is False
+
+
+def test_toolkit_compact_dtype():
+    toolkits = {}
+
+    for dtype in ["float64", "compact"]:
+        toolkits[dtype] = Toolkit(
+            tickers=["AAPL", "MSFT"],
+            balance=balance_dataset,
+            income=income_dataset,
+            cash=cash_dataset,
+            historical=historical_dataset,
+            convert_currency=False,
+            start_date="2019-12-31",
+            end_date="2023-01-01",
+            sleep_timer=False,
+            rounding=10,
+            dtype=dtype,
+        )
+
+        toolkits[dtype]._daily_risk_free_rate = risk_free_rate
+        toolkits[dtype]._daily_treasury_data = treasury_data
+
+    compact_toolkit = toolkits["compact"]
+
+    assert (compact_toolkit._balance_sheet_statement.dtypes == "float32").all()
+    assert "float32" in compact_toolkit._daily_historical_data.dtypes.to_numpy()
+    assert (
+        compact_toolkit._daily_historical_data.memory_usage().sum()
+        < toolkits["float64"]._daily_historical_data.memory_usage().sum() * 0.6
+    )
+
+    # float32 holds approximately 7 significant digits which means that the results
+    # are expected to deviate by no more than a relative difference of 1e-4
+    for function in [
+        lambda toolkit: toolkit.get_historical_data(period="yearly"),
+        lambda toolkit: toolkit.ratios.collect_all_ratios(),
+        lambda toolkit: toolkit.risk.get_maximum_drawdown(),
+        lambda toolkit: toolkit.performance.get_sharpe_ratio(),
+        lambda toolkit: toolkit.technicals.get_relative_strength_index(),
+    ]:
+        expected = function(toolkits["float64"]).astype(float)
+        result = function(compact_toolkit).astype(float)
+
+        assert expected.shape == result.shape
+        np.testing.assert_allclose(result, expected, rtol=1e-4, atol=1e-8)
+
+    with pytest.raises(ValueError):
+        Toolkit(tickers=["AAPL"], dtype="float16")
+
+
+def test_toolkit_raw_precision():
+    toolkit = Toolkit(
+        tickers=["AAPL", "MSFT"],
+        balance=balance_dataset,
+        income=income_dataset,
+        cash=cash_dataset,
+        historical=historical_dataset,
+        convert_currency=False,
+        start_date="2019-12-31",
+        end_date="2023-01-01",
+        sleep_timer=False,
+        rounding=None,
+    )
+
+    toolkit._daily_risk_free_rate = risk_free_rate
+    toolkit._daily_treasury_data = treasury_data
+
+    ratios = toolkit.ratios.collect_all_ratios()
+    ratios_growth = toolkit.ratios.collect_all_ratios(growth=True)
+    sharpe_ratio = toolkit.performance.get_sharpe_ratio()
+    maximum_drawdown = toolkit.risk.get_maximum_drawdown()
+
+    for result in [ratios, ratios_growth, sharpe_ratio, maximum_drawdown]:
+        assert not result.empty
+        assert not result.equals(result.round(4))
+
+    # Rounding is only applied once when requested for the returned results
+    pd.testing.assert_frame_equal(
+        toolkit.ratios.collect_all_ratios(rounding=4), ratios.round(4)
+    )
+
+
+def test_toolkit_stats():
+    financetoolkit.metrics.reset()
+
+    toolkit = Toolkit(
+        tickers=["AAPL", "MSFT"],
+        balance=balance_dataset,
+        income=income_dataset,
+        cash=cash_dataset,
+        historical=historical_dataset,
+        convert_currency=False,
+        start_date="2019-12-31",
+        end_date="2023-01-01",
+        sleep_timer=False,
+    )
+
+    toolkit._daily_risk_free_rate = risk_free_rate
+    toolkit._daily_treasury_data = treasury_data
+
+    toolkit.ratios.get_current_ratio()
+    toolkit.ratios.get_current_ratio()
+
+    stats = toolkit.stats()
+
+    assert stats["Latency"].loc["Ratios.get_current_ratio", "Calls"] == 2
+    assert stats["Cache"].loc["ratios controller"].tolist() == [1, 1]
+    assert "Toolkit.stats" not in stats["Latency"].index
+    assert 'method="Ratios.get_current_ratio"' in toolkit.stats(prometheus=True)
+
+
+def test_toolkit_plan():
+    toolkit = Toolkit(
+        tickers=["AAPL", "MSFT"],
+        api_key="SECRET",
+        balance=balance_dataset,
+        income=income_dataset,
+        cash=cash_dataset,
+        historical=historical_dataset,
+        convert_currency=False,
+        start_date="2019-12-31",
+        end_date="2023-01-01",
+        sleep_timer=False,
+        enforce_source="FinancialModelingPrep",
+    )
+
+    plan = toolkit.plan(["ratios", "profile"])
+
+    # Only the treasury data and the profiles are not available yet
+    assert plan["Summary"]["Cached"].tolist() == [
+        True,
+        True,
+        True,
+        False,
+        True,
+        False,
+        False,
+    ]
+    assert plan["Requests"]["Dataset"].value_counts().to_dict() == {
+        "treasury": 8,
+        "profile": 2,
+    }
+    assert plan["Summary"].loc["Total", "FinancialModelingPrep"] == 10
+
+    toolkit._daily_treasury_data = treasury_data
+
+    assert toolkit.plan("ratios")["Requests"].empty
+
+
+def test_toolkit_controller_cache_arguments():
+    def create_toolkit():
+        toolkit = Toolkit(
+            tickers=["AAPL", "MSFT"],
+            balance=balance_dataset,
+            income=income_dataset,
+            cash=cash_dataset,
+            historical=historical_dataset,
+            convert_currency=False,
+            start_date="2019-12-31",
+            end_date="2023-01-01",
+            sleep_timer=False,
+        )
+
+        toolkit._daily_risk_free_rate = risk_free_rate
+        toolkit._daily_treasury_data = treasury_data
+
+        return toolkit
+
+    toolkit = create_toolkit()
+    toolkit.ratios.collect_all_ratios()
+
+    # The cached controller only reuses ratios collected with the same arguments
+    for arguments in [
+        {"trailing": 2},
+        {"days": 100, "diluted": False, "include_dividends": True},
+        {},
+    ]:
+        pd.testing.assert_frame_equal(
+            toolkit.ratios.collect_all_ratios(**arguments),
+            create_toolkit().ratios.collect_all_ratios(**arguments),
+        )
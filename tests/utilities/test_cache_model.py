@@ -282,3 +282,32 @@ def test_load_cached_data_with_complex_pickle_data():
         assert result["list"] == test_data["list"]
         assert result["nested"] == test_data["nested"]
         pd.testing.assert_frame_equal(result["dataframe"], test_data["dataframe"])
+
+
+def test_share_intermediates():
+    class Controller:
+        def __init__(self):
+            self._intermediates = None
+            self.caches: list = []
+
+        @cache_model.share_intermediates
+        def collect(self):
+            self.caches.append(self._intermediates)
+            self.collect_category()
+
+            return self._intermediates
+
+        @cache_model.share_intermediates
+        def collect_category(self):
+            self.caches.append(self._intermediates)
+
+    controller = Controller()
+
+    assert controller.collect() == {}
+    assert controller.caches[0] is controller.caches[1]
+    assert controller._intermediates is None
+
+    controller.collect_category()
+
+    assert controller.caches[2] is not controller.caches[0]
+    assert controller._intermediates is None
@@ -0,0 +1,139 @@
+"""Kernel Model Tests"""
+
+# ruff: noqa: PLR2004
+
+import numpy as np
+import pytest
+
+from financetoolkit.utilities import kernel_model
+
+# pylint: disable=missing-function-docstring
+
+rng = np.random.default_rng(0)
+returns = rng.normal(0, 0.01, 500)
+volumes = rng.integers(-60, 100, 300).astype(np.float64)
+prices = rng.uniform(50, 150, 300)
+
+
+def match_lots(volumes: np.ndarray, prices: np.ndarray, method: str) -> list[float]:
+    # The lot matching as it was calculated before the kernels, with a list of lots
+    inventory: list[list[float]] = []
+    average_cost, total_volume, pnl = 0.0, 0.0, []
+
+    for volume, price in zip(volumes, prices):
+        realized_pnl = 0.0
+
+        if volume > 0 and method == "AVERAGE":
+            average_cost = (average_cost * total_volume + volume * price) / (
+                total_volume + volume
+            )
+            total_volume += volume
+        elif volume > 0:
+            inventory.append([volume, price])
+        elif volume < 0 and method == "AVERAGE":
+            sold_volume = min(-volume, total_volume)
+            realized_pnl = sold_volume * (price - average_cost)
+            total_volume -= sold_volume
+        elif volume < 0:
+            sell_volume = -volume
+
+            while sell_volume > 0 and inventory:
+                lot = inventory[0] if method == "FIFO" else inventory[-1]
+                matched_volume = min(lot[0], sell_volume)
+                realized_pnl += matched_volume * (price - lot[1])
+                sell_volume -= matched_volume
+                lot[0] -= matched_volume
+
+                if lot[0] == 0:
+                    inventory.remove(lot)
+
+        pnl.append(realized_pnl)
+
+    return pnl
+
+
+@pytest.fixture(params=kernel_model.KERNEL_BACKENDS)
+def backend(request):
+    if request.param == "numba" and not kernel_model.ENABLE_NUMBA:
+        pytest.skip("Numba is not installed")
+
+    return request.param
+
+
+def test_get_garch_variance(backend):
+    weights = [1e-6, 0.1, 0.85]
+
+    np.testing.assert_allclose(
+        kernel_model.get_garch_variance(returns, weights, 500, backend=backend),
+        kernel_model.garch_variance_loop(returns, *weights, 500),
+        rtol=1e-12,
+    )
+
+    variance = kernel_model.get_garch_variance(returns, weights, 3, backend=backend)
+
+    np.testing.assert_allclose(
+        variance,
+        [
+            returns[0] ** 2,
+            1e-6 + 0.1 * returns[0] ** 2 + 0.85 * returns[0] ** 2,
+            1e-6 + 0.1 * returns[1] ** 2 + 0.85 * variance[1],
+        ],
+    )
+
+
+def test_get_autoregressive_forecast(backend):
+    phi = np.array([0.2, -0.1, 0.5])
+
+    forecast = kernel_model.get_autoregressive_forecast(
+        np.array([1.0, 2.0, 3.0]), phi, 0.5, 4, backend=backend
+    )
+
+    values = [1.0, 2.0, 3.0]
+
+    for _ in range(4):
+        values.append(0.5 + phi @ values[-3:])
+
+    np.testing.assert_allclose(forecast, values[3:], rtol=1e-12)
+
+
+@pytest.mark.parametrize("method", ["FIFO", "LIFO", "AVERAGE"])
+def test_get_lot_matching(backend, method):
+    np.testing.assert_allclose(
+        kernel_model.get_lot_matching(volumes, prices, method, backend=backend),
+        match_lots(volumes, prices, method),
+        rtol=1e-12,
+        atol=1e-9,
+    )
+
+    # Selling more than was bought only realizes the profit and loss of the lots held
+    np.testing.assert_allclose(
+        kernel_model.get_lot_matching(
+            np.array([10.0, 5.0, -20.0, 0.0, -5.0]),
+            np.array([100.0, 110.0, 120.0, 130.0, 140.0]),
+            method,
+            backend=backend,
+        ),
+        [0.0, 0.0, 250.0 if method != "AVERAGE" else 15 * (120 - 310 / 3), 0.0, 0.0],
+    )
+
+    with pytest.raises(ValueError, match="must be one of"):
+        kernel_model.get_lot_matching(volumes, prices, "HIFO", backend=backend)
+
+
+def test_set_backend():
+    backend = kernel_model.get_backend()
+
+    assert backend == ("numba" if kernel_model.ENABLE_NUMBA else "numpy")
+
+    kernel_model.set_backend("numpy")
+
+    assert kernel_model.get_backend() == "numpy"
+
+    with pytest.raises(ValueError, match="must be one of"):
+        kernel_model.set_backend("cuda")
+
+    if not kernel_model.ENABLE_NUMBA:
+        with pytest.raises(ImportError, match="requires Numba"):
+            kernel_model.set_backend("numba")
+
+    kernel_model.set_backend(backend)
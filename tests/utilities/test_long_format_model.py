@@ -0,0 +1,98 @@
+"""Long Format Model Tests"""
+
+# ruff: noqa: PLR2004
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from financetoolkit.utilities import long_format_model
+
+# pylint: disable=missing-function-docstring
+
+
+def create_ratios() -> list[pd.DataFrame]:
+    periods = pd.period_range("2021", "2023", freq="Y")
+
+    return [
+        pd.DataFrame(
+            [[1.0, 2.0, 3.0], [np.nan, 0.5, 0.25]],
+            index=pd.MultiIndex.from_tuples(
+                [("MSFT", "Current Ratio"), ("AAPL", "Current Ratio")]
+            ),
+            columns=periods,
+        ),
+        pd.DataFrame(
+            [[0.123456, 0.2], [0.3, 0.4]],
+            index=pd.MultiIndex.from_tuples(
+                [("MSFT", "Gross Margin"), ("AAPL", "Gross Margin")]
+            ),
+            columns=periods[1:],
+        ),
+    ]
+
+
+def test_collect_long_format():
+    long_format = long_format_model.collect_long_format(create_ratios(), rounding=2)
+
+    assert long_format.columns.tolist() == long_format_model.LONG_FORMAT_COLUMNS
+    assert len(long_format) == 12
+    assert long_format["Ticker"].tolist()[::3] == ["MSFT", "AAPL", "MSFT", "AAPL"]
+    assert long_format["Metric"].tolist()[::6] == ["Current Ratio", "Gross Margin"]
+    assert long_format["Period"].astype(str).tolist()[:3] == ["2021", "2022", "2023"]
+    assert long_format["Value"].tolist()[7] == 0.12
+
+    long_format = long_format_model.collect_long_format(create_ratios(), dropna=True)
+
+    assert len(long_format) == 9
+    assert not long_format["Value"].isna().any()
+
+    with pytest.raises(ValueError, match="multiple lags"):
+        long_format_model.collect_long_format(
+            [pd.DataFrame([[1.0]], index=pd.MultiIndex.from_tuples([("A", "B", 1)]))]
+        )
+
+
+def test_collect_long_format_from_metrics():
+    periods = pd.period_range("2021", "2023", freq="Y")
+    metrics = {
+        "Value at Risk": pd.DataFrame(
+            {"AAPL": [-0.1, -0.2, -0.3], "Benchmark": [-0.05, -0.1, -0.15]},
+            index=periods,
+        ),
+        "Maximum Drawdown": pd.DataFrame(
+            {"AAPL": [-0.4, -0.5], "Benchmark": [-0.2, -0.25]}, index=periods[1:]
+        ),
+    }
+
+    long_format = long_format_model.collect_long_format_from_metrics(metrics)
+
+    assert len(long_format) == 12
+    assert long_format.iloc[6].tolist()[:2] == ["AAPL", "Maximum Drawdown"]
+    assert pd.isna(long_format.iloc[6]["Value"])
+
+    pd.testing.assert_frame_equal(
+        long_format_model.to_wide_format(long_format, axis="index"),
+        pd.concat(metrics, axis=1),
+    )
+
+
+def test_to_wide_format():
+    ratios = create_ratios()
+
+    pd.testing.assert_frame_equal(
+        long_format_model.to_wide_format(long_format_model.collect_long_format(ratios)),
+        pd.concat(ratios),
+    )
+
+    # Without the categories, the labels are restored in the order these appear
+    long_format = long_format_model.collect_long_format(ratios).astype(
+        {"Ticker": str, "Metric": str}
+    )
+
+    pd.testing.assert_frame_equal(
+        long_format_model.to_wide_format(long_format), pd.concat(ratios)
+    )
+
+    with pytest.raises(ValueError, match="axis must be"):
+        long_format_model.to_wide_format(long_format, axis="rows")
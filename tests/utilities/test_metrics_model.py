@@ -0,0 +1,136 @@
+"""Metrics Model Tests"""
+
+import tempfile
+
+import pandas as pd
+
+import financetoolkit
+from financetoolkit.utilities import cache_model, metrics_model
+
+# pylint: disable=missing-function-docstring
+
+
+class MockResponse:
+    """Mimics the response of the requests package."""
+
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.content = content
+
+
+def test_metrics_registry():
+    registry = metrics_model.MetricsRegistry()
+
+    registry.record_response(
+        "FinancialModelingPrep",
+        "https://financialmodelingprep.com/stable/profile?symbol=AAPL&apikey=SECRET",
+        MockResponse(200, b"12345"),
+    )
+    registry.record_response(
+        "FinancialModelingPrep",
+        "https://financialmodelingprep.com/stable/profile?symbol=MSFT&apikey=SECRET",
+        MockResponse(429, b"1"),
+    )
+    for ticker in ["AAPL", "MSFT"]:
+        registry.record_response(
+            "YahooFinance",
+            f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+            "?interval=1d&range=None",
+            MockResponse(200, b"123"),
+        )
+    registry.record_quota_limited("FinancialModelingPrep", "/stable/profile")
+    registry.record_retry("FinancialModelingPrep", "/stable/profile", "limit")
+    registry.record_request("YahooFinance", "history")
+    registry.record_cache("balance_sheet_statement.pickle", hit=True)
+    registry.record_cache("balance_sheet_statement.pickle", hit=False)
+    registry.record_duration("Ratios.collect_all_ratios", 2.0)
+    registry.record_duration("Ratios.collect_all_ratios", 1.0)
+
+    stats = registry.get_stats()
+
+    assert stats["Requests"].loc[
+        ("FinancialModelingPrep", "/stable/profile")
+    ].to_dict() == {
+        "Requests": 2,
+        "Failed Requests": 1,
+        "Quota Limited": 1,
+        "Retries": 1,
+        "Bytes Downloaded": 6,
+    }
+    assert stats["Requests"].loc[("YahooFinance", "history"), "Failed Requests"] == 0
+
+    # The symbol within the path of an endpoint results in a single label
+    assert stats["Requests"].loc[
+        ("YahooFinance", "/v8/finance/chart/{symbol}")
+    ].to_dict() == {
+        "Requests": 2,
+        "Failed Requests": 0,
+        "Quota Limited": 0,
+        "Retries": 0,
+        "Bytes Downloaded": 6,
+    }
+    assert stats["Cache"].loc["balance_sheet_statement.pickle"].tolist() == [1, 1]
+    assert stats["Latency"].loc["Ratios.collect_all_ratios"].tolist() == [
+        2,
+        3.0,
+        1.5,
+        2.0,
+    ]
+
+    prometheus = registry.to_prometheus()
+
+    # The API key and tickers within the query or path are never part of the metrics
+    assert "SECRET" not in prometheus
+    assert "AAPL" not in prometheus
+    assert (
+        'financetoolkit_http_requests_total{provider="FinancialModelingPrep",'
+        'endpoint="/stable/profile",status="429"} 1'
+    ) in prometheus
+    assert (
+        'financetoolkit_method_duration_seconds_count{method="Ratios.collect_all_ratios"} 2'
+        in prometheus
+    )
+    assert "# TYPE financetoolkit_cache_hits_total counter" in prometheus
+
+    registry.reset()
+
+    assert registry.get_stats()["Requests"].empty
+
+
+def test_escape_label_value():
+    assert metrics_model.escape_label_value('a"b\\c\nd') == 'a\\"b\\\\c\\nd'
+
+
+def test_measure_methods():
+    @metrics_model.measure_methods
+    class Controller:
+        def get_value(self, value: int = 1) -> int:
+            return value
+
+        def _get_private_value(self) -> int:
+            return 1
+
+    metrics_model.metrics.reset()
+
+    controller = Controller()
+    controller.get_value(value=2)
+    controller._get_private_value()
+
+    latency = financetoolkit.metrics.get_stats()["Latency"]
+
+    assert latency.index.tolist() == ["Controller.get_value"]
+    assert Controller.get_value.__name__ == "get_value"
+
+
+def test_cache_metrics():
+    metrics_model.metrics.reset()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_model.load_cached_data(temp_dir, "missing.pickle")
+        pd.DataFrame({"A": [1]}).to_pickle(f"{temp_dir}/existing.pickle")
+        cache_model.load_cached_data(temp_dir, "existing.pickle")
+
+    cache = financetoolkit.metrics.get_stats()["Cache"]
+
+    assert cache.loc["missing.pickle"].tolist() == [0, 1]
+    assert cache.loc["existing.pickle"].tolist() == [1, 0]
@@ -0,0 +1,156 @@
+"""Parallel Model Tests"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from financetoolkit import Toolkit
+from financetoolkit.utilities import parallel_model
+
+balance_dataset = pd.read_pickle("tests/datasets/balance_dataset.pickle")
+income_dataset = pd.read_pickle("tests/datasets/income_dataset.pickle")
+cash_dataset = pd.read_pickle("tests/datasets/cash_dataset.pickle")
+historical_dataset = pd.read_pickle("tests/datasets/historical_dataset.pickle")
+risk_free_rate = pd.read_pickle("tests/datasets/risk_free_rate.pickle")
+treasury_data = pd.read_pickle("tests/datasets/treasury_data.pickle")
+
+# pylint: disable=missing-function-docstring
+
+
+def create_toolkit(copies: int = 3) -> Toolkit:
+    """Creates a Toolkit with enough tickers to be split up by renaming the test tickers."""
+    balance, income, cash, historical, tickers = [], [], [], [], []
+
+    for copy in range(copies):
+        mapping = {ticker: f"{ticker}{copy}" for ticker in ["AAPL", "MSFT"]}
+        tickers.extend(mapping.values())
+
+        balance.append(balance_dataset.rename(mapping, level=0))
+        income.append(income_dataset.rename(mapping, level=0))
+        cash.append(cash_dataset.rename(mapping, level=0))
+        historical.append(
+            historical_dataset.drop(columns="Benchmark", level=1).rename(
+                columns=mapping, level=1
+            )
+        )
+
+    historical.append(historical_dataset.loc[:, (slice(None), "Benchmark")])
+
+    toolkit = Toolkit(
+        tickers=tickers,
+        balance=pd.concat(balance),
+        income=pd.concat(income),
+        cash=pd.concat(cash),
+        historical=pd.concat(historical, axis=1),
+        convert_currency=False,
+        start_date="2019-12-31",
+        end_date="2023-01-01",
+        sleep_timer=False,
+        progress_bar=False,
+    )
+
+    toolkit._daily_risk_free_rate = risk_free_rate
+    toolkit._daily_treasury_data = treasury_data
+
+    return toolkit
+
+
+def test_split_in_shards():
+    tickers = ["A", "B", "C", "D", "E"]
+
+    assert parallel_model.split_in_shards(tickers, n_jobs=2) == [
+        ["A", "B", "C"],
+        ["D", "E"],
+    ]
+
+    # Each shard contains at least two tickers
+    assert parallel_model.split_in_shards(tickers, n_jobs=10) == [
+        ["A", "B", "C"],
+        ["D", "E"],
+    ]
+
+    assert not parallel_model.split_in_shards(tickers, n_jobs=None)
+    assert not parallel_model.split_in_shards(tickers, n_jobs=1)
+    assert not parallel_model.split_in_shards(["A", "B", "C"], n_jobs=2)
+    assert not parallel_model.split_in_shards([*tickers, "Portfolio"], n_jobs=2)
+
+
+def test_shared_dataframe():
+    axis = parallel_model.get_ticker_axis(historical_dataset)
+    shared_dataset = parallel_model.SharedDataFrame(historical_dataset, axis=axis)
+
+    try:
+        dataset = shared_dataset.select(["MSFT"]).to_dataframe()
+    finally:
+        shared_dataset.close()
+
+    assert axis == 1
+    assert parallel_model.get_ticker_axis(balance_dataset) == 0
+
+    pd.testing.assert_frame_equal(
+        dataset,
+        historical_dataset.loc[
+            :, historical_dataset.columns.get_level_values(1) != "AAPL"
+        ],
+    )
+
+
+def test_combine_shards():
+    columns = pd.MultiIndex.from_product([["Metric"], ["C", "D", "Benchmark"]])
+    first_shard = pd.DataFrame(
+        np.ones((2, 3)),
+        columns=pd.MultiIndex.from_product([["Metric"], ["C", "A", "Benchmark"]]),
+    )
+    second_shard = pd.DataFrame(np.zeros((2, 3)), columns=columns)
+
+    combined = parallel_model.combine_shards(
+        [first_shard, second_shard], tickers=["C", "A", "C", "D"], axis=1
+    )
+
+    assert combined.columns.get_level_values(1).tolist() == [
+        "C",
+        "A",
+        "D",
+        "Benchmark",
+    ]
+
+
+@pytest.mark.parametrize(
+    "module, method",
+    [
+        ("ratios", "collect_all_ratios"),
+        ("risk", "collect_all_metrics"),
+        ("performance", "collect_all_metrics"),
+    ],
+)
+def test_collect_in_parallel(module, method):
+    toolkit = create_toolkit()
+
+    serial = getattr(getattr(toolkit, module), method)()
+    parallel = getattr(getattr(toolkit, module), method)(n_jobs=2)
+
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_collect_in_parallel_incremental(monkeypatch):
+    ratios = create_toolkit().ratios
+    balance = ratios._balance_sheet_statement
+    income = ratios._income_statement
+    cash = ratios._cash_flow_statement
+
+    ratios.update_financial_statements(
+        balance=balance.iloc[:, :-1], income=income.iloc[:, :-1], cash=cash.iloc[:, :-1]
+    )
+    ratios.collect_all_ratios(n_jobs=2)
+    ratios.update_financial_statements(balance=balance, income=income, cash=cash)
+
+    # The periods that were added incrementally are not collected again in parallel
+    def collect_in_parallel(**kwargs):
+        raise AssertionError("The ratios should not be collected in parallel again.")
+
+    monkeypatch.setattr(parallel_model, "collect_in_parallel", collect_in_parallel)
+
+    pd.testing.assert_frame_equal(
+        ratios.collect_all_ratios(incremental=True, n_jobs=2),
+        create_toolkit().ratios.collect_all_ratios(),
+    )
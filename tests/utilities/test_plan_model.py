@@ -0,0 +1,94 @@
+"""Plan Model Tests"""
+
+# ruff: noqa: PLR2004
+
+import pandas as pd
+import pytest
+
+from financetoolkit.utilities import plan_model
+
+# pylint: disable=missing-function-docstring
+
+
+def test_expand_datasets():
+    assert plan_model.expand_datasets(["ratios", "historical", "profile"]) == [
+        "balance",
+        "income",
+        "cashflow",
+        "treasury",
+        "historical",
+        "profile",
+    ]
+    assert plan_model.expand_datasets("risk") == ["treasury", "historical"]
+
+    with pytest.raises(ValueError):
+        plan_model.expand_datasets(["unknown"])
+
+
+def test_plan_dataset_requests():
+    requests = plan_model.plan_dataset_requests(
+        dataset="balance",
+        tickers=["AAPL", "MSFT"],
+        api_key="SECRET",
+        start_date="2020-01-01",
+        end_date="2023-01-01",
+        user_subscription="Premium",
+        enforce_source="FinancialModelingPrep",
+    )
+
+    assert len(requests) == 2
+    assert requests[0]["Endpoint"] == "/stable/balance-sheet-statement"
+    assert requests[0]["URL"] == (
+        "https://financialmodelingprep.com/stable/balance-sheet-statement"
+        "?symbol=AAPL&period=annual&apikey=API_KEY&limit=4"
+    )
+    assert requests[0]["Fallback"] is None
+
+    historical_requests = plan_model.plan_dataset_requests(
+        dataset="treasury", tickers=["AAPL"], api_key="SECRET"
+    )
+
+    # The historical data and the dividends are requested for each treasury rate
+    assert [request["Ticker"] for request in historical_requests[::2]] == (
+        plan_model.TREASURY_TICKERS
+    )
+    assert all("SECRET" not in request["URL"] for request in historical_requests)
+
+    # The amount of dividends depends on the subscription plan, as when these are obtained
+    for user_subscription, limit in [("Free", 5), ("Premium", 99999)]:
+        dividend_request = plan_model.plan_dataset_requests(
+            dataset="historical",
+            tickers=["AAPL"],
+            api_key="SECRET",
+            user_subscription=user_subscription,
+            enforce_source="FinancialModelingPrep",
+        )[1]
+
+        assert dividend_request["URL"].endswith(f"&limit={limit}")
+
+    # The company data is only available with an API key
+    assert not plan_model.plan_dataset_requests(dataset="profile", tickers=["AAPL"])
+
+
+def test_summarize_requests():
+    requests = pd.DataFrame(
+        plan_model.plan_dataset_requests(
+            dataset="historical",
+            tickers=[f"TICKER{number}" for number in range(150)],
+            api_key="SECRET",
+            user_subscription="Free",
+            enforce_source="FinancialModelingPrep",
+        )
+    )
+
+    summary = plan_model.summarize_requests(
+        requests=requests,
+        datasets={"balance": True, "historical": False},
+        user_subscription="Free",
+        requests_per_minute=100,
+    )
+
+    assert summary.loc["balance", "FinancialModelingPrep"] == 0
+    assert summary.loc["historical", "FinancialModelingPrep"] == 300
+    assert summary.loc["historical", "Estimated Duration"] == 180
+    assert summary.loc["Total"].tolist() == [False, 300, 0, 180]
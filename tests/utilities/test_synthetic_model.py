@@ -0,0 +1,194 @@
+"""Synthetic Model Tests"""
+
+# ruff: noqa: PLR2004
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from financetoolkit import Portfolio, Toolkit
+from financetoolkit.normalization_model import read_normalization_file
+from financetoolkit.utilities import synthetic_model
+
+# pylint: disable=missing-function-docstring
+
+
+def test_generate_financial_statements():
+    balance, income, cash = synthetic_model.generate_financial_statements(
+        tickers=3, years=4, seed=1
+    )
+
+    assert balance.index.get_level_values(0).unique().tolist() == [
+        "SYN0000",
+        "SYN0001",
+        "SYN0002",
+    ]
+    assert balance.columns.tolist() == [
+        pd.Period(year, freq="Y") for year in ["2020", "2021", "2022", "2023"]
+    ]
+
+    for statement, dataset in zip(
+        ["balance", "income", "cash"], [balance, income, cash], strict=True
+    ):
+        assert (
+            dataset.loc["SYN0000"].index.tolist()
+            == read_normalization_file(statement).tolist()
+        )
+        assert not dataset.isna().to_numpy().any()
+
+    balance_sheet = balance.loc["SYN0001"]
+    income_statement = income.loc["SYN0001"]
+
+    np.testing.assert_allclose(
+        balance_sheet.loc["Total Assets"],
+        balance_sheet.loc["Total Liabilities"] + balance_sheet.loc["Total Equity"],
+    )
+    np.testing.assert_allclose(
+        balance_sheet.loc["Total Current Assets"]
+        + balance_sheet.loc["Fixed Assets"]
+        + balance_sheet.loc["Other Assets"],
+        balance_sheet.loc["Total Assets"],
+    )
+    np.testing.assert_allclose(
+        income_statement.loc["Revenue"] - income_statement.loc["Cost of Goods Sold"],
+        income_statement.loc["Gross Profit"],
+    )
+    np.testing.assert_allclose(
+        cash.loc[("SYN0002", "Net Income")], income.loc[("SYN0002", "Net Income")]
+    )
+
+
+def test_generate_financial_statements_quarterly():
+    balance, _, _ = synthetic_model.generate_financial_statements(
+        tickers=2, years=2, quarterly=True, end_year=2022
+    )
+
+    assert balance.columns[0] == pd.Period("2021Q1", freq="Q")
+    assert balance.columns[-1] == pd.Period("2022Q4", freq="Q")
+
+
+def test_generate_universe_is_reproducible():
+    universe = synthetic_model.generate_universe(tickers=3, years=2, seed=5)
+    same_universe = synthetic_model.generate_universe(tickers=3, years=2, seed=5)
+    other_universe = synthetic_model.generate_universe(tickers=3, years=2, seed=6)
+
+    for dataset in ["balance", "income", "cash", "historical", "treasury"]:
+        pd.testing.assert_frame_equal(universe[dataset], same_universe[dataset])
+
+    pd.testing.assert_frame_equal(universe["portfolio"], same_universe["portfolio"])
+
+    assert not universe["balance"].equals(other_universe["balance"])
+    assert not universe["historical"].equals(other_universe["historical"])
+
+    # The data of a ticker does not depend on the amount of tickers
+    larger_universe = synthetic_model.generate_universe(tickers=5, years=2, seed=5)
+
+    pd.testing.assert_frame_equal(
+        larger_universe["balance"].loc[universe["tickers"]], universe["balance"]
+    )
+    pd.testing.assert_frame_equal(
+        larger_universe["historical"].xs("SYN0002", level=1, axis=1),
+        universe["historical"].xs("SYN0002", level=1, axis=1),
+    )
+
+
+def test_generate_historical_data():
+    treasury = synthetic_model.generate_treasury_data("2022-01-01", "2022-12-31")
+    historical = synthetic_model.generate_historical_data(
+        tickers=["A", "B"],
+        start="2022-01-01",
+        end="2022-12-31",
+        risk_free_rate=treasury.xs("10 Year", level=1, axis=1),
+        prices=pd.Series({"A": 50.0, "B": 100.0}),
+    )
+
+    assert historical.columns.get_level_values(0).unique().tolist() == [
+        "Open",
+        "High",
+        "Low",
+        "Close",
+        "Adj Close",
+        "Volume",
+        "Dividends",
+        "Return",
+        "Volatility",
+        "Excess Return",
+        "Excess Volatility",
+        "Cumulative Return",
+    ]
+    assert historical.columns.get_level_values(1).unique().tolist() == [
+        "A",
+        "B",
+        "Benchmark",
+    ]
+    assert historical.loc["2022-01-03", ("Close", "A")] == 50.0
+    assert (historical["High"] >= historical["Low"]).all().all()
+    assert (historical["Dividends"].loc["2022-02-01"] > 0).any()
+
+    # The adjusted close is lower than the close before the last dividend
+    dividend_payer = historical["Dividends"].sum().idxmax()
+
+    assert (
+        historical.loc["2022-01-03", ("Adj Close", dividend_payer)]
+        < historical.loc["2022-01-03", ("Close", dividend_payer)]
+    )
+    assert treasury.columns.get_level_values(1).unique().tolist() == [
+        "13 Week",
+        "5 Year",
+        "10 Year",
+        "30 Year",
+    ]
+    assert (treasury["Close"] > 0).all().all()
+
+
+def test_generate_portfolio_dataset():
+    universe = synthetic_model.generate_universe(tickers=4, years=2, transactions=6)
+    ledger = universe["portfolio"]
+
+    assert ledger.columns.tolist() == [
+        "Date",
+        "Identifier",
+        "Currency",
+        "Volume",
+        "Price",
+        "Costs",
+    ]
+    assert len(ledger) == 24
+    assert ledger["Date"].is_monotonic_increasing
+
+    # The position in a ticker never becomes negative
+    assert (ledger.groupby("Identifier")["Volume"].cumsum() >= 0).all()
+
+    portfolio = Portfolio(portfolio_dataset=ledger)
+
+    assert len(portfolio._portfolio_dataset) == 24
+    assert sorted(portfolio._original_tickers) == universe["tickers"]
+
+
+def test_generate_universe_with_toolkit():
+    universe = synthetic_model.generate_universe(tickers=3, years=3)
+
+    toolkit = Toolkit(
+        tickers=universe["tickers"],
+        balance=universe["balance"],
+        income=universe["income"],
+        cash=universe["cash"],
+        historical=universe["historical"],
+        start_date=universe["start_date"],
+        end_date=universe["end_date"],
+        convert_currency=False,
+        sleep_timer=False,
+        progress_bar=False,
+    )
+    toolkit._daily_treasury_data = universe["treasury"]
+    toolkit._daily_risk_free_rate = universe["risk_free_rate"]
+
+    price_to_earnings = toolkit.ratios.get_price_to_earnings_ratio()
+
+    assert price_to_earnings.columns.tolist() == [
+        pd.Period(year, freq="Y") for year in ["2021", "2022", "2023"]
+    ]
+    assert price_to_earnings.notna().all().all()
+
+    with pytest.raises(ValueError):
+        synthetic_model.generate_universe(tickers=3, risk_free_rate="1y")